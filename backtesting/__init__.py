@@ -4,9 +4,12 @@ Professional-grade backtesting system for validating trading strategies
 
 Components:
 - HistoricalDataLoader: Fetch and cache historical market data
+- ColumnarMarketData: Precomputed NumPy columns with per-bar timeframe alignment
 - BacktestEngine: Replay trades through strategies and filters
 - PerformanceMetrics: Calculate comprehensive performance statistics
 - ReportGenerator: Generate reports in multiple formats
+- SharedCandleStore / run_parallel_sweep: Process-pool parameter sweeps over shared data
+- MultiSymbolBacktestRunner: Same strategy/filter stack over a basket of symbols, merged portfolio result
 
 Usage:
     from backtesting import HistoricalDataLoader, BacktestEngine
@@ -24,14 +27,21 @@ Or use the convenience script:
 """
 
 from .historical_data_loader import HistoricalDataLoader
+from .columnar_data import ColumnarMarketData
 from .backtest_engine import BacktestEngine, BacktestTrade
 from .performance_metrics import PerformanceMetrics
 from .report_generator import ReportGenerator
+from .parallel_sweep import SharedCandleStore, run_parallel_sweep
+from .multi_symbol_runner import MultiSymbolBacktestRunner
 
 __all__ = [
     'HistoricalDataLoader',
+    'ColumnarMarketData',
     'BacktestEngine',
     'BacktestTrade',
     'PerformanceMetrics',
-    'ReportGenerator'
+    'ReportGenerator',
+    'SharedCandleStore',
+    'run_parallel_sweep',
+    'MultiSymbolBacktestRunner'
 ]
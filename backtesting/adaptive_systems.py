@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 from collections import deque
 import logging
 
+from data_feed.indicators import TechnicalIndicators
+
 logger = logging.getLogger(__name__)
 
 
@@ -352,63 +354,23 @@ class RollingRegimeDetector:
         }
     
     def calculate_adx(self, candles: List[Dict], period: int = 14) -> float:
-        """Calculate ADX from candles"""
+        """Calculate ADX from candles (mean of the last `period` DX values)"""
         if len(candles) < period + 1:
             return 0
         
-        highs = [c['high'] for c in candles]
-        lows = [c['low'] for c in candles]
-        closes = [c['close'] for c in candles]
-        
-        # True Range
-        tr_list = []
-        plus_dm_list = []
-        minus_dm_list = []
-        
-        for i in range(1, len(candles)):
-            high, low, prev_close = highs[i], lows[i], closes[i-1]
-            prev_high, prev_low = highs[i-1], lows[i-1]
-            
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            tr_list.append(tr)
-            
-            plus_dm = max(0, high - prev_high) if high - prev_high > prev_low - low else 0
-            minus_dm = max(0, prev_low - low) if prev_low - low > high - prev_high else 0
-            plus_dm_list.append(plus_dm)
-            minus_dm_list.append(minus_dm)
+        highs = np.array([c['high'] for c in candles])
+        lows = np.array([c['low'] for c in candles])
+        closes = np.array([c['close'] for c in candles])
         
-        if len(tr_list) < period:
-            return 0
-        
-        # Wilder's smoothing
-        def wilder_smooth(data, period):
-            smoothed = [sum(data[:period])]
-            for val in data[period:]:
-                smoothed.append(smoothed[-1] - smoothed[-1]/period + val)
-            return smoothed
-        
-        atr = wilder_smooth(tr_list, period)
-        plus_di_smooth = wilder_smooth(plus_dm_list, period)
-        minus_di_smooth = wilder_smooth(minus_dm_list, period)
-        
-        # DI values
-        dx_list = []
-        for i in range(len(atr)):
-            if atr[i] == 0:
-                continue
-            plus_di = 100 * plus_di_smooth[i] / atr[i]
-            minus_di = 100 * minus_di_smooth[i] / atr[i]
-            
-            di_sum = plus_di + minus_di
-            if di_sum > 0:
-                dx = 100 * abs(plus_di - minus_di) / di_sum
-                dx_list.append(dx)
+        # DX for every bar in one vectorized pass, skipping undefined values
+        dx = TechnicalIndicators.calculate_dx_batch(highs, lows, closes, period)
+        dx = dx[~np.isnan(dx)]
         
-        if len(dx_list) < period:
+        if len(dx) < period:
             return 0
         
         # ADX is smoothed DX
-        adx = sum(dx_list[-period:]) / period
+        adx = float(np.sum(dx[-period:])) / period
         return adx
     
     def analyze(self, candles: List[Dict], current_time: datetime) -> Tuple[MarketRegime, RegimeConfig]:
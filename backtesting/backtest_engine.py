@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import copy
 
+import numpy as np
+
 from strategy.breakout_strategy import BreakoutStrategy
 from strategy.breakout_strategy_v2 import BreakoutStrategyV2
 from strategy.breakout_strategy_v3 import BreakoutStrategyV3
@@ -59,8 +61,10 @@ from backtesting.elite_prediction_system import (
     create_elite_prediction_system_v2, ElitePredictionSystemV2, EliteGuidance
 )
 # Note: FundingArbitrageStrategy excluded - requires live funding rate data not in historical candles
+from backtesting.columnar_data import ColumnarMarketData, LOOKBACK_WINDOWS, DEFAULT_LOOKBACK
 from filters.filter_manager import FilterManager
 from data_feed.indicators import TechnicalIndicators
+from data_feed.indicator_state import IndicatorState
 import config
 
 logger = logging.getLogger(__name__)
@@ -386,6 +390,7 @@ class BacktestEngine:
     def __init__(self, initial_capital: float = 10000.0, breakout_strategy=None):
         self.initial_capital = initial_capital
         self.current_capital = initial_capital
+        self.symbol = config.TRADING_SYMBOL  # Recorded on trades (set per symbol by the multi-symbol runner)
 
         # Initialize components
         # Allow custom strategy for parameter optimization
@@ -659,7 +664,10 @@ class BacktestEngine:
         logger.info(f"🎯 BacktestEngine initialized (capital: ${initial_capital:,.2f})")
 
     def run(self, sol_data: Dict, btc_data: Dict,
-            start_date: str, end_date: str) -> Dict:
+            start_date: str, end_date: str,
+            btc_states: Optional[Dict[int, Dict]] = None,
+            window: Optional[Tuple[int, int]] = None,
+            sol_columns: Optional[ColumnarMarketData] = None) -> Dict:
         """
         Run backtest on historical data
 
@@ -668,6 +676,12 @@ class BacktestEngine:
             btc_data: BTC historical data (all timeframes)
             start_date: Start date 'YYYY-MM-DD' (requested, may differ from actual data)
             end_date: End date 'YYYY-MM-DD' (requested, may differ from actual data)
+            btc_states: Optional precomputed BTC market states keyed by primary bar
+                timestamp (see precompute_market_states), shared between runs
+            window: Optional (start_ts, end_ts) in ms - only bars in [start, end)
+                are traded; indicators still see all earlier history
+            sol_columns: Optional prebuilt ColumnarMarketData for sol_data, reused
+                between runs on the same data (e.g. walk-forward folds)
 
         Returns:
             Comprehensive backtest results
@@ -711,9 +725,31 @@ class BacktestEngine:
             logger.error("❌ No SOL data available for backtesting")
             return self._generate_results()
 
+        # Convert every timeframe to column arrays once, aligned to the primary bars
+        if sol_columns is None:
+            sol_columns = ColumnarMarketData(sol_data, primary_tf)
+        sol_candles = sol_columns.primary.candles
+
+        # Bars to trade (all of them unless a window is given)
+        start_idx, end_idx = 0, len(sol_candles)
+        if window:
+            timestamps = sol_columns.primary.timestamp
+            start_idx = int(np.searchsorted(timestamps, window[0], side='left'))
+            end_idx = int(np.searchsorted(timestamps, window[1], side='left'))
+            if start_idx >= end_idx:
+                logger.error("❌ No SOL data inside the backtest window")
+                return self._generate_results()
+
+        # Incremental indicators: each candle is folded in once for the whole run
+        sol_indicator_states = self._create_indicator_states(sol_columns)
+        # BTC is always matched to the SOL bar by timestamp, never by position:
+        # the two series need not start at the same bar or share gaps
+        if btc_states is None:
+            btc_states = self.precompute_market_states(btc_data, primary_tf)
+
         # Determine actual date range from data (may differ from requested range)
-        actual_start_ts = sol_candles[0]['timestamp']
-        actual_end_ts = sol_candles[-1]['timestamp']
+        actual_start_ts = sol_candles[start_idx]['timestamp']
+        actual_end_ts = sol_candles[end_idx - 1]['timestamp']
         # Store as instance variables for use in _generate_results
         self.actual_start_date = datetime.fromtimestamp(actual_start_ts / 1000).strftime('%Y-%m-%d')
         self.actual_end_date = datetime.fromtimestamp(actual_end_ts / 1000).strftime('%Y-%m-%d')
@@ -729,7 +765,7 @@ class BacktestEngine:
         logger.info(f"Symbol: {config.TRADING_SYMBOL}")
         logger.info(f"{'='*60}\n")
 
-        total_candles = len(sol_candles)
+        total_candles = end_idx - start_idx
         logger.info(f"\n📊 Data Summary:")
         logger.info(f"   Primary timeframe ({primary_tf}): {total_candles} candles")
         for tf_name, candles in sol_data.items():
@@ -752,19 +788,20 @@ class BacktestEngine:
         last_prediction_day = None
         
         # Process each candle
-        for idx, candle in enumerate(sol_candles):
+        for idx in range(start_idx, end_idx):
+            candle = sol_candles[idx]
             current_time = datetime.fromtimestamp(candle['timestamp'] / 1000)
             current_day = current_time.date()
 
             # Progress update every 10% (avoid division by zero)
             progress_interval = max(1, total_candles // 10)
-            if idx % progress_interval == 0:
-                progress = (idx / total_candles) * 100
+            if (idx - start_idx) % progress_interval == 0:
+                progress = ((idx - start_idx) / total_candles) * 100
                 logger.info(f"⏳ Progress: {progress:.0f}% ({current_time.strftime('%Y-%m-%d')})")
 
             # Build market state up to current candle
-            sol_market_state = self._build_market_state(sol_data, idx, primary_tf)
-            btc_market_state = self._build_market_state(btc_data, idx, primary_tf)
+            sol_market_state = self._build_market_state(sol_columns, idx, sol_indicator_states)
+            btc_market_state = btc_states.get(candle['timestamp'])
 
             # Skip if we couldn't build market state (data alignment issues)
             if not sol_market_state or not btc_market_state:
@@ -825,7 +862,7 @@ class BacktestEngine:
 
         # Close any remaining open position
         if self.open_position:
-            self._force_close_position(sol_candles[-1], "backtest_end")
+            self._force_close_position(sol_candles[end_idx - 1], "backtest_end")
 
         # Generate final results
         results = self._generate_results()
@@ -929,46 +966,71 @@ class BacktestEngine:
 
         return results
 
-    def _build_market_state(self, data: Dict, current_idx: int, primary_tf: str) -> Dict:
+    def precompute_market_states(self, data: Dict, primary_tf: str = '15m') -> Dict[int, Dict]:
+        """
+        Market state at every primary bar, keyed by bar timestamp
+
+        Used for the BTC reference, which is identical for every symbol in a
+        multi-symbol backtest and so only needs building once.
+        """
+        columns = ColumnarMarketData(data, primary_tf)
+        indicator_states = self._create_indicator_states(columns)
+        states = {}
+        for idx in range(len(columns)):
+            market_state = self._build_market_state(columns, idx, indicator_states)
+            if market_state:
+                states[market_state['timestamp']] = market_state
+        return states
+
+    def _create_indicator_states(self, columns: ColumnarMarketData) -> Dict[str, IndicatorState]:
+        """Create one incremental indicator state per timeframe"""
+        period = 14
+        return {
+            # Keep as many ATR values as a full lookback window produces
+            tf_name: IndicatorState(
+                atr_period=period,
+                ema_periods=(20, 50),
+                rsi_period=period,
+                volume_period=20,
+                atr_history=LOOKBACK_WINDOWS.get(tf_name, DEFAULT_LOOKBACK) - period + 1
+            )
+            for tf_name in columns.timeframes
+        }
+
+    def _build_market_state(self, columns: ColumnarMarketData, current_idx: int,
+                            indicator_states: Dict[str, IndicatorState]) -> Dict:
         """
         Build market state at a specific point in time
 
-        This simulates what the live system would see
+        This simulates what the live system would see. Windows come from the
+        precomputed columnar index, and indicators are advanced incrementally
+        with only the candles that closed since the previous bar.
         """
         # Bounds check
-        if current_idx >= len(data[primary_tf]):
-            logger.warning(f"Index {current_idx} out of bounds for {primary_tf} (len={len(data[primary_tf])})")
+        if current_idx >= len(columns):
+            logger.warning(f"Index {current_idx} out of bounds for {columns.primary_tf} (len={len(columns)})")
             return None
 
         market_state = {
             'timeframes': {},
-            'timestamp': data[primary_tf][current_idx]['timestamp']
+            'timestamp': columns.timestamp_at(current_idx)
         }
 
-        # For each timeframe, get candles up to current point
-        for tf_name, candles in data.items():
-            # Find the matching index for this timeframe
-            current_ts = data[primary_tf][current_idx]['timestamp']
-
-            # Get all candles up to current time
-            tf_candles = [c for c in candles if c['timestamp'] <= current_ts]
+        # For each timeframe, take the lookback window ending at the current bar
+        for tf_name, tf_columns in columns.timeframes.items():
+            start, end = columns.window_bounds(tf_name, current_idx)
 
-            if not tf_candles:
+            if end == 0:
                 continue
 
-            # Take last N candles (lookback window)
-            lookback_map = {
-                '1m': 300,
-                '5m': 300,
-                '15m': 200,
-                '1H': 100,
-                '4H': 100
-            }
-            lookback = lookback_map.get(tf_name, 100)
-            recent_candles = tf_candles[-lookback:] if len(tf_candles) > lookback else tf_candles
+            recent_candles = tf_columns.candles[start:end]
+
+            # Fold in candles that closed since the last bar
+            state = indicator_states[tf_name]
+            if end > state.count:
+                state.update_many(tf_columns.candles[state.count:end])
 
-            # Calculate indicators
-            indicators = self._calculate_indicators(recent_candles)
+            indicators = self._calculate_indicators(state)
 
             market_state['timeframes'][tf_name] = {
                 'candles': recent_candles,
@@ -978,20 +1040,15 @@ class BacktestEngine:
 
         return market_state
 
-    def _calculate_indicators(self, candles: List[Dict]) -> Dict:
-        """Calculate technical indicators for candles"""
-        if len(candles) < 20:
+    def _calculate_indicators(self, state: IndicatorState) -> Dict:
+        """Read technical indicators from a timeframe's incremental state"""
+        if state.count < 20:
             return {}
 
-        closes = [c['close'] for c in candles]
-        highs = [c['high'] for c in candles]
-        lows = [c['low'] for c in candles]
-        volumes = [c['volume'] for c in candles]
-
         indicators = {}
 
-        # ATR - calculate_atr returns single float, calculate_atr_series returns list
-        atr_series = self.indicators.calculate_atr_series(highs, lows, closes, period=14)
+        # ATR - Wilder series kept by the state (last lookback window's worth)
+        atr_series = state.atr_series
         if atr_series:
             # Calculate ATR percentile for compression check
             atr_percentile = self.indicators.calculate_atr_percentile(atr_series[-1], atr_series)
@@ -999,37 +1056,38 @@ class BacktestEngine:
             
             indicators['atr'] = {
                 'atr': atr_series[-1],
-                'atr_previous': atr_series[-2] if len(atr_series) > 1 else atr_series[-1],
+                'atr_previous': state.atr_previous,
                 'atr_series': atr_series,  # Include full series for compression check
                 'atr_percentile': atr_percentile,
                 'is_compressed': is_compressed
             }
 
         # Trend
-        ema_fast = self.indicators.calculate_ema(closes, period=20)
-        ema_slow = self.indicators.calculate_ema(closes, period=50)
+        ema_fast = state.ema(20)
+        ema_slow = state.ema(50)
 
-        if ema_fast and ema_slow:
-            trend_direction = 'up' if ema_fast[-1] > ema_slow[-1] else 'down'
-            trend_strength = abs(ema_fast[-1] - ema_slow[-1]) / ema_slow[-1]
+        if ema_fast is not None and ema_slow is not None:
+            trend_direction = 'up' if ema_fast > ema_slow else 'down'
+            trend_strength = abs(ema_fast - ema_slow) / ema_slow
 
             indicators['trend'] = {
                 'trend_direction': trend_direction,
                 'trend_strength': min(trend_strength * 10, 1.0),  # Normalize to 0-1
-                'ema_20': ema_fast[-1],
-                'ema_50': ema_slow[-1]
+                'ema_20': ema_fast,
+                'ema_50': ema_slow
             }
 
         # Volume
-        avg_volume = sum(volumes[-20:]) / min(20, len(volumes))
+        current_volume = state.current_volume
+        avg_volume = state.average_volume
         indicators['volume'] = {
-            'current_volume': volumes[-1],
+            'current_volume': current_volume,
             'average_volume': avg_volume,
-            'volume_ratio': volumes[-1] / avg_volume if avg_volume > 0 else 1.0
+            'volume_ratio': current_volume / avg_volume if avg_volume > 0 else 1.0
         }
 
         # RSI for momentum
-        rsi = self.indicators.calculate_rsi(closes, period=14)
+        rsi = state.rsi
         indicators['momentum'] = {
             'rsi': rsi if rsi else 50
         }
@@ -1395,7 +1453,7 @@ class BacktestEngine:
         trade = BacktestTrade(
             signal_id=f"{strategy}_{current_time.strftime('%Y%m%d_%H%M%S')}",
             timestamp=current_time,
-            symbol=config.TRADING_SYMBOL,
+            symbol=self.symbol,
             direction=direction,
             strategy=strategy,
             entry_price=signal['entry_price'],
@@ -0,0 +1,165 @@
+"""
+Range-Aware Candle Store
+One append-only candle array per symbol/timeframe plus the time ranges it covers
+
+HistoricalDataLoader used to cache each exact (symbol, timeframe, start, end)
+request in its own file, so shifting a backtest window by a day re-fetched the
+whole range. CandleStore keeps a single sorted .npy array per symbol/timeframe
+and a list of covered [start_ts, end_ts] intervals next to it. A request is
+answered by slicing the local array; only the uncovered gaps are fetched.
+
+Layout (in cache_dir):
+    <SYMBOL>_<tf>.npy           CANDLE_DTYPE array, sorted and deduplicated
+    <SYMBOL>_<tf>.ranges.json   [[start_ts, end_ts], ...] merged, inclusive, ms
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backtesting.columnar_data import CANDLE_DTYPE, CandleArrayView, candles_to_array
+
+logger = logging.getLogger(__name__)
+
+
+Range = Tuple[int, int]
+
+
+def merge_ranges(ranges: List[Range]) -> List[Range]:
+    """Merge overlapping or touching inclusive ranges"""
+    merged: List[List[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def subtract_ranges(start_ts: int, end_ts: int, covered: List[Range]) -> List[Range]:
+    """Parts of [start_ts, end_ts] not inside any covered range"""
+    gaps = []
+    cursor = start_ts
+    for start, end in merge_ranges(covered):
+        if end < cursor:
+            continue
+        if start > end_ts:
+            break
+        if start > cursor:
+            gaps.append((cursor, start - 1))
+        cursor = max(cursor, end + 1)
+    if cursor <= end_ts:
+        gaps.append((cursor, end_ts))
+    return gaps
+
+
+class CandleStore:
+    """
+    Append-only per-symbol/timeframe candle store with coverage tracking
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # (symbol, timeframe) -> (array, covered ranges)
+        self._loaded: Dict[Tuple[str, str], Tuple[np.ndarray, List[Range]]] = {}
+
+    def _paths(self, symbol: str, timeframe: str) -> Tuple[Path, Path]:
+        stem = f"{symbol.replace('-', '_')}_{timeframe}"
+        return self.cache_dir / f"{stem}.npy", self.cache_dir / f"{stem}.ranges.json"
+
+    def _load(self, symbol: str, timeframe: str) -> Tuple[np.ndarray, List[Range]]:
+        key = (symbol, timeframe)
+        if key in self._loaded:
+            return self._loaded[key]
+
+        array_file, ranges_file = self._paths(symbol, timeframe)
+        array = np.empty(0, dtype=CANDLE_DTYPE)
+        ranges: List[Range] = []
+
+        if array_file.exists() and ranges_file.exists():
+            try:
+                loaded = np.load(array_file, mmap_mode='r')
+                with open(ranges_file, 'r') as f:
+                    loaded_ranges = [tuple(r) for r in json.load(f)]
+                if loaded.dtype == CANDLE_DTYPE:
+                    array, ranges = loaded, loaded_ranges
+                else:
+                    logger.warning(f"⚠️  {array_file.name} has invalid structure, ignoring")
+            except (ValueError, OSError, json.JSONDecodeError) as e:
+                logger.warning(f"⚠️  Candle store {array_file.name} corrupted ({e}), ignoring")
+
+        self._loaded[key] = (array, ranges)
+        return array, ranges
+
+    def covered_ranges(self, symbol: str, timeframe: str) -> List[Range]:
+        return list(self._load(symbol, timeframe)[1])
+
+    def missing_ranges(self, symbol: str, timeframe: str,
+                       start_ts: int, end_ts: int) -> List[Range]:
+        """Sub-ranges of [start_ts, end_ts] that still need fetching"""
+        return subtract_ranges(start_ts, end_ts, self._load(symbol, timeframe)[1])
+
+    def get(self, symbol: str, timeframe: str, start_ts: int, end_ts: int) -> CandleArrayView:
+        """Stored candles with start_ts <= timestamp <= end_ts (lazy view of the memory map)"""
+        array, _ = self._load(symbol, timeframe)
+        lo = np.searchsorted(array['timestamp'], start_ts, side='left')
+        hi = np.searchsorted(array['timestamp'], end_ts, side='right')
+        return CandleArrayView(array[lo:hi])
+
+    def add(self, symbol: str, timeframe: str, candles: List[Dict],
+            start_ts: Optional[int], end_ts: Optional[int], replace: bool = False):
+        """
+        Merge fetched candles and mark [start_ts, end_ts] as covered
+
+        Existing candles win on duplicate timestamps unless replace=True
+        (used for force-refresh, where fresh data should overwrite).
+        start_ts=None stores the candles without claiming any coverage.
+        """
+        array, ranges = self._load(symbol, timeframe)
+        new = candles_to_array(candles)
+        covered = start_ts is not None and end_ts is not None
+        if replace and covered:
+            keep = (array['timestamp'] < start_ts) | (array['timestamp'] > end_ts)
+            array = array[keep]
+
+        # Existing rows come first, so np.unique's first index keeps them on duplicates
+        merged = np.concatenate([np.asarray(array), new])
+        merged = merged[np.unique(merged['timestamp'], return_index=True)[1]]
+        if covered:
+            ranges = merge_ranges(ranges + [(start_ts, end_ts)])
+
+        self._write(symbol, timeframe, merged, ranges)
+        self._loaded[(symbol, timeframe)] = (merged, ranges)
+
+    def _write(self, symbol: str, timeframe: str, array: np.ndarray, ranges: List[Range]):
+        array_file, ranges_file = self._paths(symbol, timeframe)
+        tmp_array = array_file.with_name(array_file.name + '.tmp')
+        tmp_ranges = ranges_file.with_name(ranges_file.name + '.tmp')
+        try:
+            with open(tmp_array, 'wb') as f:
+                np.save(f, array)
+            with open(tmp_ranges, 'w') as f:
+                json.dump([list(r) for r in ranges], f)
+            # Array first: a crash in between leaves coverage under-reported, never over
+            os.replace(tmp_array, array_file)
+            os.replace(tmp_ranges, ranges_file)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to save candle store {array_file.name}: {e}")
+            tmp_array.unlink(missing_ok=True)
+            tmp_ranges.unlink(missing_ok=True)
+
+    def clear(self, symbol: str = None) -> int:
+        """Remove stored files (for one symbol or all), returns files removed"""
+        prefix = f"{symbol.replace('-', '_')}_" if symbol else ""
+        files = list(self.cache_dir.glob(f"{prefix}*.npy")) + \
+            list(self.cache_dir.glob(f"{prefix}*.ranges.json"))
+        for file in files:
+            file.unlink()
+        self._loaded.clear()
+        return len(files)
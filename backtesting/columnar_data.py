@@ -0,0 +1,226 @@
+"""
+Columnar Market Data for Backtesting
+Precomputed NumPy representation of historical candles for fast replay
+
+BacktestEngine builds a market state for every primary-timeframe bar. Doing
+that by filtering each timeframe's full candle list makes a backtest O(N²).
+This module converts every timeframe ONCE into column arrays and uses
+np.searchsorted to map each primary bar to its end position in every other
+timeframe, so a lookback window is a slice instead of a rescan.
+
+Usage:
+    columns = ColumnarMarketData(sol_data, primary_tf='15m')
+    start, end = columns.window_bounds('1H', idx)
+    closes = columns['1H'].close[start:end]      # NumPy view, no copy
+    candles = columns.window('1H', idx)          # Candle dicts for strategies
+
+Cached data arrives as CandleArrayView (a memory-mapped CANDLE_DTYPE array
+that looks like a list of candle dicts); ColumnarCandles takes its columns
+straight from the array, and dicts are only built for candles actually read.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Candles of history kept per timeframe when building market state
+LOOKBACK_WINDOWS = {
+    '1m': 300,
+    '5m': 300,
+    '15m': 200,
+    '1H': 100,
+    '4H': 100
+}
+DEFAULT_LOOKBACK = 100
+
+# On-disk / shared-memory candle record (HistoricalDataLoader cache, parallel sweeps)
+CANDLE_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64)
+])
+
+
+def candles_to_array(candles: List[Dict]) -> np.ndarray:
+    """
+    Convert candle dicts to a CANDLE_DTYPE array sorted by timestamp
+
+    Duplicate timestamps keep the first occurrence.
+    """
+    if isinstance(candles, CandleArrayView):
+        return np.array(candles.array)
+
+    array = np.empty(len(candles), dtype=CANDLE_DTYPE)
+    for name in CANDLE_DTYPE.names:
+        array[name] = [c.get(name, 0) for c in candles]
+
+    _, first = np.unique(array['timestamp'], return_index=True)
+    if len(first) < len(array):
+        logger.warning(f"⚠️  Removed {len(array) - len(first)} duplicate candles")
+    # np.unique sorts by timestamp, so indexing by first occurrence also sorts
+    return array[first]
+
+
+def array_to_candles(array: np.ndarray) -> List[Dict]:
+    """Convert a CANDLE_DTYPE array back to candle dicts (plain Python ints/floats)"""
+    columns = [array[name].tolist() for name in CANDLE_DTYPE.names]
+    return [dict(zip(CANDLE_DTYPE.names, row)) for row in zip(*columns)]
+
+
+class CandleArrayView(Sequence):
+    """
+    Read-only list of candle dicts backed by a CANDLE_DTYPE array
+
+    Loading a cache file stays a memory map: a candle's dict is built the
+    first time it is read and then reused, so code that only needs columns
+    (ColumnarCandles, gap checks) never creates any. Slicing returns a plain
+    list, which is what strategies expect for their lookback windows.
+    """
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+        self._rows: List[Dict] = [None] * len(array)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _row(self, index: int) -> Dict:
+        row = self._rows[index]
+        if row is None:
+            row = dict(zip(CANDLE_DTYPE.names, self.array[index].tolist()))
+            self._rows[index] = row
+        return row
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self._rows)))]
+        if index < 0:
+            index += len(self._rows)
+        if not 0 <= index < len(self._rows):
+            raise IndexError('candle index out of range')
+        return self._row(index)
+
+    def __iter__(self):
+        return (self._row(i) for i in range(len(self._rows)))
+
+    def __repr__(self) -> str:
+        return f"CandleArrayView({len(self)} candles)"
+
+
+class ColumnarCandles:
+    """
+    One timeframe's candles as column arrays (oldest first)
+
+    The original candle dicts are kept alongside the arrays because
+    strategies and filters still consume candles as dicts. A CandleArrayView
+    (sorted and deduplicated by CandleStore) is used as-is: the columns come
+    straight from its array.
+    """
+
+    FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, candles: Union[List[Dict], CandleArrayView], timeframe: str = ''):
+        self.timeframe = timeframe
+
+        if isinstance(candles, CandleArrayView):
+            self.candles = candles
+            self.timestamp = np.ascontiguousarray(candles.array['timestamp'])
+            for name in self.FIELDS:
+                setattr(self, name, np.ascontiguousarray(candles.array[name]))
+            return
+
+        timestamps = np.fromiter((c['timestamp'] for c in candles),
+                                 dtype=np.int64, count=len(candles))
+
+        # searchsorted and incremental indicators need strictly ascending timestamps
+        if len(timestamps) > 1 and np.any(np.diff(timestamps) < 0):
+            logger.warning(f"⚠️  {timeframe}: candles not in time order, sorting")
+            order = np.argsort(timestamps, kind='stable')
+            candles = [candles[i] for i in order]
+            timestamps = timestamps[order]
+
+        if len(timestamps) > 1:
+            keep = np.concatenate(([True], np.diff(timestamps) != 0))
+            if not keep.all():
+                logger.warning(f"⚠️  {timeframe}: Removed {int((~keep).sum())} duplicate candles")
+                candles = [c for c, k in zip(candles, keep) if k]
+                timestamps = timestamps[keep]
+
+        self.candles = candles
+        self.timestamp = timestamps
+
+        for name in self.FIELDS:
+            column = np.fromiter((c.get(name, 0.0) for c in candles),
+                                 dtype=np.float64, count=len(candles))
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return len(self.candles)
+
+    def columns(self, start: int, end: int) -> Dict[str, np.ndarray]:
+        """Get column views for candles[start:end]"""
+        return {name: getattr(self, name)[start:end] for name in self.FIELDS}
+
+
+class ColumnarMarketData:
+    """
+    Index-aligned columnar view of one symbol's multi-timeframe data
+
+    end_index[tf][i] is the number of `tf` candles with a timestamp at or
+    before primary bar i, i.e. the exclusive end of the slice the live system
+    would have seen at that moment.
+    """
+
+    def __init__(self, data: Dict[str, List[Dict]], primary_tf: str):
+        self.primary_tf = primary_tf
+        self.timeframes: Dict[str, ColumnarCandles] = {
+            tf: ColumnarCandles(candles, tf) for tf, candles in data.items()
+        }
+
+        primary = self.timeframes.get(primary_tf)
+        primary_ts = primary.timestamp if primary is not None else np.empty(0, dtype=np.int64)
+
+        self.end_index: Dict[str, np.ndarray] = {
+            tf: np.searchsorted(column.timestamp, primary_ts, side='right')
+            for tf, column in self.timeframes.items()
+        }
+
+    def __len__(self) -> int:
+        """Number of primary-timeframe bars"""
+        primary = self.timeframes.get(self.primary_tf)
+        return len(primary) if primary is not None else 0
+
+    def __getitem__(self, timeframe: str) -> ColumnarCandles:
+        return self.timeframes[timeframe]
+
+    @property
+    def primary(self) -> ColumnarCandles:
+        return self.timeframes[self.primary_tf]
+
+    def timestamp_at(self, idx: int) -> int:
+        """Timestamp (ms) of primary bar idx"""
+        return int(self.primary.timestamp[idx])
+
+    def window_bounds(self, timeframe: str, idx: int) -> Tuple[int, int]:
+        """
+        Get [start, end) of the lookback window for a timeframe at primary bar idx
+
+        Returns:
+            (start, end) positions into that timeframe's arrays
+        """
+        end = int(self.end_index[timeframe][idx])
+        lookback = LOOKBACK_WINDOWS.get(timeframe, DEFAULT_LOOKBACK)
+        return max(0, end - lookback), end
+
+    def window(self, timeframe: str, idx: int) -> List[Dict]:
+        """Get the lookback window of candle dicts for a timeframe at primary bar idx"""
+        start, end = self.window_bounds(timeframe, idx)
+        return self.timeframes[timeframe].candles[start:end]
@@ -15,6 +15,8 @@ from typing import Dict, Tuple, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
+from data_feed.indicators import TechnicalIndicators
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,37 +75,12 @@ class ProperRegimeDetector:
         lows = np.array([c['low'] for c in candles])
         closes = np.array([c['close'] for c in candles])
         
-        # True Range
-        tr = np.maximum(
-            highs[1:] - lows[1:],
-            np.maximum(
-                np.abs(highs[1:] - closes[:-1]),
-                np.abs(lows[1:] - closes[:-1])
-            )
-        )
-        
-        # +DM and -DM
-        up_move = highs[1:] - highs[:-1]
-        down_move = lows[:-1] - lows[1:]
-        
-        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
-        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
-        
-        # Smoothed averages (Wilder's smoothing)
-        def smooth(data, period):
-            result = np.zeros(len(data))
-            result[period-1] = np.sum(data[:period])
-            for i in range(period, len(data)):
-                result[i] = result[i-1] - result[i-1]/period + data[i]
-            return result / period
-        
-        atr = smooth(tr, period)
-        plus_di = 100 * smooth(plus_dm, period) / (atr + 1e-10)
-        minus_di = 100 * smooth(minus_dm, period) / (atr + 1e-10)
+        # DX per bar (vectorized); bars before the first full period count as 0
+        dx = TechnicalIndicators.calculate_dx_batch(highs, lows, closes, period)[1:]
+        dx = np.nan_to_num(dx, nan=0.0)
         
-        # DX and ADX
-        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
-        adx = smooth(dx, period)
+        # ADX is Wilder's moving average of DX
+        adx = TechnicalIndicators.calculate_wilder_sum_batch(dx, period) / period
         
         return float(adx[-1]) if len(adx) > 0 and not np.isnan(adx[-1]) else 0
     
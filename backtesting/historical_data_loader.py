@@ -4,7 +4,7 @@ Fetches and caches historical OHLCV data from OKX API
 
 This module:
 - Downloads historical candle data for SOL and BTC
-- Caches data locally to avoid repeated API calls
+- Caches data locally in a range-aware CandleStore, fetching only missing gaps
 - Handles multiple timeframes (1m, 5m, 15m, 1H, 4H)
 - Validates data quality
 - Provides data in format compatible with existing filters
@@ -13,10 +13,13 @@ This module:
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import time
+import numpy as np
 from data_feed.okx_client import OKXClient
+from backtesting.candle_store import CandleStore
+from backtesting.columnar_data import CandleArrayView, array_to_candles
 import config
 
 logger = logging.getLogger(__name__)
@@ -40,6 +43,10 @@ class HistoricalDataLoader:
         # OKXClient reads credentials from config.py directly
         self.client = OKXClient()
 
+        self.store = CandleStore(self.cache_dir)
+        self._legacy_imported = set()
+        self._legacy_marker = self.cache_dir / self.LEGACY_MARKER
+
         self.timeframes = {
             '1m': '1m',
             '5m': '5m',
@@ -81,70 +88,51 @@ class HistoricalDataLoader:
         logger.info(f"   Timeframes: {', '.join(timeframes)}")
 
         data = {}
+        start_ts, end_ts = self._date_range_to_ts(start_date, end_date)
 
         for tf in timeframes:
-            cache_file = self._get_cache_filename(symbol, tf, start_date, end_date)
-
-            # Try to load from cache first
-            if not force_refresh and cache_file.exists():
-                try:
-                    logger.info(f"   ✅ {tf}: Loading from cache")
-                    with open(cache_file, 'r') as f:
-                        cached_data = json.load(f)
-                    
-                    # Validate cache data quality
-                    if isinstance(cached_data, list) and len(cached_data) > 0:
-                        # Check if data looks reasonable (has expected structure)
-                        first_candle = cached_data[0]
-                        if isinstance(first_candle, dict) and 'timestamp' in first_candle:
-                            # Deduplicate cached data (in case cache has duplicates)
-                            seen_timestamps = set()
-                            unique_cached = []
-                            for candle in cached_data:
-                                if candle.get('timestamp') not in seen_timestamps:
-                                    seen_timestamps.add(candle['timestamp'])
-                                    unique_cached.append(candle)
-                            
-                            if len(unique_cached) < len(cached_data):
-                                logger.warning(f"   ⚠️  {tf}: Removed {len(cached_data) - len(unique_cached)} duplicates from cache")
-                            
-                            data[tf] = unique_cached
-                            logger.info(f"      Loaded {len(unique_cached)} unique candles from cache")
-                        else:
-                            logger.warning(f"   ⚠️  {tf}: Cache file has invalid structure, fetching fresh data")
-                            force_refresh = True
-                    else:
-                        logger.warning(f"   ⚠️  {tf}: Cache file is empty, fetching fresh data")
-                        force_refresh = True
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"   ⚠️  {tf}: Cache file corrupted ({e}), fetching fresh data")
-                    force_refresh = True
-            
-            if force_refresh or tf not in data:
-                # Fetch from API
-                logger.info(f"   📡 {tf}: Fetching from OKX API...")
-                candles = self._fetch_candles(symbol, tf, start_date, end_date)
-
+            if force_refresh:
+                logger.info(f"   📡 {tf}: Force refresh, fetching from OKX API...")
+                candles, covered_from = self._fetch_range(symbol, tf, start_ts, end_ts)
                 if candles:
-                    data[tf] = candles
-                    # Cache the data
-                    self._save_to_cache(cache_file, candles)
-                    logger.info(f"   ✅ {tf}: Fetched {len(candles)} candles")
-                else:
-                    # For 4H and 1H timeframes, if no data (common for recent data),
-                    # fall back to using 15m data aggregated or skip gracefully
-                    if tf in ['4H', '1H']:
-                        logger.warning(f"   ⚠️  {tf}: No data available (may be too recent for completed candles)")
-                        logger.warning(f"      Falling back to 15m data for this timeframe")
-                        # Use 15m data as fallback - the filters will handle missing HTF data
-                        if '15m' in data and data['15m']:
-                            data[tf] = data['15m']  # Use 15m candles as fallback
-                            logger.info(f"      Using {len(data[tf])} candles from 15m as fallback")
-                        else:
-                            data[tf] = []
+                    self.store.add(symbol, tf, candles, covered_from,
+                                   end_ts if covered_from is not None else None, replace=True)
+            else:
+                self._import_legacy_cache(symbol, tf)
+                gaps = self._fetchable_gaps(symbol, tf, start_ts, end_ts)
+                if not gaps:
+                    logger.info(f"   ✅ {tf}: Fully cached")
+                for gap_start, gap_end in gaps:
+                    logger.info(f"   📡 {tf}: Fetching missing range "
+                                f"{datetime.fromtimestamp(gap_start / 1000)} to "
+                                f"{datetime.fromtimestamp(gap_end / 1000)}")
+                    candles, covered_from = self._fetch_range(symbol, tf, gap_start, gap_end)
+                    # Only the span pagination actually walked is marked covered; an
+                    # empty or truncated fetch leaves the rest of the gap for next time
+                    if candles:
+                        self.store.add(symbol, tf, candles, covered_from,
+                                       gap_end if covered_from is not None else None)
+
+            candles = self.store.get(symbol, tf, start_ts, end_ts)
+
+            if candles:
+                data[tf] = candles
+                logger.info(f"   ✅ {tf}: {len(candles)} candles")
+            else:
+                # For 4H and 1H timeframes, if no data (common for recent data),
+                # fall back to using 15m data aggregated or skip gracefully
+                if tf in ['4H', '1H']:
+                    logger.warning(f"   ⚠️  {tf}: No data available (may be too recent for completed candles)")
+                    logger.warning(f"      Falling back to 15m data for this timeframe")
+                    # Use 15m data as fallback - the filters will handle missing HTF data
+                    if '15m' in data and data['15m']:
+                        data[tf] = data['15m']  # Use 15m candles as fallback
+                        logger.info(f"      Using {len(data[tf])} candles from 15m as fallback")
                     else:
-                        logger.error(f"   ❌ {tf}: Failed to fetch data")
                         data[tf] = []
+                else:
+                    logger.error(f"   ❌ {tf}: Failed to fetch data")
+                    data[tf] = []
 
         # Log detailed information about loaded data
         logger.info(f"\n📊 Data Loading Summary for {symbol}:")
@@ -295,11 +283,21 @@ class HistoricalDataLoader:
         of date parameters, so it's not suitable for backtesting.
         
         Pagination logic:
-        - Start with before = end_ts + 1 day (to ensure we get end_date data)
-        - Call get_history_candles with 'before' parameter
-        - Update 'before' to oldest timestamp from each batch
+        - Start with after = end_ts + 1 (to ensure we get end_date data)
+        - Call get_history_candles with 'after' parameter
+        - Update 'after' to oldest timestamp from each batch
         - Stop when oldest_timestamp <= start_ts
         """
+        start_ts, end_ts = self._date_range_to_ts(start_date, end_date)
+        return self._fetch_candles_between(symbol, timeframe, start_ts, end_ts)
+
+    def _date_range_to_ts(self, start_date: str, end_date: str):
+        """
+        Convert a 'YYYY-MM-DD' date range to inclusive millisecond timestamps
+
+        end_date is capped at the end of yesterday, since today's candles
+        might not be complete.
+        """
         start_dt = datetime.strptime(start_date, '%Y-%m-%d')
         end_dt = datetime.strptime(end_date, '%Y-%m-%d')
         
@@ -311,16 +309,31 @@ class HistoricalDataLoader:
             end_dt = end_dt.replace(hour=23, minute=59, second=59)  # End of yesterday
         
         # Convert to milliseconds
-        end_ts = int(end_dt.timestamp() * 1000)
-        start_ts = int(start_dt.timestamp() * 1000)
-        
-        logger.info(f"   Adjusted date range: {start_date} to {end_dt.strftime('%Y-%m-%d')}")
-        
+        return int(start_dt.timestamp() * 1000), int(end_dt.timestamp() * 1000)
+
+    def _fetch_candles_between(self, symbol: str, timeframe: str,
+                               start_ts: int, end_ts: int) -> List[Dict]:
+        """Fetch candles with start_ts <= timestamp <= end_ts (see _fetch_range)"""
+        return self._fetch_range(symbol, timeframe, start_ts, end_ts)[0]
+
+    def _fetch_range(self, symbol: str, timeframe: str,
+                     start_ts: int, end_ts: int) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Fetch candles with start_ts <= timestamp <= end_ts from the history-candles endpoint
+
+        Pagination starts just after end_ts and walks backwards with 'after',
+        so fetching an old gap does not page through everything newer first.
+
+        Returns:
+            (candles, covered_from): [covered_from, end_ts] is the span the
+            pages really walked - start_ts when pagination reached it, the
+            oldest candle when it stopped early (call limit, error, end of
+            history), None when nothing usable was paged (latest-candles fallback)
+        """
         # CRITICAL FIX: Use 'after' parameter to paginate backwards (get older data)
         # OKX API: 'after' returns records OLDER than the timestamp
-        # Strategy: Start with most recent data, then use 'after' to go backwards
         
-        logger.info(f"   Fetching {timeframe} HISTORY data from {start_date} to {end_date}")
+        logger.info(f"   Fetching {timeframe} HISTORY data")
         logger.info(f"   Using history-candles endpoint with 'after' pagination (backwards)")
         logger.info(f"   Start timestamp: {datetime.fromtimestamp(start_ts/1000)}")
         logger.info(f"   End timestamp: {datetime.fromtimestamp(end_ts/1000)}")
@@ -329,49 +342,40 @@ class HistoricalDataLoader:
         max_calls = 100  # Safety limit to prevent infinite loops
         call_count = 0
         
-        # Strategy: First get most recent candles (without 'after'), then paginate backwards
-        # This ensures we get data up to end_ts
-        current_after = None  # Start with None to get most recent data first
+        # Start just after end_ts so the first page ends at end_ts
+        current_after = end_ts + 1
+        first_call = True
+        used_fallback = False
+        reached_start = False
         
         while call_count < max_calls:
             call_count += 1
             
             try:
-                # First call: Get most recent candles (no 'after' parameter)
-                # Subsequent calls: Use 'after' to get older candles
                 # CRITICAL: Force history-candles endpoint for ALL backtesting calls
-                if current_after is None:
-                    logger.info(f"   Call {call_count}: Getting most recent candles (no 'after' parameter)")
-                    logger.info(f"      This will get the latest available candles from OKX")
-                    candles = self.client.get_history_candles(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        after=None,  # No 'after' = get most recent
-                        limit=100,
-                        force_history_endpoint=True  # Force history endpoint for backtesting
-                    )
-                    
-                    # If first call returns no data, try with regular candles endpoint as fallback
-                    if (not candles or len(candles) == 0) and call_count == 1:
-                        logger.warning(f"   ⚠️  First call returned no data, trying regular candles endpoint as fallback...")
-                        candles_fallback = self.client.get_candles(
-                            symbol=symbol,
-                            timeframe=timeframe,
-                            limit=100
-                        )
-                        if candles_fallback:
-                            logger.info(f"   ✅ Fallback worked! Got {len(candles_fallback)} candles from regular endpoint")
-                            candles = candles_fallback
-                else:
-                    logger.info(f"   Call {call_count}: Requesting candles after (older than) timestamp: {current_after} "
-                               f"({datetime.fromtimestamp(current_after/1000)})")
-                    candles = self.client.get_history_candles(
+                logger.info(f"   Call {call_count}: Requesting candles after (older than) timestamp: {current_after} "
+                           f"({datetime.fromtimestamp(current_after/1000)})")
+                candles = self.client.get_history_candles(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    after=str(current_after),  # 'after' gets OLDER data
+                    limit=100,  # history-candles max is 100
+                    force_history_endpoint=True  # Force history endpoint for backtesting
+                )
+                
+                # If first call returns no data, try with regular candles endpoint as fallback
+                if (not candles or len(candles) == 0) and first_call:
+                    logger.warning(f"   ⚠️  First call returned no data, trying regular candles endpoint as fallback...")
+                    candles_fallback = self.client.get_candles(
                         symbol=symbol,
                         timeframe=timeframe,
-                        after=str(current_after),  # 'after' gets OLDER data
-                        limit=100,  # history-candles max is 100
-                        force_history_endpoint=True  # Force history endpoint for backtesting
+                        limit=100
                     )
+                    if candles_fallback:
+                        logger.info(f"   ✅ Fallback worked! Got {len(candles_fallback)} candles from regular endpoint")
+                        candles = candles_fallback
+                        used_fallback = True
+                first_call = False
                 
                 if not candles or len(candles) == 0:
                     if call_count == 1:
@@ -415,7 +419,12 @@ class HistoricalDataLoader:
                 
                 # Stop if we've reached or passed the start date
                 if oldest_ts <= start_ts:
-                    logger.info(f"   ✅ Reached start date ({start_date}), stopping pagination")
+                    logger.info(f"   ✅ Reached start timestamp, stopping pagination")
+                    reached_start = True
+                    break
+                
+                # The latest-candles fallback is one page, not a walk back to start_ts
+                if used_fallback:
                     break
                 
                 # Move 'after' cursor to oldest timestamp for next iteration
@@ -457,22 +466,97 @@ class HistoricalDataLoader:
             last_ts = datetime.fromtimestamp(unique_candles[-1]['timestamp'] / 1000)
             logger.info(f"   Data range: {first_ts.strftime('%Y-%m-%d %H:%M')} to {last_ts.strftime('%Y-%m-%d %H:%M')}")
         
-        return unique_candles
+        if used_fallback or not all_candles:
+            covered_from = None
+        elif reached_start:
+            covered_from = start_ts
+        else:
+            covered_from = min(c['timestamp'] for c in all_candles)
+            logger.warning(f"   ⚠️  Pagination stopped before the start "
+                           f"({datetime.fromtimestamp(covered_from / 1000)}); the rest stays uncached")
+        
+        return unique_candles, covered_from
 
-    def _get_cache_filename(self, symbol: str, timeframe: str,
-                           start_date: str, end_date: str) -> Path:
-        """Generate cache filename"""
-        safe_symbol = symbol.replace('-', '_')
-        filename = f"{safe_symbol}_{timeframe}_{start_date}_{end_date}.json"
-        return self.cache_dir / filename
+    # Minutes per candle, used to skip gaps too short to hold a candle
+    TIMEFRAME_MINUTES = {'1m': 1, '5m': 5, '15m': 15, '1H': 60, '4H': 240}
+
+    def _fetchable_gaps(self, symbol: str, timeframe: str,
+                        start_ts: int, end_ts: int) -> List:
+        """
+        Uncovered parts of [start_ts, end_ts] that can contain a candle
 
-    def _save_to_cache(self, cache_file: Path, data: List[Dict]):
-        """Save data to cache file"""
+        Candle timestamps are multiples of the timeframe, so a gap with no
+        multiple inside it (e.g. the tail between the last candle and end_ts)
+        is skipped instead of costing an API call.
+        """
+        gaps = self.store.missing_ranges(symbol, timeframe, start_ts, end_ts)
+        minutes = self.TIMEFRAME_MINUTES.get(timeframe)
+        if not minutes:
+            return gaps
+
+        step = minutes * 60 * 1000
+        return [(gs, ge) for gs, ge in gaps if -(-gs // step) * step <= ge]
+
+    # Legacy files already merged into the store: {file name: size in bytes}
+    LEGACY_MARKER = 'legacy_imported.json'
+
+    def _load_legacy_marker(self) -> Dict[str, int]:
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.warning(f"⚠️  Failed to save cache: {e}")
+            with open(self._legacy_marker, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_legacy_marker(self, imported: Dict[str, int]):
+        try:
+            with open(self._legacy_marker, 'w') as f:
+                json.dump(imported, f, indent=1, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"   ⚠️  Could not record imported legacy cache files: {e}")
+
+    def _import_legacy_cache(self, symbol: str, timeframe: str):
+        """
+        Fold per-request cache files into the CandleStore
+
+        Older versions wrote one file per (symbol, timeframe, start, end) as
+        JSON or .npy. Each is merged into the store, covering the span of the
+        candles it holds. The files are left in place (some are tracked in
+        git); the marker file records which were imported so each is read once.
+        """
+        if (symbol, timeframe) in self._legacy_imported:
+            return
+        self._legacy_imported.add((symbol, timeframe))
+
+        imported = self._load_legacy_marker()
+        changed = False
+        safe_symbol = symbol.replace('-', '_')
+        for legacy_file in sorted(self.cache_dir.glob(f"{safe_symbol}_{timeframe}_*_*.*")):
+            if legacy_file.suffix not in ('.json', '.npy'):
+                continue
+            size = legacy_file.stat().st_size
+            if imported.get(legacy_file.name) == size:
+                continue
+            try:
+                if legacy_file.suffix == '.json':
+                    with open(legacy_file, 'r') as f:
+                        candles = json.load(f)
+                    if not isinstance(candles, list) or (candles and 'timestamp' not in candles[0]):
+                        raise ValueError("unexpected structure")
+                else:
+                    candles = array_to_candles(np.load(legacy_file))
+            except (json.JSONDecodeError, ValueError, OSError) as e:
+                logger.warning(f"   ⚠️  Legacy cache {legacy_file.name} unreadable ({e}), ignoring")
+                continue
+
+            if candles:
+                timestamps = [c['timestamp'] for c in candles]
+                self.store.add(symbol, timeframe, candles, min(timestamps), max(timestamps))
+            imported[legacy_file.name] = size
+            changed = True
+            logger.info(f"   🔄 Imported {legacy_file.name} into candle store")
+
+        if changed:
+            self._save_legacy_marker(imported)
 
     def _validate_data(self, data: Dict, start_date: str, end_date: str):
         """
@@ -517,6 +601,14 @@ class HistoricalDataLoader:
         gaps = []
         expected_gap_ms = candle_minutes * 60 * 1000
 
+        if isinstance(candles, CandleArrayView):
+            # Check the timestamp column without building candle dicts
+            timestamps = candles.array['timestamp']
+            for i in np.flatnonzero(np.diff(timestamps) > expected_gap_ms * 1.5) + 1:
+                gap_time = datetime.fromtimestamp(int(timestamps[i]) / 1000)
+                gaps.append(f"{gap_time.strftime('%Y-%m-%d %H:%M')}")
+            return gaps
+
         for i in range(1, len(candles)):
             actual_gap = candles[i]['timestamp'] - candles[i-1]['timestamp']
             if actual_gap > expected_gap_ms * 1.5:  # Allow 50% tolerance
@@ -532,21 +624,25 @@ class HistoricalDataLoader:
         Args:
             symbol: If provided, only clear cache for this symbol
         """
-        if symbol:
-            safe_symbol = symbol.replace('-', '_')
-            pattern = f"{safe_symbol}_*.json"
-            files = list(self.cache_dir.glob(pattern))
-        else:
-            files = list(self.cache_dir.glob("*.json"))
+        removed = self.store.clear(symbol)
 
-        for file in files:
+        prefix = f"{symbol.replace('-', '_')}_" if symbol else ""
+        legacy_files = [f for f in self.cache_dir.glob(f"{prefix}*.json") if f.name != self.LEGACY_MARKER]
+        for file in legacy_files:
             file.unlink()
+        # The store no longer holds these symbols, so their legacy files must be re-imported
+        imported = self._load_legacy_marker()
+        if imported:
+            self._save_legacy_marker({name: size for name, size in imported.items()
+                                      if not name.startswith(prefix)})
+        self._legacy_imported.clear()
 
-        logger.info(f"🗑️  Cleared {len(files)} cache files")
+        logger.info(f"🗑️  Cleared {removed + len(legacy_files)} cache files")
 
     def get_cache_info(self) -> Dict:
         """Get information about cached data"""
-        cache_files = list(self.cache_dir.glob("*.json"))
+        cache_files = [f for suffix in ('npy', 'json') for f in self.cache_dir.glob(f"*.{suffix}")
+                       if f.name != self.LEGACY_MARKER]
 
         info = {
             'total_files': len(cache_files),
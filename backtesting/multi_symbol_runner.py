@@ -0,0 +1,247 @@
+"""
+Multi-Symbol Backtest Runner
+Backtests the same strategy and filter stack across a basket of symbols
+
+Candles for every symbol are written once to a SharedCandleStore and each
+symbol runs in its own BacktestEngine (equal share of the capital) on a
+process pool. Each worker builds the BTC reference market states once and
+reuses them for every symbol it is handed, instead of every engine rebuilding
+BTC columns and indicators. Per-symbol results are merged into one portfolio
+result in BacktestEngine._generate_results format, with an equity curve and
+drawdown computed (NumPy) over every symbol's closed trades in time order.
+
+Usage:
+    runner = MultiSymbolBacktestRunner(initial_capital=10000, workers=4)
+    results = runner.run({'SOL-USDT-SWAP': sol_data, 'ETH-USDT-SWAP': eth_data},
+                         btc_data, '2024-01-01', '2024-03-31')
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backtesting.backtest_engine import BacktestEngine
+from backtesting.parallel_sweep import SharedCandleStore, resolve_workers
+
+logger = logging.getLogger(__name__)
+
+# Store key for the BTC reference data (symbols use their own names)
+REFERENCE_KEY = '_reference'
+
+
+class _SymbolWorker:
+    """
+    Runs per-symbol backtests; BTC reference states are built on first use
+    """
+
+    def __init__(self, load: Callable[[str], Dict], primary_tf: str):
+        self.load = load
+        self.primary_tf = primary_tf
+        self.reference_data: Optional[Dict] = None
+        self.reference_states: Optional[Dict[int, Dict]] = None
+
+    def run_symbol(self, symbol: str, capital: float, start_date: str, end_date: str,
+                   engine_factory: Optional[Callable] = None) -> Dict:
+        engine = engine_factory(capital) if engine_factory else BacktestEngine(initial_capital=capital)
+        engine.symbol = symbol
+
+        if self.reference_states is None:
+            self.reference_data = self.load(REFERENCE_KEY)
+            self.reference_states = engine.precompute_market_states(self.reference_data, self.primary_tf)
+
+        return engine.run(self.load(symbol), self.reference_data, start_date, end_date,
+                          btc_states=self.reference_states)
+
+
+# Set once per worker process by _init_worker
+_worker: Optional[_SymbolWorker] = None
+
+
+def _init_worker(store_root: str, primary_tf: str):
+    global _worker
+    store = SharedCandleStore(root=store_root)
+    _worker = _SymbolWorker(store.load, primary_tf)
+
+
+def _run_symbol_task(symbol: str, capital: float, start_date: str, end_date: str,
+                     engine_factory: Optional[Callable]) -> Tuple[str, Optional[Dict]]:
+    try:
+        return symbol, _worker.run_symbol(symbol, capital, start_date, end_date, engine_factory)
+    except Exception as e:
+        logger.error(f"❌ Backtest for {symbol} failed: {e}")
+        return symbol, None
+
+
+class MultiSymbolBacktestRunner:
+    """
+    Runs one strategy/filter stack over several symbols and merges the results
+    """
+
+    def __init__(self, initial_capital: float = 10000.0, workers: int = 0,
+                 primary_tf: str = '15m', engine_factory: Optional[Callable] = None):
+        """
+        Args:
+            initial_capital: Portfolio capital, split equally between symbols
+            workers: Processes (0 = CPU count, 1 = run in this process)
+            primary_tf: Iteration timeframe (must match BacktestEngine.run)
+            engine_factory: Optional picklable engine_factory(capital) -> BacktestEngine
+        """
+        self.initial_capital = initial_capital
+        self.workers = workers
+        self.primary_tf = primary_tf
+        self.engine_factory = engine_factory
+
+    def run(self, symbol_data: Dict[str, Dict], btc_data: Dict,
+            start_date: str, end_date: str) -> Dict:
+        """
+        Backtest every symbol and merge into a portfolio result
+
+        Args:
+            symbol_data: {symbol: {timeframe: [candles]}}
+            btc_data: BTC reference data (all timeframes)
+            start_date / end_date: 'YYYY-MM-DD'
+
+        Returns:
+            _generate_results-format dict for the whole portfolio, plus
+            'by_symbol' (per-symbol results without trades) and 'equity_curve'
+        """
+        symbols = [symbol for symbol, data in symbol_data.items() if data.get(self.primary_tf)]
+        skipped = set(symbol_data) - set(symbols)
+        if skipped:
+            logger.warning(f"⚠️  No {self.primary_tf} data for {', '.join(sorted(skipped))}, skipping")
+        if not symbols:
+            logger.error("❌ No symbol data available for backtesting")
+            return merge_results({}, self.initial_capital, start_date, end_date)
+
+        capital = self.initial_capital / len(symbols)
+        workers = min(resolve_workers(self.workers), len(symbols))
+        logger.info(f"🚀 Multi-symbol backtest: {len(symbols)} symbols, "
+                    f"${capital:,.2f} each, {workers} worker(s)")
+
+        if workers == 1:
+            local = {REFERENCE_KEY: btc_data, **symbol_data}
+            worker = _SymbolWorker(local.__getitem__, self.primary_tf)
+            by_symbol = {}
+            for symbol in symbols:
+                try:
+                    by_symbol[symbol] = worker.run_symbol(symbol, capital, start_date, end_date,
+                                                          self.engine_factory)
+                except Exception as e:
+                    logger.error(f"❌ Backtest for {symbol} failed: {e}")
+        else:
+            by_symbol = self._run_parallel(symbols, symbol_data, btc_data, capital,
+                                           start_date, end_date, workers)
+
+        results = merge_results({s: by_symbol[s] for s in symbols if by_symbol.get(s)},
+                                self.initial_capital, start_date, end_date)
+        summary = results['summary']
+        logger.info(f"✅ Portfolio: ${summary['total_pnl']:+,.2f} ({summary['total_return_pct']:+.2f}%), "
+                    f"max DD {summary['max_drawdown_pct']:.2f}%, {results['trades']['total_trades']} trades")
+        return results
+
+    def _run_parallel(self, symbols: List[str], symbol_data: Dict[str, Dict], btc_data: Dict,
+                      capital: float, start_date: str, end_date: str, workers: int) -> Dict[str, Dict]:
+        store_data = {REFERENCE_KEY: btc_data}
+        store_data.update({symbol: symbol_data[symbol] for symbol in symbols})
+        by_symbol = {}
+        with SharedCandleStore(store_data) as store:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(str(store.root), self.primary_tf)) as pool:
+                futures = [pool.submit(_run_symbol_task, symbol, capital, start_date, end_date,
+                                       self.engine_factory)
+                           for symbol in symbols]
+                for future in as_completed(futures):
+                    symbol, result = future.result()
+                    by_symbol[symbol] = result
+                    if result:
+                        logger.info(f"   {symbol}: {result['trades']['total_trades']} trades, "
+                                    f"${result['summary']['total_pnl']:+,.2f}")
+        return by_symbol
+
+
+def merge_results(by_symbol: Dict[str, Dict], initial_capital: float,
+                  start_date: str, end_date: str) -> Dict:
+    """
+    Merge per-symbol backtest results into one portfolio result
+
+    Counts and PnL are summed. Drawdown comes from the combined equity curve:
+    every executed trade's PnL applied at its exit time, all symbols together.
+    """
+    trades = sorted((t for r in by_symbol.values() for t in r['all_trades']),
+                    key=lambda t: t.timestamp)
+    executed = [t for t in trades if t.executed]
+    wins = [t for t in executed if t.win]
+    losses = [t for t in executed if not t.win and t.pnl_dollar < 0]
+
+    closed = sorted((t for t in executed if t.exit_timestamp), key=lambda t: t.exit_timestamp)
+    pnl = np.array([t.pnl_dollar for t in closed], dtype=float)
+    equity = initial_capital + np.cumsum(pnl)
+    peaks = np.maximum.accumulate(np.concatenate(([initial_capital], equity)))[1:]
+    max_drawdown = float(np.max((peaks - equity) / peaks)) if len(equity) else 0.0
+    total_pnl = float(pnl.sum())
+    final_capital = initial_capital + total_pnl
+
+    def total(section: str, key: str) -> float:
+        return sum(r[section][key] for r in by_symbol.values())
+
+    total_signals = total('signals', 'total_signals')
+    passed_filters = total('signals', 'signals_passed_filters')
+
+    filter_rejections = {}
+    for result in by_symbol.values():
+        for name, count in result.get('filter_rejections', {}).items():
+            filter_rejections[name] = filter_rejections.get(name, 0) + count
+
+    summaries = [r['summary'] for r in by_symbol.values()]
+    results = {
+        'summary': {
+            'initial_capital': initial_capital,
+            'final_capital': final_capital,
+            'total_pnl': total_pnl,
+            'total_return_pct': total_pnl / initial_capital * 100 if initial_capital else 0,
+            'max_drawdown_pct': max_drawdown * 100,
+            'requested_start_date': start_date,
+            'requested_end_date': end_date,
+            'actual_start_date': min((s['actual_start_date'] for s in summaries), default=start_date),
+            'actual_end_date': max((s['actual_end_date'] for s in summaries), default=end_date),
+            'symbols': list(by_symbol),
+        },
+        'signals': {
+            'total_signals': total_signals,
+            'signals_passed_filters': passed_filters,
+            'signals_rejected': total('signals', 'signals_rejected'),
+            'filter_pass_rate': (passed_filters / total_signals * 100) if total_signals > 0 else 0
+        },
+        'trades': {
+            'total_trades': len(executed),
+            'wins': len(wins),
+            'losses': len(losses),
+            'breakevens': total('trades', 'breakevens'),
+            'win_rate': (len(wins) / len(executed) * 100) if executed else 0,
+        },
+        'performance': {},
+        'filter_rejections': filter_rejections,
+        'all_trades': trades,
+        'equity_curve': [(t.exit_timestamp, float(e)) for t, e in zip(closed, equity)],
+        # Per-symbol sections (trades are in all_trades, tagged with their symbol)
+        'by_symbol': {symbol: {k: v for k, v in r.items() if k != 'all_trades'}
+                      for symbol, r in by_symbol.items()}
+    }
+
+    if wins:
+        results['performance']['avg_win'] = sum(t.pnl_dollar for t in wins) / len(wins)
+        results['performance']['avg_win_pct'] = sum(t.pnl_percent for t in wins) / len(wins) * 100
+        results['performance']['largest_win'] = max(t.pnl_dollar for t in wins)
+
+    if losses:
+        results['performance']['avg_loss'] = sum(t.pnl_dollar for t in losses) / len(losses)
+        results['performance']['avg_loss_pct'] = sum(t.pnl_percent for t in losses) / len(losses) * 100
+        results['performance']['largest_loss'] = min(t.pnl_dollar for t in losses)
+
+    if wins and losses:
+        results['performance']['profit_factor'] = abs(sum(t.pnl_dollar for t in wins) /
+                                                     sum(t.pnl_dollar for t in losses))
+
+    return results
@@ -0,0 +1,138 @@
+"""
+Parallel Parameter Sweep
+Runs backtest parameter variations across a process pool
+
+Candle data is loaded once by the parent and written to a directory of
+memory-mapped .npy arrays (one structured array per symbol/timeframe).
+Each worker maps those files read-only when it starts, rebuilds the candle
+dicts once, and then runs one BacktestEngine per variation it is handed.
+Results are yielded as they finish so callers can persist them immediately.
+
+Usage:
+    with SharedCandleStore({'SOL': sol_data, 'BTC': btc_data}) as store:
+        for name, params, result in run_parallel_sweep(store, variations, ...):
+            ...
+"""
+
+import os
+import logging
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from backtesting.columnar_data import CandleArrayView, candles_to_array
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCandleStore:
+    """
+    Read-only, memory-mapped candle arrays shared between processes
+
+    Layout: <root>/<key>/<timeframe>.npy
+    """
+
+    def __init__(self, data: Optional[Dict[str, Dict[str, List[Dict]]]] = None,
+                 root: Optional[str] = None):
+        """
+        Args:
+            data: {key: {timeframe: [candles]}} to write, or None to open an existing store
+            root: Store directory (default: new temp directory, removed on close)
+        """
+        self._owns_root = root is None
+        self.root = Path(root) if root else Path(tempfile.mkdtemp(prefix='sweep_candles_'))
+
+        if data is not None:
+            for key, timeframes in data.items():
+                for tf, candles in timeframes.items():
+                    self._write(key, tf, candles)
+
+    def _write(self, key: str, timeframe: str, candles: List[Dict]):
+        array = candles_to_array(candles)
+        path = self.root / key / f"{timeframe}.npy"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, array)
+
+    def keys(self) -> List[str]:
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def load(self, key: str) -> Dict[str, List[Dict]]:
+        """Map a key's arrays read-only as {timeframe: CandleArrayView}"""
+        data = {}
+        for path in sorted((self.root / key).glob('*.npy')):
+            data[path.stem] = CandleArrayView(np.load(path, mmap_mode='r'))
+        return data
+
+    def close(self):
+        """Remove the store if it was created in a temp directory"""
+        if self._owns_root:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =====================================
+# WORKER SIDE
+# =====================================
+
+# Set once per worker process by _init_worker
+_worker_data: Dict[str, Dict[str, List[Dict]]] = {}
+_worker_backtest: Optional[Callable] = None
+
+
+def _init_worker(store_root: str, backtest_fn: Callable):
+    global _worker_data, _worker_backtest
+    store = SharedCandleStore(root=store_root)
+    _worker_data = {key: store.load(key) for key in store.keys()}
+    _worker_backtest = backtest_fn
+
+
+def _run_task(name: str, params: Dict, kwargs: Dict) -> Tuple[str, Dict, Optional[Dict]]:
+    try:
+        return name, params, _worker_backtest(params, _worker_data, **kwargs)
+    except Exception as e:
+        logger.error(f"❌ Sweep variation {name} failed: {e}")
+        return name, params, None
+
+
+def resolve_workers(workers: int) -> int:
+    """0 or negative means one worker per CPU core"""
+    if workers and workers > 0:
+        return workers
+    return os.cpu_count() or 1
+
+
+def run_parallel_sweep(store: SharedCandleStore, variations: List[Tuple[str, Dict]],
+                       backtest_fn: Callable, workers: int = 0,
+                       **kwargs) -> Iterator[Tuple[str, Dict, Optional[Dict]]]:
+    """
+    Run variations across a process pool, yielding results as they finish
+
+    Args:
+        store: Shared candle data
+        variations: [(name, params)]
+        backtest_fn: Picklable module-level function
+            backtest_fn(params, data, **kwargs) -> result or None,
+            where data is {key: {timeframe: [candles]}} from the store
+        workers: Number of processes (0 = CPU count)
+        **kwargs: Extra arguments passed to backtest_fn
+
+    Yields:
+        (name, params, result) in completion order; result is None on failure
+    """
+    workers = min(resolve_workers(workers), max(1, len(variations)))
+    logger.info(f"⚡ Parallel sweep: {len(variations)} variations on {workers} workers")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(str(store.root), backtest_fn)) as pool:
+        futures = [pool.submit(_run_task, name, params, kwargs) for name, params in variations]
+        for future in as_completed(futures):
+            yield future.result()
@@ -24,6 +24,11 @@ DASHBOARD_ENABLED = True
 DASHBOARD_HOST = '0.0.0.0'
 DASHBOARD_PORT = 8080
 DASHBOARD_SECRET_KEY = os.getenv('DASHBOARD_SECRET_KEY', 'supequant-dashboard-2026')
+DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS = 5  # /api/live serves OKX snapshots up to this old (one refresh per window)
+DASHBOARD_LOOP_SNAPSHOT_MAX_AGE_SECONDS = 60  # While the trading loop feeds /api/live, refresh from OKX only past this age
+DASHBOARD_STREAM_KEEPALIVE_SECONDS = 15  # /api/stream comment line after this much silence
+DASHBOARD_STREAM_HISTORY = 256  # Events kept for EventSource Last-Event-ID replay
+RISK_DASHBOARD_CASH_FLOW_THRESHOLD_PCT = 2.0  # Balance moves this large (% of balance) not explained by closed trades count as deposits/withdrawals
 
 # =====================================
 # TRADING PARAMETERS
@@ -39,6 +44,13 @@ SPOT_SYMBOL = "SOL-USDT"  # Spot trading symbol for fallback
 MAX_DAILY_TRADES = 10  # Increased from 5
 TRADE_INTERVAL_MINUTES = 30  # Reduced from 60 - trade more often
 
+# Portfolio mode: scan several perpetuals per cycle (BTC reference data shared)
+PORTFOLIO_MODE = os.getenv('PORTFOLIO_MODE', 'False').lower() == 'true'
+PORTFOLIO_SYMBOLS = [TRADING_SYMBOL, "ETH-USDT-SWAP", "BTC-USDT-SWAP"]
+PORTFOLIO_MAX_WORKERS = 4  # Symbols evaluated concurrently (strategies + filters)
+PORTFOLIO_MAX_POSITIONS_PER_SYMBOL = 1  # Open positions allowed on one symbol
+PORTFOLIO_MAX_TOTAL_RISK_PCT = 0.06  # Combined stop-loss risk of all open positions (fraction of account)
+
 # =====================================
 # RISK MANAGEMENT
 # =====================================
@@ -158,6 +170,12 @@ ADAPTIVE_THRESHOLD_SPEED = 0.15    # How fast to adjust (0.15 = 15% adjustment p
 SCORE_THRESHOLD_ADAPTIVE_ENABLED = True  # Enable adaptive threshold raising
 SCORE_THRESHOLD_MIN_TRADES_FOR_ADAPTATION = 20  # Need 20+ trades before raising threshold
 SCORE_THRESHOLD_ADAPTED_VALUE = 55  # Raise to 55 after enough winning trades
+TRADE_STATS_PATH = 'data/trade_stats.json'  # Closed-trade counters for the adaptive threshold
+PATTERN_MATCH_TOP_K = 0  # Score signals against the k nearest winning patterns (0 = all)
+
+# Filter gate ordering (critical filters + score threshold, all must pass)
+FILTER_COST_ORDERING = True    # Run gates by lowest cost / reject-rate first
+FILTER_ORDER_MIN_SAMPLES = 20  # Evaluations before measured cost replaces the declared estimate
 
 # =====================================
 # =====================================
@@ -453,15 +471,64 @@ STRUCTURE_MIN_TOUCHES = 2          # Min touches to confirm level
 # DATA FEED SETTINGS
 # =====================================
 # API rate limiting
-API_RATE_LIMIT_MS = 100
+API_RATE_LIMIT_MS = 100            # Pacing for endpoints not listed in OKX_RATE_LIMITS
+API_RATE_LIMIT_BURST = 5           # Requests allowed back-to-back before API_RATE_LIMIT_MS pacing applies
+
+# Per-endpoint OKX limits: prefix -> (requests, per_seconds). Longest prefix wins;
+# 'METHOD /path' keys limit one method separately. Each group has its own bucket
+OKX_RATE_LIMITS = {
+    '/api/v5/market/candles': (40, 2),
+    '/api/v5/market/history-candles': (20, 2),
+    '/api/v5/market/ticker': (20, 2),
+    '/api/v5/market/books': (40, 2),
+    '/api/v5/public/funding-rate': (20, 2),
+    '/api/v5/public/open-interest': (20, 2),
+    '/api/v5/account/balance': (10, 2),
+    '/api/v5/account/positions': (10, 2),
+    '/api/v5/account/set-leverage': (20, 2),
+    '/api/v5/account/leverage-info': (20, 2),
+    'POST /api/v5/trade/order': (60, 2),         # Place order
+    'GET /api/v5/trade/order': (60, 2),          # Order details (monitor polling)
+    '/api/v5/trade/cancel-order': (60, 2),
+    '/api/v5/trade/orders-pending': (60, 2),
+}
+OKX_RATE_LIMIT_HEADROOM = 0.8      # Use 80% of each OKX limit
 MAX_RETRIES = 3
 RETRY_DELAY_MS = 1000
 API_TIMEOUT_SECONDS = 30  # Increased from 10 to handle slow OKX API responses
 
+# HTTP connection pooling (OKXClient keeps one keep-alive session)
+OKX_HTTP_POOL_SIZE = 10            # Max pooled connections (>= MARKET_DATA_FETCH_WORKERS)
+OKX_HTTP_KEEPALIVE = True          # Reuse TCP/TLS connections between requests
+API_CONNECT_TIMEOUT_SECONDS = 5    # TCP/TLS connect timeout
+API_ENDPOINT_TIMEOUTS = {          # Read timeout: '.../' = prefix, else exact endpoint (longest match wins), else API_TIMEOUT_SECONDS
+    '/api/v5/trade/': 10,          # Order status/pending reads fail fast and retry
+    '/api/v5/trade/order': 30,     # Order placement: wait it out (never blindly re-sent)
+    '/api/v5/market/': 15,
+}
+
 # Caching
 ENABLE_CACHE = True
 CACHE_EXPIRY_SECONDS = 60
 
+# Concurrent market data fetching (timeframes, funding, OI and ticker in parallel)
+MARKET_DATA_CONCURRENT_FETCH = True
+MARKET_DATA_FETCH_WORKERS = 8
+
+# WebSocket streaming (candles, ticker, funding, OI, books5 pushed into memory; REST as fallback)
+MARKET_DATA_STREAMING = os.getenv('MARKET_DATA_STREAMING', 'False').lower() == 'true'
+_OKX_WS_HOST = 'wsus.okx.com' if OKX_API_DOMAIN.startswith('us.') else 'ws.okx.com'
+OKX_WS_PUBLIC_URL = os.getenv('OKX_WS_PUBLIC_URL', f'wss://{_OKX_WS_HOST}:8443/ws/v5/public')
+OKX_WS_BUSINESS_URL = os.getenv('OKX_WS_BUSINESS_URL', f'wss://{_OKX_WS_HOST}:8443/ws/v5/business')  # Candle channels
+STREAM_CANDLE_BOOK_SIZE = 300      # Candles kept in memory per symbol/timeframe
+STREAM_PING_INTERVAL_SECONDS = 20  # OKX closes connections idle for 30s
+
+# Event-driven trading loop (full cycle on candle close instead of every 60s)
+EVENT_DRIVEN_LOOP = True
+EVENT_TRIGGER_TIMEFRAMES = [LTF_TIMEFRAME, MTF_TIMEFRAME]  # Closes that trigger a full cycle
+POSITION_UPDATE_INTERVAL_SECONDS = 15  # Position-only updates between closes
+CANDLE_CLOSE_DELAY_SECONDS = 2         # Wait for the closed candle to reach REST (skipped when streamed)
+
 # =====================================
 # CLAUDE AI SETTINGS
 # =====================================
@@ -541,6 +608,13 @@ BACKTEST_START_DATE = "2025-12-01"
 BACKTEST_END_DATE = "2025-12-15"
 BACKTEST_INITIAL_CAPITAL = 10000
 BACKTEST_COMMISSION = 0.0006
+OPTIMIZER_WORKERS = 1              # Parallel sweep processes (1 = serial, 0 = one per CPU core; opt in with --workers)
+WALK_FORWARD_TRAIN_DAYS = 60       # In-sample window per walk-forward fold
+WALK_FORWARD_TEST_DAYS = 15        # Out-of-sample window per fold
+WALK_FORWARD_STEP_DAYS = 0         # Roll forward by this much (0 = test window length)
+OPTIMIZER_SEARCH_CANDIDATES = 27   # Successive-halving search: candidates in the first rung
+OPTIMIZER_SEARCH_ETA = 3           # Keep the best 1/eta of candidates per rung (window grows eta x)
+OPTIMIZER_SEARCH_MIN_DAYS = 7      # Shortest rung window
 
 # =====================================
 # ELITE BACKTEST IMPROVEMENTS (BACKTEST ONLY)
@@ -810,11 +884,20 @@ TELEGRAM_SEND_SENTIMENT_ALERTS = True  # Send market sentiment updates
 TELEGRAM_REPORT_INTERVAL_DAYS = 3  # Days between auto reports
 TELEGRAM_SENTIMENT_INTERVAL_HOURS = 4  # Hours between sentiment updates
 
+# Delivery (background queue - alert calls never wait on the Telegram API)
+TELEGRAM_ASYNC_DELIVERY = True  # False = send inline (blocking)
+TELEGRAM_BATCH_WINDOW_SECONDS = 1.0  # Bursts within this window go out as one message
+TELEGRAM_MIN_SEND_INTERVAL_SECONDS = 1.0  # Telegram: ~1 message/second per chat
+TELEGRAM_MAX_MESSAGES_PER_MINUTE = 20  # Telegram: 20 messages/minute per group chat
+TELEGRAM_MAX_RETRIES = 5  # Retries per batch (exponential backoff, honours 429 retry_after)
+TELEGRAM_QUEUE_SIZE = 200  # Pending messages kept before the oldest is dropped
+
 # =====================================
 # TRADE JOURNAL SETTINGS
 # =====================================
 TRADE_JOURNAL_ENABLED = True  # Log all closed trades to disk
 TRADE_JOURNAL_PATH = "runs"   # Base directory for trade logs (runs/YYYY-MM-DD/trades.jsonl)
+TRADE_JOURNAL_PARSED_CACHE_SIZE = 5000  # Decoded trades JournalStore keeps in memory (LRU) for repeat queries
 
 # =====================================
 # PERFORMANCE ANALYTICS SETTINGS
@@ -7,9 +7,18 @@ Enhanced in Phase 1.4 with:
 - Confidence breakdown analytics
 - Trade history from journal
 - Daily summary stats
+
+Exchange reads (/api/live) go through a SnapshotCache. The trading loop
+fills it with the balances, prices and positions it already read
+(update_live_snapshot); only when that goes quiet does one background
+refresher talk to OKX, and request threads never call the exchange themselves.
+
+/api/stream pushes the same state over Server-Sent Events: a full snapshot
+on connect, then only what changed whenever the trading loop updates
+prices, balance, positions, signals or filter results.
 """
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, jsonify, request
 from datetime import datetime, timedelta, timezone
 import json
 import os
@@ -20,6 +29,10 @@ import logging
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import config
+from utils.snapshot_cache import SnapshotCache
+from utils.event_stream import EventStream
+
 # Import trade journal and analytics (with graceful fallback)
 try:
     from utils.trade_journal import TradeJournal
@@ -55,6 +68,132 @@ def _get_okx_client():
             logger.warning(f"Could not initialize OKX client: {e}")
     return _okx_client
 
+
+# Cached exchange snapshots (filled by the cache's single refresher thread)
+_snapshot_cache = SnapshotCache(max_age=getattr(config, 'DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS', 5))
+
+# Incremental updates pushed to /api/stream subscribers
+_event_stream = EventStream(history=getattr(config, 'DASHBOARD_STREAM_HISTORY', 256))
+
+
+def _fetch_live_snapshot() -> dict:
+    """
+    Read balances, prices and positions from OKX (runs on the refresher thread).
+    
+    Only used while the trading loop is not feeding the snapshot itself
+    (see update_live_snapshot), e.g. when the dashboard runs on its own.
+    
+    Returns:
+        /api/live payload
+    """
+    client = _get_okx_client()
+    if not client:
+        raise RuntimeError('OKX client not available')
+    
+    balances = _parse_balances(client.get_account_balance())
+    sol_price = _ticker_last(client.get_ticker('SOL-USDT-SWAP'))
+    btc_price = _ticker_last(client.get_ticker('BTC-USDT-SWAP'))
+    
+    # Fetch open positions
+    positions = []
+    pos_data = client.get_positions()
+    if isinstance(pos_data, dict):
+        pos_data = pos_data.get('data', [])
+    for pos in pos_data or []:
+        if float(pos.get('pos', 0)) != 0:
+            positions.append({
+                'symbol': pos.get('instId', ''),
+                'direction': 'long' if pos.get('posSide') == 'long' else 'short',
+                'size': abs(float(pos.get('pos', 0))),
+                'entry_price': float(pos.get('avgPx', 0)),
+                'current_price': float(pos.get('last', sol_price) or sol_price),
+                'pnl': float(pos.get('upl', 0)),
+                'pnl_pct': float(pos.get('uplRatio', 0)) * 100,
+                'leverage': pos.get('lever', '1')
+            })
+    
+    return _build_live_snapshot(balances, sol_price, btc_price, positions)
+
+
+def _parse_balances(balance_data) -> dict:
+    """SOL and USDT balances from an OKX account balance response"""
+    balances = {'usdt_balance': 0, 'usdt_equity_usd': 0, 'sol_balance': 0, 'sol_equity_usd': 0}
+    if balance_data and isinstance(balance_data, list):
+        for account in balance_data:
+            # Parse each currency from details
+            for detail in account.get('details', []):
+                ccy = detail.get('ccy', '')
+                avail_bal = float(detail.get('availBal', 0) or 0)
+                eq_usd = float(detail.get('eqUsd', 0) or 0)
+                
+                if ccy == 'USDT':
+                    balances['usdt_balance'] = avail_bal
+                    balances['usdt_equity_usd'] = eq_usd
+                elif ccy == 'SOL':
+                    balances['sol_balance'] = avail_bal
+                    balances['sol_equity_usd'] = eq_usd
+    return balances
+
+
+def _ticker_last(ticker) -> float:
+    """Last price from get_ticker (ticker dict, or a raw {'data': [...]} response)"""
+    if ticker and 'data' in ticker:
+        ticker = ticker['data'][0] if ticker['data'] else None
+    return float(ticker.get('last', 0) or 0) if ticker else 0
+
+
+def _build_live_snapshot(balances: dict, sol_price: float, btc_price: float,
+                         positions: list) -> dict:
+    """Assemble the /api/live payload and push its changes to stream subscribers"""
+    # Calculate total equity (SOL + USDT only)
+    total_equity = balances['usdt_equity_usd'] + balances['sol_equity_usd']
+    
+    # Update dashboard_data for other endpoints
+    dashboard_data['balance'] = balances['usdt_balance']
+    dashboard_data['equity'] = total_equity
+    dashboard_data['current_price'] = sol_price
+    dashboard_data['btc_price'] = btc_price
+    dashboard_data['last_update'] = datetime.now(timezone.utc).isoformat()
+    
+    snapshot = {
+        'usdt_balance': round(balances['usdt_balance'], 2),
+        'usdt_equity_usd': round(balances['usdt_equity_usd'], 2),
+        'sol_balance': round(balances['sol_balance'], 6),
+        'sol_equity_usd': round(balances['sol_equity_usd'], 2),
+        'total_equity': round(total_equity, 2),
+        'sol_price': round(sol_price, 2),
+        'btc_price': round(btc_price, 2),
+        'positions': positions,
+        'last_update': datetime.now(timezone.utc).isoformat(),
+        'connected': True
+    }
+    
+    # Stream subscribers only hear about fields that moved
+    _event_stream.publish_changes(
+        'live',
+        {key: value for key, value in snapshot.items() if key != 'last_update'},
+        extra={'last_update': snapshot['last_update']}
+    )
+    return snapshot
+
+
+# Latest reads handed over by the trading loop (update_live_snapshot)
+_loop_live = {}
+_loop_live_lock = threading.Lock()
+
+
+def _live_max_age() -> float:
+    """
+    Age at which a request may refresh the live snapshot from OKX
+
+    While the trading loop feeds the snapshot, requests only fall back to
+    their own OKX reads when the loop has gone quiet.
+    """
+    if _loop_live.get('fed'):
+        return getattr(config, 'DASHBOARD_LOOP_SNAPSHOT_MAX_AGE_SECONDS', 60)
+    return _snapshot_cache.max_age
+
+
 # Global data store for dashboard
 dashboard_data = {
     'balance': 0.0,
@@ -156,6 +295,59 @@ def _calculate_duration_minutes(entry_time):
     except Exception:
         return 0
 
+
+def _enhance_positions(positions):
+    """
+    Positions with confidence color, TP/SL levels and duration (API/stream format)
+    """
+    enhanced_positions = []
+    
+    for pos in positions:
+        # Build enhanced position object
+        confidence = pos.get('confidence') or pos.get('confidence_score')
+        entry_time = pos.get('entry_time') or pos.get('entry_timestamp')
+        
+        enhanced = {
+            'symbol': pos.get('symbol', 'SOL-USDT-SWAP'),
+            'direction': pos.get('direction', pos.get('side', 'unknown')),
+            'entry_price': float(pos.get('entry_price', 0)),
+            'current_price': float(pos.get('current_price', dashboard_data['current_price'])),
+            'size': float(pos.get('size', pos.get('quantity', 0))),
+            'pnl': float(pos.get('pnl', 0)),
+            'pnl_pct': float(pos.get('pnl_pct', pos.get('pnl_percent', 0))),
+            'confidence': confidence,
+            'confidence_color': get_confidence_color(confidence),
+            'tp1': pos.get('take_profit_1') or pos.get('tp1'),
+            'tp2': pos.get('take_profit_2') or pos.get('tp2'),
+            'sl': pos.get('stop_loss') or pos.get('sl'),
+            'entry_time': entry_time,
+            'duration_minutes': _calculate_duration_minutes(entry_time),
+            'strategy': pos.get('strategy', 'unknown')
+        }
+        enhanced_positions.append(enhanced)
+    
+    return enhanced_positions
+
+
+def _stream_snapshot():
+    """Full state sent to a stream subscriber on connect"""
+    state = {key: value for key, value in dashboard_data.items()
+             if key not in ('recent_trades', 'signals', 'errors', 'open_positions')}
+    state['signals'] = dashboard_data['signals'][-100:]
+    state['errors'] = dashboard_data['errors'][-20:]
+    state['positions'] = _enhance_positions(dashboard_data['open_positions'])
+    cached = _snapshot_cache.peek('live')
+    if cached is not None:
+        state['live'] = cached[0]
+    return state
+
+
+def _refresh_live_snapshot():
+    """Keep the OKX snapshot fresh while browsers listen (fallback when the loop is quiet)"""
+    if _get_okx_client():
+        _snapshot_cache.get('live', _fetch_live_snapshot, max_age=_live_max_age())
+
+
 def create_app():
     """Create Flask dashboard application"""
     app = Flask(__name__, 
@@ -212,35 +404,8 @@ def create_app():
         - TP/SL levels
         - Duration in minutes
         """
-        positions = dashboard_data['open_positions']
-        enhanced_positions = []
-        
-        for pos in positions:
-            # Build enhanced position object
-            confidence = pos.get('confidence') or pos.get('confidence_score')
-            entry_time = pos.get('entry_time') or pos.get('entry_timestamp')
-            
-            enhanced = {
-                'symbol': pos.get('symbol', 'SOL-USDT-SWAP'),
-                'direction': pos.get('direction', pos.get('side', 'unknown')),
-                'entry_price': float(pos.get('entry_price', 0)),
-                'current_price': float(pos.get('current_price', dashboard_data['current_price'])),
-                'size': float(pos.get('size', pos.get('quantity', 0))),
-                'pnl': float(pos.get('pnl', 0)),
-                'pnl_pct': float(pos.get('pnl_pct', pos.get('pnl_percent', 0))),
-                'confidence': confidence,
-                'confidence_color': get_confidence_color(confidence),
-                'tp1': pos.get('take_profit_1') or pos.get('tp1'),
-                'tp2': pos.get('take_profit_2') or pos.get('tp2'),
-                'sl': pos.get('stop_loss') or pos.get('sl'),
-                'entry_time': entry_time,
-                'duration_minutes': _calculate_duration_minutes(entry_time),
-                'strategy': pos.get('strategy', 'unknown')
-            }
-            enhanced_positions.append(enhanced)
-        
         return jsonify({
-            'positions': enhanced_positions
+            'positions': _enhance_positions(dashboard_data['open_positions'])
         })
     
     @app.route('/api/signals')
@@ -260,6 +425,41 @@ def create_app():
         """Get all dashboard data"""
         return jsonify(dashboard_data)
     
+    @app.route('/api/stream')
+    def api_stream():
+        """
+        Server-Sent Events push channel.
+        
+        Sends a 'snapshot' event on connect, then incremental events:
+        - prices / account / status: changed fields only
+        - positions: enhanced open positions (when they change)
+        - signal / trade / error: the new entry
+        - filters: changed filter stats
+        - live: changed fields of the OKX snapshot
+        """
+        try:
+            last_event_id = int(request.headers.get('Last-Event-ID', ''))
+        except ValueError:
+            last_event_id = None
+        
+        keepalive = getattr(config, 'DASHBOARD_STREAM_KEEPALIVE_SECONDS', 15)
+        events = _event_stream.subscribe(
+            _stream_snapshot,
+            last_event_id=last_event_id,
+            keepalive=keepalive,
+            on_wake=_refresh_live_snapshot,
+            wake_interval=_snapshot_cache.max_age
+        )
+        return Response(events, mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+    
+    @app.route('/api/stream-stats')
+    def api_stream_stats():
+        """Push channel statistics (subscribers, events sent vs suppressed)"""
+        return jsonify(_event_stream.get_statistics())
+    
     @app.route('/api/confidence-breakdown')
     def api_confidence_breakdown():
         """
@@ -282,9 +482,8 @@ def create_app():
             })
         
         try:
-            # Load recent trades and calculate breakdown
-            trades = analytics.load_trades(days=30)
-            by_confidence = analytics.calculate_metrics_by_confidence(trades)
+            # Confidence breakdown from the journal's rolling aggregates
+            by_confidence = analytics.aggregate_metrics(days=30)['by_confidence']
             
             # Format for frontend with colors
             color_map = {
@@ -348,7 +547,7 @@ def create_app():
         
         try:
             # Get trades from journal (last 30 days, limit 50)
-            raw_trades = journal.get_recent_trades(days=30)[:50]
+            raw_trades = journal.query_trades(days=30, limit=50)
             
             formatted_trades = []
             for trade in raw_trades:
@@ -387,9 +586,9 @@ def create_app():
     @app.route('/api/live')
     def api_live():
         """
-        Get LIVE data directly from OKX API.
+        Get LIVE data from OKX (via the snapshot cache).
         
-        Fetches real-time:
+        Serves (at most DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS old):
         - SOL and USDT balances only
         - SOL and BTC prices
         - Open positions
@@ -411,81 +610,10 @@ def create_app():
             })
         
         try:
-            # Fetch account balance
-            balance_data = client.get_account_balance()
-            
-            # Initialize balances
-            usdt_balance = 0
-            usdt_equity_usd = 0
-            sol_balance = 0
-            sol_equity_usd = 0
-            
-            if balance_data and isinstance(balance_data, list):
-                for account in balance_data:
-                    # Parse each currency from details
-                    for detail in account.get('details', []):
-                        ccy = detail.get('ccy', '')
-                        avail_bal = float(detail.get('availBal', 0) or 0)
-                        eq_usd = float(detail.get('eqUsd', 0) or 0)
-                        
-                        if ccy == 'USDT':
-                            usdt_balance = avail_bal
-                            usdt_equity_usd = eq_usd
-                        elif ccy == 'SOL':
-                            sol_balance = avail_bal
-                            sol_equity_usd = eq_usd
-            
-            # Calculate total equity (SOL + USDT only)
-            total_equity = usdt_equity_usd + sol_equity_usd
-            
-            # Fetch SOL price
-            sol_price = 0
-            sol_ticker = client.get_ticker('SOL-USDT-SWAP')
-            if sol_ticker and 'data' in sol_ticker and sol_ticker['data']:
-                sol_price = float(sol_ticker['data'][0].get('last', 0))
-            
-            # Fetch BTC price
-            btc_price = 0
-            btc_ticker = client.get_ticker('BTC-USDT-SWAP')
-            if btc_ticker and 'data' in btc_ticker and btc_ticker['data']:
-                btc_price = float(btc_ticker['data'][0].get('last', 0))
-            
-            # Fetch open positions
-            positions = []
-            pos_data = client.get_positions()
-            if pos_data and 'data' in pos_data:
-                for pos in pos_data.get('data', []):
-                    if float(pos.get('pos', 0)) != 0:
-                        positions.append({
-                            'symbol': pos.get('instId', ''),
-                            'direction': 'long' if pos.get('posSide') == 'long' else 'short',
-                            'size': abs(float(pos.get('pos', 0))),
-                            'entry_price': float(pos.get('avgPx', 0)),
-                            'current_price': float(pos.get('last', sol_price)),
-                            'pnl': float(pos.get('upl', 0)),
-                            'pnl_pct': float(pos.get('uplRatio', 0)) * 100,
-                            'leverage': pos.get('lever', '1')
-                        })
-            
-            # Update dashboard_data for other endpoints
-            dashboard_data['balance'] = usdt_balance
-            dashboard_data['equity'] = total_equity
-            dashboard_data['current_price'] = sol_price
-            dashboard_data['btc_price'] = btc_price
-            dashboard_data['last_update'] = datetime.now(timezone.utc).isoformat()
-            
-            return jsonify({
-                'usdt_balance': round(usdt_balance, 2),
-                'usdt_equity_usd': round(usdt_equity_usd, 2),
-                'sol_balance': round(sol_balance, 6),
-                'sol_equity_usd': round(sol_equity_usd, 2),
-                'total_equity': round(total_equity, 2),
-                'sol_price': round(sol_price, 2),
-                'btc_price': round(btc_price, 2),
-                'positions': positions,
-                'last_update': datetime.now(timezone.utc).isoformat(),
-                'connected': True
-            })
+            # Served from the snapshot cache, normally filled by the trading loop;
+            # OKX is only read here when no recent snapshot exists
+            snapshot, age = _snapshot_cache.get('live', _fetch_live_snapshot, max_age=_live_max_age())
+            return jsonify({**snapshot, 'snapshot_age_seconds': round(age, 1)})
             
         except Exception as e:
             logger.error(f"Error fetching live data: {e}")
@@ -577,6 +705,26 @@ def create_app():
             logger.error(f"Error getting system health: {e}")
             return jsonify({'error': str(e), 'status': 'error'})
     
+    @app.route('/api/latency')
+    def api_latency():
+        """
+        Get per-stage trading cycle latency from the StageTimer.
+        Returns p50/p95/p99 per stage and the last cycle's breakdown.
+        """
+        try:
+            from utils.latency import get_stage_timer
+            return jsonify(get_stage_timer().snapshot())
+        except ImportError:
+            return jsonify({'error': 'StageTimer not available'})
+        except Exception as e:
+            logger.error(f"Error getting cycle latency: {e}")
+            return jsonify({'error': str(e)})
+    
+    @app.route('/api/snapshot-cache')
+    def api_snapshot_cache():
+        """Hit/refresh counters and snapshot ages of the exchange read cache."""
+        return jsonify(_snapshot_cache.get_statistics())
+    
     @app.route('/api/filter-scores')
     def api_filter_scores():
         """
@@ -601,10 +749,9 @@ def create_app():
         Returns current exposure, drawdown, VaR, Kelly criterion.
         """
         try:
-            from utils.risk_dashboard import RiskDashboard
-            # Create dashboard without managers (will show limited data)
-            # Full data requires integration with main.py
-            dashboard = RiskDashboard()
+            from utils.risk_dashboard import get_risk_dashboard
+            # Shared instance; the trading bot registers its managers with it
+            dashboard = get_risk_dashboard()
             summary = dashboard.get_summary()
             return jsonify(summary)
         except ImportError:
@@ -672,8 +819,8 @@ def create_app():
         
         # Risk Exposure
         try:
-            from utils.risk_dashboard import RiskDashboard
-            dashboard = RiskDashboard()
+            from utils.risk_dashboard import get_risk_dashboard
+            dashboard = get_risk_dashboard()
             risk = dashboard.get_summary()
             exposure = risk.get('exposure', {})
             summary['risk_exposure'] = {
@@ -684,15 +831,15 @@ def create_app():
         except Exception as e:
             summary['risk_exposure'] = {'status': 'error', 'message': str(e)}
         
-        # Trade Quality
+        # Trade Quality (rolling 30-day aggregates, no trade list loaded)
         try:
-            from utils.trade_quality import TradeQualityInspector
-            inspector = TradeQualityInspector()
-            quality = inspector.get_summary()
-            overall = quality.get('overall', {})
+            analytics = _get_performance_analytics()
+            if not analytics:
+                raise RuntimeError('Analytics not available')
+            overall = analytics.aggregate_metrics(days=30)['overall']
             summary['trade_quality'] = {
                 'total_trades': overall.get('total_trades', 0),
-                'win_rate': overall.get('win_rate', 0),
+                'win_rate': round(overall.get('win_rate_pct', 0), 1),
                 'total_pnl': overall.get('total_pnl', 0)
             }
         except Exception as e:
@@ -709,20 +856,27 @@ def update_balance(balance, equity, unrealized_pnl=0):
     dashboard_data['equity'] = equity
     dashboard_data['unrealized_pnl'] = unrealized_pnl
     dashboard_data['last_update'] = datetime.now().isoformat()
+    _event_stream.publish_changes('account', {
+        'balance': balance,
+        'equity': equity,
+        'unrealized_pnl': unrealized_pnl
+    }, extra={'last_update': dashboard_data['last_update']})
 
 
 def update_daily_pnl(pnl, pnl_pct):
     """Update daily PnL"""
     dashboard_data['daily_pnl'] = pnl
     dashboard_data['daily_pnl_pct'] = pnl_pct
+    _event_stream.publish_changes('account', {'daily_pnl': pnl, 'daily_pnl_pct': pnl_pct})
 
 
 def add_trade(trade_data):
     """Add a completed trade"""
-    dashboard_data['recent_trades'].append({
+    trade = {
         **trade_data,
         'timestamp': datetime.now().isoformat()
-    })
+    }
+    dashboard_data['recent_trades'].append(trade)
     dashboard_data['total_trades'] += 1
     
     if trade_data.get('pnl', 0) > 0:
@@ -738,52 +892,109 @@ def add_trade(trade_data):
     # Keep only last 500 trades
     if len(dashboard_data['recent_trades']) > 500:
         dashboard_data['recent_trades'] = dashboard_data['recent_trades'][-500:]
+    
+    _event_stream.publish('trade', trade)
+    _event_stream.publish_changes('account', {
+        key: dashboard_data[key]
+        for key in ('total_trades', 'winning_trades', 'losing_trades', 'win_rate')
+    })
 
 
 def update_positions(positions):
     """Update open positions"""
     dashboard_data['open_positions'] = positions
+    _event_stream.publish_changes('positions', {'positions': _enhance_positions(positions)})
+
+
+def update_live_snapshot(balance_data=None, sol_price=None, btc_price=None, positions=None):
+    """
+    Fill the /api/live snapshot from the trading loop's own reads (no OKX call)
+
+    Each call passes whatever the loop just read; the snapshot is cached once
+    balances, both prices and positions have all been seen.
+
+    Args:
+        balance_data: Raw OKX account balance response
+        sol_price / btc_price: Latest prices
+        positions: Open positions as passed to update_positions
+    """
+    with _loop_live_lock:
+        if balance_data:
+            _loop_live['balances'] = _parse_balances(balance_data)
+        if sol_price:
+            _loop_live['sol_price'] = sol_price
+        if btc_price:
+            _loop_live['btc_price'] = btc_price
+        if positions is not None:
+            _loop_live['positions'] = [{
+                'symbol': pos.get('symbol', ''),
+                'direction': pos.get('side', pos.get('direction', 'long')),
+                'size': pos.get('size', 0),
+                'entry_price': pos.get('entry_price', 0),
+                'current_price': pos.get('current_price', 0),
+                'pnl': pos.get('pnl', 0),
+                'pnl_pct': pos.get('pnl_pct', 0),
+                'leverage': str(pos.get('leverage', '1'))
+            } for pos in positions]
+        if not all(key in _loop_live for key in ('balances', 'sol_price', 'btc_price', 'positions')):
+            return
+        snapshot = _build_live_snapshot(_loop_live['balances'], _loop_live['sol_price'],
+                                        _loop_live['btc_price'], _loop_live['positions'])
+        _snapshot_cache.put('live', snapshot)
+        _loop_live['fed'] = True
 
 
 def add_signal(signal_data):
     """Add a signal event"""
-    dashboard_data['signals'].append({
+    signal = {
         **signal_data,
         'timestamp': datetime.now().isoformat()
-    })
+    }
+    dashboard_data['signals'].append(signal)
     # Keep only last 500 signals
     if len(dashboard_data['signals']) > 500:
         dashboard_data['signals'] = dashboard_data['signals'][-500:]
+    
+    _event_stream.publish('signal', signal)
 
 
 def update_filter_stats(stats):
     """Update filter statistics"""
     dashboard_data['filter_stats'] = stats
+    _event_stream.publish_changes('filters', stats)
 
 
 def set_bot_status(status):
     """Set bot status (running, stopped, error)"""
     dashboard_data['bot_status'] = status
     dashboard_data['last_update'] = datetime.now().isoformat()
+    _event_stream.publish_changes('status', {'bot_status': status})
 
 
-def update_prices(sol_price, btc_price):
-    """Update current prices"""
+def update_prices(sol_price, btc_price=None):
+    """Update current prices (btc_price=None keeps the last known BTC price)"""
     dashboard_data['current_price'] = sol_price
-    dashboard_data['btc_price'] = btc_price
+    if btc_price is not None:
+        dashboard_data['btc_price'] = btc_price
+    btc_price = dashboard_data.get('btc_price', 0)
+    _event_stream.publish_changes('prices', {'current_price': sol_price, 'btc_price': btc_price})
 
 
 def set_market_regime(regime):
     """Set current market regime"""
     dashboard_data['market_regime'] = regime
+    _event_stream.publish_changes('status', {'market_regime': regime})
 
 
 def add_error(error_msg):
     """Add an error to the log"""
-    dashboard_data['errors'].append({
+    error = {
         'message': error_msg,
         'timestamp': datetime.now().isoformat()
-    })
+    }
+    dashboard_data['errors'].append(error)
     # Keep only last 100 errors
     if len(dashboard_data['errors']) > 100:
         dashboard_data['errors'] = dashboard_data['errors'][-100:]
+    
+    _event_stream.publish('error', error)
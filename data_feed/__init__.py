@@ -5,7 +5,10 @@ Handles all market data acquisition from OKX API and on-chain sources
 
 from .okx_client import OKXClient
 from .market_data import MarketDataFeed
+from .websocket_feed import CandleBook, OKXWebSocketFeed, StreamingMarketDataFeed
 from .indicators import TechnicalIndicators
+from .indicator_state import IndicatorState
+from .feature_context import FeatureContext, get_features
 from .onchain_tracker import OnchainTracker
 from .liquidation_tracker import LiquidationTracker
 from .sentiment_tracker import SentimentTracker, get_sentiment_tracker
@@ -14,7 +17,13 @@ from .market_structure import MarketStructureAnalyzer
 __all__ = [
     'OKXClient', 
     'MarketDataFeed', 
+    'CandleBook',
+    'OKXWebSocketFeed',
+    'StreamingMarketDataFeed',
     'TechnicalIndicators', 
+    'IndicatorState',
+    'FeatureContext',
+    'get_features',
     'OnchainTracker', 
     'LiquidationTracker',
     'SentimentTracker',
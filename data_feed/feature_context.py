@@ -0,0 +1,112 @@
+"""
+Feature Context
+Memoized derived features shared by every consumer of one market state
+
+Strategies and filters each used to rebuild close lists and recompute RSI,
+EMAs and Bollinger Bands from the same candles in every cycle. FeatureContext
+is attached to the market state as market_state['features'] and computes each
+feature at most once, keyed by (symbol, timeframe, last candle ts, feature,
+params). Values are exactly what TechnicalIndicators returns for the same
+closes, so consumers see no numerical change.
+
+Returned lists are shared between consumers and must not be mutated.
+
+Usage:
+    features = get_features(market_state)
+    rsi = features.rsi('15m', 14)
+    ema_20 = features.ema('15m', 20)
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .indicators import TechnicalIndicators
+
+
+class FeatureContext:
+    """
+    Per-market-state memo of derived features
+    """
+
+    def __init__(self, market_state: Dict):
+        self._state = market_state
+        self.symbol = market_state.get('symbol', '')
+        self._memo: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def candles(self, timeframe: str) -> List[Dict]:
+        return self._state.get('timeframes', {}).get(timeframe, {}).get('candles', [])
+
+    def feature(self, timeframe: str, name: str, compute: Callable[[List[Dict]], Any],
+                params: Hashable = ()) -> Any:
+        """
+        Memoized compute(candles) for one timeframe
+
+        The key includes the last candle timestamp, so a context reused with
+        different candles never returns a stale value.
+        """
+        candles = self.candles(timeframe)
+        last_ts = candles[-1].get('timestamp') if candles else None
+        key = (self.symbol, timeframe, last_ts, len(candles), name, params)
+
+        with self._lock:
+            if key in self._memo:
+                self.hits += 1
+                return self._memo[key]
+
+        value = compute(candles)
+        with self._lock:
+            self.misses += 1
+            self._memo.setdefault(key, value)
+            return self._memo[key]
+
+    # =====================================
+    # COMMON FEATURES
+    # =====================================
+
+    def closes(self, timeframe: str) -> List[float]:
+        return self.feature(timeframe, 'closes', lambda candles: [c['close'] for c in candles])
+
+    def rsi(self, timeframe: str, period: int = 14) -> Optional[float]:
+        return self.feature(
+            timeframe, 'rsi',
+            lambda _: TechnicalIndicators.calculate_rsi(self.closes(timeframe), period),
+            period
+        )
+
+    def ema(self, timeframe: str, period: int) -> List[float]:
+        return self.feature(
+            timeframe, 'ema',
+            lambda _: TechnicalIndicators.calculate_ema(self.closes(timeframe), period),
+            period
+        )
+
+    def bollinger_bands(self, timeframe: str, period: int = 20,
+                        std_dev: float = 2.0) -> Tuple[List[float], List[float], List[float]]:
+        return self.feature(
+            timeframe, 'bollinger_bands',
+            lambda _: TechnicalIndicators.calculate_bollinger_bands(self.closes(timeframe), period, std_dev),
+            (period, std_dev)
+        )
+
+    def pct_change(self, timeframe: str) -> Optional[float]:
+        """Last close vs previous close in percent, None without two candles"""
+        def compute(candles):
+            if len(candles) < 2 or candles[-2]['close'] <= 0:
+                return None
+            return (candles[-1]['close'] - candles[-2]['close']) / candles[-2]['close'] * 100
+        return self.feature(timeframe, 'pct_change', compute)
+
+    def get_stats(self) -> Dict:
+        return {'features': len(self._memo), 'hits': self.hits, 'misses': self.misses}
+
+
+def get_features(market_state: Dict) -> FeatureContext:
+    """FeatureContext attached to market_state (created on first use)"""
+    features = market_state.get('features')
+    if features is None:
+        features = FeatureContext(market_state)
+        market_state['features'] = features
+    return features
@@ -0,0 +1,245 @@
+"""
+Incremental Indicator State
+Advances ATR, EMA, RSI and rolling volume one candle at a time
+
+TechnicalIndicators recomputes every series from scratch, so calling it on
+each new bar costs O(window) per indicator. IndicatorState keeps the running
+values for one symbol/timeframe and folds in each new candle in O(1), giving
+the same numbers TechnicalIndicators returns for the full sequence seen so far:
+
+- atr / atr_series: calculate_atr_series (Wilder smoothing, SMA seed)
+- atr_sma: calculate_atr (mean of the last `atr_period` true ranges)
+- ema(period): calculate_ema (SMA seed)
+- rsi: calculate_rsi (mean gain/loss over the last `rsi_period` closes)
+- average_volume: mean of the last `volume_period` volumes
+
+The newest candle may be revised (live feeds return the still-forming bar):
+updating with the same timestamp again replaces it instead of advancing.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorState:
+    """
+    Running indicator values for one symbol/timeframe
+    """
+
+    def __init__(self, atr_period: int = 14, ema_periods: Iterable[int] = (20, 50),
+                 rsi_period: int = 14, volume_period: int = 20,
+                 atr_history: int = 100):
+        """
+        Args:
+            atr_period: ATR period
+            ema_periods: EMA periods to track
+            rsi_period: RSI period
+            volume_period: Rolling volume window
+            atr_history: Number of recent ATR values kept for percentile/compression checks
+        """
+        self.atr_period = atr_period
+        self.ema_periods = tuple(ema_periods)
+        self.rsi_period = rsi_period
+        self.volume_period = volume_period
+
+        # Scalar state
+        self.count = 0
+        self.last_timestamp: Optional[int] = None
+        self.last_close: Optional[float] = None
+        self.current_volume = 0.0
+        self._atr: Optional[float] = None
+        self._tr_seed_sum = 0.0
+        self._emas: Dict[int, Optional[float]] = {p: None for p in self.ema_periods}
+        self._ema_seed_sums: Dict[int, float] = {p: 0.0 for p in self.ema_periods}
+
+        # Rolling windows
+        self._true_ranges = deque(maxlen=atr_period)  # Excludes the first bar (no previous close)
+        self._gains = deque(maxlen=rsi_period)
+        self._losses = deque(maxlen=rsi_period)
+        self._volumes = deque(maxlen=volume_period)
+        self._atr_history = deque(maxlen=atr_history)
+
+        # Undo log for revising the newest candle
+        self._undo_scalars: Optional[Dict] = None
+        self._undo_windows: List = []
+
+    # =====================================
+    # UPDATES
+    # =====================================
+
+    def update(self, candle: Dict) -> bool:
+        """
+        Fold in one candle
+
+        A candle with the same timestamp as the newest one replaces it;
+        an older candle is ignored.
+
+        Returns:
+            True if the candle was applied
+        """
+        ts = candle['timestamp']
+
+        if self.last_timestamp is not None:
+            if ts < self.last_timestamp:
+                return False
+            if ts == self.last_timestamp:
+                self._rollback()
+
+        self._checkpoint()
+        self._advance(ts, candle['high'], candle['low'], candle['close'], candle['volume'])
+        return True
+
+    def update_many(self, candles: Iterable[Dict]) -> int:
+        """Fold in candles in order, returns the number applied"""
+        return sum(1 for candle in candles if self.update(candle))
+
+    def _advance(self, ts: int, high: float, low: float, close: float, volume: float):
+        prev_close = self.last_close
+
+        # True range - the first bar has no previous close, so use high-low
+        if prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            self._push(self._true_ranges, tr)
+
+        # Wilder ATR, seeded with the mean of the first `atr_period` true ranges
+        n = self.count + 1
+        if n <= self.atr_period:
+            self._tr_seed_sum += tr
+            if n == self.atr_period:
+                self._atr = self._tr_seed_sum / self.atr_period
+                self._push(self._atr_history, self._atr)
+        else:
+            alpha = 1 / self.atr_period
+            self._atr = alpha * tr + (1 - alpha) * self._atr
+            self._push(self._atr_history, self._atr)
+
+        # EMAs, seeded with the SMA of the first `period` closes
+        for period in self.ema_periods:
+            if n <= period:
+                self._ema_seed_sums[period] += close
+                if n == period:
+                    self._emas[period] = self._ema_seed_sums[period] / period
+            else:
+                ema = self._emas[period]
+                self._emas[period] = (close - ema) * (2 / (period + 1)) + ema
+
+        # RSI gains/losses
+        if prev_close is not None:
+            delta = close - prev_close
+            self._push(self._gains, delta if delta > 0 else 0.0)
+            self._push(self._losses, -delta if delta < 0 else 0.0)
+
+        self._push(self._volumes, volume)
+
+        self.last_close = close
+        self.current_volume = volume
+        self.last_timestamp = ts
+        self.count = n
+
+    def _push(self, window: deque, value: float):
+        """Append to a rolling window, remembering what fell off for rollback"""
+        evicted = window[0] if len(window) == window.maxlen else None
+        window.append(value)
+        self._undo_windows.append((window, evicted))
+
+    def _checkpoint(self):
+        self._undo_scalars = {
+            'count': self.count,
+            'last_timestamp': self.last_timestamp,
+            'last_close': self.last_close,
+            'current_volume': self.current_volume,
+            '_atr': self._atr,
+            '_tr_seed_sum': self._tr_seed_sum,
+            '_emas': dict(self._emas),
+            '_ema_seed_sums': dict(self._ema_seed_sums),
+        }
+        self._undo_windows = []
+
+    def _rollback(self):
+        """Undo the newest candle so it can be replaced"""
+        if self._undo_scalars is None:
+            return
+
+        for window, evicted in reversed(self._undo_windows):
+            window.pop()
+            if evicted is not None:
+                window.appendleft(evicted)
+
+        for name, value in self._undo_scalars.items():
+            setattr(self, name, value)
+
+        self._undo_scalars = None
+        self._undo_windows = []
+
+    # =====================================
+    # VALUES
+    # =====================================
+
+    @property
+    def atr(self) -> Optional[float]:
+        """Latest Wilder ATR (same as calculate_atr_series()[-1])"""
+        if self.count < self.atr_period + 1:
+            return None
+        return self._atr
+
+    @property
+    def atr_previous(self) -> Optional[float]:
+        """ATR one bar ago (falls back to the latest value)"""
+        if self.atr is None:
+            return None
+        return self._atr_history[-2] if len(self._atr_history) > 1 else self._atr
+
+    @property
+    def atr_series(self) -> List[float]:
+        """Most recent ATR values, oldest first"""
+        if self.atr is None:
+            return []
+        return list(self._atr_history)
+
+    @property
+    def atr_sma(self) -> Optional[float]:
+        """Mean of the last `atr_period` true ranges (same as calculate_atr)"""
+        if self.count < self.atr_period + 1:
+            return None
+        return sum(self._true_ranges) / self.atr_period
+
+    def ema(self, period: int) -> Optional[float]:
+        """Latest EMA for a tracked period (same as calculate_ema()[-1])"""
+        return self._emas.get(period)
+
+    @property
+    def rsi(self) -> Optional[float]:
+        """Latest RSI (same as calculate_rsi)"""
+        if self.count < self.rsi_period + 1:
+            return None
+
+        avg_gain = sum(self._gains) / self.rsi_period
+        avg_loss = sum(self._losses) / self.rsi_period
+
+        if avg_loss == 0:
+            return 100.0
+
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+    @property
+    def volume_window(self) -> int:
+        """Number of volumes currently in the rolling window"""
+        return len(self._volumes)
+
+    @property
+    def volume_sum(self) -> float:
+        """Sum of volumes in the rolling window"""
+        return sum(self._volumes)
+
+    @property
+    def average_volume(self) -> float:
+        """Mean volume over the rolling window"""
+        if not self._volumes:
+            return 0.0
+        return self.volume_sum / len(self._volumes)
@@ -2,15 +2,51 @@
 Technical Indicators
 Calculates ATR, volatility metrics, and other technical indicators
 All calculations are vectorized for performance
+
+The *_batch methods compute an indicator over an entire history in one call
+and return a NumPy array aligned to the input (NaN where the scalar version
+has no value yet), so backtests can precompute once per run instead of
+recomputing a window on every bar.
 """
 
 import numpy as np
-from typing import List, Tuple, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Tuple, Optional, Sequence
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _linear_recurrence(seed: float, decay: float, inputs: np.ndarray) -> np.ndarray:
+    """
+    Solve y[k] = decay * y[k-1] + inputs[k] with y[-1] = seed, vectorized
+
+    Each block uses the closed form y[k] = decay^(k+1) * y_prev +
+    decay^k * cumsum(inputs[j] * decay^-j). Blocks are sized so decay^-j
+    stays far from overflow, which keeps the result accurate to ~1e-13.
+    """
+    inputs = np.asarray(inputs, dtype=np.float64)
+    out = np.empty(len(inputs))
+
+    if len(inputs) == 0:
+        return out
+    if decay == 0:
+        out[:] = inputs
+        return out
+
+    block = int(min(1024, max(1, 100 / -np.log10(decay))))
+    prev = seed
+
+    for start in range(0, len(inputs), block):
+        chunk = inputs[start:start + block]
+        powers = decay ** np.arange(len(chunk))
+        values = powers * (decay * prev + np.cumsum(chunk / powers))
+        out[start:start + block] = values
+        prev = values[-1]
+
+    return out
+
+
 class TechnicalIndicators:
     """
     Collection of technical indicator calculations
@@ -328,3 +364,195 @@ class TechnicalIndicators:
             return 'bearish'  # Price up, indicator down
 
         return None
+
+    # =====================================
+    # BATCH (WHOLE-HISTORY) INDICATORS
+    # =====================================
+
+    @staticmethod
+    def calculate_true_range_batch(highs: Sequence[float], lows: Sequence[float],
+                                   closes: Sequence[float]) -> np.ndarray:
+        """
+        True range for every candle
+
+        The first candle has no previous close, so its true range is
+        high - low (same convention as calculate_atr_series).
+        """
+        highs = np.asarray(highs, dtype=np.float64)
+        lows = np.asarray(lows, dtype=np.float64)
+        closes = np.asarray(closes, dtype=np.float64)
+
+        true_range = highs - lows
+        if len(true_range) > 1:
+            prev_close = closes[:-1]
+            true_range[1:] = np.maximum(
+                true_range[1:],
+                np.maximum(np.abs(highs[1:] - prev_close), np.abs(lows[1:] - prev_close))
+            )
+        return true_range
+
+    @staticmethod
+    def calculate_rolling_mean_batch(values: Sequence[float], period: int) -> np.ndarray:
+        """
+        Mean of the last `period` values at every index (NaN until a full window)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        out = np.full(len(values), np.nan)
+        if len(values) >= period:
+            out[period - 1:] = sliding_window_view(values, period).mean(axis=1)
+        return out
+
+    @staticmethod
+    def calculate_ema_batch(values: Sequence[float], period: int) -> np.ndarray:
+        """
+        EMA at every index
+
+        out[i] == calculate_ema(values[:i+1], period)[-1]; NaN before index period-1.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        out = np.full(len(values), np.nan)
+        if len(values) < period:
+            return out
+
+        multiplier = 2 / (period + 1)
+        seed = np.mean(values[:period])
+        out[period - 1] = seed
+        out[period:] = _linear_recurrence(seed, 1 - multiplier, multiplier * values[period:])
+        return out
+
+    @staticmethod
+    def calculate_atr_series_batch(highs: Sequence[float], lows: Sequence[float],
+                                   closes: Sequence[float], period: int = 14) -> np.ndarray:
+        """
+        Wilder ATR at every index
+
+        The tail of the array equals calculate_atr_series() on the same candles;
+        NaN before index period-1 (where the SMA seed lands).
+        """
+        true_range = TechnicalIndicators.calculate_true_range_batch(highs, lows, closes)
+        out = np.full(len(true_range), np.nan)
+        if len(true_range) < period + 1:
+            return out
+
+        alpha = 1 / period
+        seed = np.mean(true_range[:period])
+        out[period - 1] = seed
+        out[period:] = _linear_recurrence(seed, 1 - alpha, alpha * true_range[period:])
+        return out
+
+    @staticmethod
+    def calculate_atr_batch(highs: Sequence[float], lows: Sequence[float],
+                            closes: Sequence[float], period: int = 14) -> np.ndarray:
+        """
+        Simple-average ATR at every index
+
+        out[i] == calculate_atr(highs[:i+1], lows[:i+1], closes[:i+1], period);
+        NaN before index period.
+        """
+        true_range = TechnicalIndicators.calculate_true_range_batch(highs, lows, closes)
+        out = np.full(len(true_range), np.nan)
+        if len(true_range) >= period + 1:
+            out[period:] = sliding_window_view(true_range[1:], period).mean(axis=1)
+        return out
+
+    @staticmethod
+    def calculate_rsi_batch(closes: Sequence[float], period: int = 14) -> np.ndarray:
+        """
+        RSI at every index
+
+        out[i] == calculate_rsi(closes[:i+1], period); NaN before index period.
+        """
+        closes = np.asarray(closes, dtype=np.float64)
+        out = np.full(len(closes), np.nan)
+        if len(closes) < period + 1:
+            return out
+
+        deltas = np.diff(closes)
+        gains = np.where(deltas > 0, deltas, 0)
+        losses = np.where(deltas < 0, -deltas, 0)
+
+        avg_gain = sliding_window_view(gains, period).mean(axis=1)
+        avg_loss = sliding_window_view(losses, period).mean(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        out[period:] = np.where(avg_loss == 0, 100.0, rsi)
+        return out
+
+    @staticmethod
+    def calculate_wilder_sum_batch(values: Sequence[float], period: int) -> np.ndarray:
+        """
+        Wilder running sum at every index (NaN before index period-1)
+
+        Seeded with sum(values[:period]), then s = s - s/period + value.
+        Divide by `period` for Wilder's moving average.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        out = np.full(len(values), np.nan)
+        if len(values) < period:
+            return out
+
+        seed = np.sum(values[:period])
+        out[period - 1] = seed
+        out[period:] = _linear_recurrence(seed, 1 - 1 / period, values[period:])
+        return out
+
+    @staticmethod
+    def calculate_dx_batch(highs: Sequence[float], lows: Sequence[float],
+                           closes: Sequence[float], period: int = 14) -> np.ndarray:
+        """
+        Directional movement index (DX) at every index
+
+        Uses Wilder-smoothed TR, +DM and -DM. NaN before index period and
+        wherever DX is undefined (zero ATR or zero DI sum).
+        """
+        highs = np.asarray(highs, dtype=np.float64)
+        lows = np.asarray(lows, dtype=np.float64)
+        closes = np.asarray(closes, dtype=np.float64)
+
+        out = np.full(len(highs), np.nan)
+        if len(highs) < period + 1:
+            return out
+
+        # Per-bar moves (length n-1, bar i+1 relative to bar i)
+        true_range = TechnicalIndicators.calculate_true_range_batch(highs, lows, closes)[1:]
+        up_move = highs[1:] - highs[:-1]
+        down_move = lows[:-1] - lows[1:]
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+        smoothed_tr = TechnicalIndicators.calculate_wilder_sum_batch(true_range, period)
+        smoothed_plus = TechnicalIndicators.calculate_wilder_sum_batch(plus_dm, period)
+        smoothed_minus = TechnicalIndicators.calculate_wilder_sum_batch(minus_dm, period)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = 100 * smoothed_plus / smoothed_tr
+            minus_di = 100 * smoothed_minus / smoothed_tr
+            di_sum = plus_di + minus_di
+            dx = 100 * np.abs(plus_di - minus_di) / di_sum
+
+        dx[(smoothed_tr == 0) | ~(di_sum > 0)] = np.nan
+        out[1:] = dx
+        return out
+
+    @staticmethod
+    def calculate_indicators_batch(highs: Sequence[float], lows: Sequence[float],
+                                   closes: Sequence[float], volumes: Sequence[float],
+                                   atr_period: int = 14, ema_periods: Tuple[int, ...] = (20, 50),
+                                   rsi_period: int = 14, volume_period: int = 20) -> Dict[str, np.ndarray]:
+        """
+        Compute the standard indicator set over a whole history in one call
+
+        Returns:
+            Dict of arrays aligned to the input candles:
+            {'atr', 'ema_<period>' for each period, 'rsi', 'volume_mean', 'dx'}
+        """
+        result = {
+            'atr': TechnicalIndicators.calculate_atr_series_batch(highs, lows, closes, atr_period),
+            'rsi': TechnicalIndicators.calculate_rsi_batch(closes, rsi_period),
+            'volume_mean': TechnicalIndicators.calculate_rolling_mean_batch(volumes, volume_period),
+            'dx': TechnicalIndicators.calculate_dx_batch(highs, lows, closes, atr_period)
+        }
+        for period in ema_periods:
+            result[f'ema_{period}'] = TechnicalIndicators.calculate_ema_batch(closes, period)
+        return result
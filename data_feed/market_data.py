@@ -2,15 +2,24 @@
 Market Data Feed
 Aggregates all market data from OKX and provides unified interface
 Handles caching, multi-timeframe data, and derived metrics
+
+Independent requests (per-timeframe candles, funding, OI, ticker, and
+whole symbols) are issued concurrently on a thread pool. The shared
+per-endpoint token buckets in OKXClient keep the combined rate within API limits.
 """
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 from .okx_client import OKXClient
 from .indicators import TechnicalIndicators
+from .indicator_state import IndicatorState
+from .feature_context import FeatureContext
 from config import ENABLE_CACHE, CACHE_EXPIRY_SECONDS
+import config
+from utils.latency import get_stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +38,36 @@ class MarketDataFeed:
         self.cache = {} if ENABLE_CACHE else None
         self.cache_timestamps = {}
 
+        # Incremental indicator state per (symbol, timeframe)
+        self.indicator_states: Dict[Tuple[str, str], IndicatorState] = {}
+
+        # Thread pool for concurrent API requests (None = sequential)
+        self.concurrent = getattr(config, 'MARKET_DATA_CONCURRENT_FETCH', False)
+        self._executor = ThreadPoolExecutor(
+            max_workers=getattr(config, 'MARKET_DATA_FETCH_WORKERS', 8),
+            thread_name_prefix='market-data'
+        ) if self.concurrent else None
+
+    def _submit(self, fn, *args) -> Future:
+        """Run fn on the fetch pool, or inline when concurrent fetching is off"""
+        if self._executor is not None:
+            return self._executor.submit(fn, *args)
+
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _result(self, name: str, future: Future) -> any:
+        """Wait for a submitted request, logging and returning None on failure"""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"❌ Market data request {name} failed: {e}")
+            return None
+
     def _get_cache_key(self, *args) -> str:
         """Generate cache key from arguments"""
         return '_'.join(str(arg) for arg in args)
@@ -71,6 +110,7 @@ class MarketDataFeed:
             Dict mapping timeframe to candle data
         """
         result = {}
+        pending = {}
 
         for tf in timeframes:
             cache_key = self._get_cache_key('candles', symbol, tf, limit)
@@ -78,19 +118,21 @@ class MarketDataFeed:
 
             if cached is not None:
                 result[tf] = cached
-                continue
+            else:
+                pending[tf] = self._submit(self.client.get_candles, symbol, tf, limit)
 
-            raw_candles = self.client.get_candles(symbol, tf, limit)
+        for tf, future in pending.items():
+            raw_candles = self._result(f"{symbol} {tf} candles", future)
             if raw_candles:
                 # Convert to structured format
                 candles = self._format_candles(raw_candles)
                 result[tf] = candles
-                self._cache_data(cache_key, candles)
+                self._cache_data(self._get_cache_key('candles', symbol, tf, limit), candles)
             else:
                 logger.warning(f"Failed to fetch {tf} candles for {symbol}")
                 result[tf] = []
 
-        return result
+        return {tf: result[tf] for tf in timeframes}
 
     def _format_candles(self, raw_candles: List[List]) -> List[Dict]:
         """
@@ -98,21 +140,24 @@ class MarketDataFeed:
 
         OKX format: [timestamp, open, high, low, close, volume, volumeCcy]
         """
-        candles = []
-        for candle in raw_candles:
-            candles.append({
-                'timestamp': int(candle[0]),
-                'datetime': datetime.fromtimestamp(int(candle[0]) / 1000),
-                'open': float(candle[1]),
-                'high': float(candle[2]),
-                'low': float(candle[3]),
-                'close': float(candle[4]),
-                'volume': float(candle[5]),
-                'volume_ccy': float(candle[6]) if len(candle) > 6 else 0
-            })
+        candles = [self._format_candle(candle) for candle in raw_candles]
         # OKX returns newest first, reverse to oldest first
         return list(reversed(candles))
 
+    @staticmethod
+    def _format_candle(candle: List) -> Dict:
+        """Convert one OKX raw candle (REST or WebSocket push) to structured dict"""
+        return {
+            'timestamp': int(candle[0]),
+            'datetime': datetime.fromtimestamp(int(candle[0]) / 1000),
+            'open': float(candle[1]),
+            'high': float(candle[2]),
+            'low': float(candle[3]),
+            'close': float(candle[4]),
+            'volume': float(candle[5]),
+            'volume_ccy': float(candle[6]) if len(candle) > 6 else 0
+        }
+
     def get_current_price(self, symbol: str) -> Optional[float]:
         """Get current market price"""
         cache_key = self._get_cache_key('ticker', symbol)
@@ -152,16 +197,21 @@ class MarketDataFeed:
 
         funding = self.client.get_funding_rate(symbol)
         if funding:
-            result = {
-                'funding_rate': float(funding.get('fundingRate', 0)),
-                'funding_time': datetime.fromtimestamp(int(funding.get('fundingTime', 0)) / 1000),
-                'next_funding_time': datetime.fromtimestamp(int(funding.get('nextFundingTime', 0)) / 1000)
-            }
+            result = self._parse_funding(funding)
             self._cache_data(cache_key, result)
             return result
 
         return None
 
+    @staticmethod
+    def _parse_funding(funding: Dict) -> Dict:
+        """OKX funding-rate payload (REST or WebSocket) to get_funding_rate format"""
+        return {
+            'funding_rate': float(funding.get('fundingRate', 0)),
+            'funding_time': datetime.fromtimestamp(int(funding.get('fundingTime', 0)) / 1000),
+            'next_funding_time': datetime.fromtimestamp(int(funding.get('nextFundingTime', 0)) / 1000)
+        }
+
     def get_open_interest(self, symbol: str) -> Optional[Dict]:
         """
         Get open interest data
@@ -181,16 +231,21 @@ class MarketDataFeed:
 
         oi_data = self.client.get_open_interest(symbol)
         if oi_data:
-            result = {
-                'open_interest': float(oi_data.get('oi', 0)),
-                'open_interest_ccy': float(oi_data.get('oiCcy', 0)),
-                'timestamp': datetime.fromtimestamp(int(oi_data.get('ts', 0)) / 1000)
-            }
+            result = self._parse_open_interest(oi_data)
             self._cache_data(cache_key, result)
             return result
 
         return None
 
+    @staticmethod
+    def _parse_open_interest(oi_data: Dict) -> Dict:
+        """OKX open-interest payload (REST or WebSocket) to get_open_interest format"""
+        return {
+            'open_interest': float(oi_data.get('oi', 0)),
+            'open_interest_ccy': float(oi_data.get('oiCcy', 0)),
+            'timestamp': datetime.fromtimestamp(int(oi_data.get('ts', 0)) / 1000)
+        }
+
     def get_liquidation_heatmap(self, symbol: str, limit: int = 100) -> Optional[List[Dict]]:
         """
         Get recent liquidations for heatmap analysis
@@ -235,6 +290,11 @@ class MarketDataFeed:
         if not orderbook:
             return None
 
+        return self._parse_orderbook(orderbook)
+
+    @staticmethod
+    def _parse_orderbook(orderbook: Dict) -> Optional[Dict]:
+        """OKX books payload (REST or WebSocket) to get_orderbook_depth format"""
         bids = [(float(b[0]), float(b[1])) for b in orderbook.get('bids', [])]
         asks = [(float(a[0]), float(a[1])) for a in orderbook.get('asks', [])]
 
@@ -389,6 +449,112 @@ class MarketDataFeed:
             'volume_delta_positive': volume_delta_positive
         }
 
+    # =====================================
+    # INCREMENTAL INDICATORS
+    # =====================================
+
+    def update_indicator_state(self, symbol: str, timeframe: str,
+                               candles: List[Dict]) -> IndicatorState:
+        """
+        Fold newly fetched candles into the incremental indicator state
+
+        Only candles newer than the last one seen are applied; the newest
+        (still forming) candle is revised in place on every cycle. The state
+        is rebuilt when the fetched window no longer overlaps it.
+        """
+        key = (symbol, timeframe)
+        state = self.indicator_states.get(key)
+
+        if state is None or state.last_timestamp is None or \
+                candles[0]['timestamp'] > state.last_timestamp:
+            # Periods mirror calculate_atr_for_timeframe / calculate_trend_metrics / get_volume_analysis
+            state = IndicatorState(atr_period=14, ema_periods=(10, 20), rsi_period=14,
+                                   volume_period=50, atr_history=100 - 14 + 1)
+            self.indicator_states[key] = state
+
+        state.update_many(candles)
+        return state
+
+    def _atr_metrics_from_state(self, state: IndicatorState) -> Optional[Dict]:
+        """ATR metrics in calculate_atr_for_timeframe format"""
+        atr = state.atr_sma
+        atr_series = state.atr_series
+
+        if not atr or not atr_series:
+            return None
+
+        return {
+            'atr': atr,
+            'atr_series': atr_series,
+            'atr_percentile': self.indicators.calculate_atr_percentile(atr, atr_series),
+            'is_compressed': self.indicators.is_volatility_compressed(atr_series),
+            'current_price': state.last_close
+        }
+
+    def _trend_metrics_from_state(self, state: IndicatorState, candles: List[Dict],
+                                  period: int = 20) -> Optional[Dict]:
+        """Trend metrics in calculate_trend_metrics format"""
+        if len(candles) < period + 1:
+            return None
+
+        closes = [c['close'] for c in candles[-period:]]
+        trend_strength = self.indicators.calculate_trend_strength(closes, period)
+
+        ema_short = state.ema(period // 2)
+        ema_long = state.ema(period)
+
+        if ema_short is not None and ema_long is not None:
+            if ema_short > ema_long * 1.001:  # 0.1% threshold
+                trend_direction = 'up'
+            elif ema_short < ema_long * 0.999:
+                trend_direction = 'down'
+            else:
+                trend_direction = 'sideways'
+        else:
+            trend_direction = 'sideways'
+
+        rsi = state.rsi
+
+        return {
+            'trend_strength': trend_strength,
+            'trend_direction': trend_direction,
+            'rsi': rsi or 50.0,
+            'ema_short': ema_short if ema_short is not None else state.last_close,
+            'ema_long': ema_long if ema_long is not None else state.last_close,
+            'current_price': state.last_close
+        }
+
+    def _volume_metrics_from_state(self, state: IndicatorState,
+                                   candles: List[Dict]) -> Optional[Dict]:
+        """Volume metrics in get_volume_analysis format"""
+        if len(candles) < 10 or state.volume_window < 2:
+            return None
+
+        current_volume = state.current_volume
+        # Rolling window includes the current candle, the average excludes it
+        avg_volume = (state.volume_sum - current_volume) / (state.volume_window - 1)
+        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
+
+        volumes = [c['volume'] for c in candles[-10:]]
+        recent_avg = sum(volumes[-5:]) / 5
+        older_avg = sum(volumes[-10:-5]) / 5
+        volume_trend = 'increasing' if recent_avg > older_avg * 1.1 else \
+                      'decreasing' if recent_avg < older_avg * 0.9 else 'stable'
+
+        tail = candles[-6:]
+        volume_deltas = self.indicators.calculate_volume_delta(
+            [c['volume'] for c in tail], [c['close'] for c in tail]
+        )
+        volume_delta_positive = sum(volume_deltas) > 0 if volume_deltas else False
+
+        return {
+            'current_volume': current_volume,
+            'avg_volume': avg_volume,
+            'volume_ratio': volume_ratio,
+            'volume_trend': volume_trend,
+            'volume_delta_positive': volume_delta_positive
+        }
+
     # =====================================
     # COMPREHENSIVE MARKET STATE
     # =====================================
@@ -402,23 +568,29 @@ class MarketDataFeed:
         """
         logger.info(f"Fetching market state for {symbol}")
 
-        # Get multi-timeframe candles
-        candle_data = self.get_multi_timeframe_data(symbol, timeframes, limit=200)
-
-        # Get market metrics
+        # Market metrics are independent of the candles - start them first
         # Funding rate and open interest only exist for perpetuals (SWAP)
         is_perpetual = 'SWAP' in symbol.upper()
-        funding = self.get_funding_rate(symbol) if is_perpetual else None
-        oi = self.get_open_interest(symbol) if is_perpetual else None
-        current_price = self.get_current_price(symbol)
+        price_future = self._submit(self.get_current_price, symbol)
+        funding_future = self._submit(self.get_funding_rate, symbol) if is_perpetual else None
+        oi_future = self._submit(self.get_open_interest, symbol) if is_perpetual else None
+
+        # Get multi-timeframe candles (timeframes are fetched concurrently)
+        candle_data = self.get_multi_timeframe_data(symbol, timeframes, limit=200)
+
+        current_price = self._result(f"{symbol} ticker", price_future)
+        funding = self._result(f"{symbol} funding", funding_future) if funding_future else None
+        oi = self._result(f"{symbol} open interest", oi_future) if oi_future else None
 
         # Calculate indicators for each timeframe
         indicators_by_tf = {}
         for tf in timeframes:
             if candle_data[tf]:
-                atr_data = self.calculate_atr_for_timeframe(symbol, tf)
-                trend_data = self.calculate_trend_metrics(symbol, tf)
-                volume_data = self.get_volume_analysis(symbol, tf)
+                # Advance the incremental state with candles since the last cycle
+                state = self.update_indicator_state(symbol, tf, candle_data[tf])
+                atr_data = self._atr_metrics_from_state(state)
+                trend_data = self._trend_metrics_from_state(state, candle_data[tf])
+                volume_data = self._volume_metrics_from_state(state, candle_data[tf])
 
                 indicators_by_tf[tf] = {
                     'atr': atr_data,
@@ -435,9 +607,35 @@ class MarketDataFeed:
             'open_interest': oi,
             'timeframes': indicators_by_tf
         }
+        # Derived features (RSI, EMAs, ...) computed once and shared by strategies and filters
+        market_state['features'] = FeatureContext(market_state)
 
         return market_state
 
+    def get_market_states(self, symbols: List[str], timeframes: List[str]) -> Dict[str, Dict]:
+        """
+        Get market state for several symbols at once (e.g. SOL and BTC reference)
+
+        Symbols are fetched concurrently when MARKET_DATA_CONCURRENT_FETCH is on.
+
+        Returns:
+            Dict mapping symbol to get_market_state() result
+        """
+        if self._executor is None or len(symbols) < 2:
+            return {symbol: self._timed_market_state(symbol, timeframes) for symbol in symbols}
+
+        # Separate short-lived threads: get_market_state waits on requests in
+        # self._executor, so it must not occupy a worker of that pool itself
+        with ThreadPoolExecutor(max_workers=len(symbols), thread_name_prefix='market-state') as pool:
+            futures = {symbol: pool.submit(self._timed_market_state, symbol, timeframes)
+                       for symbol in symbols}
+            return {symbol: future.result() for symbol, future in futures.items()}
+
+    def _timed_market_state(self, symbol: str, timeframes: List[str]) -> Dict:
+        """get_market_state() recorded as a per-symbol stage of the trading cycle"""
+        with get_stage_timer().span(f"market_data.{symbol}"):
+            return self.get_market_state(symbol, timeframes)
+
     # =====================================
     # UTILITY METHODS
     # =====================================
@@ -448,6 +646,7 @@ class MarketDataFeed:
             self.cache.clear()
             self.cache_timestamps.clear()
             logger.info("Cache cleared")
+        self.indicator_states.clear()
 
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
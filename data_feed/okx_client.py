@@ -1,7 +1,8 @@
 """
 OKX API Client
 Handles all direct interactions with OKX exchange API
-Includes rate limiting, retries, and error handling
+Includes per-endpoint rate limiting (shared token buckets), retries, and error handling
+Requests go through one pooled keep-alive session with per-endpoint latency histograms
 
 DRY_RUN MODE: When enabled, skips all authenticated endpoints
 and uses simulated data for paper trading without API keys.
@@ -12,20 +13,29 @@ import hmac
 import base64
 import json
 import os
+import uuid
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import requests
+from requests.adapters import HTTPAdapter
 from config import (
     OKX_API_KEY, OKX_SECRET_KEY, OKX_PASSPHRASE, OKX_SIMULATED, OKX_API_DOMAIN,
-    API_RATE_LIMIT_MS, MAX_RETRIES, RETRY_DELAY_MS, API_TIMEOUT_SECONDS
+    MAX_RETRIES, RETRY_DELAY_MS, API_TIMEOUT_SECONDS
 )
+import config
 import logging
+from .rate_limiter import get_rate_limiter
+from utils.latency import LatencyRecorder
 
 logger = logging.getLogger(__name__)
 
 # Check for DRY_RUN mode
 DRY_RUN = os.getenv('DRY_RUN', 'False').lower() == 'true'
 
+# POSTs that create orders: re-sending one that reached OKX duplicates the order
+NON_IDEMPOTENT_ENDPOINTS = ('/api/v5/trade/order', '/api/v5/trade/batch-orders', '/api/v5/trade/close-position')
+
 
 class OKXClient:
     """
@@ -56,14 +66,24 @@ class OKXClient:
         else:
             logger.info("🔴 OKX Client initialized in LIVE mode")
 
-        self.last_request_time = 0
+        # Process-wide per-endpoint buckets, shared with every other OKXClient
+        self.rate_limiter = get_rate_limiter()
         self.request_count = 0
         self.error_count = 0
+
+        # Pooled keep-alive HTTP session (saves a TCP+TLS handshake per request)
+        self.session = self._create_session()
+        self.latency = LatencyRecorder()
+        # Per-thread: did the last order POST fail after it may have reached OKX?
+        self._request_state = threading.local()
         
         # Simulated account for dry run
         self._dry_run_balance = 10000.0
         self._dry_run_positions = []
 
+        # Instrument specs (contract value, lot size) - static, fetched once per symbol
+        self._instruments: Dict[str, Dict] = {}
+
     def _generate_signature(self, timestamp: str, method: str, request_path: str, body: str = '') -> str:
         """Generate signature for authenticated requests"""
         message = timestamp + method + request_path + body
@@ -96,23 +116,59 @@ class OKXClient:
 
         return headers
 
-    def _rate_limit(self):
-        """Implement rate limiting to avoid API throttling"""
-        elapsed = (time.time() * 1000) - self.last_request_time
-        if elapsed < API_RATE_LIMIT_MS:
-            time.sleep((API_RATE_LIMIT_MS - elapsed) / 1000)
-        self.last_request_time = time.time() * 1000
+    def _create_session(self) -> requests.Session:
+        """Create the pooled HTTP session shared by all requests"""
+        pool_size = getattr(config, 'OKX_HTTP_POOL_SIZE', 10)
+        session = requests.Session()
+        # Retries are handled in _request, so the adapter must not retry on its own
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not getattr(config, 'OKX_HTTP_KEEPALIVE', True):
+            session.headers['Connection'] = 'close'
+        return session
+
+    def _timeout_for(self, endpoint: str):
+        """
+        (connect, read) timeout for an endpoint
+
+        Keys ending in '/' match every endpoint below them, other keys match
+        one endpoint exactly; the longest match wins.
+        """
+        read_timeout = API_TIMEOUT_SECONDS
+        best = ''
+        for prefix, timeout in getattr(config, 'API_ENDPOINT_TIMEOUTS', {}).items():
+            matches = endpoint.startswith(prefix) if prefix.endswith('/') else endpoint == prefix
+            if matches and len(prefix) > len(best):
+                best, read_timeout = prefix, timeout
+        return getattr(config, 'API_CONNECT_TIMEOUT_SECONDS', API_TIMEOUT_SECONDS), read_timeout
+
+    def _rate_limit(self, method: str, endpoint: str):
+        """
+        Wait for a token in this endpoint's bucket
+
+        Only calls in the same endpoint group wait on each other, so order
+        placement never queues behind market-data reads.
+        """
+        self.rate_limiter.acquire(method, endpoint)
 
     def _request(self, method: str, endpoint: str, params: Optional[Dict] = None,
                  body: Optional[Dict] = None, authenticated: bool = False) -> Optional[Dict]:
-        """Make HTTP request to OKX API with retry logic"""
+        """
+        Make HTTP request to OKX API with retry logic
+
+        Order-creating POSTs (NON_IDEMPOTENT_ENDPOINTS) are only retried when
+        the connection was never established; after that the order may exist
+        on OKX, so the caller reconciles instead (see place_order).
+        """
         
         # DRY RUN: Skip authenticated requests entirely
         if self.dry_run and authenticated:
             logger.debug(f"🧪 DRY RUN: Skipping authenticated request to {endpoint}")
             return None
             
-        self._rate_limit()
+        self._rate_limit(method, endpoint)
+        self._request_state.unconfirmed = False
 
         url = self.base_url + endpoint
         request_body = json.dumps(body) if body else ''
@@ -124,6 +180,8 @@ class OKXClient:
             query_string = '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
             sign_path = f"{endpoint}?{query_string}"
 
+        timeout = self._timeout_for(endpoint)
+
         for attempt in range(MAX_RETRIES):
             try:
                 if authenticated:
@@ -131,12 +189,17 @@ class OKXClient:
                 else:
                     headers = {'Content-Type': 'application/json'}
 
-                if method == 'GET':
-                    response = requests.get(url, params=params, headers=headers, timeout=API_TIMEOUT_SECONDS)
-                elif method == 'POST':
-                    response = requests.post(url, data=request_body, headers=headers, timeout=API_TIMEOUT_SECONDS)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
+                started = time.perf_counter()
+                try:
+                    if method == 'GET':
+                        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+                    elif method == 'POST':
+                        response = self.session.post(url, data=request_body, headers=headers, timeout=timeout)
+                    else:
+                        raise ValueError(f"Unsupported method: {method}")
+                finally:
+                    # Failed and timed-out attempts count too (they are the slow ones)
+                    self.latency.observe(endpoint, (time.perf_counter() - started) * 1000)
 
                 # Try to parse response
                 try:
@@ -170,6 +233,12 @@ class OKXClient:
                 logger.warning(f"Request failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
                 self.error_count += 1
 
+                if (method == 'POST' and endpoint.startswith(NON_IDEMPOTENT_ENDPOINTS)
+                        and not isinstance(e, requests.exceptions.ConnectTimeout)):
+                    logger.error(f"❌ {endpoint} may have reached OKX - not re-sending")
+                    self._request_state.unconfirmed = True
+                    return None
+
                 if attempt < MAX_RETRIES - 1:
                     time.sleep(RETRY_DELAY_MS / 1000)
                 else:
@@ -381,6 +450,28 @@ class OKXClient:
             return response['data'][0] if response['data'] else None
         return None
 
+    def get_instrument(self, symbol: str) -> Optional[Dict]:
+        """
+        Get instrument spec - PUBLIC endpoint, cached per symbol
+
+        Swap order sizes (sz) count contracts: base size = contracts * ctVal,
+        in steps of lotSz, at least minSz.
+        """
+        if symbol in self._instruments:
+            return self._instruments[symbol]
+
+        endpoint = '/api/v5/public/instruments'
+        params = {
+            'instType': 'SWAP' if symbol.upper().endswith('-SWAP') else 'SPOT',
+            'instId': symbol
+        }
+
+        response = self._request('GET', endpoint, params=params)
+        if response and response.get('data'):
+            self._instruments[symbol] = response['data'][0]
+            return self._instruments[symbol]
+        return None
+
     def get_funding_rate(self, symbol: str) -> Optional[Dict]:
         """Get funding rate - PUBLIC endpoint"""
         endpoint = '/api/v5/public/funding-rate'
@@ -645,6 +736,8 @@ class OKXClient:
             'side': side,
             'ordType': order_type,
             'sz': size,
+            # Client order id: lets a lost response be reconciled instead of re-sent
+            'clOrdId': kwargs.get('client_order_id') or f"sq{uuid.uuid4().hex[:30]}",
         }
         
         # tdMode is REQUIRED for all orders:
@@ -669,6 +762,21 @@ class OKXClient:
         response = self._request('POST', endpoint, body=body, authenticated=True)
         if response and response.get('data'):
             return response['data'][0] if response['data'] else None
+
+        if not getattr(self._request_state, 'unconfirmed', False):
+            return None
+
+        # No answer: the order may still have been placed - look it up by clOrdId
+        existing = self.get_order(symbol, client_order_id=body['clOrdId'])
+        if existing and existing.get('ordId'):
+            logger.warning(f"⚠️  Order {body['clOrdId']} was placed despite the failed response "
+                           f"(ordId {existing['ordId']})")
+            return {
+                'ordId': existing['ordId'],
+                'clOrdId': body['clOrdId'],
+                'sCode': '0',
+                'sMsg': 'Recovered by clOrdId lookup'
+            }
         return None
 
     def cancel_order(self, symbol: str, order_id: str) -> Optional[Dict]:
@@ -688,8 +796,9 @@ class OKXClient:
             return response['data'][0] if response['data'] else None
         return None
 
-    def get_order(self, symbol: str, order_id: str) -> Optional[Dict]:
-        """Get order details - SIMULATED in DRY_RUN mode"""
+    def get_order(self, symbol: str, order_id: Optional[str] = None,
+                  client_order_id: Optional[str] = None) -> Optional[Dict]:
+        """Get order details by ordId or clOrdId - SIMULATED in DRY_RUN mode"""
         if self.dry_run:
             return {
                 'ordId': order_id,
@@ -699,10 +808,11 @@ class OKXClient:
             }
             
         endpoint = '/api/v5/trade/order'
-        params = {
-            'instId': symbol,
-            'ordId': order_id
-        }
+        params = {'instId': symbol}
+        if order_id:
+            params['ordId'] = order_id
+        else:
+            params['clOrdId'] = client_order_id
 
         response = self._request('GET', endpoint, params=params, authenticated=True)
         if response and response.get('data'):
@@ -792,5 +902,11 @@ class OKXClient:
             'error_count': self.error_count,
             'error_rate': self.error_count / max(self.request_count, 1),
             'simulated_mode': self.simulated,
-            'dry_run_mode': self.dry_run
+            'dry_run_mode': self.dry_run,
+            'latency_ms': self.latency.snapshot(),
+            'rate_limits': self.rate_limiter.stats()
         }
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        self.session.close()
@@ -0,0 +1,184 @@
+"""
+Rate Limiter
+Thread-safe token buckets for OKX API calls, one per endpoint group
+
+OKX limits each endpoint separately (e.g. candles 40 req/2s, place order
+60 req/2s, account balance 10 req/2s). A single global delay lets public
+candle reads throttle private order calls and vice versa. RateLimiter keeps
+one TokenBucket per endpoint group so a call only waits when its own bucket
+is empty.
+
+Every OKXClient in the process (trading loop, ProductionOrderManager
+monitor thread, dashboard) shares the limiter from get_rate_limiter(), so
+the buckets see the real combined request rate.
+
+Order placement has its own bucket ('POST /api/v5/trade/order'), so it never
+waits behind market-data reads; there is no cross-group priority to manage.
+"""
+
+import time
+import threading
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket shared by all threads
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+        # Stats
+        self.acquired = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if available
+
+        Returns:
+            0.0 if acquired, otherwise seconds until enough tokens are available
+        """
+        with self._cond:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                self.acquired += 1
+                return 0.0
+            return max((tokens - self._tokens) / self.rate, 0.001)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until tokens are available and take them
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                self._cond.wait(timeout=max((tokens - self._tokens) / self.rate, 0.001))
+
+            waited = time.monotonic() - started
+            self.acquired += 1
+            if waited > 0.001:
+                self.waits += 1
+                self.wait_seconds += waited
+            return waited
+
+    def stats(self) -> Dict:
+        return {
+            'rate_per_sec': round(self.rate, 2),
+            'capacity': self.capacity,
+            'acquired': self.acquired,
+            'waits': self.waits,
+            'wait_ms_total': round(self.wait_seconds * 1000, 1)
+        }
+
+
+class RateLimiter:
+    """
+    One TokenBucket per OKX endpoint group
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]], default: Tuple[float, float],
+                 headroom: float = 1.0):
+        """
+        Args:
+            limits: {endpoint prefix: (requests, per_seconds)}. A key may start with
+                a method ('POST /api/v5/trade/order') to limit that method separately.
+            default: (requests, per_seconds) for endpoints not in limits
+            headroom: Fraction of each OKX limit to actually use (e.g. 0.8)
+        """
+        self.limits = dict(limits)
+        self.default = default
+        self.headroom = headroom
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def group_for(self, method: str, endpoint: str) -> str:
+        """Longest matching prefix ('METHOD /path' keys beat plain '/path' keys)"""
+        best = None
+        best_score = -1
+        for key in self.limits:
+            if ' ' in key:
+                key_method, prefix = key.split(' ', 1)
+                if key_method != method:
+                    continue
+                bonus = 1
+            else:
+                prefix, bonus = key, 0
+            if endpoint.startswith(prefix):
+                score = len(prefix) * 2 + bonus
+                if score > best_score:
+                    best, best_score = key, score
+        return best or 'default'
+
+    def bucket(self, group: str) -> TokenBucket:
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(group)
+                if bucket is None:
+                    if group in self.limits:
+                        requests_, per_seconds = self.limits[group]
+                        capacity = max(1.0, requests_ * self.headroom)
+                    else:
+                        requests_, per_seconds = self.default
+                        capacity = max(1.0, requests_)
+                    bucket = TokenBucket(rate=capacity / per_seconds, capacity=capacity)
+                    self._buckets[group] = bucket
+        return bucket
+
+    def acquire(self, method: str, endpoint: str) -> float:
+        """Wait for a token in the endpoint's group, returns seconds waited"""
+        return self.bucket(self.group_for(method, endpoint)).acquire()
+
+    def stats(self) -> Dict[str, Dict]:
+        return {group: bucket.stats() for group, bucket in sorted(self._buckets.items())}
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide RateLimiter configured from config.py"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                import config
+                default_ms = getattr(config, 'API_RATE_LIMIT_MS', 100)
+                burst = getattr(config, 'API_RATE_LIMIT_BURST', 1)
+                _rate_limiter = RateLimiter(
+                    limits=getattr(config, 'OKX_RATE_LIMITS', {}),
+                    default=(burst, burst * default_ms / 1000),
+                    headroom=getattr(config, 'OKX_RATE_LIMIT_HEADROOM', 1.0)
+                )
+    return _rate_limiter
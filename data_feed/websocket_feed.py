@@ -0,0 +1,435 @@
+"""
+WebSocket Market Data Feed
+Streams OKX candles, tickers, funding, open interest and order books into memory
+
+REST polling only sees the market once per trading cycle. This module keeps
+an OKX WebSocket subscription open in a background thread and maintains:
+
+- CandleBook: rolling candle store per symbol/timeframe (forming candle
+  revised in place, confirmed candles fire close listeners)
+- Latest ticker / funding-rate / open-interest / books5 payload per symbol
+
+StreamingMarketDataFeed is a drop-in MarketDataFeed that answers
+get_market_state() from this memory. REST is only used to seed candle
+history and as a fallback while the stream is disconnected.
+
+Usage:
+    feed = StreamingMarketDataFeed(okx_client, ['SOL-USDT-SWAP'], ['1m', '15m'])
+    feed.start()
+    state = feed.get_market_state('SOL-USDT-SWAP', ['1m', '15m'])
+    feed.stop()
+
+Tests point public_url/business_url at a local fake WebSocket server.
+"""
+
+import json
+import time
+import asyncio
+import threading
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .okx_client import OKXClient
+from .market_data import MarketDataFeed
+import config
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# OKX serves candle channels on /business, everything else here on /public
+PUBLIC_CHANNELS = ('tickers', 'funding-rate', 'open-interest', 'books5')
+
+
+class CandleBook:
+    """
+    Thread-safe rolling candle store per (symbol, timeframe), oldest first
+    """
+
+    def __init__(self, maxlen: int = 300):
+        self.maxlen = maxlen
+        self._candles: Dict[Tuple[str, str], Deque[Dict]] = {}
+        self._stale: set = set()
+        self._close_listeners: List[Callable[[str, str, Dict], None]] = []
+        self._lock = threading.Lock()
+
+    def add_close_listener(self, callback: Callable[[str, str, Dict], None]):
+        """callback(symbol, timeframe, candle) when a candle is confirmed closed"""
+        self._close_listeners.append(callback)
+
+    def seed(self, symbol: str, timeframe: str, candles: List[Dict], fresh: bool = True):
+        """
+        Replace history (e.g. from REST)
+
+        fresh=True clears the stale flag. Seeding while the stream is down
+        passes fresh=False: the REST copy is served, but the book stays stale
+        because nothing keeps it current until the stream resubscribes.
+        """
+        key = (symbol, timeframe)
+        with self._lock:
+            book = deque(maxlen=self.maxlen)
+            existing = self._candles.get(key, ())
+            # Streamed candles newer than the seed are kept
+            last_seed_ts = candles[-1]['timestamp'] if candles else -1
+            book.extend(dict(c) for c in candles)
+            book.extend(c for c in existing if c['timestamp'] > last_seed_ts)
+            self._candles[key] = book
+            if fresh:
+                self._stale.discard(key)
+            else:
+                self._stale.add(key)
+
+    def apply(self, symbol: str, timeframe: str, candle: Dict, confirmed: bool = False) -> bool:
+        """
+        Apply a streamed candle update
+
+        Same timestamp as the newest candle replaces it; newer appends; older
+        is ignored. Returns True if the book changed.
+        """
+        key = (symbol, timeframe)
+        closed = []
+        with self._lock:
+            book = self._candles.setdefault(key, deque(maxlen=self.maxlen))
+            if book and candle['timestamp'] < book[-1]['timestamp']:
+                return False
+
+            if book and candle['timestamp'] == book[-1]['timestamp']:
+                was_confirmed = book[-1].get('confirmed', False)
+                book[-1] = candle
+            else:
+                # A newer bar implies the previous one closed, even without a confirm push
+                if book and not book[-1].get('confirmed', False):
+                    book[-1]['confirmed'] = True
+                    closed.append(book[-1])
+                was_confirmed = False
+                book.append(candle)
+
+            candle['confirmed'] = confirmed
+            if confirmed and not was_confirmed:
+                closed.append(candle)
+
+        for closed_candle in closed:
+            for callback in self._close_listeners:
+                try:
+                    callback(symbol, timeframe, closed_candle)
+                except Exception as e:
+                    logger.error(f"❌ Candle close listener failed: {e}")
+        return True
+
+    def get(self, symbol: str, timeframe: str, limit: Optional[int] = None) -> List[Dict]:
+        """Newest `limit` candles, oldest first (copies)"""
+        with self._lock:
+            book = self._candles.get((symbol, timeframe))
+            if not book:
+                return []
+            candles = list(book)[-limit:] if limit else list(book)
+        return [dict(c) for c in candles]
+
+    def mark_stale(self, keys=None):
+        """Flag books that may have missed updates (e.g. after a disconnect)"""
+        with self._lock:
+            self._stale.update(keys if keys is not None else self._candles.keys())
+
+    def is_fresh(self, symbol: str, timeframe: str) -> bool:
+        key = (symbol, timeframe)
+        with self._lock:
+            return bool(self._candles.get(key)) and key not in self._stale
+
+
+class OKXWebSocketFeed:
+    """
+    Background OKX WebSocket subscriber (asyncio loop in a daemon thread)
+    """
+
+    def __init__(self, symbols: List[str], timeframes: List[str],
+                 public_url: Optional[str] = None, business_url: Optional[str] = None,
+                 book_size: Optional[int] = None, ping_interval: Optional[float] = None):
+        self.symbols = list(symbols)
+        self.timeframes = list(timeframes)
+        self.public_url = public_url or getattr(config, 'OKX_WS_PUBLIC_URL', 'wss://ws.okx.com:8443/ws/v5/public')
+        self.business_url = business_url or getattr(config, 'OKX_WS_BUSINESS_URL', 'wss://ws.okx.com:8443/ws/v5/business')
+        self.ping_interval = ping_interval or getattr(config, 'STREAM_PING_INTERVAL_SECONDS', 20)
+
+        self.book = CandleBook(book_size or getattr(config, 'STREAM_CANDLE_BOOK_SIZE', 300))
+
+        # (channel, symbol) -> latest payload dict
+        self._latest: Dict[Tuple[str, str], Dict] = {}
+        self._connected: Dict[str, bool] = {}
+        self.message_count = 0
+        self.reconnect_count = 0
+        self._candle_session = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._ready = threading.Event()
+
+    # =====================================
+    # LIFECYCLE
+    # =====================================
+
+    def start(self):
+        """Start streaming in a background thread"""
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp is required for WebSocket streaming")
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run_loop, name='okx-websocket', daemon=True)
+        self._thread.start()
+        logger.info(f"📡 WebSocket feed starting for {', '.join(self.symbols)}")
+
+    def stop(self, timeout: float = 5.0):
+        """Close connections and stop the background thread"""
+        self._stopping = True
+        if self._loop and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._cancel_tasks)
+            except RuntimeError:
+                pass  # Loop closed in the meantime
+        if self._thread:
+            self._thread.join(timeout)
+        logger.info("📡 WebSocket feed stopped")
+
+    @staticmethod
+    def _cancel_tasks():
+        for task in asyncio.all_tasks():
+            task.cancel()
+
+    def wait_ready(self, timeout: float = 10.0) -> bool:
+        """Block until every connection has subscribed"""
+        return self._ready.wait(timeout)
+
+    @property
+    def connected(self) -> bool:
+        return bool(self._connected) and all(self._connected.values())
+
+    def candle_session(self) -> Optional[int]:
+        """Id of the current candle subscription, or None while it is down"""
+        if not self._connected.get(self.business_url):
+            return None
+        return self._candle_session
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._run())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
+
+    async def _run(self):
+        connections = self._subscriptions()
+        for url in connections:
+            self._connected[url] = False
+        await asyncio.gather(*(self._run_connection(url, args) for url, args in connections.items()),
+                             return_exceptions=True)
+
+    def _subscriptions(self) -> Dict[str, List[Dict]]:
+        """Subscription args grouped by URL"""
+        public = [{'channel': channel, 'instId': symbol}
+                  for symbol in self.symbols for channel in PUBLIC_CHANNELS
+                  if channel not in ('funding-rate', 'open-interest') or 'SWAP' in symbol.upper()]
+        business = [{'channel': f"candle{tf}", 'instId': symbol}
+                    for symbol in self.symbols for tf in self.timeframes]
+        return {self.public_url: public, self.business_url: business}
+
+    # =====================================
+    # CONNECTION
+    # =====================================
+
+    async def _run_connection(self, url: str, args: List[Dict]):
+        backoff = 1.0
+        while not self._stopping:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.ws_connect(url) as ws:
+                        await ws.send_json({'op': 'subscribe', 'args': args})
+                        if url == self.business_url:
+                            self._candle_session += 1
+                        self._connected[url] = True
+                        if all(self._connected.values()):
+                            self._ready.set()
+                        logger.info(f"✅ WebSocket connected: {url} ({len(args)} channels)")
+                        backoff = 1.0
+
+                        pinger = asyncio.ensure_future(self._keepalive(ws))
+                        try:
+                            async for msg in ws:
+                                if msg.type == aiohttp.WSMsgType.TEXT:
+                                    self._handle_message(msg.data)
+                                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                    break
+                        finally:
+                            pinger.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️  WebSocket {url} error: {e}")
+            finally:
+                if self._connected.get(url):
+                    self.reconnect_count += 1
+                self._connected[url] = False
+                self._ready.clear()
+                if url == self.business_url:
+                    # Candles pushed while disconnected are lost; re-seed before trusting the book
+                    self.book.mark_stale()
+
+            if not self._stopping:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    async def _keepalive(self, ws):
+        """OKX drops idle connections after 30s; send 'ping' periodically"""
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            await ws.send_str('ping')
+
+    # =====================================
+    # MESSAGES
+    # =====================================
+
+    def _handle_message(self, text: str):
+        if text == 'pong':
+            return
+        try:
+            message = json.loads(text)
+        except json.JSONDecodeError:
+            logger.warning(f"⚠️  Unparseable WebSocket message: {text[:100]}")
+            return
+
+        if 'event' in message:
+            if message['event'] == 'error':
+                logger.error(f"❌ WebSocket error [{message.get('code')}]: {message.get('msg')}")
+            return
+
+        arg = message.get('arg', {})
+        channel = arg.get('channel', '')
+        symbol = arg.get('instId', '')
+        data = message.get('data') or []
+        if not channel or not data:
+            return
+
+        self.message_count += 1
+
+        if channel.startswith('candle'):
+            timeframe = channel[len('candle'):]
+            for row in data:
+                candle = MarketDataFeed._format_candle(row)
+                confirmed = len(row) > 8 and str(row[8]) == '1'
+                self.book.apply(symbol, timeframe, candle, confirmed=confirmed)
+        else:
+            payload = dict(data[-1])
+            payload['_received'] = time.time()
+            self._latest[(channel, symbol)] = payload
+
+    def latest(self, channel: str, symbol: str) -> Optional[Dict]:
+        """Latest payload for a channel, or None when missing or disconnected"""
+        if not self._connected.get(self.public_url):
+            return None
+        return self._latest.get((channel, symbol))
+
+    def get_stats(self) -> Dict:
+        return {
+            'connected': self.connected,
+            'messages': self.message_count,
+            'reconnects': self.reconnect_count,
+            'channels': len(self._latest)
+        }
+
+
+class StreamingMarketDataFeed(MarketDataFeed):
+    """
+    MarketDataFeed served from the WebSocket stream
+
+    Any value the stream cannot provide (not yet received, or connection
+    down) falls back to the REST implementation in MarketDataFeed.
+    """
+
+    def __init__(self, okx_client: Optional[OKXClient] = None,
+                 symbols: Optional[List[str]] = None, timeframes: Optional[List[str]] = None,
+                 stream: Optional[OKXWebSocketFeed] = None):
+        super().__init__(okx_client)
+        self.stream = stream or OKXWebSocketFeed(symbols or [], timeframes or [])
+        self.rest_fallbacks = 0
+
+    def start(self, wait: float = 10.0):
+        """Start the stream and wait (up to `wait` seconds) for subscriptions"""
+        self.stream.start()
+        if not self.stream.wait_ready(wait):
+            logger.warning("⚠️  WebSocket not ready yet, using REST until it connects")
+
+    def stop(self):
+        self.stream.stop()
+
+    def add_candle_close_listener(self, callback: Callable[[str, str, Dict], None]):
+        """callback(symbol, timeframe, candle) on every streamed candle close"""
+        self.stream.book.add_close_listener(callback)
+
+    def get_multi_timeframe_data(self, symbol: str, timeframes: List[str],
+                                 limit: int = 100) -> Dict[str, List[Dict]]:
+        result = {}
+        missing = []
+        for tf in timeframes:
+            if self.stream.book.is_fresh(symbol, tf):
+                result[tf] = self.stream.book.get(symbol, tf, limit)
+            else:
+                missing.append(tf)
+
+        if missing:
+            # Seed (or re-seed after a disconnect) from REST, then serve from the book.
+            # The book only counts as fresh if one candle subscription was live for
+            # the whole fetch; otherwise pushes may be missing and REST is asked again
+            self.rest_fallbacks += 1
+            session = self.stream.candle_session()
+            fetched = super().get_multi_timeframe_data(symbol, missing, max(limit, self.stream.book.maxlen))
+            fresh = session is not None and session == self.stream.candle_session()
+            for tf in missing:
+                if fetched.get(tf):
+                    self.stream.book.seed(symbol, tf, fetched[tf], fresh=fresh)
+                result[tf] = self.stream.book.get(symbol, tf, limit)
+
+        return {tf: result[tf] for tf in timeframes}
+
+    def get_current_price(self, symbol: str) -> Optional[float]:
+        ticker = self.stream.latest('tickers', symbol)
+        if ticker and ticker.get('last'):
+            return float(ticker['last'])
+        self.rest_fallbacks += 1
+        return super().get_current_price(symbol)
+
+    def get_funding_rate(self, symbol: str) -> Optional[Dict]:
+        funding = self.stream.latest('funding-rate', symbol)
+        if funding:
+            return self._parse_funding(funding)
+        self.rest_fallbacks += 1
+        return super().get_funding_rate(symbol)
+
+    def get_open_interest(self, symbol: str) -> Optional[Dict]:
+        oi_data = self.stream.latest('open-interest', symbol)
+        if oi_data:
+            return self._parse_open_interest(oi_data)
+        self.rest_fallbacks += 1
+        return super().get_open_interest(symbol)
+
+    def get_orderbook_depth(self, symbol: str, depth: int = 20) -> Optional[Dict]:
+        # books5 only streams 5 levels; deeper requests go to REST
+        orderbook = self.stream.latest('books5', symbol) if depth <= 5 else None
+        if orderbook:
+            return self._parse_orderbook(orderbook)
+        self.rest_fallbacks += 1
+        return super().get_orderbook_depth(symbol, depth)
+
+    def get_cache_stats(self) -> Dict:
+        stats = super().get_cache_stats()
+        stats['stream'] = self.stream.get_stats()
+        stats['stream']['rest_fallbacks'] = self.rest_fallbacks
+        return stats
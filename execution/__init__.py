@@ -5,11 +5,14 @@ Handles order creation, management, and position tracking
 
 from .order_manager import OrderManager
 from .position_tracker import PositionTracker
+from .trade_stats import TradeStats, get_trade_stats
 from .production_manager import ProductionOrderManager, PositionState, ManagedPosition
 
 __all__ = [
     'OrderManager', 
     'PositionTracker',
+    'TradeStats',
+    'get_trade_stats',
     'ProductionOrderManager',
     'PositionState',
     'ManagedPosition'
@@ -3,9 +3,10 @@ Order Manager
 Handles order creation, modification, and cancellation on OKX
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 import logging
 from datetime import datetime
+from decimal import Decimal, ROUND_DOWN
 from data_feed.okx_client import OKXClient
 from config import (
     TRADING_SYMBOL, TRADING_MODE, MAX_RISK_PER_TRADE, 
@@ -31,6 +32,35 @@ class OrderManager:
         # Track orders placed in current session (to avoid canceling them)
         self._session_order_ids = set()
 
+    def _swap_order_size(self, symbol: str, base_size: float) -> Optional[Tuple[str, float]]:
+        """
+        Convert a base-currency size to an OKX swap order size
+
+        Swap `sz` counts contracts of ctVal base units each (1 SOL, 0.1 ETH,
+        0.01 BTC), so the size is divided by ctVal, rounded down to lotSz and
+        raised to minSz.
+
+        Returns:
+            (sz string, base size actually ordered) or None if the
+            instrument spec is unavailable
+        """
+        spec = self.client.get_instrument(symbol)
+        if not spec:
+            logger.error(f"❌ No instrument spec for {symbol} - cannot convert size to contracts")
+            return None
+
+        ct_val = Decimal(spec.get('ctVal') or '1')
+        lot_size = Decimal(spec.get('lotSz') or '1')
+        min_size = Decimal(spec.get('minSz') or spec.get('lotSz') or '1')
+
+        contracts = (Decimal(str(base_size)) / ct_val / lot_size).to_integral_value(ROUND_DOWN) * lot_size
+        if contracts < min_size:
+            logger.warning(f"⚠️  Position size {base_size:.6f} below minimum {min_size} contract(s) "
+                           f"({min_size * ct_val} base)")
+            contracts = min_size
+
+        return f"{contracts.quantize(lot_size):f}", float(contracts * ct_val)
+
     def place_market_order(self, signal: Dict, position_size: float) -> Optional[Dict]:
         """
         Place market order based on signal
@@ -47,7 +77,7 @@ class OrderManager:
             Order details or None if failed
         """
         try:
-            symbol = TRADING_SYMBOL
+            symbol = signal.get('symbol', TRADING_SYMBOL)
             direction = signal['direction']
             side = 'buy' if direction == 'long' else 'sell'
             is_spot = TRADING_MODE == 'spot'
@@ -76,18 +106,18 @@ class OrderManager:
                         logger.warning(f"⚠️  Could not set isolated leverage - using cross margin")
                         td_mode = 'cross'
 
-                # Validate minimum (0.1 for perpetual)
-                min_size = 0.1
-                if position_size < min_size:
-                    logger.warning(f"⚠️  Position size {position_size:.4f} below minimum {min_size}")
-                    position_size = min_size
+                # Swap sizes are in contracts (lot size / minimum per instrument)
+                swap_size = self._swap_order_size(symbol, position_size)
+                if not swap_size:
+                    return None
+                contracts, position_size = swap_size
 
                 # Try perpetual order
                 order_kwargs = {
                     'symbol': symbol,
                     'side': side,
                     'order_type': 'market',
-                    'size': str(round(position_size, 2)),
+                    'size': contracts,
                     'tdMode': td_mode
                 }
                 
@@ -106,10 +136,11 @@ class OrderManager:
                     last_error = getattr(self.client, '_last_error_code', None)
                     if last_error == '51155':
                         logger.warning(f"⚠️  Compliance restriction on perpetuals (51155)")
-                        logger.info(f"🔄 Falling back to SPOT trading ({SPOT_SYMBOL})...")
+                        spot_symbol = SPOT_SYMBOL if symbol == TRADING_SYMBOL else symbol.replace('-SWAP', '')
+                        logger.info(f"🔄 Falling back to SPOT trading ({spot_symbol})...")
                         is_spot = True
                         used_spot_fallback = True
-                        symbol = SPOT_SYMBOL
+                        symbol = spot_symbol
                     else:
                         logger.error("❌ Failed to place perpetual order")
                         return None
@@ -221,7 +252,7 @@ class OrderManager:
             return self.place_market_order(signal, position_size)
         
         try:
-            symbol = TRADING_SYMBOL
+            symbol = signal.get('symbol', TRADING_SYMBOL)
             direction = signal['direction']
             side = 'buy' if direction == 'long' else 'sell'
             current_price = signal.get('entry_price', 0)
@@ -259,17 +290,24 @@ class OrderManager:
                     td_mode = 'isolated'
                     logger.info(f"⚡ Using {GROWTH_LEVERAGE}x leverage (isolated margin)")
             
-            # Validate minimum size
-            min_size = 0.01 if is_spot else 0.1
-            if position_size < min_size:
-                position_size = min_size
+            # Validate minimum size (swap sizes are in contracts)
+            if is_spot:
+                min_size = 0.01
+                if position_size < min_size:
+                    position_size = min_size
+                order_size = str(round(position_size, 4))
+            else:
+                swap_size = self._swap_order_size(symbol, position_size)
+                if not swap_size:
+                    return None
+                order_size, position_size = swap_size
             
             # Place limit order
             order_kwargs = {
                 'symbol': symbol,
                 'side': side,
                 'order_type': 'limit',
-                'size': str(round(position_size, 4 if is_spot else 2)),
+                'size': order_size,
                 'price': str(limit_price),
                 'tdMode': td_mode
             }
@@ -410,11 +448,15 @@ class OrderManager:
                 return order
             else:
                 # PERP trading: Use conditional orders
+                swap_size = self._swap_order_size(symbol, size)
+                if not swap_size:
+                    return None
+
                 order_result = self.client.place_order(
                     symbol=symbol,
                     side=side,
                     order_type='conditional',
-                    size=str(size),
+                    size=swap_size[0],
                     stop_loss=str(stop_price),
                     reduce_only=True
                 )
@@ -475,12 +517,20 @@ class OrderManager:
 
             logger.info(f"🎯 Placing take profit @ ${tp_price:.2f}")
 
+            if is_spot:
+                order_size = str(round(close_size, 4))
+            else:
+                swap_size = self._swap_order_size(symbol, close_size)
+                if not swap_size:
+                    return None
+                order_size = swap_size[0]
+
             # Build order kwargs
             order_kwargs = {
                 'symbol': symbol,
                 'side': side,
                 'order_type': 'limit',
-                'size': str(round(close_size, 4 if is_spot else 2)),
+                'size': order_size,
                 'price': str(round(tp_price, 2))
             }
             
@@ -701,11 +751,19 @@ class OrderManager:
 
             logger.info(f"🔄 Closing position: {side.upper()} {size} @ market")
 
+            if is_spot:
+                order_size = str(round(size, 4))
+            else:
+                swap_size = self._swap_order_size(symbol, size)
+                if not swap_size:
+                    return False
+                order_size = swap_size[0]
+
             order_kwargs = {
                 'symbol': symbol,
                 'side': side,
                 'order_type': 'market',
-                'size': str(round(size, 4 if is_spot else 2))
+                'size': order_size
             }
             
             if is_spot:
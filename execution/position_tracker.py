@@ -8,6 +8,7 @@ import logging
 from datetime import datetime
 from data_feed.okx_client import OKXClient
 from config import TRADING_SYMBOL
+from .trade_stats import get_trade_stats
 
 logger = logging.getLogger(__name__)
 
@@ -152,6 +153,7 @@ class PositionTracker:
 
         position['pnl'] = pnl
         position['pnl_pct'] = pnl_pct
+        get_trade_stats().record_close(pnl)
 
         # Move to closed positions
         self.closed_positions.append(position)
@@ -24,6 +24,7 @@ from config import (
     LIMIT_ORDER_ENTRY_ENABLED, LIMIT_ORDER_IMPROVEMENT,
     LIMIT_ORDER_TIMEOUT, LIMIT_ORDER_MARKET_FALLBACK
 )
+from .trade_stats import get_trade_stats
 
 logger = logging.getLogger(__name__)
 
@@ -941,6 +942,7 @@ class ProductionOrderManager:
         
         # Add to history
         self.trade_history.append(position)
+        get_trade_stats().record_close(position.realized_pnl)
         
         # Clear current position
         self.current_position = None
@@ -1050,6 +1052,7 @@ class ProductionOrderManager:
             'state': pos.state.value,
             'entry_price': pos.entry_price,
             'actual_size': pos.actual_entry_size,
+            'remaining_size': pos.actual_entry_size - (pos.tp1_size if pos.tp1_filled else 0),
             'stop_loss': pos.stop_loss,
             'tp1_price': pos.tp1_price,
             'tp1_filled': pos.tp1_filled,
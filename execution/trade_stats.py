@@ -0,0 +1,131 @@
+"""
+Trade Statistics Store
+Running closed-trade counts kept in memory and persisted to a small JSON file
+
+FilterManager's adaptive score threshold only needs the number of winning
+trades. Counting them with a SQLite query on every signal opened a new
+connection per call; TradeStats is updated once per closed position
+(PositionTracker / ProductionOrderManager) and read in O(1).
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class TradeStats:
+    """
+    Incremental closed-trade counters (thread-safe, persisted on every update)
+    """
+
+    def __init__(self, path: str, legacy_db: Optional[str] = None):
+        """
+        Args:
+            path: JSON file holding the counters
+            legacy_db: SQLite database to seed from when the JSON file does not exist yet
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.total_trades = 0
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.total_pnl = 0.0
+        self.updated_at: Optional[str] = None
+
+        if self.path.exists():
+            self._load()
+        elif legacy_db:
+            self._seed_from_db(legacy_db)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.total_trades = int(data.get('total_trades', 0))
+            self.winning_trades = int(data.get('winning_trades', 0))
+            self.losing_trades = int(data.get('losing_trades', 0))
+            self.total_pnl = float(data.get('total_pnl', 0.0))
+            self.updated_at = data.get('updated_at')
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Could not load trade stats from {self.path}: {e}")
+
+    def _seed_from_db(self, db_path: str):
+        """One-time import of counts from the positions table"""
+        if not os.path.exists(db_path):
+            return
+        try:
+            conn = sqlite3.connect(db_path)
+            try:
+                total, wins, pnl = conn.execute(
+                    "SELECT COUNT(*), SUM(pnl > 0), SUM(pnl) FROM positions WHERE status = 'closed'"
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"No legacy trade stats in {db_path}: {e}")
+            return
+
+        self.total_trades = total or 0
+        self.winning_trades = wins or 0
+        self.losing_trades = self.total_trades - self.winning_trades
+        self.total_pnl = float(pnl or 0.0)
+        if self.total_trades:
+            logger.info(f"📊 Trade stats seeded from {db_path}: {self.winning_trades}/{self.total_trades} wins")
+            self._save()
+
+    def record_close(self, pnl: float):
+        """Count one closed trade (pnl > 0 is a win, matching PositionTracker stats)"""
+        with self._lock:
+            self.total_trades += 1
+            if pnl > 0:
+                self.winning_trades += 1
+            else:
+                self.losing_trades += 1
+            self.total_pnl += pnl
+            self.updated_at = datetime.now().isoformat()
+            self._save()
+
+    def _save(self):
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not save trade stats to {self.path}: {e}")
+
+    def to_dict(self) -> Dict:
+        return {
+            'total_trades': self.total_trades,
+            'winning_trades': self.winning_trades,
+            'losing_trades': self.losing_trades,
+            'total_pnl': round(self.total_pnl, 8),
+            'updated_at': self.updated_at
+        }
+
+
+_trade_stats: Optional[TradeStats] = None
+_trade_stats_lock = threading.Lock()
+
+
+def get_trade_stats() -> TradeStats:
+    """Get the process-wide TradeStats configured from config.py"""
+    global _trade_stats
+    if _trade_stats is None:
+        with _trade_stats_lock:
+            if _trade_stats is None:
+                _trade_stats = TradeStats(
+                    getattr(config, 'TRADE_STATS_PATH', 'data/trade_stats.json'),
+                    legacy_db='trading.db'
+                )
+    return _trade_stats
@@ -18,6 +18,7 @@ from typing import Dict, Optional, Tuple
 import numpy as np
 import logging
 import config
+from data_feed.feature_context import get_features
 from config import (
     BTC_SOL_CORRELATION_ENABLED,
     BTC_SOL_MIN_CORRELATION,
@@ -278,14 +279,11 @@ class BTCSOLCorrelationFilter:
             return result
         
         # === STEP 1: Calculate price changes across timeframes ===
+        features = get_features(btc_state)
         for tf, tf_key in [('15m', '15m'), ('1H', '1h'), ('4H', '4h')]:
-            candles = btc_timeframes.get(tf, {}).get('candles', [])
-            if len(candles) >= 2:
-                current = candles[-1]['close']
-                previous = candles[-2]['close']
-                if previous > 0:
-                    change_pct = ((current - previous) / previous) * 100
-                    result['changes'][tf_key] = round(change_pct, 2)
+            change_pct = features.pct_change(tf)
+            if change_pct is not None:
+                result['changes'][tf_key] = round(change_pct, 2)
         
         # === STEP 2: Determine direction and severity ===
         changes = result['changes']
@@ -7,6 +7,8 @@ Enhanced with ConfidenceEngineV2 for elite position sizing
 
 from typing import Dict, Tuple, List, Optional
 from datetime import datetime, timezone
+import time
+import threading
 import logging
 from .market_regime import MarketRegimeFilter
 from .market_regime_enhanced import MarketRegimeEnhancedFilter
@@ -22,6 +24,8 @@ from .liquidation_filter import LiquidationFilter
 from .open_interest import OpenInterestFilter
 from .signal_scorer import SignalScorer
 from research_filters import SOLPlaybookEngine, TradingChecklistFilter, DriverTierWeighting
+from data_feed.feature_context import get_features
+from execution.trade_stats import get_trade_stats
 import config
 
 logger = logging.getLogger(__name__)
@@ -33,6 +37,10 @@ class FilterManager:
     Ensures EVERY filter passes before allowing trade
     """
 
+    # Pseudo-gate name for the quality score threshold in the gate order
+    QUALITY_GATE = 'quality_score'
+    QUALITY_GATE_COST_MS = 3.0  # RSI + signal scorer + pattern matcher
+
     def __init__(self):
         # Critical filters (binary - must pass)
         self.critical_filters = {
@@ -61,7 +69,7 @@ class FilterManager:
         # Pattern matcher for adaptive learning (similarity to winners)
         try:
             from strategy.pattern_matcher import PatternMatcher
-            self.pattern_matcher = PatternMatcher()
+            self.pattern_matcher = PatternMatcher(top_k=getattr(config, 'PATTERN_MATCH_TOP_K', 0))
             logger.info(f"   Pattern matcher: Enabled ({self.pattern_matcher.get_statistics()['winning_patterns']} winning patterns)")
         except Exception as e:
             logger.warning(f"   Pattern matcher: Disabled ({e})")
@@ -95,6 +103,15 @@ class FilterManager:
             'confidence_distribution': []  # Track confidence distribution
         }
 
+        # check_all may run concurrently for several symbols (portfolio mode)
+        self._stats_lock = threading.Lock()
+
+        # Measured cost and reject rate per binary gate (drives evaluation order)
+        self.gate_profile = {
+            name: {'evaluations': 0, 'rejects': 0, 'total_ms': 0.0}
+            for name in list(self.critical_filters) + [self.QUALITY_GATE]
+        }
+
         logger.info(f"✅ FilterManager initialized with scoring system")
         logger.info(f"   Critical filters: {len(self.critical_filters)} (binary)")
         logger.info(f"   Quality filters: {len(self.quality_filters)} (scoring)")
@@ -117,7 +134,7 @@ class FilterManager:
         Returns:
             (passed: bool, results: Dict with score, breakdown, position_size_multiplier)
         """
-        self.filter_stats['total_checks'] += 1
+        self._count('total_checks')
 
         results = {
             'overall_pass': False,
@@ -133,132 +150,42 @@ class FilterManager:
         logger.info(f"🔍 FILTER CHECK: {signal_direction.upper()} {strategy_name}")
         logger.info(f"{'='*60}")
 
-        # Step 1: Check critical filters (binary - must pass)
-        for filter_name, filter_obj in self.critical_filters.items():
-            if filter_name == 'pattern_failure':
-                passed, reason = filter_obj.check(market_state, signal_direction)
+        # Step 1: Binary gates - critical filters and the quality score threshold.
+        # All must pass, so they run cheapest expected cost first and the
+        # first failure rejects the signal without evaluating the rest.
+        score_context = {}
+        for gate_name in self.get_gate_order():
+            started = time.perf_counter()
+            if gate_name == self.QUALITY_GATE:
+                passed, reason = self._check_quality_score(
+                    market_state, signal_direction, results, score_context
+                )
             else:
-                passed, reason = filter_obj.check(market_state)
-            
-            results['filter_results'][filter_name] = {
-                'passed': passed,
-                'reason': reason
-            }
-            
+                passed, reason = self._check_critical(gate_name, market_state, signal_direction)
+                results['filter_results'][gate_name] = {
+                    'passed': passed,
+                    'reason': reason
+                }
+            self._record_gate(gate_name, passed, (time.perf_counter() - started) * 1000)
+
             if not passed:
                 results['overall_pass'] = False
-                results['failed_filters'].append(filter_name)
-                self._log_failure(filter_name, reason)
-                logger.info(f"❌ CRITICAL FILTER FAILED: {filter_name} - {reason}")
+                results['failed_filters'].append(gate_name)
+                if gate_name == self.QUALITY_GATE:
+                    logger.info(f"❌ QUALITY SCORE TOO LOW: {reason}")
+                else:
+                    self._log_failure(gate_name, reason)
+                    logger.info(f"❌ CRITICAL FILTER FAILED: {gate_name} - {reason}")
                 logger.info(f"{'='*60}\n")
-                self.filter_stats['failed'] += 1
+                self._count('failed')
                 return False, results
-            else:
-                results['passed_filters'].append(filter_name)
+            elif gate_name != self.QUALITY_GATE:
+                results['passed_filters'].append(gate_name)
 
-        # Step 2: Score quality filters
-        # Extract market data for scoring
-        timeframes = market_state.get('timeframes', {})
-        tf_15m = timeframes.get('15m', {})
-        
-        volume_data = tf_15m.get('volume', {})
-        trend_data = tf_15m.get('trend', {})
-        atr_data = tf_15m.get('atr', {})
-        
-        # Calculate RSI if not available
-        candles = tf_15m.get('candles', [])
-        rsi = None
-        if candles and len(candles) >= 14:
-            from data_feed.indicators import TechnicalIndicators
-            indicators = TechnicalIndicators()
-            closes = [c['close'] for c in candles]
-            rsi = indicators.calculate_rsi(closes, period=14)
-        
-        # Get current price from candles if not in market_state
-        current_price = market_state.get('current_price', 0)
-        if current_price == 0 and candles:
-            current_price = candles[-1].get('close', 0)
-        
-        # Prepare market data for scoring
-        market_data_for_scoring = {
-            'volume': volume_data.get('current_volume', 0),
-            'avg_volume_20': volume_data.get('average_volume', 0),
-            'trend': trend_data.get('trend_direction', 'neutral'),
-            'trend_strength': trend_data.get('trend_strength', 0),  # Add trend strength
-            'rsi_14': rsi if rsi is not None else 50,
-            'atr': atr_data.get('atr', 0),
-            'current_price': current_price
-        }
-        
-        signal_for_scoring = {
-            'direction': signal_direction
-        }
-        
-        # Score the signal
-        score, score_breakdown = self.signal_scorer.score_signal(
-            market_data_for_scoring, signal_for_scoring
-        )
-        
-        # Boost score based on similarity to winning patterns (adaptive learning)
-        if self.pattern_matcher:
-            try:
-                market_context = {
-                    'volatility': market_state.get('volatility', 0),
-                    'volume_ratio': market_state.get('volume_ratio', 1),
-                    'trend': market_state.get('trend', 'unknown')
-                }
-                pattern_score = self.pattern_matcher.score_signal(signal_for_scoring, market_context)
-                # Blend pattern score with base score (30% pattern, 70% base)
-                score = (score * 0.7) + (pattern_score * 0.3)
-                score_breakdown['pattern_similarity'] = pattern_score
-                logger.debug(f"   Pattern similarity boost: {pattern_score:.1f} (final score: {score:.1f})")
-            except Exception as e:
-                logger.debug(f"   Pattern matching failed: {e}")
-        
-        results['score'] = score
-        results['score_breakdown'] = score_breakdown
-        self.filter_stats['score_distribution'].append(score)
-        
-        # Step 3: Check if score meets threshold (adaptive - starts at 45, raises to 55 after learning)
-        score_threshold = getattr(config, 'SCORE_THRESHOLD', 45)
-        
-        # Adaptive threshold: raise after enough trades if enabled
-        if getattr(config, 'SCORE_THRESHOLD_ADAPTIVE_ENABLED', True):
-            # Check if we have enough winning patterns learned
-            if self.pattern_matcher:
-                stats = self.pattern_matcher.get_statistics()
-                total_patterns = stats.get('total_patterns', 0)
-                winning_patterns = stats.get('winning_patterns', 0)
-                
-                # Raise threshold if we have 20+ winning patterns
-                if winning_patterns >= getattr(config, 'SCORE_THRESHOLD_MIN_TRADES_FOR_ADAPTATION', 20):
-                    score_threshold = getattr(config, 'SCORE_THRESHOLD_ADAPTED_VALUE', 55)
-                    logger.debug(f"📈 Adaptive threshold raised: {score_threshold} (after {winning_patterns} winning patterns)")
-            else:
-                # Fallback: try to get stats from position tracker if available
-                try:
-                    from execution.position_tracker import PositionTracker
-                    import sqlite3
-                    # Try to read from database directly
-                    conn = sqlite3.connect('trading.db')
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT COUNT(*) FROM positions WHERE pnl > 0")
-                    winning_trades = cursor.fetchone()[0]
-                    conn.close()
-                    
-                    if winning_trades >= getattr(config, 'SCORE_THRESHOLD_MIN_TRADES_FOR_ADAPTATION', 20):
-                        score_threshold = getattr(config, 'SCORE_THRESHOLD_ADAPTED_VALUE', 55)
-                        logger.debug(f"📈 Adaptive threshold raised: {score_threshold} (after {winning_trades} winning trades)")
-                except:
-                    pass  # Fallback to default if can't get stats
-        
-        if score < score_threshold:
-            results['overall_pass'] = False
-            results['failed_filters'].append('quality_score')
-            logger.info(f"❌ QUALITY SCORE TOO LOW: {score}/100 (minimum: {score_threshold})")
-            logger.info(f"{'='*60}\n")
-            self.filter_stats['failed'] += 1
-            return False, results
+        score = results['score']
+        atr_data = score_context['atr_data']
+        trend_data = score_context['trend_data']
+        current_price = score_context['current_price']
         
         # Step 4: Enhanced confidence scoring with ConfidenceEngineV2
         confidence_band = 'MEDIUM'
@@ -270,7 +197,7 @@ class FilterManager:
             try:
                 # Build signal context for ConfidenceEngineV2
                 signal_context = {
-                    'symbol': 'SOL',
+                    'symbol': market_state.get('symbol', config.TRADING_SYMBOL).split('-')[0],
                     'direction': signal_direction,
                     'base_confidence': score,
                     'filters_passed': results['passed_filters'],
@@ -343,173 +270,174 @@ class FilterManager:
         logger.info(f"   Position size multiplier: {position_multiplier}x")
         logger.info(f"{'='*60}\n")
         
-        self.filter_stats['passed'] += 1
+        self._count('passed')
         return True, results
 
-        # Run each filter in sequence
-        # Order matters: cheaper checks first
+    def _check_critical(self, filter_name: str, market_state: Dict,
+                        signal_direction: str) -> Tuple[bool, str]:
+        """Run one critical filter"""
+        filter_obj = self.critical_filters[filter_name]
+        if filter_name == 'pattern_failure':
+            return filter_obj.check(market_state, signal_direction)
+        return filter_obj.check(market_state)
 
-        # Filter 1: Market Regime (fast check)
-        regime_passed, regime_reason = self.filters['market_regime'].check(market_state)
-        results['filter_results']['market_regime'] = {
-            'passed': regime_passed,
-            'reason': regime_reason
-        }
-
-        if not regime_passed:
-            results['overall_pass'] = False
-            results['failed_filters'].append('market_regime')
-            self._log_failure('market_regime', regime_reason)
-        else:
-            results['passed_filters'].append('market_regime')
+    def _check_quality_score(self, market_state: Dict, signal_direction: str,
+                             results: Dict, score_context: Dict) -> Tuple[bool, str]:
+        """
+        Score the signal and compare against the (adaptive) threshold
 
-        # Filter 2: Pattern Failure (fast check)
-        pattern_passed, pattern_reason = self.filters['pattern_failure'].check(
-            market_state, signal_direction
-        )
-        results['filter_results']['pattern_failure'] = {
-            'passed': pattern_passed,
-            'reason': pattern_reason
+        Fills results['score'] / results['score_breakdown'] and the data later
+        steps need (atr_data, trend_data, current_price) into score_context.
+        """
+        # Extract market data for scoring
+        timeframes = market_state.get('timeframes', {})
+        tf_15m = timeframes.get('15m', {})
+        
+        volume_data = tf_15m.get('volume', {})
+        trend_data = tf_15m.get('trend', {})
+        atr_data = tf_15m.get('atr', {})
+        
+        # RSI from the shared feature context (computed once per cycle)
+        candles = tf_15m.get('candles', [])
+        rsi = None
+        if candles and len(candles) >= 14:
+            rsi = get_features(market_state).rsi('15m', 14)
+        
+        # Get current price from candles if not in market_state
+        current_price = market_state.get('current_price', 0)
+        if current_price == 0 and candles:
+            current_price = candles[-1].get('close', 0)
+        
+        # Prepare market data for scoring
+        market_data_for_scoring = {
+            'volume': volume_data.get('current_volume', 0),
+            'avg_volume_20': volume_data.get('average_volume', 0),
+            'trend': trend_data.get('trend_direction', 'neutral'),
+            'trend_strength': trend_data.get('trend_strength', 0),  # Add trend strength
+            'rsi_14': rsi if rsi is not None else 50,
+            'atr': atr_data.get('atr', 0),
+            'current_price': current_price
         }
-
-        if not pattern_passed:
-            results['overall_pass'] = False
-            results['failed_filters'].append('pattern_failure')
-            self._log_failure('pattern_failure', pattern_reason)
-        else:
-            results['passed_filters'].append('pattern_failure')
-
-        # Filter 3: Multi-Timeframe (moderate check)
-        mtf_passed, mtf_reason = self.filters['multi_timeframe'].check(
-            market_state, signal_direction
-        )
-        results['filter_results']['multi_timeframe'] = {
-            'passed': mtf_passed,
-            'reason': mtf_reason
+        
+        signal_for_scoring = {
+            'direction': signal_direction
         }
-
-        if not mtf_passed:
-            results['overall_pass'] = False
-            results['failed_filters'].append('multi_timeframe')
-            self._log_failure('multi_timeframe', mtf_reason)
-        else:
-            results['passed_filters'].append('multi_timeframe')
-
-        # Filter 4: AI Rejection (most expensive check, run last)
-        ai_passed, ai_reason = self.filters['ai_rejection'].check(
-            market_state, signal_direction, strategy_name
+        
+        # Score the signal
+        score, score_breakdown = self.signal_scorer.score_signal(
+            market_data_for_scoring, signal_for_scoring
         )
-        results['filter_results']['ai_rejection'] = {
-            'passed': ai_passed,
-            'reason': ai_reason
-        }
-
-        if not ai_passed:
-            results['overall_pass'] = False
-            results['failed_filters'].append('ai_rejection')
-            self._log_failure('ai_rejection', ai_reason)
-        else:
-            results['passed_filters'].append('ai_rejection')
-
-        # Filter 5: BTC-SOL Correlation (if enabled and BTC data available)
-        if config.BTC_SOL_CORRELATION_ENABLED and btc_market_state:
-            correlation_passed, correlation_reason = self.filters['btc_sol_correlation'].check(
-                market_state, btc_market_state, signal_direction
-            )
-            results['filter_results']['btc_sol_correlation'] = {
-                'passed': correlation_passed,
-                'reason': correlation_reason
-            }
-
-            if not correlation_passed:
-                results['overall_pass'] = False
-                results['failed_filters'].append('btc_sol_correlation')
-                self._log_failure('btc_sol_correlation', correlation_reason)
-            else:
-                results['passed_filters'].append('btc_sol_correlation')
-
-        # Filter 6: Macro Driver (if enabled)
-        macro_state = None
-        if config.MACRO_DRIVER_ENABLED:
-            macro_passed, macro_reason, macro_state = self.filters['macro_driver'].check(
-                market_state, btc_market_state, signal_direction
-            )
-            results['filter_results']['macro_driver'] = {
-                'passed': macro_passed,
-                'reason': macro_reason,
-                'macro_assessment': macro_state
-            }
-
-            if not macro_passed:
-                results['overall_pass'] = False
-                results['failed_filters'].append('macro_driver')
-                self._log_failure('macro_driver', macro_reason)
-            else:
-                results['passed_filters'].append('macro_driver')
-
-        # Filter 7: Trading Checklist (if enabled)
-        checklist_details = None
-        if config.CHECKLIST_ENABLED:
-            checklist_passed, checklist_reason, checklist_details = self.filters['checklist'].check(
-                market_state, macro_state, None  # TODO: Pass AI signals when available
-            )
-            results['filter_results']['checklist'] = {
-                'passed': checklist_passed,
-                'reason': checklist_reason,
-                'details': checklist_details
-            }
-
-            if not checklist_passed:
-                results['overall_pass'] = False
-                results['failed_filters'].append('checklist')
-                self._log_failure('checklist', checklist_reason)
+        
+        # Boost score based on similarity to winning patterns (adaptive learning)
+        if self.pattern_matcher:
+            try:
+                market_context = {
+                    'volatility': market_state.get('volatility', 0),
+                    'volume_ratio': market_state.get('volume_ratio', 1),
+                    'trend': market_state.get('trend', 'unknown')
+                }
+                pattern_score = self.pattern_matcher.score_signal(signal_for_scoring, market_context)
+                # Blend pattern score with base score (30% pattern, 70% base)
+                score = (score * 0.7) + (pattern_score * 0.3)
+                score_breakdown['pattern_similarity'] = pattern_score
+                logger.debug(f"   Pattern similarity boost: {pattern_score:.1f} (final score: {score:.1f})")
+            except Exception as e:
+                logger.debug(f"   Pattern matching failed: {e}")
+        
+        results['score'] = score
+        results['score_breakdown'] = score_breakdown
+        self.filter_stats['score_distribution'].append(score)
+        
+        # Check if score meets threshold (adaptive - starts at 45, raises to 55 after learning)
+        score_threshold = getattr(config, 'SCORE_THRESHOLD', 45)
+        
+        # Adaptive threshold: raise after enough trades if enabled
+        if getattr(config, 'SCORE_THRESHOLD_ADAPTIVE_ENABLED', True):
+            # Check if we have enough winning patterns learned
+            if self.pattern_matcher:
+                stats = self.pattern_matcher.get_statistics()
+                total_patterns = stats.get('total_patterns', 0)
+                winning_patterns = stats.get('winning_patterns', 0)
+                
+                # Raise threshold if we have 20+ winning patterns
+                if winning_patterns >= getattr(config, 'SCORE_THRESHOLD_MIN_TRADES_FOR_ADAPTATION', 20):
+                    score_threshold = getattr(config, 'SCORE_THRESHOLD_ADAPTED_VALUE', 55)
+                    logger.debug(f"📈 Adaptive threshold raised: {score_threshold} (after {winning_patterns} winning patterns)")
             else:
-                results['passed_filters'].append('checklist')
+                # Fallback: closed-trade counters kept up to date as positions close
+                winning_trades = get_trade_stats().winning_trades
+                if winning_trades >= getattr(config, 'SCORE_THRESHOLD_MIN_TRADES_FOR_ADAPTATION', 20):
+                    score_threshold = getattr(config, 'SCORE_THRESHOLD_ADAPTED_VALUE', 55)
+                    logger.debug(f"📈 Adaptive threshold raised: {score_threshold} (after {winning_trades} winning trades)")
+        
+        score_context.update({
+            'atr_data': atr_data,
+            'trend_data': trend_data,
+            'current_price': current_price
+        })
+        return score >= score_threshold, f"{score}/100 (minimum: {score_threshold})"
 
-            # Store checklist multiplier for position sizing
-            if checklist_details:
-                results['position_size_multiplier'] = checklist_details.get('total_score', 80) / 100
+    def get_gate_order(self) -> List[str]:
+        """
+        Evaluation order of the binary gates
 
-        # Research Filter: SOL Playbook (advisory only, doesn't block)
-        playbook_analysis = self.research_filters['sol_playbook'].analyze(
-            market_state, btc_market_state
-        )
-        results['playbook_analysis'] = playbook_analysis
-        logger.info(f"📖 Playbook: {playbook_analysis.get('setup', 'none')} setup (confidence: {playbook_analysis.get('confidence', 0):.2f})")
-
-        # Research Filter: Driver Tier Weighting (advisory only, doesn't block)
-        if macro_state and 'tier_outputs' in macro_state:
-            tiers = macro_state['tier_outputs']
-            tier_assessment = self.research_filters['driver_weighting'].aggregate_assessment(
-                tiers.get('tier1', {}),
-                tiers.get('tier2', {}),
-                tiers.get('tier3', {}),
-                tiers.get('tier4', {}),
-                signal_direction
-            )
-            results['tier_assessment'] = tier_assessment
-            logger.info(f"⚖️  Tier Assessment: {tier_assessment.get('environment_bias', 'neutral')} (score: {tier_assessment.get('weighted_score', 50):.1f})")
-
-        # Update stats
-        if results['overall_pass']:
-            self.filter_stats['passed'] += 1
-            logger.info(f"\n{'='*60}")
-            logger.info(f"✅ ALL FILTERS PASSED - TRADE ALLOWED")
-            logger.info(f"{'='*60}\n")
+        For independent all-must-pass checks, expected cost per signal is
+        minimized by sorting on cost / reject probability. Cost is the measured
+        mean once a gate has FILTER_ORDER_MIN_SAMPLES evaluations, otherwise the
+        filter's declared estimated_cost_ms.
+        """
+        gates = list(self.critical_filters) + [self.QUALITY_GATE]
+        if not getattr(config, 'FILTER_COST_ORDERING', True):
+            return gates
+        # Stable sort: ties keep the declaration order
+        return sorted(gates, key=self._gate_rank)
+
+    def _gate_rank(self, gate_name: str) -> float:
+        profile = self.gate_profile[gate_name]
+        if profile['evaluations'] >= getattr(config, 'FILTER_ORDER_MIN_SAMPLES', 20):
+            cost = profile['total_ms'] / profile['evaluations']
         else:
-            self.filter_stats['failed'] += 1
-            logger.info(f"\n{'='*60}")
-            logger.info(f"❌ TRADE REJECTED")
-            logger.info(f"Failed filters: {', '.join(results['failed_filters'])}")
-            logger.info(f"{'='*60}\n")
-
-        return results['overall_pass'], results
+            cost = self._estimated_cost(gate_name)
+        # Laplace-smoothed so unseen gates start at 50%
+        reject_rate = (profile['rejects'] + 1) / (profile['evaluations'] + 2)
+        return cost / reject_rate
+
+    def _estimated_cost(self, gate_name: str) -> float:
+        if gate_name == self.QUALITY_GATE:
+            return self.QUALITY_GATE_COST_MS
+        return getattr(self.critical_filters[gate_name], 'estimated_cost_ms', 1.0)
+
+    def _record_gate(self, gate_name: str, passed: bool, elapsed_ms: float):
+        with self._stats_lock:
+            profile = self.gate_profile[gate_name]
+            profile['evaluations'] += 1
+            profile['total_ms'] += elapsed_ms
+            if not passed:
+                profile['rejects'] += 1
+
+    def _count(self, stat: str):
+        with self._stats_lock:
+            self.filter_stats[stat] += 1
+
+    def get_gate_profile(self) -> Dict[str, Dict]:
+        """Measured reject rate and cost per binary gate"""
+        profile = {}
+        for gate_name, data in self.gate_profile.items():
+            evaluations = data['evaluations']
+            profile[gate_name] = {
+                'evaluations': evaluations,
+                'rejects': data['rejects'],
+                'reject_rate': data['rejects'] / evaluations if evaluations else 0,
+                'mean_ms': round(data['total_ms'] / evaluations, 3) if evaluations else None,
+                'estimated_cost_ms': self._estimated_cost(gate_name)
+            }
+        return profile
 
     def _log_failure(self, filter_name: str, reason: str):
         """Log filter failure"""
-        if filter_name not in self.filter_stats['failed_by_filter']:
-            self.filter_stats['failed_by_filter'][filter_name] = 0
-        self.filter_stats['failed_by_filter'][filter_name] += 1
+        with self._stats_lock:
+            failed_by_filter = self.filter_stats['failed_by_filter']
+            failed_by_filter[filter_name] = failed_by_filter.get(filter_name, 0) + 1
 
         logger.warning(f"❌ {filter_name}: {reason}")
 
@@ -530,6 +458,9 @@ class FilterManager:
             stats['pass_rate'] = 0
             stats['reject_rate'] = 0
 
+        stats['gate_order'] = self.get_gate_order()
+        stats['gate_profile'] = self.get_gate_profile()
+
         return stats
 
     def get_individual_filter_stats(self) -> Dict:
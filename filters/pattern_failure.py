@@ -30,6 +30,7 @@ class PatternFailureFilter:
 
     def __init__(self):
         self.name = "PatternFailure"
+        self.estimated_cost_ms = 2.0  # Trap/fakeout scans over recent candles
         self.recent_patterns = []  # Track recent patterns detected
 
     def check(self, market_state: Dict, signal_direction: str) -> Tuple[bool, str]:
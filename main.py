@@ -24,7 +24,7 @@ import signal
 import sys
 import threading
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import logging
 
 # Import modules
@@ -36,9 +36,12 @@ from utils.reliability import (
     get_system_health, init_system_health, retry_with_backoff, 
     safe_execute, SystemHealth
 )
-from data_feed import OKXClient, MarketDataFeed
+from utils.candle_scheduler import CandleCloseScheduler
+from utils.latency import get_stage_timer
+from utils.risk_dashboard import get_risk_dashboard
+from data_feed import OKXClient, MarketDataFeed, StreamingMarketDataFeed
 from filters import FilterManager
-from strategy import StrategyManager
+from strategy import StrategyManager, PortfolioScanner
 from risk import RiskManager
 from execution import OrderManager, PositionTracker, ProductionOrderManager
 from model_learning import DataCollector
@@ -115,7 +118,8 @@ try:
         set_market_regime,
         update_filter_stats,
         add_error,
-        update_daily_pnl
+        update_daily_pnl,
+        update_live_snapshot
     )
     DASHBOARD_AVAILABLE = True
 except ImportError:
@@ -156,10 +160,42 @@ class EliteQuantSystem:
 
         # Initialize all components
         self.okx_client = OKXClient()
-        self.market_data = MarketDataFeed(self.okx_client)
+
+        # Tradable symbols: TRADING_SYMBOL, or PORTFOLIO_SYMBOLS in portfolio mode
+        self.trading_symbols = [config.TRADING_SYMBOL]
+        if getattr(config, 'PORTFOLIO_MODE', False):
+            self.trading_symbols = list(dict.fromkeys(getattr(config, 'PORTFOLIO_SYMBOLS', self.trading_symbols)))
+        self.market_symbols = list(self.trading_symbols)
+        if hasattr(config, 'REFERENCE_SYMBOL') and config.REFERENCE_SYMBOL not in self.market_symbols:
+            self.market_symbols.append(config.REFERENCE_SYMBOL)
+
+        if getattr(config, 'MARKET_DATA_STREAMING', False):
+            # Candles/ticker/funding/OI pushed over WebSocket, REST only as fallback
+            self.market_data = StreamingMarketDataFeed(
+                self.okx_client,
+                symbols=self.market_symbols,
+                timeframes=[config.MICRO_TIMEFRAME, config.LTF_TIMEFRAME,
+                            config.MTF_TIMEFRAME, config.HTF_TIMEFRAME]
+            )
+            self.market_data.start()
+            logger.info("✅ WebSocket market data streaming enabled")
+        else:
+            self.market_data = MarketDataFeed(self.okx_client)
         self.filter_manager = FilterManager()
         self.strategy_manager = StrategyManager()
         self.risk_manager = RiskManager(self.okx_client)
+
+        # Portfolio mode: strategies + filters for every symbol, evaluated concurrently
+        self.portfolio_scanner = None
+        if getattr(config, 'PORTFOLIO_MODE', False):
+            self.portfolio_scanner = PortfolioScanner(
+                self.trading_symbols,
+                self.filter_manager,
+                max_workers=getattr(config, 'PORTFOLIO_MAX_WORKERS', 4),
+                reference_symbol=getattr(config, 'REFERENCE_SYMBOL', None),
+                signal_gate=self._htf_trend_block
+            )
+            logger.info(f"✅ Portfolio mode: {len(self.trading_symbols)} symbols")
         self.order_manager = OrderManager(self.okx_client)
         self.position_tracker = PositionTracker(self.okx_client)
         self.data_collector = DataCollector()
@@ -292,6 +328,9 @@ class EliteQuantSystem:
             
             self.production_manager._on_trade_close = on_trade_complete
 
+        # /api/risk-exposure reads balance and position through the shared risk dashboard
+        get_risk_dashboard(self.risk_manager, self.production_manager)
+
         # Initialize AI gating (Hybrid AI preferred, fallback to Claude-only)
         self.claude_system = None
         self.claude_enabled = getattr(config, 'CLAUDE_GATING_ENABLED', True)
@@ -378,6 +417,21 @@ class EliteQuantSystem:
             config.HTF_TIMEFRAME
         ]
 
+        # Per-stage cycle latency (exposed via SystemMonitor and /api/latency)
+        self.stages = get_stage_timer()
+
+        # Event-driven loop: full cycles on candle close, position updates in between
+        self.candle_scheduler = None
+        if getattr(config, 'EVENT_DRIVEN_LOOP', False):
+            self.candle_scheduler = CandleCloseScheduler(
+                getattr(config, 'EVENT_TRIGGER_TIMEFRAMES', [config.LTF_TIMEFRAME]),
+                position_interval=getattr(config, 'POSITION_UPDATE_INTERVAL_SECONDS', 15),
+                close_delay=getattr(config, 'CANDLE_CLOSE_DELAY_SECONDS', 2)
+            )
+            if isinstance(self.market_data, StreamingMarketDataFeed):
+                self.market_data.add_candle_close_listener(self.candle_scheduler.notify_close)
+            logger.info(f"✅ Event-driven loop on {', '.join(self.candle_scheduler.periods)} candle close")
+
         logger.info("✅ All components initialized")
 
     def run(self):
@@ -391,7 +445,7 @@ class EliteQuantSystem:
 
         logger.info("\n" + "="*60)
         logger.info("🎯 ELITE QUANT SYSTEM STARTED")
-        logger.info(f"Symbol: {config.TRADING_SYMBOL}")
+        logger.info(f"Symbol{'s' if len(self.trading_symbols) > 1 else ''}: {', '.join(self.trading_symbols)}")
         logger.info(f"Mode: {'SIMULATED' if config.OKX_SIMULATED else 'LIVE'}")
         logger.info(f"Max Daily Trades: {config.MAX_DAILY_TRADES}")
         logger.info(f"Risk Per Trade: {config.MAX_RISK_PER_TRADE*100}%")
@@ -410,7 +464,17 @@ class EliteQuantSystem:
         max_consecutive_errors = 5
         
         try:
+            run_full_cycle = True
             while self.running:
+                if not run_full_cycle:
+                    # Mid-bar: nothing new to analyze, just keep positions current
+                    try:
+                        self._update_positions()
+                    except Exception as e:
+                        logger.error(f"❌ Position update error: {e}")
+                    run_full_cycle = self.candle_scheduler.wait()
+                    continue
+
                 self.cycle_count += 1
                 status = "PAUSED" if self.trading_paused else "ACTIVE"
                 logger.info(f"\n{'─'*60}")
@@ -421,8 +485,9 @@ class EliteQuantSystem:
                 self.system_health.beat('trading_loop')
                 
                 try:
-                    # Run one trading cycle
-                    self._run_trading_cycle()
+                    # Run one trading cycle (per-stage latency in self.stages)
+                    with self.stages.cycle():
+                        self._run_trading_cycle()
                     
                     # Success - reset error counter
                     consecutive_errors = 0
@@ -462,8 +527,11 @@ Check logs and restart when ready.
                         time.sleep(30)
                         continue  # Skip the normal wait
 
-                # Wait before next cycle
-                time.sleep(60)  # Check every minute
+                # Wait for the next candle close (position updates in between)
+                if self.candle_scheduler:
+                    run_full_cycle = self.candle_scheduler.wait()
+                else:
+                    time.sleep(60)  # Check every minute
                 
                 # Log health status every 10 cycles
                 if self.cycle_count % 10 == 0:
@@ -502,45 +570,46 @@ Manual restart required.
         """
         try:
             # Step 1: Update existing positions
-            self._update_positions()
+            with self.stages.span('update_positions'):
+                self._update_positions()
 
-            # Step 2: Fetch market data for SOL (trading) and BTC (reference)
+            # Step 2: Fetch market data for SOL (or every portfolio symbol) and BTC (reference) concurrently
             logger.info(f"📊 Fetching market data...")
-            sol_market_state = self.market_data.get_market_state(
-                config.TRADING_SYMBOL,
-                self.timeframes
-            )
+            with self.stages.span('market_data'):
+                market_states = self.market_data.get_market_states(self.market_symbols, self.timeframes)
+            sol_market_state = market_states.get(config.TRADING_SYMBOL)
             
             # Heartbeat - market data fetched successfully
             if sol_market_state:
                 self.system_health.beat('market_data')
 
-            # Update dashboard with prices
-            if DASHBOARD_AVAILABLE and sol_market_state:
-                current_price = sol_market_state.get('current_price', 0)
-                update_prices(current_price, 0)  # BTC price updated below
-
-            # Fetch BTC data for correlation analysis
+            # BTC data for correlation analysis
             btc_market_state = None
             if hasattr(config, 'REFERENCE_SYMBOL'):
-                logger.info(f"📊 Fetching BTC reference data...")
-                btc_market_state = self.market_data.get_market_state(
-                    config.REFERENCE_SYMBOL,
-                    self.timeframes
-                )
-                if DASHBOARD_AVAILABLE and btc_market_state:
-                    btc_price = btc_market_state.get('current_price', 0)
-                    sol_price = sol_market_state.get('current_price', 0) if sol_market_state else 0
-                    update_prices(sol_price, btc_price)
+                btc_market_state = market_states.get(config.REFERENCE_SYMBOL)
+
+            # Update dashboard with both prices at once (one 'prices' event per cycle)
+            if DASHBOARD_AVAILABLE and (sol_market_state or btc_market_state):
+                sol_price = sol_market_state.get('current_price', 0) if sol_market_state else 0
+                btc_price = btc_market_state.get('current_price') if btc_market_state else None
+                update_prices(sol_price, btc_price)
 
             # Update balance on dashboard
             if DASHBOARD_AVAILABLE:
-                balance = self.risk_manager.get_account_balance()
+                with self.stages.span('balance'):
+                    balance = self.risk_manager.get_account_balance()
                 if balance:
                     update_balance(balance, balance)
+                # Hand the reads to /api/live so the dashboard need not repeat them
+                update_live_snapshot(
+                    balance_data=self.risk_manager.last_balance_data,
+                    sol_price=sol_market_state.get('current_price') if sol_market_state else None,
+                    btc_price=btc_market_state.get('current_price') if btc_market_state else None
+                )
 
             # Step 3: Check emergency conditions (pause trading, don't stop system)
-            emergency, reason = self.risk_manager.check_emergency_conditions(sol_market_state)
+            with self.stages.span('emergency_check'):
+                emergency, reason = self.risk_manager.check_emergency_conditions(sol_market_state)
             if emergency:
                 if not self.trading_paused:
                     # First time detecting emergency - pause trading
@@ -564,7 +633,7 @@ Manual restart required.
 <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
 
 <i>Will auto-resume when conditions normalize.</i>
-""".strip())
+""".strip(), key='trading_state')
                 else:
                     # Already paused, just log briefly
                     logger.info(f"⏸️  Still paused: {reason}")
@@ -593,7 +662,7 @@ Manual restart required.
 <b>Paused for:</b> {pause_duration:.0f} seconds
 <b>Status:</b> Actively looking for trades
 <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
-""".strip())
+""".strip(), key='trading_state')
 
             # Step 3: Check if we can trade
             open_positions = self.position_tracker.get_open_positions()
@@ -610,8 +679,17 @@ Manual restart required.
                 logger.info(f"📊 Max positions open ({len(open_positions)}), monitoring only")
                 return
 
+            # Portfolio mode: scan every symbol, then execute the best candidates
+            if self.portfolio_scanner:
+                self._apply_adaptive_threshold()
+                with self.stages.span('portfolio_scan'):
+                    candidates = self.portfolio_scanner.scan(market_states, btc_market_state)
+                self._execute_portfolio_candidates(candidates)
+                return
+
             # Step 5: Look for trading signals (on SOL)
-            signal = self.strategy_manager.analyze_market(sol_market_state)
+            with self.stages.span('strategy'):
+                signal = self.strategy_manager.analyze_market(sol_market_state)
 
             if not signal:
                 logger.info("📉 No signal detected")
@@ -629,40 +707,27 @@ Manual restart required.
                 })
 
             # Step 5.5: 4H Trend Filter (skip MR in strong trends)
-            # Backtest showed this improves trending market performance
-            if config.HTF_TREND_FILTER_ENABLED and signal['strategy'] == 'mean_reversion':
-                htf_data = sol_market_state.get('timeframes', {}).get('4H', {})
-                htf_trend = htf_data.get('trend', {})
-                htf_strength = htf_trend.get('trend_strength', 0)
-                htf_alignment = abs(htf_trend.get('ema_alignment', 0))
-                
-                threshold = config.HTF_TREND_BLOCK_THRESHOLD
-                if htf_strength > threshold or htf_alignment > threshold:
-                    logger.warning(f"🚫 4H TREND FILTER: Blocking MR signal")
-                    logger.warning(f"   4H trend_strength: {htf_strength:.2f}, ema_alignment: {htf_alignment:.2f}")
-                    if DASHBOARD_AVAILABLE:
-                        add_signal({
-                            'type': 'rejected',
-                            'direction': signal['direction'],
-                            'reason': f"4H trend too strong ({htf_strength:.2f})"
-                        })
-                    return
+            htf_block = self._htf_trend_block(signal, sol_market_state)
+            if htf_block:
+                if DASHBOARD_AVAILABLE:
+                    add_signal({
+                        'type': 'rejected',
+                        'direction': signal['direction'],
+                        'reason': htf_block
+                    })
+                return
 
             # Step 5.6: Adaptive Threshold - adjust quality bar based on recent performance
-            if self.adaptive_threshold:
-                adaptive_thresh = self.adaptive_threshold.get_threshold(datetime.now())
-                original_thresh = config.SCORE_THRESHOLD
-                if abs(adaptive_thresh - original_thresh) > 1:
-                    logger.info(f"🎚️ Adaptive threshold: {original_thresh} → {adaptive_thresh:.0f}")
-                config.SCORE_THRESHOLD = adaptive_thresh
+            self._apply_adaptive_threshold()
             
             # Step 6: Run ALL filters (most important step!)
-            filters_passed, filter_results = self.filter_manager.check_all(
-                sol_market_state,
-                signal['direction'],
-                signal['strategy'],
-                btc_market_state  # Pass BTC data for correlation check
-            )
+            with self.stages.span('filters'):
+                filters_passed, filter_results = self.filter_manager.check_all(
+                    sol_market_state,
+                    signal['direction'],
+                    signal['strategy'],
+                    btc_market_state  # Pass BTC data for correlation check
+                )
 
             if DASHBOARD_AVAILABLE:
                 update_filter_stats(filter_results)
@@ -680,127 +745,222 @@ Manual restart required.
 
             logger.info(f"✅ ALL FILTERS PASSED")
 
-            # Step 7: Claude AI Gating (learned rejection rules)
-            if self.claude_system:
-                try:
-                    claude_approved = self._check_claude_approval(signal, sol_market_state)
-                    if not claude_approved:
-                        logger.warning(f"🤖 SIGNAL REJECTED BY CLAUDE AI")
-                        self.claude_blocks += 1
-                        if DASHBOARD_AVAILABLE:
-                            add_signal({
-                                'type': 'rejected',
-                                'direction': signal['direction'],
-                                'reason': 'Blocked by Claude AI (learned pattern)'
-                            })
-                        return
-                    logger.info(f"🤖 Claude AI APPROVED")
-                except Exception as e:
-                    logger.error(f"❌ Error in Claude approval check: {e}")
-                    if self.claude_fail_open:
-                        logger.warning(f"⚠️  Fail-open: Approving trade despite Claude error")
-                        logger.info(f"🤖 Claude AI BYPASSED (fail-open)")
-                    else:
-                        logger.error(f"❌ Fail-closed: Rejecting trade due to Claude error")
-                        if DASHBOARD_AVAILABLE:
-                            add_signal({
-                                'type': 'rejected',
-                                'direction': signal['direction'],
-                                'reason': f'Claude error: {str(e)[:100]}'
-                            })
-                        return
-
-            # Step 7.5: Elite Prediction V1 Check ($8k profit in backtests - THE WORKING ONE)
-            prediction_multiplier = 1.0
-            if self.prediction_v1 and self.price_predictor:
-                try:
-                    # Update predictions if needed (once per hour)
-                    self._update_predictions(sol_market_state)
-                    
-                    # Get signal confidence
-                    signal_confidence = filter_results.get('final_score', 50) / 100.0
-                    
-                    # Evaluate signal with V1
-                    v1_guidance = self.prediction_v1.evaluate_signal(
-                        signal['direction'], 
-                        signal_confidence
-                    )
-                    
-                    if not v1_guidance.should_trade:
-                        logger.warning(f"🔮 V1 PREDICTION BLOCKED: {v1_guidance.reason}")
-                        if DASHBOARD_AVAILABLE:
-                            add_signal({
-                                'type': 'rejected',
-                                'direction': signal['direction'],
-                                'reason': f'V1 Prediction: {v1_guidance.reason}'
-                            })
-                        return
-                    
-                    # Apply prediction-based adjustments
-                    prediction_multiplier = v1_guidance.position_multiplier
-                    signal['prediction_multiplier'] = prediction_multiplier
-                    signal['prediction_direction'] = v1_guidance.direction.value
-                    signal['prediction_confidence'] = v1_guidance.confidence
-                    
-                    if prediction_multiplier != 1.0:
-                        logger.info(f"🔮 V1 Prediction: {v1_guidance.reason}")
-                        logger.info(f"   Position multiplier: {prediction_multiplier:.2f}x")
-                    else:
-                        logger.info(f"🔮 V1 Prediction APPROVED")
-                except Exception as e:
-                    logger.warning(f"⚠️ V1 Prediction error (continuing): {e}")
-            
-            logger.info(f"✅ TRADE APPROVED - EXECUTING")
+            # Steps 7-9: AI gating, prediction, sizing and execution
+            self._approve_and_execute(signal, sol_market_state, filter_results)
+
+        except Exception as e:
+            logger.error(f"❌ Error in trading cycle: {e}", exc_info=True)
             if DASHBOARD_AVAILABLE:
-                add_signal({
-                    'type': 'approved',
-                    'direction': signal['direction'],
-                    'strategy': signal['strategy'],
-                    'reason': 'All filters + Claude AI + V1 passed'
-                })
+                add_error(str(e))
 
-            # Step 8: Calculate position size (with growth optimization if enabled)
-            account_balance = self.risk_manager.get_account_balance()
-            if not account_balance:
-                logger.error("❌ Could not get account balance")
-                return
+    def _htf_trend_block(self, signal: Dict, market_state: Dict) -> Optional[str]:
+        """
+        4H trend filter: block mean reversion signals in strong trends
+        Backtest showed this improves trending market performance
 
-            # Get confidence score from filter results if available
-            confidence_score = filter_results.get('confidence_score') or filter_results.get('quality_score', 0) / 100.0
-            
-            # Add passed filters to signal for trade journal logging
-            signal['filters_passed'] = filter_results.get('passed_filters', [])
-            signal['confidence_score'] = confidence_score
-            
-            position_size, size_details = self.risk_manager.calculate_position_size(
-                signal,
-                account_balance,
-                confidence_score=confidence_score
+        Returns:
+            Rejection reason, or None if the signal may continue
+        """
+        if not config.HTF_TREND_FILTER_ENABLED or signal['strategy'] != 'mean_reversion':
+            return None
+
+        htf_data = market_state.get('timeframes', {}).get('4H', {})
+        htf_trend = htf_data.get('trend', {})
+        htf_strength = htf_trend.get('trend_strength', 0)
+        htf_alignment = abs(htf_trend.get('ema_alignment', 0))
+
+        threshold = config.HTF_TREND_BLOCK_THRESHOLD
+        if htf_strength > threshold or htf_alignment > threshold:
+            logger.warning(f"🚫 4H TREND FILTER: Blocking MR signal")
+            logger.warning(f"   4H trend_strength: {htf_strength:.2f}, ema_alignment: {htf_alignment:.2f}")
+            return f"4H trend too strong ({htf_strength:.2f})"
+        return None
+
+    def _apply_adaptive_threshold(self):
+        """Adjust the quality score bar based on recent performance"""
+        if self.adaptive_threshold:
+            adaptive_thresh = self.adaptive_threshold.get_threshold(datetime.now())
+            original_thresh = config.SCORE_THRESHOLD
+            if abs(adaptive_thresh - original_thresh) > 1:
+                logger.info(f"🎚️ Adaptive threshold: {original_thresh} → {adaptive_thresh:.0f}")
+            config.SCORE_THRESHOLD = adaptive_thresh
+
+    def _execute_portfolio_candidates(self, candidates: List[Dict]):
+        """
+        Execute portfolio candidates (best first) within portfolio risk limits
+
+        Open positions are re-read after every execution, so MAX_POSITIONS_OPEN,
+        the per-symbol cap and the total risk budget apply across all symbols.
+        """
+        if DASHBOARD_AVAILABLE:
+            for symbol, reason in self.portfolio_scanner.last_results.items():
+                add_signal({'type': 'scan', 'reason': f"{symbol}: {reason}"})
+
+        if not candidates:
+            logger.info("📉 No portfolio signal passed filters")
+            return
+
+        logger.info(f"🎯 {len(candidates)} portfolio candidate(s): "
+                    f"{', '.join(c['symbol'] for c in candidates)}")
+
+        for candidate in candidates:
+            signal = candidate['signal']
+            open_positions = self._portfolio_open_positions()
+            allowed, reason = self.risk_manager.check_portfolio_exposure(
+                open_positions, candidate['symbol'], self.risk_manager.get_account_balance()
             )
-            
-            # Apply V1 prediction multiplier to position size
-            if prediction_multiplier != 1.0:
-                original_size = position_size
-                position_size = position_size * prediction_multiplier
-                logger.info(f"🔮 V1 Position adjusted: {original_size:.4f} → {position_size:.4f} ({prediction_multiplier:.2f}x)")
-            
-            # Get aggressive TP targets if growth mode enabled
-            aggressive_tps = self.risk_manager.get_aggressive_tp_targets(signal)
-            if aggressive_tps:
-                # Override signal TP targets with aggressive ones
-                signal['take_profit_1'] = aggressive_tps['take_profit_1']
-                signal['take_profit_2'] = aggressive_tps['take_profit_2']
-                signal['take_profit_3'] = aggressive_tps.get('take_profit_3')
-                signal['tp_split'] = aggressive_tps.get('position_split', {1: 0.5, 2: 0.5})
-                logger.info(f"🎯 Aggressive TP targets: TP1={aggressive_tps['rr_ratio_1']:.1f}R, TP2={aggressive_tps['rr_ratio_2']:.1f}R, TP3={aggressive_tps['rr_ratio_3']:.1f}R")
-
-            # Step 9: Execute trade
-            self._execute_trade(signal, position_size)
+            if not allowed:
+                logger.info(f"⏸️  {candidate['symbol']}: {reason}")
+                if DASHBOARD_AVAILABLE:
+                    add_signal({
+                        'type': 'rejected',
+                        'direction': signal['direction'],
+                        'reason': f"{candidate['symbol']}: {reason}"
+                    })
+                continue
 
-        except Exception as e:
-            logger.error(f"❌ Error in trading cycle: {e}", exc_info=True)
             if DASHBOARD_AVAILABLE:
-                add_error(str(e))
+                update_filter_stats(candidate['filter_results'])
+            self._approve_and_execute(signal, candidate['market_state'], candidate['filter_results'])
+
+    def _portfolio_open_positions(self) -> List[Dict]:
+        """
+        Open positions of both execution paths, keyed by portfolio symbol
+
+        ProductionOrderManager keeps its position to itself (under the spot
+        symbol), so it is added here as TRADING_SYMBOL for the per-symbol cap,
+        the risk budget and MAX_POSITIONS_OPEN.
+        """
+        open_positions = list(self.position_tracker.get_open_positions())
+        if self.production_manager:
+            summary = self.production_manager.get_position_summary()
+            if summary and summary['state'] not in ('tp2_filled', 'stopped_out', 'closed', 'failed'):
+                open_positions.append({**summary, 'symbol': config.TRADING_SYMBOL})
+        return open_positions
+
+    def _approve_and_execute(self, signal: Dict, market_state: Dict, filter_results: Dict):
+        """
+        Claude AI gating, V1 prediction, position sizing and execution
+        for a signal that passed all filters
+        """
+        # Step 7: Claude AI Gating (learned rejection rules)
+        if self.claude_system:
+            try:
+                with self.stages.span('claude_approval'):
+                    claude_approved = self._check_claude_approval(signal, market_state)
+                if not claude_approved:
+                    logger.warning(f"🤖 SIGNAL REJECTED BY CLAUDE AI")
+                    self.claude_blocks += 1
+                    if DASHBOARD_AVAILABLE:
+                        add_signal({
+                            'type': 'rejected',
+                            'direction': signal['direction'],
+                            'reason': 'Blocked by Claude AI (learned pattern)'
+                        })
+                    return
+                logger.info(f"🤖 Claude AI APPROVED")
+            except Exception as e:
+                logger.error(f"❌ Error in Claude approval check: {e}")
+                if self.claude_fail_open:
+                    logger.warning(f"⚠️  Fail-open: Approving trade despite Claude error")
+                    logger.info(f"🤖 Claude AI BYPASSED (fail-open)")
+                else:
+                    logger.error(f"❌ Fail-closed: Rejecting trade due to Claude error")
+                    if DASHBOARD_AVAILABLE:
+                        add_signal({
+                            'type': 'rejected',
+                            'direction': signal['direction'],
+                            'reason': f'Claude error: {str(e)[:100]}'
+                        })
+                    return
+
+        # Step 7.5: Elite Prediction V1 Check ($8k profit in backtests - THE WORKING ONE)
+        prediction_multiplier = 1.0
+        if self.prediction_v1 and self.price_predictor and signal.get('symbol', config.TRADING_SYMBOL) == config.TRADING_SYMBOL:
+            try:
+                # Update predictions if needed (once per hour)
+                self._update_predictions(market_state)
+                
+                # Get signal confidence
+                signal_confidence = filter_results.get('final_score', 50) / 100.0
+                
+                # Evaluate signal with V1
+                v1_guidance = self.prediction_v1.evaluate_signal(
+                    signal['direction'], 
+                    signal_confidence
+                )
+                
+                if not v1_guidance.should_trade:
+                    logger.warning(f"🔮 V1 PREDICTION BLOCKED: {v1_guidance.reason}")
+                    if DASHBOARD_AVAILABLE:
+                        add_signal({
+                            'type': 'rejected',
+                            'direction': signal['direction'],
+                            'reason': f'V1 Prediction: {v1_guidance.reason}'
+                        })
+                    return
+                
+                # Apply prediction-based adjustments
+                prediction_multiplier = v1_guidance.position_multiplier
+                signal['prediction_multiplier'] = prediction_multiplier
+                signal['prediction_direction'] = v1_guidance.direction.value
+                signal['prediction_confidence'] = v1_guidance.confidence
+                
+                if prediction_multiplier != 1.0:
+                    logger.info(f"🔮 V1 Prediction: {v1_guidance.reason}")
+                    logger.info(f"   Position multiplier: {prediction_multiplier:.2f}x")
+                else:
+                    logger.info(f"🔮 V1 Prediction APPROVED")
+            except Exception as e:
+                logger.warning(f"⚠️ V1 Prediction error (continuing): {e}")
+        
+        logger.info(f"✅ TRADE APPROVED - EXECUTING")
+        if DASHBOARD_AVAILABLE:
+            add_signal({
+                'type': 'approved',
+                'direction': signal['direction'],
+                'strategy': signal['strategy'],
+                'reason': 'All filters + Claude AI + V1 passed'
+            })
+
+        # Step 8: Calculate position size (with growth optimization if enabled)
+        account_balance = self.risk_manager.get_account_balance()
+        if not account_balance:
+            logger.error("❌ Could not get account balance")
+            return
+
+        # Get confidence score from filter results if available
+        confidence_score = filter_results.get('confidence_score') or filter_results.get('quality_score', 0) / 100.0
+        
+        # Add passed filters to signal for trade journal logging
+        signal['filters_passed'] = filter_results.get('passed_filters', [])
+        signal['confidence_score'] = confidence_score
+        
+        position_size, size_details = self.risk_manager.calculate_position_size(
+            signal,
+            account_balance,
+            confidence_score=confidence_score
+        )
+        
+        # Apply V1 prediction multiplier to position size
+        if prediction_multiplier != 1.0:
+            original_size = position_size
+            position_size = position_size * prediction_multiplier
+            logger.info(f"🔮 V1 Position adjusted: {original_size:.4f} → {position_size:.4f} ({prediction_multiplier:.2f}x)")
+        
+        # Get aggressive TP targets if growth mode enabled
+        aggressive_tps = self.risk_manager.get_aggressive_tp_targets(signal)
+        if aggressive_tps:
+            # Override signal TP targets with aggressive ones
+            signal['take_profit_1'] = aggressive_tps['take_profit_1']
+            signal['take_profit_2'] = aggressive_tps['take_profit_2']
+            signal['take_profit_3'] = aggressive_tps.get('take_profit_3')
+            signal['tp_split'] = aggressive_tps.get('position_split', {1: 0.5, 2: 0.5})
+            logger.info(f"🎯 Aggressive TP targets: TP1={aggressive_tps['rr_ratio_1']:.1f}R, TP2={aggressive_tps['rr_ratio_2']:.1f}R, TP3={aggressive_tps['rr_ratio_3']:.1f}R")
+
+        # Step 9: Execute trade
+        with self.stages.span('order_placement'):
+            self._execute_trade(signal, position_size)
 
     def _check_claude_approval(self, signal: Dict, market_state: Dict) -> bool:
         """
@@ -945,8 +1105,8 @@ Manual restart required.
                     'reason': f"Executing {signal['direction'].upper()} trade"
                 })
 
-            # Use ProductionOrderManager if available
-            if self.production_manager:
+            # Use ProductionOrderManager if available (manages TRADING_SYMBOL only)
+            if self.production_manager and signal.get('symbol', config.TRADING_SYMBOL) == config.TRADING_SYMBOL:
                 self._execute_trade_production(signal, position_size)
                 return
 
@@ -1093,7 +1253,7 @@ Manual restart required.
         # Update dashboard
         if DASHBOARD_AVAILABLE:
             add_trade({
-                'symbol': config.TRADING_SYMBOL,
+                'symbol': signal.get('symbol', config.TRADING_SYMBOL),
                 'side': signal['direction'],
                 'entry_price': signal['entry_price'],
                 'exit_price': 0,
@@ -1111,14 +1271,20 @@ Manual restart required.
         if not open_positions:
             if DASHBOARD_AVAILABLE:
                 update_positions([])
+                update_live_snapshot(positions=[])
             return
 
-        current_price = self.market_data.get_current_price(config.TRADING_SYMBOL)
-        if not current_price:
-            return
+        # One price per symbol with open positions (several in portfolio mode)
+        prices = {}
+        for symbol in {p.get('symbol', config.TRADING_SYMBOL) for p in open_positions}:
+            prices[symbol] = self.market_data.get_current_price(symbol)
 
         dashboard_positions = []
         for position in open_positions:
+            symbol = position.get('symbol', config.TRADING_SYMBOL)
+            current_price = prices.get(symbol)
+            if not current_price:
+                continue
             self.position_tracker.update_position_pnl(
                 position['position_id'],
                 current_price
@@ -1134,7 +1300,7 @@ Manual restart required.
             # Format for dashboard
             if DASHBOARD_AVAILABLE:
                 dashboard_positions.append({
-                    'symbol': config.TRADING_SYMBOL,
+                    'symbol': symbol,
                     'side': position.get('direction', 'long'),
                     'size': position.get('size', 0),
                     'entry_price': position.get('entry_price', 0),
@@ -1145,6 +1311,8 @@ Manual restart required.
 
         if DASHBOARD_AVAILABLE:
             update_positions(dashboard_positions)
+            update_live_snapshot(sol_price=prices.get(config.TRADING_SYMBOL),
+                                 positions=dashboard_positions)
         
         # Check for newly closed positions and send to Claude for learning
         self._check_closed_positions_for_learning()
@@ -1217,6 +1385,19 @@ Manual restart required.
         if DASHBOARD_AVAILABLE:
             set_bot_status('stopped')
 
+        if self.candle_scheduler:
+            self.candle_scheduler.stop()
+
+        if isinstance(self.market_data, StreamingMarketDataFeed):
+            self.market_data.stop()
+
+        if self.portfolio_scanner:
+            self.portfolio_scanner.shutdown()
+
+        # Deliver queued Telegram alerts before exiting
+        if self.notifier:
+            self.notifier.close(timeout=10)
+
         # Log final statistics
         self._log_final_statistics()
 
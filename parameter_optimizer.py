@@ -7,6 +7,9 @@ Usage:
     python parameter_optimizer.py --start 2024-01-01 --end 2024-03-31
     python parameter_optimizer.py --quick  # Quick 30-day test
     python parameter_optimizer.py --auto-deploy  # Auto-deploy if better
+    python parameter_optimizer.py --quick --workers 8  # Parallel sweep on 8 cores
+    python parameter_optimizer.py --start 2024-01-01 --end 2024-12-31 --walk-forward  # Rolling train/test folds
+    python parameter_optimizer.py --start 2024-01-01 --end 2024-06-30 --search  # Successive-halving search
 """
 
 import sys
@@ -15,15 +18,20 @@ import logging
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import copy
+import math
+
+import numpy as np
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from backtesting.historical_data_loader import HistoricalDataLoader
 from backtesting.backtest_engine import BacktestEngine
+from backtesting.columnar_data import ColumnarMarketData
 from backtesting.performance_metrics import PerformanceMetrics
+from backtesting.parallel_sweep import SharedCandleStore, run_parallel_sweep, resolve_workers
 from strategy.breakout_strategy_v3 import BreakoutStrategyV3
 import config
 
@@ -40,6 +48,205 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def backtest_with_params(params: Dict, data: Dict[str, Dict], start_date: str, end_date: str,
+                         initial_capital: float = 10000.0) -> Optional[Dict]:
+    """
+    Run one backtest on preloaded data
+
+    Module-level so parallel sweep workers can pickle it.
+
+    Args:
+        params: Parameter config dict
+        data: {'sol': sol_data, 'btc': btc_data}
+        start_date: Start date
+        end_date: End date
+        initial_capital: Starting capital
+
+    Returns:
+        {'results', 'metrics'} or None if the backtest produced nothing
+    """
+    parameterized_strategy = BreakoutStrategyV3(config=params)
+    engine = BacktestEngine(initial_capital=initial_capital, breakout_strategy=parameterized_strategy)
+
+    results = engine.run(
+        sol_data=data['sol'],
+        btc_data=data['btc'],
+        start_date=start_date,
+        end_date=end_date
+    )
+
+    if not results:
+        return None
+
+    metrics = PerformanceMetrics.calculate_all(results, results['all_trades'])
+
+    return {
+        'results': results,
+        'metrics': metrics
+    }
+
+
+# Per-process cache of what every walk-forward fold shares: SOL column arrays
+# and BTC market states depend only on the candles, not on the parameters
+_fold_cache: Dict[str, Dict] = {}
+
+
+def _prepared_fold_data(data: Dict[str, Dict], engine: BacktestEngine) -> Dict:
+    prepared = _fold_cache.get('prepared')
+    if prepared is None or prepared['sol'] is not data['sol']:
+        prepared = {
+            'sol': data['sol'],  # Identity check above; keeps the cached data alive
+            'sol_columns': ColumnarMarketData(data['sol'], '15m'),
+            'btc_states': engine.precompute_market_states(data['btc'], '15m')
+        }
+        _fold_cache['prepared'] = prepared
+    return prepared
+
+
+def backtest_window(task: Dict, data: Dict[str, Dict],
+                    initial_capital: float = 10000.0) -> Optional[Dict]:
+    """
+    Run one backtest on a time window of preloaded data (walk-forward fold)
+
+    Module-level so parallel sweep workers can pickle it. Indicators see all
+    history before the window, and the SOL columns / BTC states are built once
+    per process and reused by every fold and candidate.
+
+    Args:
+        task: {'params', 'window': (start_ts, end_ts), 'start_date', 'end_date'}
+        data: {'sol': sol_data, 'btc': btc_data} covering every fold
+        initial_capital: Starting capital
+
+    Returns:
+        {'results', 'metrics'} or None if the backtest produced nothing
+    """
+    parameterized_strategy = BreakoutStrategyV3(config=task['params'])
+    engine = BacktestEngine(initial_capital=initial_capital, breakout_strategy=parameterized_strategy)
+    prepared = _prepared_fold_data(data, engine)
+
+    results = engine.run(
+        sol_data=data['sol'],
+        btc_data=data['btc'],
+        start_date=task['start_date'],
+        end_date=task['end_date'],
+        btc_states=prepared['btc_states'],
+        window=tuple(task['window']),
+        sol_columns=prepared['sol_columns']
+    )
+
+    if not results:
+        return None
+
+    metrics = PerformanceMetrics.calculate_all(results, results['all_trades'])
+
+    return {
+        'results': results,
+        'metrics': metrics
+    }
+
+
+def generate_walk_forward_folds(start_date: str, end_date: str, train_days: int,
+                                test_days: int, step_days: int = 0) -> List[Dict]:
+    """
+    Rolling train/test windows over [start_date, end_date]
+
+    Returns:
+        [{'fold', 'train': (start, end), 'test': (start, end)}] with dates as
+        'YYYY-MM-DD' (end exclusive); only folds whose test window fits
+    """
+    step = timedelta(days=step_days or test_days)
+    train, test = timedelta(days=train_days), timedelta(days=test_days)
+    cursor = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
+
+    folds = []
+    while cursor + train + test <= end:
+        folds.append({
+            'fold': len(folds) + 1,
+            'train': (cursor.strftime('%Y-%m-%d'), (cursor + train).strftime('%Y-%m-%d')),
+            'test': ((cursor + train).strftime('%Y-%m-%d'), (cursor + train + test).strftime('%Y-%m-%d'))
+        })
+        cursor += step
+    return folds
+
+
+def _window_task(params: Dict, window: Tuple[str, str]) -> Dict:
+    start_ts, end_ts = (int(datetime.strptime(d, '%Y-%m-%d').timestamp() * 1000) for d in window)
+    return {'params': params, 'window': (start_ts, end_ts),
+            'start_date': window[0], 'end_date': window[1]}
+
+
+def _oos_summary(result: Optional[Dict]) -> Dict:
+    """Headline metrics of a fold backtest (zeros if it produced no trades)"""
+    metrics = result['metrics'] if result else {}
+    return {
+        'return_pct': metrics.get('returns', {}).get('total_return_pct', 0),
+        'sharpe_ratio': metrics.get('risk', {}).get('sharpe_ratio', 0),
+        'max_drawdown_pct': metrics.get('risk', {}).get('max_drawdown_pct', 0),
+        'win_rate': metrics.get('trade_stats', {}).get('win_rate', 0),
+        'profit_factor': metrics.get('trade_stats', {}).get('profit_factor', 0),
+        'total_trades': result['results']['trades']['total_trades'] if result else 0
+    }
+
+
+# Ranges sampled by the adaptive search (uniform, rounded to 2 decimals)
+PARAMETER_SPACE = {
+    'volume_ratio_threshold': (2.0, 3.0),
+    'stop_strong': (1.0, 1.5),      # ATR multiple when volume > 3.5x
+    'stop_medium': (1.2, 1.8),      # ... when volume > 2.5x
+    'stop_weak': (1.6, 2.6),        # ... otherwise
+    'tp2_multiplier': (1.0, 2.5),
+    'tp3_multiplier': (2.0, 4.5),
+    'tp1_fraction': (0.3, 0.6),
+    'tp2_fraction': (0.2, 0.4),
+}
+
+
+def sample_parameters(rng: np.random.Generator) -> Dict:
+    """Draw one BreakoutStrategyV3 parameter set from PARAMETER_SPACE"""
+    draw = {key: round(float(rng.uniform(low, high)), 2) for key, (low, high) in PARAMETER_SPACE.items()}
+    stops = sorted((draw['stop_strong'], draw['stop_medium'], draw['stop_weak']))
+    tp1 = draw['tp1_fraction']
+    tp2 = min(draw['tp2_fraction'], round(0.9 - tp1, 2))  # Always leave >= 10% for TP3
+    return {
+        'volume_ratio_threshold': draw['volume_ratio_threshold'],
+        'stop_multipliers': {3.5: stops[0], 2.5: stops[1], 0: stops[2]},
+        'tp2_multiplier': draw['tp2_multiplier'],
+        'tp3_multiplier': max(draw['tp3_multiplier'], round(draw['tp2_multiplier'] + 0.5, 2)),
+        'position_split': {1: tp1, 2: tp2, 3: round(1 - tp1 - tp2, 2)}
+    }
+
+
+def successive_halving_rungs(start_date: str, end_date: str, n_candidates: int,
+                             eta: int, min_days: int) -> List[Tuple[int, str]]:
+    """
+    Window schedule for successive halving
+
+    Every rung ends at end_date and is eta times longer than the one before;
+    the last rung is the full period. Rungs stop when the window would drop
+    below min_days or a single candidate would be left.
+
+    Returns:
+        [(survivors, window_start_date)] from the shortest rung to the full period
+    """
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
+    total_days = (end - start).days
+
+    rungs = 1
+    while eta ** rungs <= n_candidates:
+        rungs += 1
+    while rungs > 1 and total_days / eta ** (rungs - 1) < min_days:
+        rungs -= 1
+
+    schedule = []
+    for i in range(rungs):
+        days = math.ceil(total_days / eta ** (rungs - 1 - i))
+        survivors = max(1, math.ceil(n_candidates / eta ** i))
+        schedule.append((survivors, (end - timedelta(days=days)).strftime('%Y-%m-%d')))
+    return schedule
+
+
 class ParameterOptimizer:
     """
     Auto-tuning framework for strategy parameters
@@ -106,7 +313,7 @@ class ParameterOptimizer:
         # Base parameters (current V3 defaults)
         base = {
             'volume_ratio_threshold': 2.5,
-            'stop_multipliers': {3.5: 1.2, 2.5: 1.5, 0: 2.0},
+            'stop_multipliers': dict(BreakoutStrategyV3.DEFAULT_STOP_MULTIPLIERS),
             'tp2_multiplier': 1.5,
             'tp3_multiplier': 3.0,
             'position_split': {1: 0.5, 2: 0.3, 3: 0.2}
@@ -128,9 +335,9 @@ class ParameterOptimizer:
         v3['stop_multipliers'] = {3.5: 1.1, 2.5: 1.4, 0: 1.8}
         variations.append(('tighter_stops', v3))
         
-        # Variation 4: Wider stops (1.3/1.6/2.2)
+        # Variation 4: Wider stops (1.5/1.8/2.5)
         v4 = base.copy()
-        v4['stop_multipliers'] = {3.5: 1.3, 2.5: 1.6, 0: 2.2}
+        v4['stop_multipliers'] = {3.5: 1.5, 2.5: 1.8, 0: 2.5}
         variations.append(('wider_stops', v4))
         
         # Variation 5: Different TP levels (1.2x / 2.5x)
@@ -158,7 +365,7 @@ class ParameterOptimizer:
         # Variation 9: Combined - looser volume + wider stops
         v9 = base.copy()
         v9['volume_ratio_threshold'] = 2.8
-        v9['stop_multipliers'] = {3.5: 1.3, 2.5: 1.6, 0: 2.2}
+        v9['stop_multipliers'] = {3.5: 1.5, 2.5: 1.8, 0: 2.5}
         variations.append(('loose_volume_stops', v9))
         
         # Variation 10: Optimized TP + split
@@ -170,8 +377,40 @@ class ParameterOptimizer:
         
         return variations
 
+    def load_market_data(self, start_date: str, end_date: str) -> Optional[Dict[str, Dict]]:
+        """
+        Load SOL and BTC candles once for the whole sweep
+
+        Returns:
+            {'sol': sol_data, 'btc': btc_data} or None if loading failed
+        """
+        data_loader = HistoricalDataLoader()
+        timeframes_to_load = [config.HTF_TIMEFRAME, config.MTF_TIMEFRAME, config.LTF_TIMEFRAME, '1H']
+
+        sol_data = data_loader.load_data(
+            symbol=config.TRADING_SYMBOL,
+            start_date=start_date,
+            end_date=end_date,
+            timeframes=timeframes_to_load,
+            force_refresh=False
+        )
+
+        btc_data = data_loader.load_data(
+            symbol=config.REFERENCE_SYMBOL,
+            start_date=start_date,
+            end_date=end_date,
+            timeframes=timeframes_to_load,
+            force_refresh=False
+        )
+
+        if not sol_data or not btc_data:
+            return None
+
+        return {'sol': sol_data, 'btc': btc_data}
+
     def run_backtest_with_params(self, params: Dict, start_date: str, end_date: str,
-                                 initial_capital: float = 10000.0) -> Optional[Dict]:
+                                 initial_capital: float = 10000.0,
+                                 data: Optional[Dict[str, Dict]] = None) -> Optional[Dict]:
         """
         Run backtest with specific parameters
         
@@ -180,63 +419,64 @@ class ParameterOptimizer:
             start_date: Start date
             end_date: End date
             initial_capital: Starting capital
+            data: Preloaded data from load_market_data (loaded here if None)
             
         Returns:
             Results dict or None if failed
         """
         try:
-            # Load data
-            data_loader = HistoricalDataLoader()
-            timeframes_to_load = [config.HTF_TIMEFRAME, config.MTF_TIMEFRAME, config.LTF_TIMEFRAME, '1H']
-            
-            sol_data = data_loader.load_data(
-                symbol=config.TRADING_SYMBOL,
-                start_date=start_date,
-                end_date=end_date,
-                timeframes=timeframes_to_load,
-                force_refresh=False
-            )
-            
-            btc_data = data_loader.load_data(
-                symbol=config.REFERENCE_SYMBOL,
-                start_date=start_date,
-                end_date=end_date,
-                timeframes=timeframes_to_load,
-                force_refresh=False
-            )
-            
-            if not sol_data or not btc_data:
-                return None
-            
-            # Create engine with parameterized strategy
-            parameterized_strategy = BreakoutStrategyV3(config=params)
-            engine = BacktestEngine(initial_capital=initial_capital, breakout_strategy=parameterized_strategy)
-            
-            # Run backtest
-            results = engine.run(
-                sol_data=sol_data,
-                btc_data=btc_data,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            if not results:
-                return None
-            
-            # Calculate metrics
-            metrics = PerformanceMetrics.calculate_all(results, results['all_trades'])
-            
-            return {
-                'results': results,
-                'metrics': metrics
-            }
+            if data is None:
+                data = self.load_market_data(start_date, end_date)
+                if not data:
+                    return None
+
+            return backtest_with_params(params, data, start_date, end_date, initial_capital)
             
         except Exception as e:
             logger.error(f"Backtest failed with params {params}: {e}")
             return None
 
+    def _iter_window_results(self, tasks: List[Tuple[str, Dict]], data: Dict[str, Dict],
+                             initial_capital: float, workers: int):
+        """Yield (name, task, result) for backtest_window tasks, serially or from the process pool"""
+        if workers == 1:
+            for name, task in tasks:
+                try:
+                    yield name, task, backtest_window(task, data, initial_capital)
+                except Exception as e:
+                    logger.error(f"❌ Walk-forward task {name} failed: {e}")
+                    yield name, task, None
+            return
+
+        with SharedCandleStore(data) as store:
+            yield from run_parallel_sweep(
+                store, tasks, backtest_window, workers=workers, initial_capital=initial_capital
+            )
+
+    def _iter_variation_results(self, variations: List, data: Dict[str, Dict],
+                                start_date: str, end_date: str, initial_capital: float,
+                                workers: int):
+        """Yield (name, params, result) serially or from the process pool"""
+        if workers == 1:
+            for name, params in variations:
+                logger.info(f"Testing: {name}")
+                logger.info(f"  Params: {json.dumps(params, indent=2)}")
+                yield name, params, self.run_backtest_with_params(
+                    params, start_date, end_date, initial_capital, data=data
+                )
+            return
+
+        with SharedCandleStore(data) as store:
+            for name, params, result in run_parallel_sweep(
+                store, variations, backtest_with_params, workers=workers,
+                start_date=start_date, end_date=end_date, initial_capital=initial_capital
+            ):
+                logger.info(f"Finished: {name}")
+                yield name, params, result
+
     def optimize(self, start_date: str, end_date: str, initial_capital: float = 10000.0,
-                 improvement_threshold: float = 0.05, auto_deploy: bool = False) -> Dict:
+                 improvement_threshold: float = 0.05, auto_deploy: bool = False,
+                 workers: Optional[int] = None) -> Dict:
         """
         Run optimization loop
         
@@ -246,6 +486,7 @@ class ParameterOptimizer:
             initial_capital: Starting capital
             improvement_threshold: Minimum improvement % to consider better (default 5%)
             auto_deploy: If True, automatically deploy best params if better
+            workers: Sweep processes (None = config.OPTIMIZER_WORKERS, 0 = CPU count, 1 = serial)
             
         Returns:
             Optimization results dict
@@ -257,11 +498,21 @@ class ParameterOptimizer:
         logger.info(f"Capital: ${initial_capital:,.2f}")
         logger.info(f"Improvement Threshold: {improvement_threshold*100:.1f}%")
         logger.info("="*80 + "\n")
+
+        if workers is None:
+            workers = getattr(config, 'OPTIMIZER_WORKERS', 1)
+        workers = resolve_workers(workers)
+
+        # Load candles once and reuse them for every variation
+        data = self.load_market_data(start_date, end_date)
+        if not data:
+            logger.error("❌ Failed to load market data")
+            return {'success': False, 'error': 'Data load failed'}
         
         # Get baseline (current best or default)
         baseline_params = self.best_params['params'] if self.best_params else {
             'volume_ratio_threshold': 2.5,
-            'stop_multipliers': {3.5: 1.2, 2.5: 1.5, 0: 2.0},
+            'stop_multipliers': dict(BreakoutStrategyV3.DEFAULT_STOP_MULTIPLIERS),
             'tp2_multiplier': 1.5,
             'tp3_multiplier': 3.0,
             'position_split': {1: 0.5, 2: 0.3, 3: 0.2}
@@ -269,7 +520,7 @@ class ParameterOptimizer:
         
         logger.info("📊 Running baseline backtest...")
         baseline_result = self.run_backtest_with_params(
-            baseline_params, start_date, end_date, initial_capital
+            baseline_params, start_date, end_date, initial_capital, data=data
         )
         
         if not baseline_result:
@@ -290,12 +541,9 @@ class ParameterOptimizer:
         
         logger.info(f"🧪 Testing {len(variations)} parameter variations...\n")
         
-        for name, params in variations:
-            logger.info(f"Testing: {name}")
-            logger.info(f"  Params: {json.dumps(params, indent=2)}")
-            
-            result = self.run_backtest_with_params(params, start_date, end_date, initial_capital)
-            
+        for name, params, result in self._iter_variation_results(
+            variations, data, start_date, end_date, initial_capital, workers
+        ):
             if not result:
                 logger.warning(f"  ❌ Failed\n")
                 continue
@@ -374,6 +622,267 @@ class ParameterOptimizer:
             'experiments': len(variations)
         }
 
+    def walk_forward(self, start_date: str, end_date: str, initial_capital: float = 10000.0,
+                     train_days: Optional[int] = None, test_days: Optional[int] = None,
+                     step_days: Optional[int] = None, workers: Optional[int] = None) -> Dict:
+        """
+        Walk-forward optimization over rolling train/test folds
+
+        For each fold every candidate (baseline + variations) is backtested on
+        the train window, the best by return is selected, and only that choice
+        is scored on the following test window. All train runs go through the
+        pool as one batch, then all test runs, so folds are evaluated in
+        parallel too.
+
+        Returns:
+            {'success', 'folds': [per-fold selection + out-of-sample metrics], 'summary'}
+        """
+        train_days = train_days or getattr(config, 'WALK_FORWARD_TRAIN_DAYS', 60)
+        test_days = test_days or getattr(config, 'WALK_FORWARD_TEST_DAYS', 15)
+        if step_days is None:
+            step_days = getattr(config, 'WALK_FORWARD_STEP_DAYS', 0)
+        if workers is None:
+            workers = getattr(config, 'OPTIMIZER_WORKERS', 1)
+        workers = resolve_workers(workers)
+
+        folds = generate_walk_forward_folds(start_date, end_date, train_days, test_days, step_days)
+
+        logger.info("\n" + "="*80)
+        logger.info("🚶 WALK-FORWARD OPTIMIZATION")
+        logger.info("="*80)
+        logger.info(f"Period: {start_date} to {end_date}")
+        logger.info(f"Folds: {len(folds)} (train {train_days}d / test {test_days}d / step {step_days or test_days}d)")
+        logger.info("="*80 + "\n")
+
+        if not folds:
+            logger.error("❌ Period too short for one train + test window")
+            return {'success': False, 'error': 'Period too short'}
+
+        data = self.load_market_data(start_date, end_date)
+        if not data:
+            logger.error("❌ Failed to load market data")
+            return {'success': False, 'error': 'Data load failed'}
+
+        baseline_params = self.best_params['params'] if self.best_params else self.generate_parameter_variations()[0][1]
+        candidates = [('baseline', baseline_params)] + [
+            (name, params) for name, params in self.generate_parameter_variations() if params != baseline_params
+        ]
+
+        # Stage 1: every candidate on every train window
+        train_tasks = [
+            (f"{fold['fold']}|{name}", _window_task(params, fold['train']))
+            for fold in folds for name, params in candidates
+        ]
+        logger.info(f"🧪 In-sample: {len(train_tasks)} backtests ({len(candidates)} candidates x {len(folds)} folds)")
+        train_returns: Dict[int, Dict[str, float]] = {fold['fold']: {} for fold in folds}
+        for name, task, result in self._iter_window_results(train_tasks, data, initial_capital, workers):
+            fold_id, candidate = name.split('|', 1)
+            train_returns[int(fold_id)][candidate] = _oos_summary(result)['return_pct']
+
+        # Stage 2: the selected candidate (and the baseline for reference) on each test window
+        params_by_name = dict(candidates)
+        selected = {}
+        test_tasks = []
+        for fold in folds:
+            returns = train_returns[fold['fold']]
+            # Candidate order breaks ties (pool results arrive out of order)
+            ranked = [name for name, _ in candidates if name in returns]
+            best = max(ranked, key=returns.get) if ranked else 'baseline'
+            selected[fold['fold']] = best
+            for name in dict.fromkeys([best, 'baseline']):
+                test_tasks.append((f"{fold['fold']}|{name}", _window_task(params_by_name[name], fold['test'])))
+
+        logger.info(f"📈 Out-of-sample: {len(test_tasks)} backtests")
+        test_results: Dict[str, Dict] = {}
+        for name, task, result in self._iter_window_results(test_tasks, data, initial_capital, workers):
+            test_results[name] = _oos_summary(result)
+
+        fold_reports = []
+        for fold in folds:
+            best = selected[fold['fold']]
+            oos = test_results.get(f"{fold['fold']}|{best}", _oos_summary(None))
+            baseline_oos = test_results.get(f"{fold['fold']}|baseline", _oos_summary(None))
+            report = {
+                'fold': fold['fold'],
+                'train': fold['train'],
+                'test': fold['test'],
+                'selected': best,
+                'train_return_pct': train_returns[fold['fold']].get(best, 0),
+                'oos': oos,
+                'baseline_oos_return_pct': baseline_oos['return_pct']
+            }
+            fold_reports.append(report)
+            logger.info(f"Fold {fold['fold']}: train {fold['train'][0]}..{fold['train'][1]} → {best} "
+                        f"({report['train_return_pct']:+.2f}%) | test {fold['test'][0]}..{fold['test'][1]}: "
+                        f"{oos['return_pct']:+.2f}% (baseline {baseline_oos['return_pct']:+.2f}%), "
+                        f"Sharpe {oos['sharpe_ratio']:.2f}, {oos['total_trades']} trades")
+
+        oos_returns = [f['oos']['return_pct'] for f in fold_reports]
+        train_best = [f['train_return_pct'] for f in fold_reports]
+        mean_train = sum(train_best) / len(train_best)
+        summary = {
+            'folds': len(fold_reports),
+            'mean_oos_return_pct': sum(oos_returns) / len(oos_returns),
+            'total_oos_return_pct': sum(oos_returns),
+            'mean_baseline_oos_return_pct': sum(f['baseline_oos_return_pct'] for f in fold_reports) / len(fold_reports),
+            'profitable_folds': sum(1 for r in oos_returns if r > 0),
+            'mean_train_return_pct': mean_train,
+            # Out-of-sample / in-sample return: well below 1 means the selection overfits
+            'walk_forward_efficiency': (sum(oos_returns) / len(oos_returns)) / mean_train if mean_train > 0 else None
+        }
+
+        logger.info("="*80)
+        logger.info("📊 WALK-FORWARD SUMMARY")
+        logger.info("="*80)
+        logger.info(f"Mean OOS Return: {summary['mean_oos_return_pct']:+.2f}% "
+                    f"(baseline {summary['mean_baseline_oos_return_pct']:+.2f}%)")
+        logger.info(f"Profitable Folds: {summary['profitable_folds']}/{summary['folds']}")
+        if summary['walk_forward_efficiency'] is not None:
+            logger.info(f"Walk-Forward Efficiency: {summary['walk_forward_efficiency']:.2f}")
+        logger.info("="*80 + "\n")
+
+        report = {
+            'success': True,
+            'period': {'start': start_date, 'end': end_date},
+            'config': {'train_days': train_days, 'test_days': test_days, 'step_days': step_days or test_days},
+            'folds': fold_reports,
+            'summary': summary,
+            'date': datetime.now().isoformat()
+        }
+        with open(self.results_dir / "walk_forward.json", 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def search(self, start_date: str, end_date: str, initial_capital: float = 10000.0,
+               n_candidates: Optional[int] = None, eta: Optional[int] = None,
+               min_days: Optional[int] = None, seed: Optional[int] = None,
+               improvement_threshold: float = 0.05, auto_deploy: bool = False,
+               workers: Optional[int] = None) -> Dict:
+        """
+        Adaptive parameter search (successive halving)
+
+        The baseline, the hand-written variations and random draws from
+        PARAMETER_SPACE all start on a short window at the end of the period.
+        After each rung only the best 1/eta (by return) move on to an eta
+        times longer window, so only a few candidates ever get a full-length
+        backtest. The baseline is carried through every rung as the reference.
+
+        Returns:
+            Same shape as optimize(), plus 'rungs' and 'backtest_days'
+        """
+        n_candidates = n_candidates or getattr(config, 'OPTIMIZER_SEARCH_CANDIDATES', 27)
+        eta = max(2, eta or getattr(config, 'OPTIMIZER_SEARCH_ETA', 3))
+        min_days = min_days or getattr(config, 'OPTIMIZER_SEARCH_MIN_DAYS', 7)
+        if workers is None:
+            workers = getattr(config, 'OPTIMIZER_WORKERS', 1)
+        workers = resolve_workers(workers)
+
+        data = self.load_market_data(start_date, end_date)
+        if not data:
+            logger.error("❌ Failed to load market data")
+            return {'success': False, 'error': 'Data load failed'}
+
+        baseline_params = self.best_params['params'] if self.best_params else self.generate_parameter_variations()[0][1]
+        candidates = {'baseline': baseline_params}
+        for name, params in self.generate_parameter_variations():
+            if len(candidates) < n_candidates and params not in candidates.values():
+                candidates[name] = params
+        rng = np.random.default_rng(seed)
+        while len(candidates) < n_candidates:
+            candidates[f"sample_{len(candidates)}"] = sample_parameters(rng)
+
+        rungs = successive_halving_rungs(start_date, end_date, len(candidates), eta, min_days)
+        window_end = (datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        full_days = (datetime.strptime(window_end, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days
+
+        logger.info("\n" + "="*80)
+        logger.info("🔎 SUCCESSIVE-HALVING PARAMETER SEARCH")
+        logger.info("="*80)
+        logger.info(f"Period: {start_date} to {end_date}")
+        logger.info(f"Candidates: {len(candidates)} | eta: {eta} | "
+                    f"Rungs: {' → '.join(f'{count}@{rung_start}' for count, rung_start in rungs)}")
+        logger.info("="*80 + "\n")
+
+        survivors = list(candidates)
+        rung_reports = []
+        backtests, backtest_days = 0, 0
+        results: Dict[str, Optional[Dict]] = {}
+        for rung, (keep, rung_start) in enumerate(rungs):
+            if rung > 0:
+                # Promote the best 1/eta; the baseline always rides along for comparison
+                ranked = sorted(survivors, key=lambda name: _oos_summary(results.get(name))['return_pct'],
+                                reverse=True)
+                survivors = ranked[:keep]
+                if 'baseline' not in survivors:
+                    survivors.append('baseline')
+
+            tasks = [(name, _window_task(candidates[name], (rung_start, window_end))) for name in survivors]
+            days = (datetime.strptime(window_end, '%Y-%m-%d') - datetime.strptime(rung_start, '%Y-%m-%d')).days
+            backtests += len(tasks)
+            backtest_days += len(tasks) * days
+
+            results = {name: result for name, _, result in
+                       self._iter_window_results(tasks, data, initial_capital, workers)}
+            scores = {name: _oos_summary(results.get(name))['return_pct'] for name in survivors}
+            leader = max(survivors, key=scores.get)
+            rung_reports.append({'rung': rung + 1, 'start': rung_start, 'days': days,
+                                 'candidates': len(survivors), 'scores': scores})
+            logger.info(f"🪜 Rung {rung + 1}: {len(survivors)} candidates on {days}d from {rung_start} | "
+                        f"leader {leader} ({scores[leader]:+.2f}%)")
+
+        # Last rung is the full period
+        final = {name: _oos_summary(results.get(name)) for name in survivors}
+        for name in survivors:
+            self._save_experiment({
+                'name': name,
+                'params': candidates[name],
+                'performance': final[name],
+                'date': datetime.now().isoformat()
+            })
+
+        ranked = [name for name in candidates if name in final]
+        best_name = max(ranked, key=lambda name: final[name]['return_pct'])
+        best_return = final[best_name]['return_pct']
+        baseline_return = final['baseline']['return_pct']
+
+        logger.info("="*80)
+        logger.info("📊 SEARCH SUMMARY")
+        logger.info("="*80)
+        logger.info(f"Backtests: {backtests} ({backtest_days / full_days:.1f} full-length equivalents "
+                    f"vs {len(candidates)} for an exhaustive sweep)")
+        logger.info(f"Baseline Return: {baseline_return:+.2f}%")
+        logger.info(f"Best Return: {best_return:+.2f}%")
+        logger.info(f"Best Config: {best_name}")
+        logger.info("="*80 + "\n")
+
+        if auto_deploy and best_name != 'baseline' and best_return > baseline_return * (1 + improvement_threshold):
+            logger.info(f"🚀 AUTO-DEPLOYING: {best_name} ({best_return:+.2f}% vs {baseline_return:+.2f}%)")
+            self._save_best_params(candidates[best_name], {
+                'return_pct': best_return,
+                'sharpe_ratio': final[best_name]['sharpe_ratio'],
+                'win_rate': final[best_name]['win_rate']
+            })
+            logger.info("✅ Best parameters saved to optimizer_results/best_params.json")
+        elif best_return > baseline_return:
+            logger.info(f"💡 Found better params ({best_name}) but not auto-deploying")
+
+        return {
+            'success': True,
+            'baseline': {
+                'return': baseline_return,
+                'params': baseline_params
+            },
+            'best': {
+                'name': best_name,
+                'return': best_return,
+                'params': candidates[best_name],
+                'improvement': best_return - baseline_return
+            },
+            'experiments': backtests,
+            'backtest_days': backtest_days,
+            'rungs': rung_reports
+        }
+
 
 def main():
     """Main entry point"""
@@ -388,6 +897,16 @@ def main():
     parser.add_argument('--quick', action='store_true', help='Quick 30-day test')
     parser.add_argument('--auto-deploy', action='store_true', help='Auto-deploy if better')
     parser.add_argument('--threshold', type=float, default=0.05, help='Improvement threshold (default: 0.05 = 5%%)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Parallel sweep processes (default: config.OPTIMIZER_WORKERS, 0 = all cores, 1 = serial)')
+    parser.add_argument('--walk-forward', action='store_true', help='Rolling train/test folds instead of one in-sample window')
+    parser.add_argument('--train-days', type=int, default=None, help='Walk-forward train window (default: config)')
+    parser.add_argument('--test-days', type=int, default=None, help='Walk-forward test window (default: config)')
+    parser.add_argument('--step-days', type=int, default=None, help='Walk-forward step (default: config, 0 = test window)')
+    parser.add_argument('--search', action='store_true', help='Successive-halving search instead of the fixed variation grid')
+    parser.add_argument('--candidates', type=int, default=None, help='Search candidates (default: config.OPTIMIZER_SEARCH_CANDIDATES)')
+    parser.add_argument('--eta', type=int, default=None, help='Search reduction factor per rung (default: config.OPTIMIZER_SEARCH_ETA)')
+    parser.add_argument('--seed', type=int, default=None, help='Search random seed')
     
     args = parser.parse_args()
     
@@ -403,12 +922,39 @@ def main():
     
     # Run optimizer
     optimizer = ParameterOptimizer()
+    if args.walk_forward:
+        result = optimizer.walk_forward(
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=args.capital,
+            train_days=args.train_days,
+            test_days=args.test_days,
+            step_days=args.step_days,
+            workers=args.workers
+        )
+        sys.exit(0 if result['success'] else 1)
+
+    if args.search:
+        result = optimizer.search(
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=args.capital,
+            n_candidates=args.candidates,
+            eta=args.eta,
+            seed=args.seed,
+            improvement_threshold=args.threshold,
+            auto_deploy=args.auto_deploy,
+            workers=args.workers
+        )
+        sys.exit(0 if result['success'] else 1)
+
     result = optimizer.optimize(
         start_date=start_date,
         end_date=end_date,
         initial_capital=args.capital,
         improvement_threshold=args.threshold,
-        auto_deploy=args.auto_deploy
+        auto_deploy=args.auto_deploy,
+        workers=args.workers
     )
     
     if result['success']:
@@ -7,7 +7,7 @@ Enforces all risk management rules:
 - Emergency shutdown conditions
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime, date
 from data_feed.okx_client import OKXClient
@@ -32,6 +32,7 @@ from config import (
     GROWTH_AGGRESSIVE_TP
 )
 from .growth_optimizer import GrowthOptimizer
+import config
 import os
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,7 @@ class RiskManager:
         # Account tracking
         self.starting_balance = None
         self.current_balance = None
+        self.last_balance_data = None  # Raw OKX balance response (dashboard reuses it)
 
         # Emergency state
         self.emergency_shutdown = False
@@ -109,6 +111,39 @@ class RiskManager:
 
         return True, "All risk checks passed"
 
+    def check_portfolio_exposure(self, open_positions: List[Dict], symbol: str,
+                                 account_balance: Optional[float]) -> Tuple[bool, str]:
+        """
+        Portfolio-wide limits for a new position on `symbol`
+
+        MAX_POSITIONS_OPEN counts positions across all symbols. On top of that,
+        each symbol is capped at PORTFOLIO_MAX_POSITIONS_PER_SYMBOL and the
+        combined stop-loss risk of the open positions plus the new trade
+        (MAX_RISK_PER_TRADE) must stay within PORTFOLIO_MAX_TOTAL_RISK_PCT.
+
+        Returns:
+            (allowed: bool, reason: str)
+        """
+        if len(open_positions) >= MAX_POSITIONS_OPEN:
+            return False, f"Max positions reached ({len(open_positions)}/{MAX_POSITIONS_OPEN})"
+
+        per_symbol_limit = getattr(config, 'PORTFOLIO_MAX_POSITIONS_PER_SYMBOL', 1)
+        symbol_positions = sum(1 for p in open_positions if p.get('symbol') == symbol)
+        if symbol_positions >= per_symbol_limit:
+            return False, f"{symbol} already has {symbol_positions} open position(s)"
+
+        if account_balance:
+            open_risk = sum(
+                p.get('remaining_size', p.get('size', 0)) * abs(p.get('entry_price', 0) - (p.get('stop_loss') or 0))
+                for p in open_positions if p.get('stop_loss')
+            )
+            total_risk_pct = open_risk / account_balance + MAX_RISK_PER_TRADE
+            max_total_risk = getattr(config, 'PORTFOLIO_MAX_TOTAL_RISK_PCT', 0.06)
+            if total_risk_pct > max_total_risk:
+                return False, f"Portfolio risk {total_risk_pct*100:.1f}% would exceed {max_total_risk*100:.1f}%"
+
+        return True, "Portfolio exposure OK"
+
     def calculate_position_size(self, signal: Dict, account_balance: float, 
                                confidence_score: Optional[float] = None) -> Tuple[float, Dict]:
         """
@@ -302,6 +337,7 @@ class RiskManager:
         try:
             # If in simulated mode and balance fetch fails, use demo balance
             balance_data = self.client.get_account_balance()
+            self.last_balance_data = balance_data
 
             if not balance_data:
                 # Use demo balance for simulated mode
@@ -8,6 +8,7 @@ Usage:
     python run_backtest.py --start 2024-01-01 --end 2024-03-31 --name my_test
     python run_backtest.py --start 2024-01-01 --end 2024-03-31 --capital 20000
     python run_backtest.py --quick  # Quick 30-day test
+    python run_backtest.py --quick --symbols SOL-USDT-SWAP,ETH-USDT-SWAP  # Portfolio backtest
 """
 
 import sys
@@ -15,12 +16,14 @@ import logging
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List, Optional
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from backtesting.historical_data_loader import HistoricalDataLoader
 from backtesting.backtest_engine import BacktestEngine
+from backtesting.multi_symbol_runner import MultiSymbolBacktestRunner
 from backtesting.performance_metrics import PerformanceMetrics
 from backtesting.report_generator import ReportGenerator
 import config
@@ -41,7 +44,9 @@ logger = logging.getLogger(__name__)
 def run_backtest(start_date: str, end_date: str,
                 initial_capital: float = 10000.0,
                 run_name: str = None,
-                force_refresh: bool = False):
+                force_refresh: bool = False,
+                symbols: Optional[List[str]] = None,
+                workers: int = 0):
     """
     Run a complete backtest
 
@@ -51,6 +56,8 @@ def run_backtest(start_date: str, end_date: str,
         initial_capital: Starting capital in USD
         run_name: Optional name for this backtest run
         force_refresh: If True, re-fetch data from API
+        symbols: Backtest this basket as one portfolio (default: TRADING_SYMBOL only)
+        workers: Processes for a multi-symbol backtest (0 = CPU count)
 
     Returns:
         Dict with results
@@ -75,13 +82,18 @@ def run_backtest(start_date: str, end_date: str,
         timeframes_to_load = [config.HTF_TIMEFRAME, config.MTF_TIMEFRAME, config.LTF_TIMEFRAME, '1H']
         logger.info(f"   Loading timeframes: {', '.join(timeframes_to_load)}")
 
-        sol_data = data_loader.load_data(
-            symbol=config.TRADING_SYMBOL,
-            start_date=start_date,
-            end_date=end_date,
-            timeframes=timeframes_to_load,
-            force_refresh=force_refresh
-        )
+        symbols = symbols or [config.TRADING_SYMBOL]
+        symbol_data = {
+            symbol: data_loader.load_data(
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                timeframes=timeframes_to_load,
+                force_refresh=force_refresh
+            )
+            for symbol in symbols
+        }
+        sol_data = symbol_data[symbols[0]]
 
         btc_data = data_loader.load_data(
             symbol=config.REFERENCE_SYMBOL,
@@ -99,14 +111,18 @@ def run_backtest(start_date: str, end_date: str,
 
         # Step 2: Run backtest
         logger.info("🎯 STEP 2: Running backtest...")
-        engine = BacktestEngine(initial_capital=initial_capital)
-
-        results = engine.run(
-            sol_data=sol_data,
-            btc_data=btc_data,
-            start_date=start_date,
-            end_date=end_date
-        )
+        if len(symbols) > 1:
+            runner = MultiSymbolBacktestRunner(initial_capital=initial_capital, workers=workers)
+            results = runner.run(symbol_data, btc_data, start_date, end_date)
+        else:
+            engine = BacktestEngine(initial_capital=initial_capital)
+
+            results = engine.run(
+                sol_data=sol_data,
+                btc_data=btc_data,
+                start_date=start_date,
+                end_date=end_date
+            )
 
         if not results:
             logger.error("❌ Backtest failed")
@@ -211,6 +227,9 @@ Examples:
 
   # Force refresh data from API
   python run_backtest.py --start 2024-01-01 --end 2024-03-31 --refresh
+
+  # Portfolio backtest over several symbols (capital split equally)
+  python run_backtest.py --quick --symbols SOL-USDT-SWAP,ETH-USDT-SWAP,AVAX-USDT-SWAP --workers 3
         """
     )
 
@@ -225,6 +244,8 @@ Examples:
     parser.add_argument('--strategy', type=str, default='breakout',
                        help='Strategy to debug (for --ai-debug) - will auto-detect V3/V2/V1')
     parser.add_argument('--max-iterations', type=int, default=5, help='Max debug iterations (for --ai-debug)')
+    parser.add_argument('--symbols', type=str, help='Comma-separated symbols to backtest as one portfolio')
+    parser.add_argument('--workers', type=int, default=0, help='Processes for --symbols (default: CPU count)')
 
     args = parser.parse_args()
 
@@ -267,7 +288,9 @@ Examples:
         end_date=end_date,
         initial_capital=args.capital,
         run_name=run_name,
-        force_refresh=args.refresh or args.clear_cache
+        force_refresh=args.refresh or args.clear_cache,
+        symbols=[s.strip() for s in args.symbols.split(',') if s.strip()] if args.symbols else None,
+        workers=args.workers
     )
 
     # If AI debug enabled and no signals, run debug agent
@@ -10,6 +10,7 @@ from .funding_arbitrage import FundingArbitrageStrategy
 from .momentum_strategy import MomentumStrategy
 from .structure_strategy import StructureStrategy
 from .strategy_manager import StrategyManager
+from .portfolio_scanner import PortfolioScanner
 
 __all__ = [
     'BreakoutStrategy', 
@@ -18,5 +19,6 @@ __all__ = [
     'FundingArbitrageStrategy',
     'MomentumStrategy',
     'StructureStrategy',
-    'StrategyManager'
+    'StrategyManager',
+    'PortfolioScanner'
 ]
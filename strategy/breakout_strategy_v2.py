@@ -13,6 +13,7 @@ Key features:
 from typing import Dict, Optional, List
 import logging
 from data_feed.indicators import TechnicalIndicators
+from data_feed.feature_context import get_features
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +55,9 @@ class BreakoutStrategyV2:
             atr_data = tf_data.get('atr', {})
             trend_data = tf_data.get('trend', {})
             
-            # Calculate RSI
-            closes = [c['close'] for c in candles]
-            rsi = self.indicators.calculate_rsi(closes, period=14)
+            # Calculate RSI (shared with other strategies/filters this cycle)
+            features = get_features(market_state)
+            rsi = features.rsi('15m', 14)
             if rsi is None:
                 return None
             
@@ -84,8 +85,8 @@ class BreakoutStrategyV2:
             current_price = current_candle['close']
             
             # Calculate EMAs for trend filter
-            ema_20 = self.indicators.calculate_ema(closes, period=20)
-            ema_50 = self.indicators.calculate_ema(closes, period=50)
+            ema_20 = features.ema('15m', 20)
+            ema_50 = features.ema('15m', 50)
             
             if not ema_20 or not ema_50 or len(ema_20) == 0 or len(ema_50) == 0:
                 return None
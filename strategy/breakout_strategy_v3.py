@@ -16,6 +16,7 @@ Key features:
 from typing import Dict, Optional, List
 import logging
 from data_feed.indicators import TechnicalIndicators
+from data_feed.feature_context import get_features
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +30,28 @@ class BreakoutStrategyV3:
     4. Stricter volume (2.5x minimum instead of 2.0x)
     """
 
-    def __init__(self):
+    # Minimum volume ratio -> stop distance in ATR (see _calculate_dynamic_stop_multiplier)
+    DEFAULT_STOP_MULTIPLIERS = {3.5: 1.3, 2.5: 1.6, 0: 2.2}
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Args:
+            config: Optional parameter overrides (parameter_optimizer format):
+                volume_ratio_threshold, stop_multipliers {min_volume_ratio: atr_mult},
+                tp2_multiplier, tp3_multiplier, position_split {tp: fraction}
+        """
         self.name = "BreakoutV3"
+        self.params = config or {}
+        self.volume_threshold = self.params.get('volume_ratio_threshold', 2.5)
+        self.tp2_multiplier = self.params.get('tp2_multiplier', 1.5)
+        self.tp3_multiplier = self.params.get('tp3_multiplier', 3.0)
+        # JSON round-trips (best_params.json) turn numeric keys into strings
+        self.stop_multipliers = sorted(
+            ((float(k), v) for k, v in
+             (self.params.get('stop_multipliers') or self.DEFAULT_STOP_MULTIPLIERS).items()), reverse=True
+        )
+        self.position_split = {int(k): v for k, v in
+                               self.params.get('position_split', {1: 0.5, 2: 0.3, 3: 0.2}).items()}
         self.signals_generated = 0
         self.indicators = TechnicalIndicators()
 
@@ -60,9 +81,9 @@ class BreakoutStrategyV3:
             atr_data = tf_data.get('atr', {})
             trend_data = tf_data.get('trend', {})
             
-            # Calculate RSI
-            closes = [c['close'] for c in candles]
-            rsi = self.indicators.calculate_rsi(closes, period=14)
+            # Calculate RSI (shared with other strategies/filters this cycle)
+            features = get_features(market_state)
+            rsi = features.rsi('15m', 14)
             if rsi is None:
                 return None
             
@@ -79,8 +100,8 @@ class BreakoutStrategyV3:
             # BALANCED: Require strong volume but not TOO strict
             # Analysis: 3.0x + highest = only 1 signal (too strict)
             # Solution: 2.5x + top 3 = better balance (quality + quantity)
-            if volume_ratio < 2.5:  # Balanced threshold
-                logger.debug(f"❌ {self.name}: Volume too weak ({volume_ratio:.2f}x < 2.5x)")
+            if volume_ratio < self.volume_threshold:  # Balanced threshold (2.5x)
+                logger.debug(f"❌ {self.name}: Volume too weak ({volume_ratio:.2f}x < {self.volume_threshold}x)")
                 return None
             
             # BALANCED: Volume must be in top 3 (not highest, but still strong)
@@ -95,8 +116,8 @@ class BreakoutStrategyV3:
             current_price = current_candle['close']
             
             # Calculate EMAs for trend filter
-            ema_20 = self.indicators.calculate_ema(closes, period=20)
-            ema_50 = self.indicators.calculate_ema(closes, period=50)
+            ema_20 = features.ema('15m', 20)
+            ema_50 = features.ema('15m', 50)
             
             if not ema_20 or not ema_50 or len(ema_20) == 0 or len(ema_50) == 0:
                 return None
@@ -436,18 +457,13 @@ class BreakoutStrategyV3:
         Returns:
             Stop multiplier (1.3x, 1.6x, or 2.2x ATR) - Balanced to prevent premature stops
         """
-        # BALANCED: Slightly wider stops to prevent premature stop-outs
-        # MFE analysis shows trades need more room (0.96% MFE vs 0.56% stop)
-        if volume_ratio > 3.5:
-            multiplier = 1.3  # Was 1.2 - give strong breakouts more room
-            logger.debug(f"📊 Dynamic Stop: Strong volume ({volume_ratio:.2f}x) → 1.3x ATR")
-        elif volume_ratio >= 2.5:
-            multiplier = 1.6  # Was 1.5 - balanced default
-            logger.debug(f"📊 Dynamic Stop: Medium volume ({volume_ratio:.2f}x) → 1.6x ATR")
-        else:
-            multiplier = 2.2  # Was 2.0 - wider for weaker volume
-            logger.debug(f"📊 Dynamic Stop: Weak volume ({volume_ratio:.2f}x) → 2.2x ATR")
-        
+        # Defaults and optimizer overrides go through the same table and comparison
+        multiplier = self.stop_multipliers[-1][1]
+        for min_ratio, band_multiplier in self.stop_multipliers:
+            if volume_ratio >= min_ratio:
+                multiplier = band_multiplier
+                break
+        logger.debug(f"📊 Dynamic Stop: Volume {volume_ratio:.2f}x → {multiplier}x ATR")
         return multiplier
 
     def _generate_signal(self, direction: str, entry_price: float, atr: float, volume_ratio: float) -> Optional[Dict]:
@@ -483,16 +499,16 @@ class BreakoutStrategyV3:
             # TP1: Breakeven (exit 50% of position)
             take_profit_1 = entry_price
             # TP2: 1.5:1 R:R (exit 30% of position)
-            take_profit_2 = entry_price + (risk * 1.5)
+            take_profit_2 = entry_price + (risk * self.tp2_multiplier)
             # TP3: 3.0:1 R:R (exit 20% of position)
-            take_profit_3 = entry_price + (risk * 3.0)
+            take_profit_3 = entry_price + (risk * self.tp3_multiplier)
         else:
             # TP1: Breakeven (exit 50% of position)
             take_profit_1 = entry_price
             # TP2: 1.5:1 R:R (exit 30% of position)
-            take_profit_2 = entry_price - (risk * 1.5)
+            take_profit_2 = entry_price - (risk * self.tp2_multiplier)
             # TP3: 3.0:1 R:R (exit 20% of position)
-            take_profit_3 = entry_price - (risk * 3.0)
+            take_profit_3 = entry_price - (risk * self.tp3_multiplier)
         
         signal = {
             'strategy': self.name,
@@ -502,10 +518,12 @@ class BreakoutStrategyV3:
             'take_profit_1': take_profit_1,
             'take_profit_2': take_profit_2,
             'take_profit_3': take_profit_3,
-            'position_split': {1: 0.5, 2: 0.3, 3: 0.2}  # 50% at TP1, 30% at TP2, 20% at TP3
+            'position_split': dict(self.position_split)  # Default 50% at TP1, 30% at TP2, 20% at TP3
         }
         
-        logger.info(f"💰 {self.name}: TP1=${take_profit_1:.2f} (50%), TP2=${take_profit_2:.2f} (30%), TP3=${take_profit_3:.2f} (20%)")
+        split = self.position_split
+        logger.info(f"💰 {self.name}: TP1=${take_profit_1:.2f} ({split.get(1, 0):.0%}), "
+                    f"TP2=${take_profit_2:.2f} ({split.get(2, 0):.0%}), TP3=${take_profit_3:.2f} ({split.get(3, 0):.0%})")
         
         return signal
 
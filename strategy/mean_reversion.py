@@ -98,12 +98,13 @@ class MeanReversionStrategy:
                     return None
             
             # STEP 2: Check RSI extreme
-            direction, rsi_value = self._check_rsi_extreme(candles)
+            features = market_state.get('features')
+            direction, rsi_value = self._check_rsi_extreme(candles, features, timeframe)
             if direction is None:
                 return None
             
             # STEP 3: Check Bollinger Band touch
-            bb_touch = self._check_bb_touch(candles, direction)
+            bb_touch = self._check_bb_touch(candles, direction, features, timeframe)
             if not bb_touch:
                 return None
             
@@ -193,10 +194,13 @@ class MeanReversionStrategy:
         logger.debug(f"{self.name}: Blocked - marginal trend regime ({trend_strength:.2f})")
         return False
     
-    def _check_rsi_extreme(self, candles: List[Dict]) -> Tuple[Optional[str], float]:
+    def _check_rsi_extreme(self, candles: List[Dict], features=None,
+                           timeframe: str = '15m') -> Tuple[Optional[str], float]:
         """
         Check if RSI is at oversold/overbought extreme.
         
+        Uses the market state's shared FeatureContext when given.
+        
         Returns:
             (direction: 'long'/'short'/None, rsi_value: float)
         """
@@ -205,10 +209,12 @@ class MeanReversionStrategy:
         if not self.indicators:
             return None, 50.0
         
-        closes = [c['close'] for c in candles]
         period = getattr(config, 'MR_RSI_PERIOD', 14)
         
-        rsi = self.indicators.calculate_rsi(closes, period)
+        if features is not None:
+            rsi = features.rsi(timeframe, period)
+        else:
+            rsi = self.indicators.calculate_rsi([c['close'] for c in candles], period)
         
         if rsi is None:
             return None, 50.0
@@ -223,7 +229,8 @@ class MeanReversionStrategy:
         
         return None, rsi
     
-    def _check_bb_touch(self, candles: List[Dict], direction: str) -> Optional[Dict]:
+    def _check_bb_touch(self, candles: List[Dict], direction: str, features=None,
+                        timeframe: str = '15m') -> Optional[Dict]:
         """
         Check if price is touching/beyond Bollinger Band.
         
@@ -238,13 +245,15 @@ class MeanReversionStrategy:
         if not self.indicators:
             return None
         
-        closes = [c['close'] for c in candles]
         period = getattr(config, 'MR_BB_PERIOD', 20)
         std_dev = getattr(config, 'MR_BB_STD_DEV', 2.0)
         
-        upper, middle, lower = self.indicators.calculate_bollinger_bands(
-            closes, period, std_dev
-        )
+        if features is not None:
+            upper, middle, lower = features.bollinger_bands(timeframe, period, std_dev)
+        else:
+            upper, middle, lower = self.indicators.calculate_bollinger_bands(
+                [c['close'] for c in candles], period, std_dev
+            )
         
         if not upper or not middle or not lower:
             return None
@@ -2,10 +2,19 @@
 Pattern Matcher
 Compares new signals to past winners/losers to score similarity
 Higher similarity to winners = higher confidence score
+
+Stored patterns are encoded once into column arrays (categorical codes +
+numeric feature matrix) and scored against a signal in one vectorized pass.
+Patterns appended to the JSON files by the pattern learners are encoded
+incrementally on the next refresh. One lock covers refresh, encoding and
+scoring, so concurrent filter checks (portfolio scanner threads) never see
+the pattern list and its index out of step.
 """
 
+import os
 import json
 import logging
+import threading
 from typing import Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -13,6 +22,60 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+CATEGORICAL_FEATURES = ('direction', 'strategy', 'trend')
+NUMERICAL_FEATURES = ('volatility', 'volume_ratio', 'risk_reward')
+CATEGORICAL_WEIGHT = 0.3
+NUMERICAL_WEIGHT = 0.7
+
+
+class PatternIndex:
+    """
+    Column-encoded patterns for vectorized similarity
+    """
+
+    def __init__(self):
+        self.categorical = np.empty((0, len(CATEGORICAL_FEATURES)), dtype=object)
+        self.numerical = np.empty((0, len(NUMERICAL_FEATURES)), dtype=float)
+        self.weights = np.empty(0, dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def add(self, features: List[Dict], weights: List[float]):
+        """Append encoded rows (features as returned by _extract_features_from_pattern)"""
+        if not features:
+            return
+        categorical = np.array([[f[name] for name in CATEGORICAL_FEATURES] for f in features], dtype=object)
+        numerical = np.array([[f[name] for name in NUMERICAL_FEATURES] for f in features], dtype=float)
+        self.categorical = np.concatenate([self.categorical, categorical])
+        self.numerical = np.concatenate([self.numerical, numerical])
+        self.weights = np.concatenate([self.weights, np.asarray(weights, dtype=float)])
+
+    def similarity(self, features: Dict) -> np.ndarray:
+        """
+        Similarity (0-1) of one feature set to every row
+
+        Same definition as the per-pattern loop: exact match on categorical
+        features, 1 - relative distance on numerical ones (both zero = 1,
+        exactly one zero = 0).
+        """
+        query_cat = np.array([features[name] for name in CATEGORICAL_FEATURES], dtype=object)
+        categorical_score = (self.categorical == query_cat).mean(axis=1)
+
+        query_num = np.array([features[name] for name in NUMERICAL_FEATURES], dtype=float)
+        rows = self.numerical
+        max_abs = np.maximum(np.abs(rows), np.abs(query_num))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance = np.abs(rows - query_num) / max_abs
+        numeric = 1.0 - np.minimum(distance, 1.0)
+        row_zero = rows == 0
+        query_zero = query_num == 0
+        numeric = np.where(row_zero & query_zero, 1.0, numeric)
+        numeric = np.where(row_zero ^ query_zero, 0.0, numeric)
+        numerical_score = numeric.mean(axis=1)
+
+        return categorical_score * CATEGORICAL_WEIGHT + numerical_score * NUMERICAL_WEIGHT
+
 
 class PatternMatcher:
     """
@@ -21,11 +84,24 @@ class PatternMatcher:
     """
     
     def __init__(self, winning_patterns_file: str = "claude_winning_patterns.json",
-                 losing_patterns_file: str = "claude_rejection_rules.json"):
+                 losing_patterns_file: str = "claude_rejection_rules.json",
+                 top_k: int = 0):
+        """
+        Args:
+            top_k: Score against only the k most similar winning patterns
+                (0 = all patterns, weighted by success_count)
+        """
         self.winning_patterns_file = winning_patterns_file
         self.losing_patterns_file = losing_patterns_file
-        self.winning_patterns = self._load_patterns(winning_patterns_file)
-        self.losing_patterns = self._load_patterns(losing_patterns_file)
+        self.top_k = top_k
+        self.winning_patterns: List[Dict] = []
+        self.losing_patterns: List[Dict] = []
+        self._winning_index = PatternIndex()
+        self._losing_index = PatternIndex()
+        self._file_mtimes: Dict[str, Optional[float]] = {}
+        # Guards the pattern lists together with their encoded indexes
+        self._lock = threading.RLock()
+        self.refresh()
     
     def _load_patterns(self, filepath: str) -> List[Dict]:
         """Load patterns from JSON file"""
@@ -41,7 +117,53 @@ class PatternMatcher:
         except Exception as e:
             logger.warning(f"Failed to load patterns from {filepath}: {e}")
             return []
-    
+
+    @staticmethod
+    def _mtime(filepath: str) -> Optional[float]:
+        try:
+            return os.stat(filepath).st_mtime
+        except OSError:
+            return None
+
+    def refresh(self):
+        """
+        Pick up patterns written to the JSON files since the last load
+
+        The learners append to these lists, so only the new tail is encoded;
+        anything else (file shrank or was rewritten) re-encodes that file.
+        """
+        with self._lock:
+            for filepath, winning in ((self.winning_patterns_file, True), (self.losing_patterns_file, False)):
+                mtime = self._mtime(filepath)
+                if filepath in self._file_mtimes and mtime == self._file_mtimes[filepath]:
+                    continue
+                self._file_mtimes[filepath] = mtime
+
+                loaded = self._load_patterns(filepath)
+                current = self.winning_patterns if winning else self.losing_patterns
+                if len(loaded) >= len(current) and loaded[:len(current)] == current:
+                    self._add_patterns(loaded[len(current):], winning)
+                else:
+                    if winning:
+                        self.winning_patterns, self._winning_index = [], PatternIndex()
+                    else:
+                        self.losing_patterns, self._losing_index = [], PatternIndex()
+                    self._add_patterns(loaded, winning)
+
+    def _add_patterns(self, patterns: List[Dict], winning: bool):
+        if not patterns:
+            return
+        features = [self._extract_features_from_pattern(p) for p in patterns]
+        with self._lock:
+            if winning:
+                # Weight by success (more successful patterns count more), capped at 5
+                weights = [min(p.get('success_count', 1), 5) for p in patterns]
+                self.winning_patterns.extend(patterns)
+                self._winning_index.add(features, weights)
+            else:
+                self.losing_patterns.extend(patterns)
+                self._losing_index.add(features, [1.0] * len(patterns))
+
     def score_signal(self, signal: Dict, market_context: Dict) -> float:
         """
         Score a signal based on similarity to winning patterns
@@ -53,27 +175,30 @@ class PatternMatcher:
         Returns:
             Confidence score 0-100 (higher = more similar to winners)
         """
-        if not self.winning_patterns:
-            # No patterns learned yet, return neutral score
-            return 50.0
-        
         # Extract features from signal and market context
         signal_features = self._extract_features(signal, market_context)
-        
-        # Calculate similarity to each winning pattern
-        similarities = []
-        for pattern in self.winning_patterns:
-            pattern_features = self._extract_features_from_pattern(pattern)
-            similarity = self._calculate_similarity(signal_features, pattern_features)
-            # Weight by success (more successful patterns count more)
-            weight = min(pattern.get('success_count', 1), 5)  # Cap weight at 5
-            similarities.append(similarity * weight)
-        
-        if not similarities:
+
+        with self._lock:
+            self.refresh()
+
+            if not self.winning_patterns:
+                # No patterns learned yet, return neutral score
+                return 50.0
+
+            # Similarity to every winning pattern, weighted by success
+            similarities = self._winning_index.similarity(signal_features)
+            weights = self._winning_index.weights
+            losing_similarity = (self._losing_index.similarity(signal_features)
+                                 if self.losing_patterns else None)
+
+        if 0 < self.top_k < len(similarities):
+            nearest = np.argpartition(-similarities, self.top_k - 1)[:self.top_k]
+            similarities, weights = similarities[nearest], weights[nearest]
+        if weights.sum() <= 0:
             return 50.0
         
         # Average similarity, weighted
-        avg_similarity = sum(similarities) / sum(min(p.get('success_count', 1), 5) for p in self.winning_patterns)
+        avg_similarity = float(np.dot(similarities, weights) / weights.sum())
         
         # Convert to 0-100 score
         # Similarity ranges from 0-1, map to 0-100
@@ -81,20 +206,13 @@ class PatternMatcher:
         score = min(avg_similarity * 100 * 1.2, 100.0)
         
         # Penalize if similar to losing patterns
-        if self.losing_patterns:
-            losing_similarities = []
-            for pattern in self.losing_patterns:
-                pattern_features = self._extract_features_from_pattern(pattern)
-                similarity = self._calculate_similarity(signal_features, pattern_features)
-                losing_similarities.append(similarity)
-            
-            if losing_similarities:
-                avg_losing_similarity = sum(losing_similarities) / len(losing_similarities)
-                # Reduce score if similar to losers
-                score = score * (1 - avg_losing_similarity * 0.5)  # Reduce by up to 50%
+        if losing_similarity is not None:
+            avg_losing_similarity = float(losing_similarity.mean())
+            # Reduce score if similar to losers
+            score = score * (1 - avg_losing_similarity * 0.5)  # Reduce by up to 50%
         
         return max(0.0, min(100.0, score))
-    
+
     def _extract_features(self, signal: Dict, market_context: Dict) -> Dict:
         """Extract features from signal and market context"""
         return {
@@ -197,8 +315,9 @@ class PatternMatcher:
     
     def get_statistics(self) -> Dict:
         """Get pattern matching statistics"""
-        return {
-            'winning_patterns': len(self.winning_patterns),
-            'losing_patterns': len(self.losing_patterns),
-            'total_patterns': len(self.winning_patterns) + len(self.losing_patterns)
-        }
+        with self._lock:
+            return {
+                'winning_patterns': len(self.winning_patterns),
+                'losing_patterns': len(self.losing_patterns),
+                'total_patterns': len(self.winning_patterns) + len(self.losing_patterns)
+            }
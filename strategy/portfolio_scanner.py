@@ -0,0 +1,153 @@
+"""
+Portfolio Scanner
+Evaluates strategies and filters for several perpetuals in one trading cycle
+
+Each symbol gets its own StrategyManager (per-symbol signal history and
+strategy counters). The FilterManager is shared, so gate ordering and pattern
+statistics learn from every symbol. Symbols are evaluated concurrently on a
+small thread pool and all of them see the same BTC reference market state,
+so a cycle costs roughly the slowest symbol rather than the sum of all.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from utils.latency import get_stage_timer
+from .strategy_manager import StrategyManager
+
+logger = logging.getLogger(__name__)
+
+
+class PortfolioScanner:
+    """
+    Runs StrategyManager + FilterManager for every portfolio symbol
+    """
+
+    def __init__(self, symbols: List[str], filter_manager, max_workers: int = 4,
+                 reference_symbol: Optional[str] = None,
+                 signal_gate: Optional[Callable[[Dict, Dict], Optional[str]]] = None):
+        """
+        Args:
+            symbols: Perpetuals to scan (e.g. ['SOL-USDT-SWAP', 'ETH-USDT-SWAP'])
+            filter_manager: Shared FilterManager
+            max_workers: Symbols evaluated concurrently (1 = sequential)
+            reference_symbol: Symbol whose market state is passed as BTC reference
+                (not passed to itself)
+            signal_gate: Optional check run between strategy and filters;
+                returns a rejection reason or None
+        """
+        self.symbols = list(dict.fromkeys(symbols))
+        self.filter_manager = filter_manager
+        self.reference_symbol = reference_symbol
+        self.signal_gate = signal_gate
+        self.strategy_managers = {symbol: StrategyManager() for symbol in self.symbols}
+        self.stages = get_stage_timer()
+
+        workers = min(max_workers, len(self.symbols))
+        self._executor = (ThreadPoolExecutor(max_workers=workers, thread_name_prefix='portfolio')
+                          if workers > 1 else None)
+
+        self._lock = threading.Lock()
+        self.scans = 0
+        self.signals_by_symbol = {symbol: 0 for symbol in self.symbols}
+        self.passed_by_symbol = {symbol: 0 for symbol in self.symbols}
+        self.last_results: Dict[str, str] = {}
+
+        logger.info(f"✅ PortfolioScanner initialized: {', '.join(self.symbols)} ({workers} workers)")
+
+    def scan(self, market_states: Dict[str, Dict], reference_state: Optional[Dict] = None) -> List[Dict]:
+        """
+        Evaluate every symbol with a market state
+
+        Args:
+            market_states: Symbol -> market state (from MarketDataFeed.get_market_states)
+            reference_state: BTC market state shared by all symbols
+
+        Returns:
+            Candidates that passed all filters, highest confidence first. Each is
+            {'symbol', 'signal', 'market_state', 'filter_results', 'reason'}
+        """
+        jobs = [(symbol, market_states.get(symbol)) for symbol in self.symbols]
+        jobs = [(symbol, state) for symbol, state in jobs if state]
+
+        if self._executor and len(jobs) > 1:
+            futures = [self._executor.submit(self._evaluate, symbol, state, reference_state)
+                       for symbol, state in jobs]
+            outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [self._evaluate(symbol, state, reference_state) for symbol, state in jobs]
+
+        with self._lock:
+            self.scans += 1
+            self.last_results = {outcome['symbol']: outcome['reason'] for outcome in outcomes}
+            for outcome in outcomes:
+                if outcome['signal']:
+                    self.signals_by_symbol[outcome['symbol']] += 1
+                if outcome['passed']:
+                    self.passed_by_symbol[outcome['symbol']] += 1
+
+        candidates = [outcome for outcome in outcomes if outcome['passed']]
+        candidates.sort(key=self._candidate_score, reverse=True)
+        return candidates
+
+    def _evaluate(self, symbol: str, market_state: Dict, reference_state: Optional[Dict]) -> Dict:
+        """Strategy -> signal gate -> filters for one symbol"""
+        outcome = {
+            'symbol': symbol,
+            'passed': False,
+            'reason': '',
+            'signal': None,
+            'market_state': market_state,
+            'filter_results': None
+        }
+        try:
+            with self.stages.span(f"strategy.{symbol}"):
+                signal = self.strategy_managers[symbol].analyze_market(market_state)
+            if not signal:
+                outcome['reason'] = 'No signal detected'
+                return outcome
+
+            signal['symbol'] = symbol
+            outcome['signal'] = signal
+            logger.info(f"🎯 {symbol}: {signal['strategy']} - {signal['direction'].upper()}")
+
+            if self.signal_gate:
+                blocked = self.signal_gate(signal, market_state)
+                if blocked:
+                    outcome['reason'] = blocked
+                    return outcome
+
+            reference = reference_state if symbol != self.reference_symbol else None
+            with self.stages.span(f"filters.{symbol}"):
+                passed, filter_results = self.filter_manager.check_all(
+                    market_state, signal['direction'], signal['strategy'], reference
+                )
+            outcome['filter_results'] = filter_results
+            outcome['passed'] = passed
+            outcome['reason'] = ('All filters passed' if passed else
+                                 f"Failed: {', '.join(filter_results['failed_filters'])}")
+        except Exception as e:
+            logger.error(f"❌ {symbol}: Error during portfolio scan: {e}")
+            outcome['reason'] = f"Error: {e}"
+        return outcome
+
+    @staticmethod
+    def _candidate_score(candidate: Dict) -> float:
+        results = candidate['filter_results'] or {}
+        return results.get('adjusted_confidence', results.get('score', 0)) or 0
+
+    def get_statistics(self) -> Dict:
+        with self._lock:
+            return {
+                'symbols': list(self.symbols),
+                'scans': self.scans,
+                'signals_by_symbol': dict(self.signals_by_symbol),
+                'passed_by_symbol': dict(self.passed_by_symbol),
+                'last_results': dict(self.last_results)
+            }
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False)
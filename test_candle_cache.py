@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Candle cache coverage test - HistoricalDataLoader + CandleStore against a fake OKX client
+
+Only the span that pagination actually walked may be marked as covered:
+a fetch cut short (error mid-pagination, call limit, latest-candles
+fallback) must leave the rest of the gap to be fetched on the next load.
+
+Run with: python -m pytest test_candle_cache.py
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import backtesting.historical_data_loader as loader_module
+from backtesting.columnar_data import CandleArrayView, ColumnarMarketData
+from backtesting.historical_data_loader import HistoricalDataLoader
+
+SYMBOL = 'SOL-USDT-SWAP'
+TIMEFRAME = '15m'
+STEP = 15 * 60_000
+
+
+class FakeHistoryClient:
+    """history-candles stand-in: newest-first pages of 100, optional failure on one page"""
+
+    def __init__(self, start_ts: int, end_ts: int, fail_on_call: int = 0, empty_history: bool = False):
+        self.timestamps = list(range(start_ts - start_ts % STEP, end_ts + 1, STEP))
+        self.fail_on_call = fail_on_call
+        self.empty_history = empty_history
+        self.calls = 0
+
+    @staticmethod
+    def _raw(ts: int):
+        return [str(ts), '100', '101', '99', '100', '10']
+
+    def get_history_candles(self, symbol, timeframe, after=None, limit=100, **kwargs):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise ConnectionError("connection reset")
+        if self.empty_history:
+            return []
+        older = [ts for ts in self.timestamps if ts < int(after)]
+        return [self._raw(ts) for ts in reversed(older[-limit:])]
+
+    def get_candles(self, symbol, timeframe, limit=100, **kwargs):
+        return [self._raw(ts) for ts in reversed(self.timestamps[-limit:])]
+
+
+def _loader(client, cache_dir):
+    loader = HistoricalDataLoader(cache_dir=cache_dir)
+    loader.client = client
+    return loader
+
+
+def _run(test):
+    # Pagination sleeps between pages; not needed against a fake
+    sleep = loader_module.time.sleep
+    loader_module.time.sleep = lambda seconds: None
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            test(cache_dir)
+    finally:
+        loader_module.time.sleep = sleep
+
+
+def test_complete_fetch_covers_gap():
+    def check(cache_dir):
+        loader = _loader(None, cache_dir)
+        start_ts, end_ts = loader._date_range_to_ts('2024-01-01', '2024-01-03')
+        loader.client = FakeHistoryClient(start_ts, end_ts)
+        data = loader.load_data(SYMBOL, '2024-01-01', '2024-01-03', timeframes=[TIMEFRAME])
+        assert len(data[TIMEFRAME]) == len(loader.client.timestamps)
+        assert loader._fetchable_gaps(SYMBOL, TIMEFRAME, start_ts, end_ts) == []
+    _run(check)
+
+
+def test_truncated_pagination_leaves_gap():
+    def check(cache_dir):
+        loader = _loader(None, cache_dir)
+        start_ts, end_ts = loader._date_range_to_ts('2024-01-01', '2024-01-03')
+        # Page 1 (newest 100 candles) arrives, page 2 fails
+        loader.client = FakeHistoryClient(start_ts, end_ts, fail_on_call=2)
+        data = loader.load_data(SYMBOL, '2024-01-01', '2024-01-03', timeframes=[TIMEFRAME])
+        fetched = data[TIMEFRAME]
+        assert len(fetched) == 100
+
+        gaps = loader._fetchable_gaps(SYMBOL, TIMEFRAME, start_ts, end_ts)
+        assert gaps and gaps[0][0] == start_ts
+        assert gaps[-1][1] < fetched[0]['timestamp'], "fetched span must not be re-requested"
+
+        # Next load fetches only the hole and ends fully covered
+        loader.client = FakeHistoryClient(start_ts, end_ts)
+        data = loader.load_data(SYMBOL, '2024-01-01', '2024-01-03', timeframes=[TIMEFRAME])
+        assert len(data[TIMEFRAME]) == len(loader.client.timestamps)
+        assert loader._fetchable_gaps(SYMBOL, TIMEFRAME, start_ts, end_ts) == []
+    _run(check)
+
+
+def test_latest_candles_fallback_claims_no_coverage():
+    def check(cache_dir):
+        loader = _loader(None, cache_dir)
+        start_ts, end_ts = loader._date_range_to_ts('2024-01-01', '2024-01-03')
+        loader.client = FakeHistoryClient(start_ts, end_ts, empty_history=True)
+        loader.load_data(SYMBOL, '2024-01-01', '2024-01-03', timeframes=[TIMEFRAME])
+        assert loader.store.missing_ranges(SYMBOL, TIMEFRAME, start_ts, end_ts) == [(start_ts, end_ts)]
+    _run(check)
+
+
+def test_cached_load_builds_no_candle_dicts():
+    def check(cache_dir):
+        loader = _loader(None, cache_dir)
+        start_ts, end_ts = loader._date_range_to_ts('2024-01-01', '2024-01-03')
+        loader.client = FakeHistoryClient(start_ts, end_ts)
+        loader.load_data(SYMBOL, '2024-01-01', '2024-01-03', timeframes=[TIMEFRAME])
+
+        # Second load is served from the memory-mapped cache
+        candles = loader.load_data(SYMBOL, '2024-01-01', '2024-01-03', timeframes=[TIMEFRAME])[TIMEFRAME]
+        assert isinstance(candles, CandleArrayView)
+        columns = ColumnarMarketData({TIMEFRAME: candles}, TIMEFRAME)
+        assert columns.primary.close.tolist() == candles.array['close'].tolist()
+
+        # Only the summary log's first/last candles were materialized
+        assert sum(row is not None for row in candles._rows) <= 2
+        window = columns.window(TIMEFRAME, len(columns) - 1)
+        assert isinstance(window, list) and window[-1] == candles[-1]
+        assert window[-1]['timestamp'] == loader.client.timestamps[-1]
+    _run(check)
+
+
+def test_legacy_files_imported_once_and_kept():
+    def check(cache_dir):
+        loader = _loader(None, cache_dir)
+        start_ts, end_ts = loader._date_range_to_ts('2024-01-01', '2024-01-02')
+        client = FakeHistoryClient(start_ts, end_ts)
+        candles = [{'timestamp': ts, 'open': 100.0, 'high': 101.0, 'low': 99.0, 'close': 100.0, 'volume': 10.0}
+                   for ts in client.timestamps]
+        legacy = Path(cache_dir) / 'SOL_USDT_SWAP_15m_2024-01-01_2024-01-02.json'
+        legacy.write_text(json.dumps(candles))
+
+        loader.client = client
+        data = loader.load_data(SYMBOL, '2024-01-01', '2024-01-02', timeframes=[TIMEFRAME])
+        assert len(data[TIMEFRAME]) == len(candles)
+        assert client.calls == 0, "legacy span must be served without fetching"
+        # Tracked in git: the import must not delete it
+        assert legacy.exists()
+
+        # A fresh loader does not read the file again
+        other = _loader(client, cache_dir)
+        imports = []
+        other.store.add = lambda *args: imports.append(args)
+        other._import_legacy_cache(SYMBOL, TIMEFRAME)
+        assert imports == []
+    _run(check)
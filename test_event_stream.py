@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Event stream test - EventStream change detection and Last-Event-ID replay
+
+Subscribers are driven directly as generators: a reconnect inside the
+history window replays only what was missed, one that fell out of the
+window gets a fresh snapshot instead of a silent gap.
+
+Run with: python -m pytest test_event_stream.py
+"""
+
+import sys
+import json
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.event_stream import EventStream, format_event
+
+
+def _parse(message: str) -> dict:
+    """SSE text -> {'id', 'event', 'data'} (comments -> {'comment': True})"""
+    if message.startswith(':'):
+        return {'comment': True}
+    fields = dict(line.split(': ', 1) for line in message.strip().split('\n'))
+    return {'id': int(fields['id']) if 'id' in fields else None,
+            'event': fields['event'], 'data': json.loads(fields['data'])}
+
+
+def test_format_event():
+    assert format_event('prices', {'btc_price': 1}, 7) == 'id: 7\nevent: prices\ndata: {"btc_price": 1}\n\n'
+
+
+def test_publish_changes_sends_only_diffs():
+    stream = EventStream()
+    assert stream.publish_changes('prices', {'sol': 1.0, 'btc': 2.0}) == 1
+    assert stream.publish_changes('prices', {'sol': 1.0, 'btc': 2.0}, extra={'ts': 'x'}) is None
+    assert stream.publish_changes('prices', {'sol': 1.5, 'btc': 2.0}, extra={'ts': 'y'}) == 2
+
+    events = list(stream._pending(0))
+    assert [data for _, _, data in events] == [{'sol': 1.0, 'btc': 2.0}, {'sol': 1.5, 'ts': 'y'}]
+    assert stream.get_statistics()['changes_suppressed'] == 1
+
+
+def test_replay_after_reconnect():
+    stream = EventStream(history=10)
+    for i in range(5):
+        stream.publish('signal', {'n': i})
+
+    subscriber = stream.subscribe(snapshot=lambda: {'full': True}, last_event_id=2, keepalive=0.05)
+    replayed = [_parse(next(subscriber)) for _ in range(3)]
+    assert [m['id'] for m in replayed] == [3, 4, 5]
+    assert [m['data']['n'] for m in replayed] == [2, 3, 4]
+
+    # Live events follow the replay
+    threading.Timer(0.01, stream.publish, args=('signal', {'n': 5})).start()
+    message = _parse(next(subscriber))
+    while message.get('comment'):
+        message = _parse(next(subscriber))
+    assert message['id'] == 6
+    subscriber.close()
+    assert stream.get_statistics()['subscribers'] == 0
+
+
+def test_snapshot_after_eviction():
+    stream = EventStream(history=3)
+    for i in range(10):
+        stream.publish('signal', {'n': i})
+
+    # Events 3..7 were evicted: resuming from 2 would skip them silently
+    subscriber = stream.subscribe(snapshot=lambda: {'full': True}, last_event_id=2, keepalive=0.05)
+    message = _parse(next(subscriber))
+    assert message['event'] == 'snapshot'
+    assert message['id'] == 10 and message['data'] == {'full': True}
+    subscriber.close()
+
+
+def test_slow_subscriber_gets_new_snapshot():
+    stream = EventStream(history=3)
+    snapshots = []
+
+    def snapshot():
+        snapshots.append(stream.last_id())
+        return {'at': stream.last_id()}
+
+    subscriber = stream.subscribe(snapshot=snapshot, keepalive=0.05)
+    assert _parse(next(subscriber))['event'] == 'snapshot'
+
+    # The subscriber is not reading while more than `history` events go out
+    for i in range(6):
+        stream.publish('signal', {'n': i})
+    message = _parse(next(subscriber))
+    assert message['event'] == 'snapshot' and message['id'] == 6
+    assert snapshots == [0, 6]
+    subscriber.close()
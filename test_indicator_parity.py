@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Indicator parity test - Batch (whole-history) indicators vs scalar versions
+
+Every *_batch value at index i must match the scalar TechnicalIndicators
+function run on the candles up to and including i. The regime detectors'
+ADX, now built on the batch DX, must match their original loop versions.
+
+Run with: python -m pytest test_indicator_parity.py
+"""
+
+import sys
+import random
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from data_feed.indicators import TechnicalIndicators
+from data_feed.indicator_state import IndicatorState
+from backtesting.adaptive_systems import RollingRegimeDetector
+from backtesting.dual_regime_system import ProperRegimeDetector
+
+TOLERANCE = 1e-9
+
+
+def _make_candles(count: int = 400, seed: int = 7):
+    """Random-walk OHLCV candles"""
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for i in range(count):
+        open_price = price
+        price *= 1 + rng.gauss(0, 0.01)
+        # Flat stretch exercises zero-loss RSI and zero-range bars
+        if 200 <= i < 220:
+            price = open_price
+        candles.append({
+            'timestamp': 1_700_000_000_000 + i * 900_000,
+            'open': open_price,
+            'high': max(open_price, price) * (1 + (0 if 200 <= i < 220 else rng.random() * 0.004)),
+            'low': min(open_price, price) * (1 - (0 if 200 <= i < 220 else rng.random() * 0.004)),
+            'close': price,
+            'volume': rng.random() * 1000
+        })
+    return candles
+
+
+CANDLES = _make_candles()
+HIGHS = [c['high'] for c in CANDLES]
+LOWS = [c['low'] for c in CANDLES]
+CLOSES = [c['close'] for c in CANDLES]
+VOLUMES = [c['volume'] for c in CANDLES]
+
+
+def _assert_close(batch_value, scalar_value, label):
+    if scalar_value is None:
+        assert np.isnan(batch_value), f"{label}: expected NaN, got {batch_value}"
+        return
+    assert abs(batch_value - scalar_value) <= TOLERANCE * max(1.0, abs(scalar_value)), \
+        f"{label}: batch {batch_value} != scalar {scalar_value}"
+
+
+def test_ema_batch():
+    for period in (10, 20, 50):
+        batch = TechnicalIndicators.calculate_ema_batch(CLOSES, period)
+        assert len(batch) == len(CLOSES)
+        for i in range(len(CLOSES)):
+            scalar = TechnicalIndicators.calculate_ema(CLOSES[:i + 1], period)
+            _assert_close(batch[i], scalar[-1] if scalar else None, f"ema{period}[{i}]")
+
+
+def test_atr_series_batch():
+    batch = TechnicalIndicators.calculate_atr_series_batch(HIGHS, LOWS, CLOSES, 14)
+    series = TechnicalIndicators.calculate_atr_series(HIGHS, LOWS, CLOSES, 14)
+    assert len(batch) == len(CLOSES)
+    assert np.isnan(batch[:13]).all()
+    for offset, value in enumerate(series):
+        _assert_close(batch[13 + offset], value, f"atr_series[{13 + offset}]")
+
+
+def test_atr_batch():
+    batch = TechnicalIndicators.calculate_atr_batch(HIGHS, LOWS, CLOSES, 14)
+    for i in range(len(CLOSES)):
+        scalar = TechnicalIndicators.calculate_atr(HIGHS[:i + 1], LOWS[:i + 1], CLOSES[:i + 1], 14)
+        _assert_close(batch[i], scalar, f"atr[{i}]")
+
+
+def test_rsi_batch():
+    batch = TechnicalIndicators.calculate_rsi_batch(CLOSES, 14)
+    for i in range(len(CLOSES)):
+        scalar = TechnicalIndicators.calculate_rsi(CLOSES[:i + 1], 14)
+        _assert_close(batch[i], scalar, f"rsi[{i}]")
+
+
+def test_rolling_mean_batch():
+    batch = TechnicalIndicators.calculate_rolling_mean_batch(VOLUMES, 20)
+    for i in range(len(VOLUMES)):
+        scalar = float(np.mean(VOLUMES[i - 19:i + 1])) if i >= 19 else None
+        _assert_close(batch[i], scalar, f"volume_mean[{i}]")
+
+
+def test_indicator_state_matches_batch():
+    state = IndicatorState(ema_periods=(20, 50), atr_history=len(CANDLES))
+    ema_20 = TechnicalIndicators.calculate_ema_batch(CLOSES, 20)
+    atr = TechnicalIndicators.calculate_atr_series_batch(HIGHS, LOWS, CLOSES, 14)
+    rsi = TechnicalIndicators.calculate_rsi_batch(CLOSES, 14)
+
+    for i, candle in enumerate(CANDLES):
+        state.update(candle)
+        _assert_close(ema_20[i], state.ema(20), f"state ema20[{i}]")
+        _assert_close(rsi[i], state.rsi, f"state rsi[{i}]")
+        if i >= 14:
+            _assert_close(atr[i], state.atr, f"state atr[{i}]")
+
+
+def test_short_history_is_all_nan():
+    short = CLOSES[:5]
+    assert np.isnan(TechnicalIndicators.calculate_ema_batch(short, 20)).all()
+    assert np.isnan(TechnicalIndicators.calculate_rsi_batch(short, 14)).all()
+    assert np.isnan(TechnicalIndicators.calculate_atr_series_batch(
+        HIGHS[:5], LOWS[:5], short, 14)).all()
+
+
+def _rolling_adx_loop(candles, period=14):
+    """RollingRegimeDetector.calculate_adx before the batch rewrite"""
+    if len(candles) < period + 1:
+        return 0
+    highs = [c['high'] for c in candles]
+    lows = [c['low'] for c in candles]
+    closes = [c['close'] for c in candles]
+    tr_list, plus_dm_list, minus_dm_list = [], [], []
+    for i in range(1, len(candles)):
+        high, low, prev_close = highs[i], lows[i], closes[i-1]
+        prev_high, prev_low = highs[i-1], lows[i-1]
+        tr_list.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+        plus_dm_list.append(max(0, high - prev_high) if high - prev_high > prev_low - low else 0)
+        minus_dm_list.append(max(0, prev_low - low) if prev_low - low > high - prev_high else 0)
+    if len(tr_list) < period:
+        return 0
+
+    def wilder_smooth(data, period):
+        smoothed = [sum(data[:period])]
+        for val in data[period:]:
+            smoothed.append(smoothed[-1] - smoothed[-1]/period + val)
+        return smoothed
+
+    atr = wilder_smooth(tr_list, period)
+    plus_di_smooth = wilder_smooth(plus_dm_list, period)
+    minus_di_smooth = wilder_smooth(minus_dm_list, period)
+    dx_list = []
+    for i in range(len(atr)):
+        if atr[i] == 0:
+            continue
+        plus_di = 100 * plus_di_smooth[i] / atr[i]
+        minus_di = 100 * minus_di_smooth[i] / atr[i]
+        di_sum = plus_di + minus_di
+        if di_sum > 0:
+            dx_list.append(100 * abs(plus_di - minus_di) / di_sum)
+    if len(dx_list) < period:
+        return 0
+    return sum(dx_list[-period:]) / period
+
+
+def _proper_adx_loop(candles, period=14):
+    """ProperRegimeDetector.calculate_adx before the batch rewrite"""
+    if len(candles) < period + 10:
+        return 0
+    highs = np.array([c['high'] for c in candles])
+    lows = np.array([c['low'] for c in candles])
+    closes = np.array([c['close'] for c in candles])
+    tr = np.maximum(highs[1:] - lows[1:],
+                    np.maximum(np.abs(highs[1:] - closes[:-1]), np.abs(lows[1:] - closes[:-1])))
+    up_move = highs[1:] - highs[:-1]
+    down_move = lows[:-1] - lows[1:]
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+
+    def smooth(data, period):
+        result = np.zeros(len(data))
+        result[period-1] = np.sum(data[:period])
+        for i in range(period, len(data)):
+            result[i] = result[i-1] - result[i-1]/period + data[i]
+        return result / period
+
+    atr = smooth(tr, period)
+    plus_di = 100 * smooth(plus_dm, period) / (atr + 1e-10)
+    minus_di = 100 * smooth(minus_dm, period) / (atr + 1e-10)
+    dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
+    adx = smooth(dx, period)
+    return float(adx[-1]) if len(adx) > 0 and not np.isnan(adx[-1]) else 0
+
+
+# The original loops divide by (x + 1e-10); allow for that epsilon
+ADX_TOLERANCE = 1e-6
+
+
+def test_regime_adx_matches_loop_versions():
+    rolling = RollingRegimeDetector()
+    proper = ProperRegimeDetector()
+    # Windows ending before, inside and after the flat stretch
+    for end in (10, 15, 24, 29, 40, 100, 205, 215, 225, 260, len(CANDLES)):
+        for start in (0, max(0, end - 60)):
+            window = CANDLES[start:end]
+            for period in (7, 14):
+                expected = _rolling_adx_loop(window, period)
+                actual = rolling.calculate_adx(window, period)
+                assert abs(actual - expected) <= ADX_TOLERANCE, \
+                    f"rolling adx{period}[{start}:{end}]: {actual} != {expected}"
+
+                expected = _proper_adx_loop(window, period)
+                actual = proper.calculate_adx(window, period)
+                assert abs(actual - expected) <= ADX_TOLERANCE, \
+                    f"proper adx{period}[{start}:{end}]: {actual} != {expected}"
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Journal store test - SQLite index over the daily trades.jsonl files
+
+Trades are appended to the JSONL files the way TradeJournal writes them;
+the store must index each complete line exactly once, leave a line that is
+still being written for the next sync, and answer filtered queries.
+
+Run with: python -m pytest test_journal_store.py
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.journal_store import JournalStore
+from utils.performance_analytics import PerformanceAnalytics
+
+
+def _day(offset: int = 0) -> str:
+    return (datetime.now(timezone.utc).date() - timedelta(days=offset)).strftime('%Y-%m-%d')
+
+
+def _trade(n: int, day: str, **fields) -> dict:
+    trade = {
+        'trade_id': f"t{n}",
+        'timestamp_close': f"{day}T{n % 24:02d}:00:00+00:00",
+        'symbol': 'SOL-USDT-SWAP',
+        'strategy_name': 'BreakoutV3' if n % 2 else 'Structure',
+        'close_reason': 'tp1' if n % 3 else 'sl',
+        'pnl_abs': (n % 5) - 2.0,
+        'confidence_score': (n * 17) % 100,
+        'duration_seconds': 600 + n
+    }
+    trade.update(fields)
+    return trade
+
+
+def _append(base: Path, day: str, text: str):
+    path = base / day / 'trades.jsonl'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_partial_line_waits_for_newline():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        day = _day()
+        first, second = json.dumps(_trade(1, day)), json.dumps(_trade(2, day))
+        # The second trade is mid-write: no trailing newline yet
+        _append(base, day, first + '\n' + second[:20])
+
+        store = JournalStore(tmp)
+        assert store.sync() == 1
+        assert [t['trade_id'] for t in store.query(sync=False)] == ['t1']
+
+        _append(base, day, second[20:] + '\n')
+        assert store.sync() == 1
+        assert store.sync() == 0
+        assert sorted(t['trade_id'] for t in store.query()) == ['t1', 't2']
+
+
+def test_offsets_shared_across_store_instances():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        day = _day()
+        _append(base, day, ''.join(json.dumps(_trade(n, day)) + '\n' for n in range(5)))
+
+        assert JournalStore(tmp).sync() == 5
+        # A second process opening the same database does not re-import
+        other = JournalStore(tmp)
+        assert other.sync() == 0
+        assert other.count() == 5
+
+
+def test_query_filters_and_order():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        for offset in range(3):
+            day = _day(offset)
+            _append(base, day, ''.join(json.dumps(_trade(n, day)) + '\n' for n in range(offset * 10, offset * 10 + 6)))
+        # Outside a 3-day window
+        old = _day(10)
+        _append(base, old, json.dumps(_trade(99, old)) + '\n')
+
+        store = JournalStore(tmp)
+        recent = store.query(days=3)
+        assert len(recent) == 18
+        closes = [t['timestamp_close'] for t in recent]
+        assert closes == sorted(closes, reverse=True)
+
+        assert all(t['strategy_name'] == 'Structure' for t in store.query(strategy='Structure'))
+        stops = store.query(days=3, close_reason='sl')
+        assert stops and all(t['close_reason'] == 'sl' for t in stops)
+        assert len(store.query(limit=4)) == 4
+        assert store.count() == 19
+
+
+def test_parsed_cache_is_bounded():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        day = _day()
+        _append(base, day, ''.join(json.dumps(_trade(n, day)) + '\n' for n in range(20)))
+
+        store = JournalStore(tmp)
+        store._parsed_max = 5
+        assert len(store.query()) == 20
+        assert len(store._parsed) == 5
+        # Repeat queries still return complete, independent copies
+        recent = store.query(limit=3)
+        recent[0]['note'] = 'annotated'
+        assert 'note' not in store.query(limit=1)[0]
+        assert len(store._parsed) == 5
+
+
+def _list_metrics(analytics: PerformanceAnalytics, trades: list) -> dict:
+    return {
+        'overall': analytics.calculate_metrics(trades),
+        'by_confidence': analytics.calculate_metrics_by_confidence(trades),
+        'by_strategy': analytics.calculate_metrics_by_strategy(trades),
+        'by_close_reason': analytics.calculate_metrics_by_close_reason(trades),
+        'by_day_of_week': analytics.calculate_metrics_by_day_of_week(trades),
+    }
+
+
+def test_aggregates_match_list_metrics():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        n = 0
+        for offset in (40, 12, 6, 2, 0):
+            day = _day(offset)
+            batch = []
+            for hour in range(7):
+                n += 1
+                # The journal appends trades in close order
+                batch.append(json.dumps(_trade(n, day, timestamp_close=f"{day}T{hour + 8:02d}:00:00+00:00")))
+            # Two syncs per day: aggregates must fold increments, not overwrite them
+            _append(base, day, '\n'.join(batch[:3]) + '\n')
+            JournalStore(tmp).sync()
+            _append(base, day, '\n'.join(batch[3:]) + '\n')
+
+        analytics = PerformanceAnalytics(journal_path=tmp, output_path=str(base / 'analytics'))
+        assert analytics.journal.store, "journal store unavailable"
+        for days in (3, 7, 30):
+            trades = analytics.load_trades(days=days)
+            assert trades
+            expected = _list_metrics(analytics, trades)
+            actual = analytics.aggregate_metrics(days=days)
+            assert actual == expected, f"aggregate/list mismatch for {days} days"
+
+
+def test_drawdown_spans_days():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        # Peak on day 1, losses continue through day 2: one drawdown of 10
+        for offset, pnls in ((2, [5.0, -2.0]), (1, [-4.0, -4.0]), (0, [3.0])):
+            day = _day(offset)
+            _append(base, day, ''.join(json.dumps(_trade(i, day, pnl_abs=p)) + '\n'
+                                       for i, p in enumerate(pnls)))
+
+        store = JournalStore(tmp)
+        analytics = PerformanceAnalytics(journal_path=tmp, output_path=str(base / 'analytics'))
+        trades = list(reversed(analytics.load_trades(days=7)))
+        assert store.aggregates(days=7)['max_drawdown'] == 10.0
+        assert analytics._calculate_max_drawdown(trades) == 10.0
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Rate limiter test - per-endpoint OKX token buckets
+
+Each endpoint group has its own bucket: draining the candles bucket must
+not delay order placement, while calls in the same group are paced.
+
+Run with: python -m pytest test_rate_limiter.py
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from data_feed.rate_limiter import RateLimiter, TokenBucket
+
+LIMITS = {
+    '/api/v5/market/candles': (4, 1),
+    'POST /api/v5/trade/order': (4, 1),
+    'GET /api/v5/trade/order': (2, 1),
+}
+
+
+def _limiter():
+    return RateLimiter(LIMITS, default=(1, 1))
+
+
+def test_groups_split_by_method():
+    limiter = _limiter()
+    assert limiter.group_for('POST', '/api/v5/trade/order') == 'POST /api/v5/trade/order'
+    assert limiter.group_for('GET', '/api/v5/trade/order') == 'GET /api/v5/trade/order'
+    assert limiter.group_for('GET', '/api/v5/market/candles') == '/api/v5/market/candles'
+    assert limiter.group_for('GET', '/api/v5/market/books') == 'default'
+
+
+def test_same_group_is_paced():
+    bucket = TokenBucket(rate=20, capacity=2)
+    started = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    # Two tokens were free, the other two refill at 20/s
+    assert time.monotonic() - started >= 0.09
+    assert bucket.waits >= 1
+
+
+def test_order_placement_not_blocked_by_market_reads():
+    limiter = _limiter()
+    for _ in range(4):
+        limiter.acquire('GET', '/api/v5/market/candles')
+
+    # Market-data callers now queue on an empty bucket
+    readers = [threading.Thread(target=limiter.acquire, args=('GET', '/api/v5/market/candles'))
+               for _ in range(4)]
+    for reader in readers:
+        reader.start()
+
+    waited = limiter.acquire('POST', '/api/v5/trade/order')
+    for reader in readers:
+        reader.join()
+
+    assert waited < 0.05, f"order waited {waited:.3f}s behind market reads"
+    stats = limiter.stats()
+    assert stats['POST /api/v5/trade/order']['waits'] == 0
+    assert stats['/api/v5/market/candles']['waits'] >= 1
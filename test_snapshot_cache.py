@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Snapshot cache test - SnapshotCache single-flight and stale-while-revalidate
+
+The loader stands in for an OKX read: it counts calls and can be held open
+with an Event, so the tests control exactly when the refresher finishes.
+
+Run with: python -m pytest test_snapshot_cache.py
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.snapshot_cache import SnapshotCache
+
+
+class SlowLoader:
+    """Upstream stand-in: blocks until released, then returns the call number"""
+
+    def __init__(self, fail: bool = False):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = 0
+        self.fail = fail
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(5), "loader never released"
+        if self.fail:
+            raise ConnectionError("okx unreachable")
+        return {'call': self.calls}
+
+
+def test_concurrent_misses_share_one_load():
+    cache = SnapshotCache(max_age=60)
+    loader = SlowLoader()
+    results = []
+
+    def request():
+        results.append(cache.get('live', loader))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    assert loader.started.wait(5)
+    # Let every request reach the cache before the load completes
+    time.sleep(0.05)
+    loader.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert loader.calls == 1
+    assert [value for value, _ in results] == [{'call': 1}] * 8
+    stats = cache.get_statistics()
+    assert stats['loads'] == 1 and stats['coalesced'] == 7
+    cache.shutdown()
+
+
+def test_stale_value_served_without_waiting():
+    cache = SnapshotCache(max_age=0.05)
+    cache.put('live', {'call': 0})
+    time.sleep(0.1)
+
+    loader = SlowLoader()
+    started = time.monotonic()
+    value, age = cache.get('live', loader)
+    # The refresh is still blocked, yet the caller already has the old snapshot
+    assert time.monotonic() - started < 0.5
+    assert value == {'call': 0} and age >= 0.05
+
+    # A second stale read joins the queued refresh instead of starting another
+    assert cache.get('live', loader)[0] == {'call': 0}
+    loader.release.set()
+    deadline = time.monotonic() + 5
+    while cache.peek('live')[0] != {'call': 1} and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert cache.peek('live')[0] == {'call': 1}
+    assert loader.calls == 1
+    stats = cache.get_statistics()
+    assert stats['stale_hits'] == 2 and stats['coalesced'] == 1
+    cache.shutdown()
+
+
+def test_failed_refresh():
+    cache = SnapshotCache(max_age=60)
+    loader = SlowLoader(fail=True)
+    loader.release.set()
+
+    # Nothing to fall back on: the caller sees the loader's error
+    try:
+        cache.get('live', loader)
+        assert False, "expected the loader error"
+    except ConnectionError:
+        pass
+
+    # With an old snapshot the failure is absorbed and the next read retries
+    cache.put('live', {'call': 0})
+    assert cache.get('live', loader, max_age=0)[0] == {'call': 0}
+    deadline = time.monotonic() + 5
+    while (cache.get_statistics()['errors'] < 2 or cache._inflight) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert cache.peek('live')[0] == {'call': 0}
+    assert cache.get_statistics()['errors'] == 2
+    assert cache.get('live', loader, max_age=0)[0] == {'call': 0}
+    while loader.calls < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert loader.calls == 3
+    cache.shutdown()
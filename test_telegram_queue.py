@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Telegram queue test - TelegramDeliveryQueue against a scripted send function
+
+The fake send records every delivered text and raises DeliveryError as
+scripted: 429 with retry_after, transient 5xx, or a permanent rejection of
+any text containing 'BAD'.
+
+Run with: python -m pytest test_telegram_queue.py
+"""
+
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.telegram_queue import DeliveryError, TelegramDeliveryQueue
+
+
+class FakeTelegram:
+    """send(text, parse_mode) stand-in; `errors` are raised first, in order"""
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.sent = []
+        self.attempts = []
+
+    def __call__(self, text, parse_mode):
+        self.attempts.append((time.monotonic(), text))
+        if self.errors:
+            raise self.errors.pop(0)
+        if 'BAD' in text:
+            raise DeliveryError("400 Bad Request: can't parse entities", permanent=True)
+        self.sent.append(text)
+        return True
+
+
+def _queue(telegram, **kwargs):
+    options = dict(batch_window=0.05, min_interval=0, max_per_minute=100,
+                   backoff_base=0.01, backoff_max=0.05)
+    options.update(kwargs)
+    return TelegramDeliveryQueue(telegram, **options)
+
+
+def test_burst_is_batched_and_coalesced():
+    telegram = FakeTelegram()
+    queue = _queue(telegram)
+    futures = [queue.enqueue(text) for text in ('a', 'b', 'a', 'a')]
+    futures.append(queue.enqueue('paused', key='state'))
+    futures.append(queue.enqueue('resumed', key='state'))
+    assert queue.flush(5)
+
+    assert all(f.result() for f in futures)
+    assert telegram.sent == ['a\n<i>(×3)</i>\n\nb\n\nresumed']
+    assert queue.get_statistics()['coalesced'] == 3
+
+
+def test_429_waits_retry_after():
+    telegram = FakeTelegram([DeliveryError("429 Too Many Requests", retry_after=0.2)])
+    queue = _queue(telegram)
+    future = queue.enqueue('alert')
+    assert future.result(timeout=5) is True
+
+    (first, _), (second, _) = telegram.attempts
+    assert second - first >= 0.2
+    assert telegram.sent == ['alert']
+    assert queue.get_statistics()['retries'] == 1
+
+
+def test_transient_errors_retry_then_give_up():
+    telegram = FakeTelegram([DeliveryError("502 Bad Gateway")] * 2)
+    queue = _queue(telegram)
+    assert queue.enqueue('alert').result(timeout=5) is True
+    assert len(telegram.attempts) == 3
+
+    telegram = FakeTelegram([ConnectionError("reset")] * 4)
+    queue = _queue(telegram, max_retries=3)
+    assert queue.enqueue('alert').result(timeout=5) is False
+    assert len(telegram.attempts) == 4
+    assert queue.get_statistics()['failed'] == 1
+
+
+def test_permanent_error_drops_only_the_bad_message():
+    telegram = FakeTelegram()
+    queue = _queue(telegram)
+    futures = [queue.enqueue(text) for text in ('tp1 hit', 'BAD <b', 'stop moved')]
+    assert queue.flush(5)
+
+    assert [f.result() for f in futures] == [True, False, True]
+    assert telegram.sent == ['tp1 hit', 'stop moved']
+    stats = queue.get_statistics()
+    assert stats['messages_delivered'] == 2 and stats['failed'] == 1 and stats['retries'] == 0
+
+
+def test_permanent_error_is_not_retried():
+    telegram = FakeTelegram()
+    queue = _queue(telegram)
+    assert queue.enqueue('BAD').result(timeout=5) is False
+    assert len(telegram.attempts) == 1
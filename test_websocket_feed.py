@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+WebSocket feed test - StreamingMarketDataFeed against a local fake OKX server
+
+A fake OKX WebSocket server (aiohttp) pushes candle, ticker, funding and
+open-interest messages. After REST seeds candle history once, market state
+must be served from memory without further REST calls.
+
+Run with: python -m pytest test_websocket_feed.py
+"""
+
+import sys
+import json
+import time
+import asyncio
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aiohttp import web
+
+from data_feed.websocket_feed import CandleBook, OKXWebSocketFeed, StreamingMarketDataFeed
+
+SYMBOL = 'SOL-USDT-SWAP'
+BASE_TS = 1_700_000_000_000
+MINUTE = 60_000
+
+
+def _raw(ts: int, close: float, confirm: str = '0'):
+    return [str(ts), str(close), str(close + 1), str(close - 1), str(close), '10', '1', '1', confirm]
+
+
+class FakeOKXClient:
+    """REST stand-in that counts calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_candles(self, symbol, timeframe='1m', limit=100, **kwargs):
+        self.calls.append(('candles', timeframe))
+        # Newest first, like OKX; newest candle is still forming
+        return [_raw(BASE_TS - i * MINUTE, 100.0, '0' if i == 0 else '1') for i in range(limit)]
+
+    def get_ticker(self, symbol):
+        self.calls.append(('ticker', symbol))
+        return {'last': '1.0'}
+
+    def get_funding_rate(self, symbol):
+        self.calls.append(('funding', symbol))
+        return None
+
+    def get_open_interest(self, symbol):
+        self.calls.append(('oi', symbol))
+        return None
+
+    def get_orderbook(self, symbol, depth=20):
+        self.calls.append(('orderbook', symbol))
+        return None
+
+
+class FakeOKXServer:
+    """Accepts subscriptions and lets the test push messages to every client"""
+
+    def __init__(self):
+        self.sockets = []
+        self.subscriptions = []
+        self.pings = 0
+        self.loop = asyncio.new_event_loop()
+        self.port = None
+        self._started = threading.Event()
+        threading.Thread(target=self._serve, daemon=True).start()
+        self._started.wait(5)
+
+    def _serve(self):
+        asyncio.set_event_loop(self.loop)
+        app = web.Application()
+        app.router.add_get('/ws/v5/public', self._handler)
+        app.router.add_get('/ws/v5/business', self._handler)
+        runner = web.AppRunner(app)
+        self.loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        self.loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._started.set()
+        self.loop.run_forever()
+
+    async def _handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        async for msg in ws:
+            if msg.data == 'ping':
+                self.pings += 1
+                await ws.send_str('pong')
+                continue
+            message = json.loads(msg.data)
+            self.subscriptions.extend(message.get('args', []))
+            for arg in message.get('args', []):
+                await ws.send_json({'event': 'subscribe', 'arg': arg})
+        return ws
+
+    def url(self, path: str) -> str:
+        return f"ws://127.0.0.1:{self.port}/ws/v5/{path}"
+
+    def push(self, channel: str, data: list):
+        message = {'arg': {'channel': channel, 'instId': SYMBOL}, 'data': data}
+        for ws in list(self.sockets):
+            asyncio.run_coroutine_threadsafe(ws.send_json(message), self.loop).result(5)
+
+    def drop_all(self):
+        for ws in list(self.sockets):
+            asyncio.run_coroutine_threadsafe(ws.close(), self.loop).result(5)
+        self.sockets.clear()
+
+
+def _wait_for(predicate, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_candle_book_updates_and_closes():
+    book = CandleBook(maxlen=3)
+    closed = []
+    book.add_close_listener(lambda symbol, tf, candle: closed.append(candle['timestamp']))
+
+    book.apply(SYMBOL, '1m', {'timestamp': 1, 'close': 1.0})
+    book.apply(SYMBOL, '1m', {'timestamp': 1, 'close': 2.0})
+    assert [c['close'] for c in book.get(SYMBOL, '1m')] == [2.0]
+    assert closed == []
+
+    book.apply(SYMBOL, '1m', {'timestamp': 1, 'close': 3.0}, confirmed=True)
+    assert closed == [1]
+    # Repeated confirm push does not fire twice
+    book.apply(SYMBOL, '1m', {'timestamp': 1, 'close': 3.0}, confirmed=True)
+    assert closed == [1]
+
+    # Newer bar without a confirm for the previous one still closes it
+    book.apply(SYMBOL, '1m', {'timestamp': 2, 'close': 4.0})
+    book.apply(SYMBOL, '1m', {'timestamp': 3, 'close': 5.0})
+    assert closed == [1, 2]
+
+    # Older updates are ignored, book is bounded
+    assert not book.apply(SYMBOL, '1m', {'timestamp': 0, 'close': 9.0})
+    book.apply(SYMBOL, '1m', {'timestamp': 4, 'close': 6.0})
+    assert [c['timestamp'] for c in book.get(SYMBOL, '1m')] == [2, 3, 4]
+    assert [c['timestamp'] for c in book.get(SYMBOL, '1m', limit=2)] == [3, 4]
+
+
+def test_seed_while_disconnected_stays_stale():
+    client = FakeOKXClient()
+    stream = OKXWebSocketFeed([SYMBOL], ['1m'])  # never started: no candle subscription
+    feed = StreamingMarketDataFeed(client, stream=stream)
+
+    candles = feed.get_multi_timeframe_data(SYMBOL, ['1m'])['1m']
+    assert len(candles) == 100
+    assert not stream.book.is_fresh(SYMBOL, '1m'), "REST seed without a live stream must stay stale"
+
+    # Nothing streams into the book, so the next call asks REST again
+    feed.cache = {}
+    feed.get_multi_timeframe_data(SYMBOL, ['1m'])
+    assert client.calls.count(('candles', '1m')) == 2
+
+
+def test_streaming_feed_serves_from_memory():
+    server = FakeOKXServer()
+    client = FakeOKXClient()
+    stream = OKXWebSocketFeed([SYMBOL], ['1m'], public_url=server.url('public'),
+                              business_url=server.url('business'), ping_interval=0.2)
+    feed = StreamingMarketDataFeed(client, stream=stream)
+    feed.start(wait=5)
+    try:
+        assert stream.connected
+        assert _wait_for(lambda: len(server.subscriptions) >= 5)
+        channels = {(a['channel'], a['instId']) for a in server.subscriptions}
+        assert ('candle1m', SYMBOL) in channels
+        assert ('tickers', SYMBOL) in channels
+        assert ('funding-rate', SYMBOL) in channels
+
+        server.push('tickers', [{'instId': SYMBOL, 'last': '123.45'}])
+        server.push('funding-rate', [{'fundingRate': '0.0001', 'fundingTime': str(BASE_TS),
+                                      'nextFundingTime': str(BASE_TS + 8 * 3600_000)}])
+        server.push('open-interest', [{'oi': '5000', 'oiCcy': '50', 'ts': str(BASE_TS)}])
+        assert _wait_for(lambda: stream.latest('open-interest', SYMBOL) is not None)
+
+        # First call seeds candle history from REST
+        state = feed.get_market_state(SYMBOL, ['1m'])
+        assert state['current_price'] == 123.45
+        assert state['funding_rate']['funding_rate'] == 0.0001
+        assert state['open_interest']['open_interest'] == 5000.0
+        assert len(state['timeframes']['1m']['candles']) == 200
+        seeded_calls = list(client.calls)
+        assert seeded_calls == [('candles', '1m')]
+
+        # Streamed candles close the forming bar and open a new one
+        closed = []
+        feed.add_candle_close_listener(lambda symbol, tf, candle: closed.append(candle['timestamp']))
+        server.push('candle1m', [_raw(BASE_TS, 101.0, '1')])
+        server.push('candle1m', [_raw(BASE_TS + MINUTE, 102.0)])
+        assert _wait_for(lambda: len(closed) == 1)
+        assert closed == [BASE_TS]
+
+        feed.cache = {}
+        state = feed.get_market_state(SYMBOL, ['1m'])
+        candles = state['timeframes']['1m']['candles']
+        assert candles[-1]['timestamp'] == BASE_TS + MINUTE
+        assert candles[-2]['close'] == 101.0
+        assert client.calls == seeded_calls, f"unexpected REST calls: {client.calls[len(seeded_calls):]}"
+
+        assert _wait_for(lambda: server.pings > 0)
+
+        # Disconnect marks the book stale; it is re-seeded from REST after reconnect
+        server.drop_all()
+        assert _wait_for(lambda: stream.connected and len(server.sockets) == 2, timeout=10)
+        feed.get_multi_timeframe_data(SYMBOL, ['1m'])
+        assert client.calls.count(('candles', '1m')) == 2
+    finally:
+        feed.stop()
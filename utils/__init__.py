@@ -5,24 +5,40 @@ Helper functions and logging setup
 
 from .logger import setup_logging
 from .trade_journal import TradeJournal
+from .journal_store import JournalStore, get_journal_store
 from .performance_analytics import PerformanceAnalytics
 from .telegram_notifier import TelegramNotifier
+from .telegram_queue import TelegramDeliveryQueue
 from .system_monitor import SystemMonitor, get_monitor
 from .filter_scorer import FilterScorer
 from .risk_dashboard import RiskDashboard, get_risk_dashboard
 from .trade_quality import TradeQualityInspector
 from .confidence_v2 import ConfidenceEngineV2
+from .latency import LatencyHistogram, LatencyRecorder, StageTimer, get_stage_timer
+from .candle_scheduler import CandleCloseScheduler
+from .snapshot_cache import SnapshotCache
+from .event_stream import EventStream
 
 __all__ = [
     'setup_logging', 
     'TradeJournal', 
+    'JournalStore',
+    'get_journal_store',
     'PerformanceAnalytics', 
     'TelegramNotifier',
+    'TelegramDeliveryQueue',
     'SystemMonitor',
     'get_monitor',
     'FilterScorer',
     'RiskDashboard',
     'get_risk_dashboard',
     'TradeQualityInspector',
-    'ConfidenceEngineV2'
+    'ConfidenceEngineV2',
+    'LatencyHistogram',
+    'LatencyRecorder',
+    'StageTimer',
+    'get_stage_timer',
+    'CandleCloseScheduler',
+    'SnapshotCache',
+    'EventStream'
 ]
@@ -0,0 +1,145 @@
+"""
+Candle Close Scheduler
+Wakes the trading loop on candle-close boundaries instead of a fixed sleep
+
+A fixed 60s sleep fires signals up to a full interval after a candle closes,
+and most mid-bar cycles repeat the same analysis. CandleCloseScheduler tells
+the loop when to run a full cycle:
+
+- On the exchange candle-close boundary of any trigger timeframe
+  (plus a small delay so the closed candle is available via REST)
+- Earlier, when the WebSocket stream confirms a close (notify_close)
+
+Between closes, wait() returns at the position-update interval so the loop
+only refreshes open positions.
+
+Usage:
+    scheduler = CandleCloseScheduler(['5m', '15m'], position_interval=15)
+    feed.add_candle_close_listener(scheduler.notify_close)   # optional
+    while running:
+        if scheduler.wait():
+            run_full_cycle()
+        else:
+            update_positions()
+"""
+
+import time
+import threading
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_UNIT_SECONDS = {'m': 60, 'H': 3600, 'D': 86400}
+
+# OKX daily candles open at 00:00 UTC+8 unless the 'utc' variant (e.g. '1Dutc') is used
+_HK_OFFSET_SECONDS = 8 * 3600
+
+
+def timeframe_seconds(timeframe: str) -> int:
+    """OKX bar size ('1m', '15m', '4H', '1D', '1Dutc') in seconds"""
+    tf = timeframe[:-3] if timeframe.endswith('utc') else timeframe
+    unit = tf[-1:]
+    if unit not in _UNIT_SECONDS or not tf[:-1].isdigit():
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    return int(tf[:-1]) * _UNIT_SECONDS[unit]
+
+
+def last_close(timeframe: str, now: float) -> float:
+    """Most recent candle-close boundary (epoch seconds) at or before now"""
+    period = timeframe_seconds(timeframe)
+    offset = 0
+    if period >= 86400 and not timeframe.endswith('utc'):
+        offset = -_HK_OFFSET_SECONDS % period
+    return (now - offset) // period * period + offset
+
+
+class CandleCloseScheduler:
+    """
+    Decides when the trading loop runs a full cycle vs a position update
+    """
+
+    def __init__(self, trigger_timeframes: List[str], position_interval: float = 15.0,
+                 close_delay: float = 2.0):
+        """
+        Args:
+            trigger_timeframes: Timeframes whose candle close triggers a full cycle
+            position_interval: Seconds between position-only updates
+            close_delay: Seconds after a boundary before the full cycle runs
+                (ignored when the stream confirms the close first)
+        """
+        self.periods: Dict[str, int] = {tf: timeframe_seconds(tf) for tf in trigger_timeframes}
+        self.position_interval = position_interval
+        self.close_delay = close_delay
+
+        # Latest close boundary already handled - avoids running twice per close
+        self._handled = self.latest_close(time.time())
+        self._streamed_close = 0.0
+        self._event = threading.Event()
+        self._stopped = False
+        self._lock = threading.Lock()
+
+        self.close_cycles = 0
+        self.stream_triggered = 0
+        self.position_updates = 0
+
+    def latest_close(self, now: float) -> float:
+        return max(last_close(tf, now) for tf in self.periods)
+
+    def next_close(self, now: float) -> float:
+        """Next candle-close boundary across all trigger timeframes"""
+        return min(last_close(tf, now) + period for tf, period in self.periods.items())
+
+    def notify_close(self, symbol: str, timeframe: str, candle: Dict):
+        """Candle close listener for StreamingMarketDataFeed"""
+        period = self.periods.get(timeframe)
+        if period is None:
+            return
+        close_time = candle['timestamp'] / 1000 + period
+        with self._lock:
+            if close_time > self._streamed_close:
+                self._streamed_close = close_time
+        self._event.set()
+
+    def wait(self) -> bool:
+        """
+        Block until the next action is due
+
+        Returns:
+            True when a candle closed (run a full cycle), False when only
+            the position update is due (or the scheduler was stopped)
+        """
+        position_due = time.time() + self.position_interval
+        while not self._stopped:
+            now = time.time()
+            with self._lock:
+                closed = max(self.latest_close(now - self.close_delay), self._streamed_close)
+                if closed > self._handled:
+                    if self._streamed_close >= closed and self._streamed_close > self._handled:
+                        self.stream_triggered += 1
+                    self._handled = closed
+                    self.close_cycles += 1
+                    return True
+
+            if now >= position_due:
+                self.position_updates += 1
+                return False
+
+            wake_at = min(self.next_close(now) + self.close_delay, position_due)
+            self._event.wait(max(wake_at - now, 0.0))
+            self._event.clear()
+        return False
+
+    def stop(self):
+        """Release a blocked wait()"""
+        self._stopped = True
+        self._event.set()
+
+    def get_stats(self) -> Dict:
+        return {
+            'trigger_timeframes': list(self.periods),
+            'close_cycles': self.close_cycles,
+            'stream_triggered': self.stream_triggered,
+            'position_updates': self.position_updates,
+            'next_close': self.next_close(time.time())
+        }
@@ -0,0 +1,178 @@
+"""
+Event Stream - In-process publish/subscribe feeding Server-Sent Events
+Pushes incremental dashboard updates instead of having browsers re-poll full state
+
+Producers publish small named events; publish_changes() diffs a channel's
+values against what was last published and sends only the keys that
+changed (or nothing at all). Every event gets a sequence id and is kept in
+a short ring buffer, so a reconnecting EventSource (Last-Event-ID) replays
+what it missed; a client that fell further behind gets a fresh snapshot.
+
+Usage:
+    stream = EventStream()
+    stream.publish_changes('prices', {'current_price': 142.1, 'btc_price': 97000})
+
+    # Flask
+    return Response(stream.subscribe(snapshot=build_snapshot), mimetype='text/event-stream')
+"""
+
+import json
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def format_event(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """Serialize one Server-Sent Events message"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return '\n'.join(lines) + '\n\n'
+
+
+class EventStream:
+    """
+    Sequenced event fan-out with per-channel change detection
+    """
+
+    def __init__(self, history: int = 256):
+        """
+        Args:
+            history: Events kept for Last-Event-ID replay
+        """
+        self._cond = threading.Condition()
+        self._events: deque = deque(maxlen=history)
+        self._last_id = 0
+        self._published: Dict[str, Dict[str, Any]] = {}
+
+        self.events_published = 0
+        self.changes_suppressed = 0
+        self.subscribers = 0
+
+    def publish(self, event: str, data: Any) -> int:
+        """Publish an event as-is (appends such as a new signal); returns its id"""
+        with self._cond:
+            self._last_id += 1
+            self._events.append((self._last_id, event, data))
+            self.events_published += 1
+            self._cond.notify_all()
+            return self._last_id
+
+    def publish_changes(self, channel: str, values: Dict[str, Any],
+                        extra: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """
+        Publish only the keys of values that differ from the channel's last publish
+
+        Args:
+            channel: Event name (one diff baseline per channel)
+            values: Current values for the channel
+            extra: Sent along with a diff but never compared (e.g. timestamps)
+
+        Returns:
+            Event id, or None when nothing changed
+        """
+        with self._cond:
+            published = self._published.setdefault(channel, {})
+            changed = {key: value for key, value in values.items()
+                       if key not in published or published[key] != value}
+            if not changed:
+                self.changes_suppressed += 1
+                return None
+            published.update(changed)
+            if extra:
+                changed.update(extra)
+            return self.publish(channel, changed)
+
+    def last_id(self) -> int:
+        with self._cond:
+            return self._last_id
+
+    def _pending(self, cursor: int) -> Optional[List[Tuple[int, str, Any]]]:
+        """Events after cursor, or None if some were already evicted (lock held)"""
+        if self._last_id <= cursor:
+            return []
+        if not self._events or self._events[0][0] > cursor + 1:
+            return None
+        return [entry for entry in self._events if entry[0] > cursor]
+
+    def subscribe(self, snapshot: Callable[[], Dict], last_event_id: Optional[int] = None,
+                  keepalive: float = 15.0, on_wake: Optional[Callable[[], None]] = None,
+                  wake_interval: Optional[float] = None) -> Iterator[str]:
+        """
+        Server-Sent Events generator for one client
+
+        Args:
+            snapshot: Builds the full state sent on connect (and after a gap)
+            last_event_id: Resume point sent by a reconnecting EventSource
+            keepalive: Seconds of silence before a comment line is sent
+            on_wake: Called every wake_interval seconds while subscribed
+                     (e.g. to keep a polled upstream snapshot fresh)
+            wake_interval: Seconds between on_wake calls (default: keepalive)
+
+        Yields:
+            SSE-formatted messages
+        """
+        wake_interval = wake_interval or keepalive
+        with self._cond:
+            self.subscribers += 1
+            resume = None
+            if last_event_id is not None and last_event_id <= self._last_id:
+                resume = self._pending(last_event_id)
+            cursor = last_event_id if resume is not None else self._last_id
+
+        try:
+            if resume is None:
+                yield format_event('snapshot', snapshot(), cursor)
+
+            now = time.monotonic()
+            next_keepalive = now + keepalive
+            next_wake = now + wake_interval if on_wake else None
+            while True:
+                with self._cond:
+                    pending = self._pending(cursor)
+                    if pending == []:
+                        deadline = min(next_keepalive, next_wake or next_keepalive)
+                        self._cond.wait(max(0.0, deadline - time.monotonic()))
+                        pending = self._pending(cursor)
+                    if pending is None:
+                        cursor = self._last_id
+
+                if pending is None:
+                    logger.debug("Event stream subscriber fell behind, resending snapshot")
+                    yield format_event('snapshot', snapshot(), cursor)
+                    next_keepalive = time.monotonic() + keepalive
+                elif pending:
+                    for event_id, event, data in pending:
+                        yield format_event(event, data, event_id)
+                    cursor = pending[-1][0]
+                    next_keepalive = time.monotonic() + keepalive
+
+                now = time.monotonic()
+                if next_wake is not None and now >= next_wake:
+                    next_wake = now + wake_interval
+                    try:
+                        on_wake()
+                    except Exception as e:
+                        logger.debug(f"Event stream wake callback failed: {e}")
+                if now >= next_keepalive:
+                    next_keepalive = now + keepalive
+                    yield ': keepalive\n\n'
+        finally:
+            with self._cond:
+                self.subscribers -= 1
+
+    def get_statistics(self) -> Dict:
+        with self._cond:
+            return {
+                'subscribers': self.subscribers,
+                'last_event_id': self._last_id,
+                'events_published': self.events_published,
+                'changes_suppressed': self.changes_suppressed,
+                'history': len(self._events)
+            }
@@ -16,8 +16,6 @@ Note: Requires trades to have 'filters_passed' field (added in Phase 1.5).
 
 import os
 import sys
-import json
-import glob
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
@@ -26,6 +24,8 @@ from collections import defaultdict
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.journal_store import load_recent_trades
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,7 +53,7 @@ class FilterScorer:
     
     def _load_trades(self, days: int = 30) -> List[Dict]:
         """
-        Load trades from the last N days of JSONL files.
+        Load trades from the last N days (shared journal index).
         
         Args:
             days: Number of days to look back
@@ -61,38 +61,7 @@ class FilterScorer:
         Returns:
             List of trade dictionaries
         """
-        trades = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
-        # Find all trades.jsonl files
-        pattern = os.path.join(self.trade_journal_path, "**/trades.jsonl")
-        trade_files = glob.glob(pattern, recursive=True)
-        
-        for filepath in trade_files:
-            try:
-                # Extract date from path (runs/YYYY-MM-DD/trades.jsonl)
-                dir_name = os.path.basename(os.path.dirname(filepath))
-                try:
-                    file_date = datetime.strptime(dir_name, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                    if file_date < cutoff_date:
-                        continue  # Skip old files
-                except ValueError:
-                    pass  # Not a date-formatted directory, include it
-                
-                # Read JSONL file
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                trade = json.loads(line)
-                                trades.append(trade)
-                            except json.JSONDecodeError:
-                                logger.warning(f"Invalid JSON in {filepath}")
-                                
-            except Exception as e:
-                logger.warning(f"Error reading {filepath}: {e}")
-        
+        trades = load_recent_trades(self.trade_journal_path, days)
         logger.info(f"Loaded {len(trades)} trades from last {days} days")
         return trades
     
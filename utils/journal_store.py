@@ -0,0 +1,499 @@
+"""
+Journal Store - Indexed SQLite backend for the trade journal
+
+The daily JSONL files (runs/YYYY-MM-DD/trades.jsonl) stay the source of truth;
+this store indexes them into runs/trades.db (WAL mode, so readers never block
+the trading loop's writes). Every file is ingested incrementally: the byte
+offset already imported is stored next to the rows in the same transaction,
+so each trade is parsed once no matter how many processes read the journal.
+
+Analytics consumers (PerformanceAnalytics, FilterScorer, TradeQualityInspector,
+RiskDashboard, ConfidenceEngineV2) share one store per journal path and query
+by time range, strategy, close reason or symbol instead of re-reading 30 days
+of files each.
+
+The same transaction also folds each new trade into per-day aggregates
+(counts, win/loss, PnL sums per confidence / strategy / close reason / weekday
+bucket, plus an equity segment for drawdown). Rolling-window reports sum at
+most one row per day and bucket, so they cost the same at 10 or 10,000 trades.
+
+Usage:
+    from utils.journal_store import get_journal_store
+
+    store = get_journal_store('runs')
+    trades = store.query(days=30, strategy='BreakoutV3')
+"""
+
+import os
+import json
+import glob
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = 'trades.db'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL,
+    timestamp_close TEXT,
+    symbol TEXT,
+    strategy TEXT,
+    close_reason TEXT,
+    pnl_abs REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trades_day ON trades (day, timestamp_close);
+CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades (strategy, day);
+CREATE INDEX IF NOT EXISTS idx_trades_close_reason ON trades (close_reason, day);
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily_buckets (
+    day TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    trades INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    pnl REAL NOT NULL DEFAULT 0,
+    gross_profit REAL NOT NULL DEFAULT 0,
+    gross_loss REAL NOT NULL DEFAULT 0,
+    duration_sum REAL NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, dimension, bucket)
+);
+CREATE TABLE IF NOT EXISTS daily_equity (
+    day TEXT PRIMARY KEY,
+    pnl REAL NOT NULL DEFAULT 0,
+    max_prefix REAL NOT NULL DEFAULT 0,
+    min_prefix REAL NOT NULL DEFAULT 0,
+    max_drawdown REAL NOT NULL DEFAULT 0
+);
+"""
+
+# Bumped when the aggregate tables change; older databases are rebuilt from trades
+AGGREGATES_VERSION = 1
+
+CONFIDENCE_BUCKETS = ['high', 'medium', 'low', 'very_low', 'unknown']
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+_COUNTERS = ('trades', 'wins', 'pnl', 'gross_profit', 'gross_loss', 'duration_sum', 'duration_count')
+
+
+def confidence_bucket(confidence: Optional[float]) -> str:
+    """Confidence range of a trade (high 90+, medium 70+, low 50+, very_low, unknown)"""
+    if confidence is None:
+        return 'unknown'
+    if confidence >= 90:
+        return 'high'
+    if confidence >= 70:
+        return 'medium'
+    if confidence >= 50:
+        return 'low'
+    return 'very_low'
+
+
+def weekday_bucket(trade: Dict) -> Optional[str]:
+    """Weekday of the trade's close time (None if missing/unparseable)"""
+    timestamp = trade.get('timestamp_close')
+    if not timestamp:
+        return None
+    try:
+        return WEEKDAYS[datetime.fromisoformat(timestamp.replace('Z', '+00:00')).weekday()]
+    except (ValueError, AttributeError):
+        return None
+
+
+def trade_buckets(trade: Dict) -> List[Tuple[str, str]]:
+    """(dimension, bucket) pairs a trade is counted under"""
+    buckets = [
+        ('all', 'all'),
+        ('confidence', confidence_bucket(trade.get('confidence_score'))),
+        ('strategy', str(trade.get('strategy_name') or 'unknown')),
+        ('close_reason', str(trade.get('close_reason') or 'unknown')),
+    ]
+    weekday = weekday_bucket(trade)
+    if weekday:
+        buckets.append(('day_of_week', weekday))
+    return buckets
+
+
+def empty_totals() -> Dict[str, float]:
+    return {counter: 0 for counter in _COUNTERS}
+
+
+def add_trade_to_totals(totals: Dict[str, float], trade: Dict):
+    """Fold one trade into a counter set (win = pnl_abs > 0, like the analytics)"""
+    pnl = float(trade.get('pnl_abs') or 0)
+    totals['trades'] += 1
+    totals['pnl'] += pnl
+    if pnl > 0:
+        totals['wins'] += 1
+        totals['gross_profit'] += pnl
+    else:
+        totals['gross_loss'] += -pnl
+    duration = trade.get('duration_seconds')
+    if duration:
+        totals['duration_sum'] += float(duration)
+        totals['duration_count'] += 1
+
+
+def _day_dirs(base_path: str, since_day: Optional[str] = None) -> List[str]:
+    """Daily trades.jsonl files under base_path (optionally from since_day on)"""
+    files = []
+    for filepath in glob.glob(os.path.join(base_path, '*', 'trades.jsonl')):
+        day = os.path.basename(os.path.dirname(filepath))
+        if since_day is None or day >= since_day:
+            files.append(filepath)
+    return sorted(files)
+
+
+def _since_day(days: int) -> str:
+    """First UTC day of an N-day lookback (today counts as day 1)"""
+    return (datetime.now(timezone.utc).date() - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+
+
+def scan_jsonl_trades(base_path: str, days: int = 30) -> List[Dict]:
+    """
+    Read trades straight from the JSONL files (fallback when SQLite is unusable)
+
+    Returns:
+        Trades from the last N days, newest first
+    """
+    trades = []
+    for filepath in _day_dirs(base_path, _since_day(days)):
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            trades.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            logger.debug(f"Invalid JSON in {filepath}")
+        except Exception as e:
+            logger.debug(f"Error reading {filepath}: {e}")
+    trades.sort(key=lambda t: t.get('timestamp_close') or '', reverse=True)
+    return trades
+
+
+class JournalStore:
+    """
+    SQLite index over the trade journal JSONL files
+    """
+
+    def __init__(self, base_path: str = 'runs'):
+        """
+        Args:
+            base_path: Trade journal directory (database lives at base_path/trades.db)
+        """
+        self.base_path = base_path
+        self.db_path = os.path.join(base_path, DB_FILENAME)
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        # Offsets this process has seen indexed (skips unchanged files without a transaction)
+        self._offsets: Dict[str, int] = {}
+        # Parsed trades by row id, least recently used first; rows are
+        # append-only so entries never go stale, only the size is bounded
+        self._parsed: 'OrderedDict[int, Dict]' = OrderedDict()
+        self._parsed_lock = threading.Lock()
+        self._parsed_max = getattr(config, 'TRADE_JOURNAL_PARSED_CACHE_SIZE', 5000)
+
+        os.makedirs(base_path, exist_ok=True)
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        if conn.execute('PRAGMA user_version').fetchone()[0] < AGGREGATES_VERSION:
+            self._rebuild_aggregates(conn)
+        logger.info(f"✅ JournalStore initialized ({self.db_path})")
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not shareable)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def sync(self, filepath: Optional[str] = None, since_day: Optional[str] = None) -> int:
+        """
+        Import trades appended to the JSONL files since the last sync
+
+        Args:
+            filepath: Only this file (e.g. the one just written); None = all files
+            since_day: Skip day directories before this 'YYYY-MM-DD'
+
+        Returns:
+            Number of newly indexed trades
+        """
+        files = [filepath] if filepath else _day_dirs(self.base_path, since_day)
+        added = 0
+        with self._sync_lock:
+            conn = self._connection()
+            for path in files:
+                try:
+                    added += self._ingest(conn, path)
+                except Exception as e:
+                    if conn.in_transaction:
+                        conn.execute('ROLLBACK')
+                    logger.error(f"⚠️ JournalStore: Failed to index {path}: {e}")
+        if added:
+            logger.debug(f"JournalStore: indexed {added} new trades")
+        return added
+
+    def _ingest(self, conn: sqlite3.Connection, path: str) -> int:
+        key = os.path.relpath(path, self.base_path)
+        size = os.path.getsize(path)
+        if size <= self._offsets.get(key, 0):
+            return 0
+
+        # IMMEDIATE: offset read and row inserts are atomic across processes
+        conn.execute('BEGIN IMMEDIATE')
+        row = conn.execute('SELECT offset FROM ingested_files WHERE path = ?', (key,)).fetchone()
+        offset = row[0] if row else 0
+        if size <= offset:
+            conn.execute('COMMIT')
+            self._offsets[key] = offset
+            return 0
+
+        day = os.path.basename(os.path.dirname(path))
+        rows, trades = [], []
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            chunk = f.read(size - offset)
+        # A line still being written has no newline yet; leave it for next time
+        complete = chunk[:chunk.rfind(b'\n') + 1]
+        for line in complete.decode('utf-8').splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                trade = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Invalid JSON in {path}")
+                continue
+            trades.append(trade)
+            rows.append((day, trade.get('timestamp_close'), trade.get('symbol'),
+                         trade.get('strategy_name'), trade.get('close_reason'),
+                         trade.get('pnl_abs'), line))
+
+        conn.executemany(
+            'INSERT INTO trades (day, timestamp_close, symbol, strategy, close_reason, pnl_abs, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+        )
+        self._aggregate(conn, day, trades)
+        conn.execute('INSERT OR REPLACE INTO ingested_files (path, offset) VALUES (?, ?)',
+                     (key, offset + len(complete)))
+        conn.execute('COMMIT')
+        self._offsets[key] = offset + len(complete)
+        return len(rows)
+
+    def _aggregate(self, conn: sqlite3.Connection, day: str, trades: List[Dict]):
+        """Fold trades (in close order) into the day's aggregate rows - caller holds the transaction"""
+        if not trades:
+            return
+
+        buckets: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for trade in trades:
+            for key in trade_buckets(trade):
+                add_trade_to_totals(buckets.setdefault(key, empty_totals()), trade)
+
+        columns = ', '.join(_COUNTERS)
+        updates = ', '.join(f'{c} = {c} + excluded.{c}' for c in _COUNTERS)
+        conn.executemany(
+            f'INSERT INTO daily_buckets (day, dimension, bucket, {columns}) '
+            f'VALUES (?, ?, ?, {", ".join("?" * len(_COUNTERS))}) '
+            f'ON CONFLICT (day, dimension, bucket) DO UPDATE SET {updates}',
+            [(day, dimension, bucket, *(totals[c] for c in _COUNTERS))
+             for (dimension, bucket), totals in buckets.items()]
+        )
+
+        # Equity segment for the day: cumulative PnL from the day start (0), its
+        # highest/lowest point and the deepest drawdown inside the day
+        row = conn.execute('SELECT pnl, max_prefix, min_prefix, max_drawdown FROM daily_equity WHERE day = ?',
+                           (day,)).fetchone()
+        cumulative, max_prefix, min_prefix, max_drawdown = row or (0.0, 0.0, 0.0, 0.0)
+        for trade in trades:
+            cumulative += float(trade.get('pnl_abs') or 0)
+            max_drawdown = max(max_drawdown, max_prefix - cumulative)
+            max_prefix = max(max_prefix, cumulative)
+            min_prefix = min(min_prefix, cumulative)
+        conn.execute('INSERT OR REPLACE INTO daily_equity (day, pnl, max_prefix, min_prefix, max_drawdown) '
+                     'VALUES (?, ?, ?, ?, ?)', (day, cumulative, max_prefix, min_prefix, max_drawdown))
+
+    def _rebuild_aggregates(self, conn: sqlite3.Connection):
+        """Recompute every aggregate from the indexed trades (new or older-format database)"""
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if conn.execute('PRAGMA user_version').fetchone()[0] >= AGGREGATES_VERSION:
+                conn.execute('COMMIT')  # Another process got there first
+                return
+            conn.execute('DELETE FROM daily_buckets')
+            conn.execute('DELETE FROM daily_equity')
+            by_day: Dict[str, List[Dict]] = {}
+            for day, data in conn.execute('SELECT day, data FROM trades ORDER BY id'):
+                by_day.setdefault(day, []).append(json.loads(data))
+            for day, trades in by_day.items():
+                self._aggregate(conn, day, trades)
+            conn.execute(f'PRAGMA user_version = {AGGREGATES_VERSION}')
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if by_day:
+            logger.info(f"📊 JournalStore: rebuilt aggregates for {len(by_day)} days")
+
+    def aggregates(self, days: Optional[int] = None, sync: bool = True) -> Dict:
+        """
+        Rolling-window totals from the per-day aggregates
+
+        Args:
+            days: Last N UTC days (None = everything)
+            sync: Pick up newly appended trades first
+
+        Returns:
+            {'buckets': {dimension: {bucket: totals}}, 'max_drawdown': float}
+            where totals holds trades, wins, pnl, gross_profit, gross_loss,
+            duration_sum and duration_count; dimension is 'all', 'confidence',
+            'strategy', 'close_reason' or 'day_of_week'
+        """
+        since = _since_day(days) if days is not None else ''
+        if sync:
+            self.sync(since_day=since or None)
+
+        conn = self._connection()
+        columns = ', '.join(f'SUM({c})' for c in _COUNTERS)
+        buckets: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for dimension, bucket, *values in conn.execute(
+            f'SELECT dimension, bucket, {columns} FROM daily_buckets WHERE day >= ? '
+            f'GROUP BY dimension, bucket', (since,)
+        ):
+            buckets.setdefault(dimension, {})[bucket] = dict(zip(_COUNTERS, values))
+
+        # Chain the daily equity segments: a drawdown can start on an earlier day's peak
+        cumulative, peak, max_drawdown = 0.0, 0.0, 0.0
+        for pnl, max_prefix, min_prefix, day_drawdown in conn.execute(
+            'SELECT pnl, max_prefix, min_prefix, max_drawdown FROM daily_equity WHERE day >= ? ORDER BY day',
+            (since,)
+        ):
+            max_drawdown = max(max_drawdown, day_drawdown, peak - (cumulative + min_prefix))
+            peak = max(peak, cumulative + max_prefix)
+            cumulative += pnl
+
+        return {'buckets': buckets, 'max_drawdown': max_drawdown}
+
+    def query(self, days: Optional[int] = None, start: Optional[str] = None,
+              end: Optional[str] = None, strategy: Optional[str] = None,
+              close_reason: Optional[str] = None, symbol: Optional[str] = None,
+              limit: Optional[int] = None, sync: bool = True) -> List[Dict]:
+        """
+        Indexed trade lookup
+
+        Args:
+            days: Last N UTC days (today included), like TradeJournal.get_recent_trades
+            start / end: Inclusive 'YYYY-MM-DD' day bounds
+            strategy / close_reason / symbol: Exact-match filters
+            limit: Max trades returned
+            sync: Pick up newly appended trades first
+
+        Returns:
+            Trade dicts, newest close first
+        """
+        if sync:
+            if days is not None or start:
+                self.sync(since_day=max(_since_day(days) if days is not None else '', start or ''))
+            else:
+                self.sync()
+
+        clauses, params = [], []
+        if days is not None:
+            clauses.append('day >= ?')
+            params.append(_since_day(days))
+        if start:
+            clauses.append('day >= ?')
+            params.append(start)
+        if end:
+            clauses.append('day <= ?')
+            params.append(end)
+        for column, value in (('strategy', strategy), ('close_reason', close_reason), ('symbol', symbol)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+
+        sql = 'SELECT id, data FROM trades'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += " ORDER BY COALESCE(timestamp_close, '') DESC, id DESC"
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(int(limit))
+
+        trades = []
+        for row_id, data in self._connection().execute(sql, params):
+            # Shallow copy: callers may annotate the dicts they get back
+            trades.append(dict(self._parse(row_id, data)))
+        return trades
+
+    def _parse(self, row_id: int, data: str) -> Dict:
+        """Decoded trade for a row, through the bounded LRU cache"""
+        with self._parsed_lock:
+            trade = self._parsed.get(row_id)
+            if trade is not None:
+                self._parsed.move_to_end(row_id)
+                return trade
+        trade = json.loads(data)
+        with self._parsed_lock:
+            self._parsed[row_id] = trade
+            while len(self._parsed) > self._parsed_max:
+                self._parsed.popitem(last=False)
+        return trade
+
+    def count(self, days: Optional[int] = None) -> int:
+        """Number of indexed trades (optionally in the last N days)"""
+        self.sync()
+        if days is None:
+            return self._connection().execute('SELECT COUNT(*) FROM trades').fetchone()[0]
+        return self._connection().execute(
+            'SELECT COUNT(*) FROM trades WHERE day >= ?', (_since_day(days),)
+        ).fetchone()[0]
+
+
+_stores: Dict[str, JournalStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_journal_store(base_path: str = 'runs') -> JournalStore:
+    """Get the process-wide JournalStore for a journal directory"""
+    key = os.path.abspath(base_path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = JournalStore(base_path)
+                _stores[key] = store
+    return store
+
+
+def load_recent_trades(base_path: str = 'runs', days: int = 30) -> List[Dict]:
+    """
+    Trades from the last N days via the shared store
+
+    Falls back to reading the JSONL files if the database cannot be used
+    (e.g. read-only journal directory).
+    """
+    try:
+        return get_journal_store(base_path).query(days=days)
+    except Exception as e:
+        logger.warning(f"⚠️ JournalStore unavailable ({e}), reading JSONL files")
+        return scan_jsonl_trades(base_path, days)
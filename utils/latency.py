@@ -0,0 +1,206 @@
+"""
+Latency Histograms
+Thread-safe, fixed-bucket latency recording with percentile estimates
+
+Usage:
+    from utils.latency import LatencyRecorder
+
+    latency = LatencyRecorder()
+    latency.observe('/api/v5/market/candles', 42.0)   # milliseconds
+    print(latency.snapshot())
+    # {'/api/v5/market/candles': {'count': 1, 'p50_ms': ..., 'p95_ms': ..., ...}}
+
+    # Trading cycle stages
+    stages = get_stage_timer()
+    with stages.cycle():
+        with stages.span('strategy'):
+            signal = strategy_manager.analyze_market(state)
+"""
+
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+# Bucket upper bounds in milliseconds (last bucket is open-ended)
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+
+class LatencyHistogram:
+    """
+    Latency distribution for one operation
+
+    Memory is constant: only bucket counts, sum, min and max are kept.
+    Percentiles are interpolated within the bucket they fall in.
+    """
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.bounds = list(buckets_ms)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.min_ms = ms if self.min_ms is None else min(self.min_ms, ms)
+            self.max_ms = ms if self.max_ms is None else max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimated q-th percentile (0-100) in milliseconds"""
+        with self._lock:
+            return self._percentile(q)
+
+    def _percentile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+
+        rank = q / 100 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max_ms
+                # Observed min/max are tighter than the bucket edges
+                lower = max(lower, self.min_ms)
+                upper = min(upper, self.max_ms)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.max_ms
+
+    def snapshot(self) -> Dict:
+        """Summary stats: count, mean, min, max, p50, p95, p99"""
+        with self._lock:
+            if self.count == 0:
+                return {'count': 0}
+            return {
+                'count': self.count,
+                'mean_ms': round(self.total_ms / self.count, 2),
+                'min_ms': round(self.min_ms, 2),
+                'max_ms': round(self.max_ms, 2),
+                'p50_ms': round(self._percentile(50), 2),
+                'p95_ms': round(self._percentile(95), 2),
+                'p99_ms': round(self._percentile(99), 2),
+                'buckets': self._bucket_counts()
+            }
+
+    def _bucket_counts(self) -> Dict[str, int]:
+        labels = [f"le_{b}" for b in self.bounds] + ['inf']
+        return {label: n for label, n in zip(labels, self.counts) if n}
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.total_ms = 0.0
+            self.min_ms = None
+            self.max_ms = None
+
+
+class LatencyRecorder:
+    """
+    Named collection of LatencyHistograms (e.g. one per endpoint)
+    """
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(name, LatencyHistogram(self.buckets_ms))
+        return hist
+
+    def observe(self, name: str, ms: float):
+        self.histogram(name).observe(ms)
+
+    def names(self) -> List[str]:
+        return sorted(self._histograms)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {name: self._histograms[name].snapshot() for name in self.names()}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+class StageTimer(LatencyRecorder):
+    """
+    Span timer for trading-cycle stages
+
+    Each span feeds its stage histogram; the stages of the most recent
+    complete cycle are kept as a breakdown. Spans may be recorded from
+    worker threads (e.g. concurrent market data fetches).
+    """
+
+    CYCLE = 'cycle_total'
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        super().__init__(buckets_ms)
+        self._current: Dict[str, float] = {}
+        self.last_cycle: Dict[str, float] = {}
+        self.cycles = 0
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the enclosed block as stage `name` (recorded even if it raises)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - started) * 1000
+            self.observe(name, ms)
+            with self._lock:
+                self._current[name] = self._current.get(name, 0.0) + ms
+
+    @contextmanager
+    def cycle(self):
+        """Time one full trading cycle and keep its per-stage breakdown"""
+        with self._lock:
+            self._current = {}
+        try:
+            with self.span(self.CYCLE):
+                yield
+        finally:
+            with self._lock:
+                self.last_cycle = {name: round(ms, 2) for name, ms in self._current.items()}
+                self.cycles += 1
+
+    def snapshot(self) -> Dict:
+        return {
+            'cycles': self.cycles,
+            'stages': super().snapshot(),
+            'last_cycle_ms': dict(self.last_cycle)
+        }
+
+    def reset(self):
+        super().reset()
+        with self._lock:
+            self._current = {}
+            self.last_cycle = {}
+            self.cycles = 0
+
+
+_stage_timer: Optional[StageTimer] = None
+_stage_timer_lock = threading.Lock()
+
+
+def get_stage_timer() -> StageTimer:
+    """Get the process-wide StageTimer for the live trading cycle"""
+    global _stage_timer
+    if _stage_timer is None:
+        with _stage_timer_lock:
+            if _stage_timer is None:
+                _stage_timer = StageTimer()
+    return _stage_timer
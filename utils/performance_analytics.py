@@ -25,8 +25,12 @@ from collections import defaultdict
 # Handle import whether run as module or directly
 try:
     from utils.trade_journal import TradeJournal
+    from utils.journal_store import (CONFIDENCE_BUCKETS, WEEKDAYS, add_trade_to_totals,
+                                     confidence_bucket, empty_totals, weekday_bucket)
 except ImportError:
     from trade_journal import TradeJournal
+    from journal_store import (CONFIDENCE_BUCKETS, WEEKDAYS, add_trade_to_totals,
+                               confidence_bucket, empty_totals, weekday_bucket)
 
 logger = logging.getLogger(__name__)
 
@@ -81,39 +85,58 @@ class PerformanceAnalytics:
         if not trades:
             return self._empty_metrics()
         
-        # Separate wins and losses
-        wins = [t for t in trades if t.get('pnl_abs', 0) > 0]
-        losses = [t for t in trades if t.get('pnl_abs', 0) <= 0]
+        return self._metrics_from_totals(self._totals(trades), self._calculate_max_drawdown(trades))
+    
+    @staticmethod
+    def _totals(trades: List[Dict]) -> Dict[str, float]:
+        """Sum trades into the counter set the journal store aggregates keep"""
+        totals = empty_totals()
+        for trade in trades:
+            add_trade_to_totals(totals, trade)
+        return totals
+    
+    def _metrics_from_totals(self, totals: Dict[str, float], max_drawdown: float) -> Dict[str, Any]:
+        """
+        Overall metrics from summed counters (raw trade list or journal aggregates).
+        
+        Args:
+            totals: trades, wins, pnl, gross_profit, gross_loss, duration_sum, duration_count
+            max_drawdown: Max drawdown of the cumulative PnL
+            
+        Returns:
+            Dictionary with performance metrics
+        """
+        total_trades = totals['trades']
+        if not total_trades:
+            return self._empty_metrics()
         
-        # Calculate totals
-        total_pnl = sum(t.get('pnl_abs', 0) for t in trades)
-        gross_profit = sum(t.get('pnl_abs', 0) for t in wins)
-        gross_loss = abs(sum(t.get('pnl_abs', 0) for t in losses))
+        wins = totals['wins']
+        losses = total_trades - wins
+        total_pnl = totals['pnl']
+        gross_profit = totals['gross_profit']
+        gross_loss = totals['gross_loss']
         
         # Calculate averages
-        avg_win = gross_profit / len(wins) if wins else 0
-        avg_loss = gross_loss / len(losses) if losses else 0
+        avg_win = gross_profit / wins if wins else 0
+        avg_loss = gross_loss / losses if losses else 0
         
         # Profit factor (handle division by zero)
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf') if gross_profit > 0 else 0
         
         # Win rate
-        win_rate = len(wins) / len(trades) if trades else 0
+        win_rate = wins / total_trades
         
         # Average trade duration
-        durations = [t.get('duration_seconds', 0) for t in trades if t.get('duration_seconds')]
-        avg_duration_minutes = (sum(durations) / len(durations) / 60) if durations else 0
-        
-        # Calculate max drawdown (simplified - based on cumulative PnL)
-        max_drawdown = self._calculate_max_drawdown(trades)
+        durations = totals['duration_count']
+        avg_duration_minutes = (totals['duration_sum'] / durations / 60) if durations else 0
         
         # Expectancy (average PnL per trade)
-        expectancy = total_pnl / len(trades) if trades else 0
+        expectancy = total_pnl / total_trades
         
         return {
-            'total_trades': len(trades),
-            'winning_trades': len(wins),
-            'losing_trades': len(losses),
+            'total_trades': total_trades,
+            'winning_trades': wins,
+            'losing_trades': losses,
             'win_rate': round(win_rate, 4),
             'win_rate_pct': round(win_rate * 100, 2),
             'total_pnl': round(total_pnl, 2),
@@ -193,27 +216,10 @@ class PerformanceAnalytics:
         Returns:
             Dictionary with metrics for each confidence range
         """
-        buckets = {
-            'high': [],      # 90-100
-            'medium': [],    # 70-89
-            'low': [],       # 50-69
-            'very_low': [],  # 0-49
-            'unknown': [],   # None/missing
-        }
+        buckets = {name: [] for name in CONFIDENCE_BUCKETS}
         
         for trade in trades:
-            confidence = trade.get('confidence_score')
-            
-            if confidence is None:
-                buckets['unknown'].append(trade)
-            elif confidence >= 90:
-                buckets['high'].append(trade)
-            elif confidence >= 70:
-                buckets['medium'].append(trade)
-            elif confidence >= 50:
-                buckets['low'].append(trade)
-            else:
-                buckets['very_low'].append(trade)
+            buckets[confidence_bucket(trade.get('confidence_score'))].append(trade)
         
         return {
             name: self._bucket_metrics(trades_list)
@@ -274,18 +280,12 @@ class PerformanceAnalytics:
         Returns:
             Dictionary with metrics for each day
         """
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        by_day = {day: [] for day in days}
+        by_day = {day: [] for day in WEEKDAYS}
         
         for trade in trades:
-            timestamp = trade.get('timestamp_close')
-            if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    day_name = days[dt.weekday()]
-                    by_day[day_name].append(trade)
-                except:
-                    pass
+            day_name = weekday_bucket(trade)
+            if day_name:
+                by_day[day_name].append(trade)
         
         return {
             name: self._bucket_metrics(trades_list)
@@ -313,25 +313,79 @@ class PerformanceAnalytics:
                 'profit_factor': 0,
             }
         
-        wins = [t for t in trades if t.get('pnl_abs', 0) > 0]
-        losses = [t for t in trades if t.get('pnl_abs', 0) <= 0]
+        return self._bucket_from_totals(self._totals(trades))
+    
+    def _bucket_from_totals(self, totals: Optional[Dict[str, float]]) -> Dict[str, Any]:
+        """Simplified bucket metrics from summed counters (None = empty bucket)"""
+        if not totals or not totals['trades']:
+            return {
+                'trade_count': 0,
+                'win_rate': 0,
+                'win_rate_pct': 0,
+                'avg_pnl': 0,
+                'total_pnl': 0,
+                'profit_factor': 0,
+            }
         
-        total_pnl = sum(t.get('pnl_abs', 0) for t in trades)
-        gross_profit = sum(t.get('pnl_abs', 0) for t in wins)
-        gross_loss = abs(sum(t.get('pnl_abs', 0) for t in losses))
+        total_trades = totals['trades']
+        total_pnl = totals['pnl']
+        gross_profit = totals['gross_profit']
+        gross_loss = totals['gross_loss']
         
-        win_rate = len(wins) / len(trades) if trades else 0
+        win_rate = totals['wins'] / total_trades
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf') if gross_profit > 0 else 0
         
         return {
-            'trade_count': len(trades),
+            'trade_count': total_trades,
             'win_rate': round(win_rate, 4),
             'win_rate_pct': round(win_rate * 100, 2),
-            'avg_pnl': round(total_pnl / len(trades), 2),
+            'avg_pnl': round(total_pnl / total_trades, 2),
             'total_pnl': round(total_pnl, 2),
             'profit_factor': round(profit_factor, 2) if profit_factor != float('inf') else 'inf',
         }
     
+    def aggregate_metrics(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Overall metrics and every breakdown for the last N days.
+        
+        Served from the journal store's per-day aggregates (no trade list is
+        loaded); falls back to computing from the raw trades without a store.
+        
+        Args:
+            days: Number of days to analyze
+            
+        Returns:
+            {'overall', 'by_confidence', 'by_strategy', 'by_close_reason', 'by_day_of_week'}
+        """
+        store = self.journal.store
+        if not store:
+            trades = self.load_trades(days=days)
+            return {
+                'overall': self.calculate_metrics(trades),
+                'by_confidence': self.calculate_metrics_by_confidence(trades),
+                'by_strategy': self.calculate_metrics_by_strategy(trades),
+                'by_close_reason': self.calculate_metrics_by_close_reason(trades),
+                'by_day_of_week': self.calculate_metrics_by_day_of_week(trades),
+            }
+        
+        aggregates = store.aggregates(days=days)
+        buckets = aggregates['buckets']
+        
+        def breakdown(dimension: str) -> Dict[str, Dict]:
+            return {name: self._bucket_from_totals(totals)
+                    for name, totals in buckets.get(dimension, {}).items()}
+        
+        by_day = breakdown('day_of_week')
+        return {
+            'overall': self._metrics_from_totals(buckets.get('all', {}).get('all', empty_totals()),
+                                                 aggregates['max_drawdown']),
+            'by_confidence': {name: self._bucket_from_totals(buckets.get('confidence', {}).get(name))
+                              for name in CONFIDENCE_BUCKETS},
+            'by_strategy': breakdown('strategy'),
+            'by_close_reason': breakdown('close_reason'),
+            'by_day_of_week': {day: by_day[day] for day in WEEKDAYS if day in by_day},
+        }
+    
     def generate_report(self, days: int = 30) -> Dict[str, Any]:
         """
         Generate comprehensive analytics report.
@@ -342,17 +396,16 @@ class PerformanceAnalytics:
         Returns:
             Complete report dictionary
         """
-        trades = self.load_trades(days=days)
-        
         # Calculate date range
         end_date = datetime.now(timezone.utc).date()
         start_date = end_date - timedelta(days=days)
         
-        # Generate all breakdowns
-        by_confidence = self.calculate_metrics_by_confidence(trades)
-        by_strategy = self.calculate_metrics_by_strategy(trades)
-        by_close_reason = self.calculate_metrics_by_close_reason(trades)
-        by_day = self.calculate_metrics_by_day_of_week(trades)
+        # Generate all breakdowns (from the rolling aggregates)
+        metrics = self.aggregate_metrics(days=days)
+        by_confidence = metrics['by_confidence']
+        by_strategy = metrics['by_strategy']
+        by_close_reason = metrics['by_close_reason']
+        by_day = metrics['by_day_of_week']
         
         # Validate confidence correlation
         confidence_valid = self._validate_confidence_correlation(by_confidence)
@@ -364,7 +417,7 @@ class PerformanceAnalytics:
                 'end': end_date.isoformat(),
                 'days': days,
             },
-            'overall': self.calculate_metrics(trades),
+            'overall': metrics['overall'],
             'by_confidence': by_confidence,
             'by_strategy': by_strategy,
             'by_close_reason': by_close_reason,
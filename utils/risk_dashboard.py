@@ -21,7 +21,6 @@ Usage:
 import os
 import sys
 import json
-import glob
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -30,6 +29,9 @@ from collections import defaultdict
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import config
+from utils.journal_store import load_recent_trades
+
 logger = logging.getLogger(__name__)
 
 # Try to import numpy for VaR calculations
@@ -54,7 +56,8 @@ class RiskDashboard:
     MIN_TRADES_KELLY = 20
     
     def __init__(self, risk_manager=None, production_manager=None, 
-                 trade_journal_path: str = 'runs'):
+                 trade_journal_path: str = 'runs',
+                 watermark_path: Optional[str] = 'data/equity_watermark.json'):
         """
         Initialize the risk dashboard.
         
@@ -62,6 +65,7 @@ class RiskDashboard:
             risk_manager: RiskManager instance (optional)
             production_manager: ProductionOrderManager instance (optional)
             trade_journal_path: Path to trade journal files
+            watermark_path: JSON file persisting peak equity / max drawdown (None = memory only)
         """
         self.risk_manager = risk_manager
         self.production_manager = production_manager
@@ -71,17 +75,24 @@ class RiskDashboard:
         self.peak_equity = None
         self.equity_history: List[Tuple[datetime, float]] = []
         self.max_historical_drawdown_pct = 0.0
+        # Last observed equity, to tell deposits/withdrawals from trading PnL
+        self.last_equity = None
+        self.last_equity_time = None
+        self.cash_flow_threshold_pct = getattr(config, 'RISK_DASHBOARD_CASH_FLOW_THRESHOLD_PCT', 2.0)
+        self.watermark_path = watermark_path
+        self._load_watermark()
         
         # Cache
         self._trades_cache = None
         self._trades_cache_time = None
+        self._trades_cache_days = None
         self._cache_ttl = 60  # seconds
         
         logger.info("📊 RiskDashboard initialized (read-only analytics)")
     
     def _load_trades(self, days: int = 30) -> List[Dict]:
         """
-        Load trades from TradeJournal JSONL files.
+        Load trades from the TradeJournal (shared journal index).
         
         Args:
             days: Number of days to look back
@@ -92,50 +103,61 @@ class RiskDashboard:
         # Check cache
         now = datetime.now()
         if (self._trades_cache is not None and 
+            self._trades_cache_days == days and
             self._trades_cache_time and 
             (now - self._trades_cache_time).total_seconds() < self._cache_ttl):
             return self._trades_cache
         
-        trades = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
-        # Find all trades.jsonl files
-        pattern = os.path.join(self.trade_journal_path, "**/trades.jsonl")
-        trade_files = glob.glob(pattern, recursive=True)
-        
-        for filepath in trade_files:
-            try:
-                # Extract date from path (runs/YYYY-MM-DD/trades.jsonl)
-                dir_name = os.path.basename(os.path.dirname(filepath))
-                try:
-                    file_date = datetime.strptime(dir_name, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                    if file_date < cutoff_date:
-                        continue
-                except ValueError:
-                    pass  # Not a date-formatted directory
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                trade = json.loads(line)
-                                trades.append(trade)
-                            except json.JSONDecodeError:
-                                pass
-                                
-            except Exception as e:
-                logger.debug(f"Error reading {filepath}: {e}")
+        trades = load_recent_trades(self.trade_journal_path, days)
         
         # Update cache
         self._trades_cache = trades
+        self._trades_cache_days = days
         self._trades_cache_time = now
         
         return trades
     
+    def _load_watermark(self):
+        """Restore peak equity and max drawdown from the last session."""
+        if not self.watermark_path or not os.path.exists(self.watermark_path):
+            return
+        try:
+            with open(self.watermark_path, 'r') as f:
+                data = json.load(f)
+            self.peak_equity = data.get('peak_equity')
+            self.max_historical_drawdown_pct = float(data.get('max_drawdown_pct', 0.0))
+            self.last_equity = data.get('last_equity')
+            if data.get('last_equity_time'):
+                self.last_equity_time = datetime.fromisoformat(data['last_equity_time'])
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Could not load equity watermark from {self.watermark_path}: {e}")
+    
+    def _save_watermark(self):
+        """Persist peak equity and max drawdown (only called when one of them moves)."""
+        if not self.watermark_path:
+            return
+        tmp = self.watermark_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.watermark_path) or '.', exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump({
+                    'peak_equity': self.peak_equity,
+                    'max_drawdown_pct': self.max_historical_drawdown_pct,
+                    'last_equity': self.last_equity,
+                    'last_equity_time': self.last_equity_time.isoformat() if self.last_equity_time else None,
+                    'updated_at': datetime.now(timezone.utc).isoformat()
+                }, f, indent=2)
+            os.replace(tmp, self.watermark_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save equity watermark to {self.watermark_path}: {e}")
+    
     def _get_account_balance(self) -> float:
         """Get current account balance from risk manager."""
         if self.risk_manager:
+            # The trading loop refreshes this every cycle; avoid another exchange read
+            current_balance = getattr(self.risk_manager, 'current_balance', None)
+            if current_balance:
+                return current_balance
             try:
                 balance = self.risk_manager.get_account_balance()
                 if balance:
@@ -269,9 +291,24 @@ class RiskDashboard:
                 'message': 'Unable to get account balance'
             }
         
-        # Initialize or update peak
+        # Deposits and withdrawals move the peak with them instead of
+        # showing up as a new high or a drawdown
+        watermark_moved = False
+        cash_flow = self._cash_flow_since_last(current_equity, now)
+        if cash_flow and self.peak_equity is not None:
+            self.peak_equity = max(self.peak_equity + cash_flow, current_equity)
+            watermark_moved = True
+            logger.info(f"💸 Balance change of ${cash_flow:+.2f} not explained by trades, "
+                        f"peak equity rebased to ${self.peak_equity:.2f}")
+        if self.last_equity != current_equity:
+            watermark_moved = True
+        self.last_equity = current_equity
+        self.last_equity_time = now
+        
+        # Initialize or update peak (watermark survives restarts)
         if self.peak_equity is None or current_equity > self.peak_equity:
             self.peak_equity = current_equity
+            watermark_moved = True
         
         # Record equity history (keep last 100)
         self.equity_history.append((now, current_equity))
@@ -282,18 +319,13 @@ class RiskDashboard:
         current_drawdown_dollars = current_equity - self.peak_equity
         current_drawdown_pct = ((current_equity - self.peak_equity) / self.peak_equity) * 100
         
-        # Calculate max historical drawdown from equity history
-        if len(self.equity_history) >= 2:
-            equities = [e[1] for e in self.equity_history]
-            running_peak = equities[0]
-            max_dd = 0
-            for eq in equities:
-                if eq > running_peak:
-                    running_peak = eq
-                dd = ((eq - running_peak) / running_peak) * 100
-                if dd < max_dd:
-                    max_dd = dd
-            self.max_historical_drawdown_pct = max_dd
+        # Max drawdown is a running watermark: O(1) per update instead of rescanning history
+        if current_drawdown_pct < self.max_historical_drawdown_pct:
+            self.max_historical_drawdown_pct = current_drawdown_pct
+            watermark_moved = True
+        
+        if watermark_moved:
+            self._save_watermark()
         
         # Determine status
         dd_abs = abs(current_drawdown_pct)
@@ -319,6 +351,34 @@ class RiskDashboard:
             'status_icon': status_icon
         }
     
+    def _cash_flow_since_last(self, current_equity: float, now: datetime) -> float:
+        """
+        Balance change since the last observation that closed trades do not account for.
+        
+        Returns:
+            The change (positive = deposit, negative = withdrawal), or 0 when it is
+            below RISK_DASHBOARD_CASH_FLOW_THRESHOLD_PCT of the last balance (fees, funding)
+        """
+        if not self.last_equity or self.last_equity_time is None:
+            return 0.0
+        
+        days = max(1, (now - self.last_equity_time).days + 1)
+        realized = 0.0
+        for trade in load_recent_trades(self.trade_journal_path, days):
+            try:
+                closed = datetime.fromisoformat(trade.get('timestamp_close', ''))
+            except ValueError:
+                continue
+            if closed.tzinfo is None:
+                closed = closed.replace(tzinfo=timezone.utc)
+            if closed > self.last_equity_time:
+                realized += trade.get('pnl_abs', 0) or 0
+        
+        unexplained = current_equity - self.last_equity - realized
+        if abs(unexplained) < self.last_equity * self.cash_flow_threshold_pct / 100:
+            return 0.0
+        return unexplained
+    
     def calculate_var(self, confidence_level: float = 0.95) -> Dict[str, Any]:
         """
         Calculate Value at Risk from historical trade returns.
@@ -704,10 +764,20 @@ class RiskDashboard:
 _dashboard_instance = None
 
 def get_risk_dashboard(risk_manager=None, production_manager=None) -> RiskDashboard:
-    """Get or create the global RiskDashboard instance."""
+    """
+    Get or create the global RiskDashboard instance.
+    
+    The trading bot calls this once with its managers; the dashboard's
+    endpoints then share that instance without passing any.
+    """
     global _dashboard_instance
     if _dashboard_instance is None:
         _dashboard_instance = RiskDashboard(risk_manager, production_manager)
+    else:
+        if risk_manager is not None:
+            _dashboard_instance.risk_manager = risk_manager
+        if production_manager is not None:
+            _dashboard_instance.production_manager = production_manager
     return _dashboard_instance
 
 
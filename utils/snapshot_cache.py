@@ -0,0 +1,135 @@
+"""
+Snapshot Cache - Keyed, max-age cached reads with single-flight refresh
+
+Sits between read-heavy consumers (the Flask dashboard) and a rate-limited
+upstream (OKX). Every key is loaded by one background refresher thread:
+
+- fresh snapshot: served from memory
+- stale snapshot: served immediately, one refresh is queued (stale-while-revalidate)
+- no snapshot yet: callers wait for the single in-flight load
+
+Concurrent requests for the same key therefore cost at most one upstream
+call per max-age window, however many browser tabs are polling. Producers
+that already have the data (e.g. the trading loop) can put() it directly.
+
+Usage:
+    cache = SnapshotCache(max_age=5)
+    snapshot, age = cache.get('live', fetch_live_snapshot)
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCache:
+    """
+    Max-age snapshot cache with single-flight, background loading
+    """
+
+    def __init__(self, max_age: float = 5.0):
+        """
+        Args:
+            max_age: Seconds a snapshot is served without triggering a refresh
+        """
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._refresher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot-refresh')
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.loads = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def put(self, key: str, value: Any):
+        """Store a snapshot produced elsewhere (resets its age)"""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+
+    def peek(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(snapshot, age_seconds) without loading, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry[0], time.monotonic() - entry[1]
+
+    def get(self, key: str, loader: Callable[[], Any],
+            max_age: Optional[float] = None) -> Tuple[Any, float]:
+        """
+        Snapshot for key, loading it through the refresher when needed
+
+        Args:
+            key: Snapshot name
+            loader: Upstream fetch; only ever called from the refresher thread
+            max_age: Override of the cache-wide max age
+
+        Returns:
+            (snapshot, age_seconds)
+
+        Raises:
+            The loader's exception when there is no snapshot to fall back on
+        """
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[1]
+                if age <= max_age:
+                    self.hits += 1
+                    return entry[0], age
+            future = self._start_load(key, loader)
+            if entry is not None:
+                self.stale_hits += 1
+                return entry[0], age
+
+        value = future.result()
+        return value, 0.0
+
+    def _start_load(self, key: str, loader: Callable[[], Any]) -> Future:
+        """Join the in-flight load for key or queue a new one (lock held)"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return future
+        future = self._refresher.submit(self._load, key, loader)
+        self._inflight[key] = future
+        self.loads += 1
+        return future
+
+    def _load(self, key: str, loader: Callable[[], Any]) -> Any:
+        try:
+            value = loader()
+            self.put(key, value)
+            return value
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning(f"⚠️ Snapshot refresh failed for {key}: {e}")
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def get_statistics(self) -> Dict:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                'max_age': self.max_age,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'loads': self.loads,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'ages': {key: round(now - stamp, 2) for key, (_, stamp) in self._entries.items()}
+            }
+
+    def shutdown(self):
+        self._refresher.shutdown(wait=False)
@@ -6,6 +6,7 @@ Real-time monitoring of system health including:
 - Resource usage (CPU, Memory, Disk)
 - Uptime tracking
 - Error rate calculation
+- Trading cycle stage latency (p50/p95/p99)
 - Alert determination
 
 Usage:
@@ -32,6 +33,7 @@ from typing import Dict, List, Tuple, Optional, Any
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import config
+from utils.latency import get_stage_timer
 
 # Import psutil with graceful fallback
 try:
@@ -436,6 +438,7 @@ class SystemMonitor:
         error_rate = self.get_error_rate(window_hours=1.0)
         recent_errors = self.get_recent_errors(5)
         trading_stats = self.get_trading_stats()
+        cycle_latency = get_stage_timer().snapshot()
         
         # Determine overall status
         should_alert, alert_reasons = self.should_alert()
@@ -456,6 +459,7 @@ class SystemMonitor:
             "error_rate_per_hour": error_rate,
             "recent_errors": recent_errors,
             "trading": trading_stats,
+            "cycle_latency": cycle_latency,
             "alerts": alert_reasons if should_alert else []
         }
         
@@ -18,13 +18,23 @@ Setup:
    TELEGRAM_BOT_TOKEN=your_token
    TELEGRAM_CHAT_ID=your_chat_id
 5. Set TELEGRAM_ENABLED=True in config.py
+
+Messages are handed to a TelegramDeliveryQueue: alert methods return as
+soon as the message is queued, and a background thread batches, rate
+limits and retries the actual HTTP calls (TELEGRAM_ASYNC_DELIVERY).
 """
 
 import logging
 import requests
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from typing import Dict, Optional, Any
 
+try:
+    from utils.telegram_queue import DeliveryError, TelegramDeliveryQueue
+except ImportError:
+    from telegram_queue import DeliveryError, TelegramDeliveryQueue
+
 logger = logging.getLogger(__name__)
 
 # Import config - handle both module and direct execution
@@ -82,6 +92,18 @@ class TelegramNotifier:
         
         # Track last message times for rate limiting (optional)
         self._last_messages: Dict[str, datetime] = {}
+        
+        # Background delivery (batching, coalescing, rate limits, retries)
+        self._queue: Optional[TelegramDeliveryQueue] = None
+        if self.enabled and (getattr(config, 'TELEGRAM_ASYNC_DELIVERY', True) if config else True):
+            self._queue = TelegramDeliveryQueue(
+                self._deliver,
+                batch_window=getattr(config, 'TELEGRAM_BATCH_WINDOW_SECONDS', 1.0),
+                min_interval=getattr(config, 'TELEGRAM_MIN_SEND_INTERVAL_SECONDS', 1.0),
+                max_per_minute=getattr(config, 'TELEGRAM_MAX_MESSAGES_PER_MINUTE', 20),
+                max_retries=getattr(config, 'TELEGRAM_MAX_RETRIES', 5),
+                max_pending=getattr(config, 'TELEGRAM_QUEUE_SIZE', 200)
+            )
     
     def _get_footer(self) -> str:
         """Get clean timestamp footer for messages."""
@@ -93,52 +115,94 @@ class TelegramNotifier:
         else:
             logger.info("ℹ️ TelegramNotifier disabled (set TELEGRAM_ENABLED=True to enable)")
     
-    def _send_message(self, text: str, parse_mode: str = "HTML") -> bool:
+    def _send_message(self, text: str, parse_mode: str = "HTML", key: str = None) -> bool:
         """
-        Send message to Telegram.
+        Send message to Telegram (queued for background delivery when enabled).
         
         Args:
             text: Message text (can include HTML tags)
             parse_mode: Parse mode (HTML or Markdown)
+            key: Coalescing key - a newer message with the same key replaces
+                 a still-pending one (e.g. pause/resume state)
             
         Returns:
-            True if sent successfully, False otherwise
+            True if queued (or sent, without the queue), False otherwise
         """
         if not self.enabled:
             return False
         
+        if self._queue:
+            self._queue.enqueue(text, parse_mode, key)
+            return True
+        
+        return self._send_now(text, parse_mode)
+    
+    def _send_now(self, text: str, parse_mode: str = "HTML") -> bool:
+        """Blocking send; failures are logged, never raised"""
         try:
-            payload = {
-                'chat_id': self.chat_id,
-                'text': text,
-                'parse_mode': parse_mode,
-                'disable_web_page_preview': True
-            }
-            
-            response = requests.post(self.api_url, json=payload, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('ok'):
-                    logger.debug(f"Telegram message sent successfully")
-                    return True
-                else:
-                    logger.warning(f"Telegram API error: {result.get('description', 'Unknown error')}")
-                    return False
-            else:
-                logger.warning(f"Telegram HTTP error: {response.status_code}")
-                return False
-                
-        except requests.exceptions.Timeout:
-            logger.warning("Telegram request timed out")
-            return False
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Telegram request failed: {e}")
+            return self._deliver(text, parse_mode)
+        except DeliveryError as e:
+            logger.warning(f"Telegram {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error sending Telegram message: {e}")
             return False
     
+    def _deliver(self, text: str, parse_mode: str = "HTML") -> bool:
+        """
+        POST one message to the Telegram API.
+        
+        Returns:
+            True when Telegram accepted the message
+            
+        Raises:
+            DeliveryError: with retry_after on HTTP 429, permanent for
+                           errors a retry cannot fix
+        """
+        payload = {
+            'chat_id': self.chat_id,
+            'text': text,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': True
+        }
+        
+        try:
+            response = requests.post(self.api_url, json=payload, timeout=10)
+        except requests.exceptions.Timeout:
+            raise DeliveryError("request timed out")
+        except requests.exceptions.RequestException as e:
+            raise DeliveryError(f"request failed: {e}")
+        
+        if response.status_code == 429:
+            try:
+                retry_after = response.json().get('parameters', {}).get('retry_after')
+            except ValueError:
+                retry_after = None
+            raise DeliveryError("rate limited (HTTP 429)", retry_after=retry_after)
+        if response.status_code >= 500:
+            raise DeliveryError(f"HTTP error: {response.status_code}")
+        if response.status_code != 200:
+            raise DeliveryError(f"HTTP error: {response.status_code}", permanent=True)
+        
+        result = response.json()
+        if not result.get('ok'):
+            raise DeliveryError(f"API error: {result.get('description', 'Unknown error')}", permanent=True)
+        
+        logger.debug("Telegram message sent successfully")
+        return True
+    
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait for queued messages to be delivered"""
+        return self._queue.flush(timeout) if self._queue else True
+    
+    def close(self, timeout: float = 10.0) -> bool:
+        """Deliver pending messages and stop the delivery thread (on shutdown)"""
+        return self._queue.close(timeout) if self._queue else True
+    
+    def get_delivery_stats(self) -> Dict[str, Any]:
+        """Delivery queue statistics (empty when sending inline)"""
+        return self._queue.get_statistics() if self._queue else {}
+    
     def send_trade_entry(self, position: Dict[str, Any]) -> bool:
         """
         Send trade entry alert.
@@ -616,7 +680,17 @@ class TelegramNotifier:
 {self._get_footer()}
 """.strip()
         
-        result = self._send_message(message)
+        if not self.enabled:
+            result = False
+        elif self._queue:
+            # Wait for the real outcome; the caller wants to know it arrived
+            try:
+                result = self._queue.enqueue(message).result(timeout=60)
+            except FutureTimeoutError:
+                logger.warning("⚠️ Test message still queued after 60s")
+                result = False
+        else:
+            result = self._send_now(message)
         if result:
             logger.info("✅ Test message sent successfully")
         else:
@@ -0,0 +1,314 @@
+"""
+Telegram Delivery Queue - Background, batched delivery of Telegram messages
+
+Callers enqueue and return immediately; one daemon thread does the HTTP work:
+
+- batching: messages arriving within the batch window are joined into one
+  Telegram message (up to the 4096 character limit)
+- coalescing: an identical pending message is counted instead of re-sent,
+  and a message with a key replaces the pending message with the same key
+  (e.g. pause/resume state: only the latest state goes out)
+- rate limiting: at most one send per min interval and N per minute, per chat
+- retries: exponential backoff, honouring Telegram's 429 retry_after
+- isolation: a batch Telegram rejects outright (e.g. bad HTML in one alert)
+  is resent message by message, so only the bad message is dropped
+
+The queue is bounded; when it is full the oldest pending message is dropped,
+so a Telegram outage can never grow memory or stall the trading loop.
+
+Usage:
+    queue = TelegramDeliveryQueue(notifier._deliver)
+    queue.enqueue("<b>TP1 HIT</b> ...")          # never blocks
+    queue.flush(timeout=10)                      # on shutdown
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Telegram sendMessage text limit
+MAX_MESSAGE_LENGTH = 4096
+BATCH_SEPARATOR = "\n\n"
+
+
+class DeliveryError(Exception):
+    """
+    Raised by a send function when Telegram did not accept a message
+
+    Args:
+        message: Error description
+        retry_after: Seconds Telegram asked us to wait (HTTP 429)
+        permanent: True when retrying cannot help (bad request, bad token)
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, permanent: bool = False):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.permanent = permanent
+
+
+@dataclass
+class _Pending:
+    text: str
+    parse_mode: str
+    key: Optional[str] = None
+    count: int = 1
+    futures: List[Future] = field(default_factory=list)
+
+    def render(self) -> str:
+        if self.count == 1:
+            return self.text
+        suffix = f"<i>(×{self.count})</i>" if self.parse_mode == "HTML" else f"(x{self.count})"
+        return f"{self.text}\n{suffix}"
+
+
+class TelegramDeliveryQueue:
+    """
+    Bounded message queue with a single batching, rate-limited sender thread
+    """
+
+    def __init__(self, send: Callable[[str, str], bool], batch_window: float = 1.0,
+                 min_interval: float = 1.0, max_per_minute: int = 20,
+                 max_retries: int = 5, backoff_base: float = 1.0, backoff_max: float = 60.0,
+                 max_pending: int = 200):
+        """
+        Args:
+            send: send(text, parse_mode) -> True; raises DeliveryError on failure
+            batch_window: Seconds to collect a burst before sending
+            min_interval: Minimum seconds between sends to the chat
+            max_per_minute: Maximum sends to the chat per rolling minute
+            max_retries: Retries per batch after the first attempt
+            backoff_base / backoff_max: Exponential backoff bounds (seconds)
+            max_pending: Pending messages kept before the oldest is dropped
+        """
+        self.send = send
+        self.batch_window = batch_window
+        self.min_interval = min_interval
+        self.max_per_minute = max_per_minute
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_pending = max_pending
+
+        self._cond = threading.Condition()
+        self._pending: Deque[_Pending] = deque()
+        self._sending = False
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+        self._send_times: Deque[float] = deque()
+
+        self.enqueued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.batches_sent = 0
+        self.messages_delivered = 0
+        self.retries = 0
+        self.failed = 0
+
+    def enqueue(self, text: str, parse_mode: str = "HTML", key: Optional[str] = None) -> Future:
+        """
+        Queue a message for background delivery (never blocks on the network)
+
+        Args:
+            text: Message text
+            parse_mode: Telegram parse mode (messages only batch with the same mode)
+            key: Pending messages with the same key are replaced, not repeated
+
+        Returns:
+            Future resolving to True once delivered, False if dropped or failed
+        """
+        future = Future()
+        with self._cond:
+            if self._closing:
+                future.set_result(False)
+                return future
+            self.enqueued += 1
+
+            for pending in self._pending:
+                if pending.parse_mode != parse_mode:
+                    continue
+                if key is not None and pending.key == key:
+                    pending.text, pending.count = text, 1
+                elif pending.text == text:
+                    pending.count += 1
+                else:
+                    continue
+                pending.futures.append(future)
+                self.coalesced += 1
+                return future
+
+            if len(self._pending) >= self.max_pending:
+                oldest = self._pending.popleft()
+                self.dropped += 1
+                self._resolve(oldest.futures, False)
+                logger.warning("⚠️ Telegram queue full - dropped oldest pending message")
+
+            self._pending.append(_Pending(text, parse_mode, key, futures=[future]))
+            self._ensure_thread()
+            self._cond.notify_all()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far was delivered or given up on"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._sending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 10.0) -> bool:
+        """Deliver what is pending (skipping the batch window) and stop the sender"""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        delivered = self.flush(timeout)
+        if self._thread is not None:
+            self._thread.join(timeout=0.1)
+        return delivered
+
+    def _ensure_thread(self):
+        """Start the sender on first use (lock held)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='telegram-delivery', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                # Let the burst arrive, then wait for a free rate-limit slot;
+                # both waits let more messages join this batch
+                self._wait_until(time.monotonic() + self.batch_window)
+                self._wait_until(time.monotonic() + self._rate_delay(), ignore_closing=True)
+                batch = self._take_batch()
+                self._sending = True
+
+            try:
+                self._deliver(batch)
+            finally:
+                with self._cond:
+                    self._sending = False
+                    self._cond.notify_all()
+
+    def _wait_until(self, deadline: float, ignore_closing: bool = False):
+        """Sleep on the condition until deadline (lock held); close() cuts batch waits short"""
+        while ignore_closing or not self._closing:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._cond.wait(remaining)
+
+    def _rate_delay(self) -> float:
+        """Seconds until another send to the chat is allowed"""
+        now = time.monotonic()
+        while self._send_times and now - self._send_times[0] >= 60:
+            self._send_times.popleft()
+        delay = 0.0
+        if self._send_times:
+            delay = self._send_times[-1] + self.min_interval - now
+        if len(self._send_times) >= self.max_per_minute:
+            delay = max(delay, self._send_times[0] + 60 - now)
+        return max(0.0, delay)
+
+    def _take_batch(self) -> List[_Pending]:
+        """Pop the messages that fit in one Telegram message (lock held)"""
+        batch = [self._pending.popleft()]
+        length = len(batch[0].render())
+        while self._pending and self._pending[0].parse_mode == batch[0].parse_mode:
+            added = len(BATCH_SEPARATOR) + len(self._pending[0].render())
+            if length + added > MAX_MESSAGE_LENGTH:
+                break
+            batch.append(self._pending.popleft())
+            length += added
+        return batch
+
+    def _deliver(self, batch: List[_Pending]):
+        """
+        Send a batch as one message; if Telegram rejects the joined text
+        outright, resend its messages one by one so only the bad one is lost
+        """
+        if self._send_batch(batch) is False and len(batch) > 1:
+            logger.info(f"📨 Resending {len(batch)} batched Telegram messages individually")
+            for pending in batch:
+                self._send_batch([pending])
+
+    def _send_batch(self, batch: List[_Pending]) -> Optional[bool]:
+        """
+        Send a batch with retries
+
+        Returns:
+            True if delivered; False on a permanent rejection of a multi-message
+            batch (futures left unresolved for the individual resend); None if
+            it failed and its futures were resolved False
+        """
+        text = BATCH_SEPARATOR.join(pending.render() for pending in batch)
+        parse_mode = batch[0].parse_mode
+        futures = [future for pending in batch for future in pending.futures]
+
+        for attempt in range(self.max_retries + 1):
+            with self._cond:
+                if attempt:
+                    self._wait_until(time.monotonic() + self._rate_delay(), ignore_closing=True)
+                self._send_times.append(time.monotonic())
+            try:
+                self.send(text, parse_mode)
+                with self._cond:
+                    self.batches_sent += 1
+                    self.messages_delivered += len(batch)
+                self._resolve(futures, True)
+                return True
+            except DeliveryError as e:
+                if e.permanent and len(batch) > 1:
+                    logger.warning(f"⚠️ Telegram rejected a batch of {len(batch)} messages: {e}")
+                    return False
+                if e.permanent or attempt == self.max_retries:
+                    logger.warning(f"⚠️ Telegram delivery failed ({len(batch)} message(s)): {e}")
+                    break
+                delay = e.retry_after or min(self.backoff_base * 2 ** attempt, self.backoff_max)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"❌ Telegram delivery failed ({len(batch)} message(s)): {e}")
+                    break
+                delay = min(self.backoff_base * 2 ** attempt, self.backoff_max)
+
+            with self._cond:
+                self.retries += 1
+            logger.debug(f"Telegram delivery retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            time.sleep(delay)
+
+        with self._cond:
+            self.failed += len(batch)
+        self._resolve(futures, False)
+        return None
+
+    @staticmethod
+    def _resolve(futures: List[Future], result: bool):
+        for future in futures:
+            if not future.done():
+                future.set_result(result)
+
+    def get_statistics(self) -> Dict:
+        with self._cond:
+            return {
+                'pending': len(self._pending),
+                'enqueued': self.enqueued,
+                'coalesced': self.coalesced,
+                'dropped': self.dropped,
+                'batches_sent': self.batches_sent,
+                'messages_delivered': self.messages_delivered,
+                'retries': self.retries,
+                'failed': self.failed
+            }
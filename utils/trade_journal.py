@@ -7,6 +7,7 @@ Logs every closed trade to disk in JSONL format for:
 - Trade review and improvement
 
 Files are stored in: runs/YYYY-MM-DD/trades.jsonl
+Reads go through the shared SQLite index (utils/journal_store.py, runs/trades.db)
 
 Testing:
 1. Run system in simulated mode (OKX_SIMULATED=True)
@@ -19,7 +20,12 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
+
+try:
+    from utils.journal_store import get_journal_store, scan_jsonl_trades
+except ImportError:
+    from journal_store import get_journal_store, scan_jsonl_trades
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +51,7 @@ class TradeJournal:
         """
         self.base_path = base_path
         self.enabled = enabled
+        self._store = None
         
         if self.enabled:
             # Ensure base directory exists
@@ -55,6 +62,17 @@ class TradeJournal:
                 logger.error(f"⚠️ TradeJournal: Could not create base path: {e}")
                 self.enabled = False
     
+    @property
+    def store(self):
+        """Shared JournalStore for this path (None if SQLite is unusable)"""
+        if self._store is None:
+            try:
+                self._store = get_journal_store(self.base_path)
+            except Exception as e:
+                logger.warning(f"⚠️ TradeJournal: Index unavailable, reading JSONL files: {e}")
+                self._store = False
+        return self._store or None
+    
     def log_trade(self, trade: Dict[str, Any]) -> bool:
         """
         Log a completed trade to disk.
@@ -111,6 +129,10 @@ class TradeJournal:
             with open(trades_file, 'a', encoding='utf-8') as f:
                 f.write(json.dumps(clean_trade, ensure_ascii=False) + '\n')
             
+            # Index it right away so analytics see it without rescanning
+            if self.store:
+                self.store.sync(trades_file)
+            
             logger.info(f"📝 Trade logged: {trade.get('position_id', 'unknown')} → {trades_file}")
             return True
             
@@ -151,6 +173,9 @@ class TradeJournal:
         Returns:
             List of trade dictionaries
         """
+        if self.store:
+            return self.store.query(start=date_str, end=date_str)
+        
         trades = []
         trades_file = os.path.join(self.base_path, date_str, "trades.jsonl")
         
@@ -178,24 +203,36 @@ class TradeJournal:
         Returns:
             List of trade dictionaries, sorted by time (newest first)
         """
-        from datetime import timedelta
-        
-        all_trades = []
-        today = datetime.utcnow().date()
-        
-        for i in range(days):
-            date = today - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
-            trades = self.get_trades_for_date(date_str)
-            all_trades.extend(trades)
+        if self.store:
+            return self.store.query(days=days)
+        return scan_jsonl_trades(self.base_path, days)
+    
+    def query_trades(self, days: Optional[int] = None, strategy: Optional[str] = None,
+                     close_reason: Optional[str] = None, symbol: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Dict]:
+        """
+        Filtered trade lookup (indexed by day, strategy and close reason).
         
-        # Sort by close time (newest first)
-        all_trades.sort(
-            key=lambda t: t.get('timestamp_close', ''),
-            reverse=True
-        )
+        Args:
+            days: Number of days to look back (None = all)
+            strategy: Only this strategy_name
+            close_reason: Only this close reason ('tp1', 'sl', ...)
+            symbol: Only this symbol
+            limit: Max trades
+            
+        Returns:
+            List of trade dictionaries, sorted by time (newest first)
+        """
+        if self.store:
+            return self.store.query(days=days, strategy=strategy, close_reason=close_reason,
+                                    symbol=symbol, limit=limit)
         
-        return all_trades
+        trades = scan_jsonl_trades(self.base_path, days or 36500)
+        trades = [t for t in trades
+                  if (strategy is None or t.get('strategy_name') == strategy)
+                  and (close_reason is None or t.get('close_reason') == close_reason)
+                  and (symbol is None or t.get('symbol') == symbol)]
+        return trades[:limit] if limit else trades
     
     def get_summary_stats(self, trades: Optional[list] = None) -> Dict:
         """
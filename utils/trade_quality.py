@@ -19,8 +19,6 @@ Usage:
 
 import os
 import sys
-import json
-import glob
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -29,6 +27,8 @@ from collections import defaultdict
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.journal_store import load_recent_trades
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,7 +57,7 @@ class TradeQualityInspector:
     
     def _load_trades(self, days: int = 30) -> List[Dict]:
         """
-        Load trades from TradeJournal JSONL files.
+        Load trades from the TradeJournal (shared journal index).
         
         Args:
             days: Number of days to look back
@@ -65,38 +65,7 @@ class TradeQualityInspector:
         Returns:
             List of trade dictionaries
         """
-        trades = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
-        # Find all trades.jsonl files
-        pattern = os.path.join(self.trade_journal_path, "**/trades.jsonl")
-        trade_files = glob.glob(pattern, recursive=True)
-        
-        for filepath in trade_files:
-            try:
-                # Extract date from path (runs/YYYY-MM-DD/trades.jsonl)
-                dir_name = os.path.basename(os.path.dirname(filepath))
-                try:
-                    file_date = datetime.strptime(dir_name, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                    if file_date < cutoff_date:
-                        continue
-                except ValueError:
-                    pass  # Not a date-formatted directory
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                trade = json.loads(line)
-                                trades.append(trade)
-                            except json.JSONDecodeError:
-                                pass
-                                
-            except Exception as e:
-                logger.debug(f"Error reading {filepath}: {e}")
-        
-        return trades
+        return load_recent_trades(self.trade_journal_path, days)
     
     def _parse_timestamp(self, trade: Dict) -> Optional[datetime]:
         """Parse timestamp from trade, preferring entry time."""